@@ -21,14 +21,20 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # Импортируем настройки и базовую модель
 from app.config import settings
 from app.core.infrastructure.database import Base
+from app.core.infrastructure.outbox import OutboxEventModel
 
 # Импортируем все модели для автогенерации миграций
 from app.modules.identity.infrastructure.persistence.models.user_model import UserModel
 from app.modules.lawyer.infrastructure.persistence.models.lawyer_model import LawyerModel
 from app.modules.document.infrastructure.persistence.models.document_model import DocumentModel
+from app.modules.document.infrastructure.persistence.models.chunk_model import ChunkModel
+from app.modules.chat.infrastructure.persistence.models.answer_cache_model import AnswerCacheModel
+from app.modules.chat.infrastructure.persistence.models.knowledge_base_model import (
+    KnowledgeChunkModel,
+    KnowledgeSourceModel,
+)
 
 # TODO: Раскомментировать когда модули будут созданы
-# from app.modules.document.infrastructure.persistence.models.chunk_model import ChunkModel
 # from app.modules.chat.infrastructure.persistence.models.conversation_model import ConversationModel
 # from app.modules.chat.infrastructure.persistence.models.message_model import MessageModel
 
@@ -0,0 +1,64 @@
+"""create_outbox_events_table
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-01-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Создание таблицы outbox_events (transactional outbox).
+
+    Доменные события записываются в той же транзакции, что и агрегат,
+    и доставляются фоновым диспетчером.
+    """
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False, comment='Порядковый номер записи'),
+        sa.Column('event_id', sa.String(length=36), nullable=False, comment='ID события (для дедупликации у подписчиков)'),
+        sa.Column('event_type', sa.String(length=100), nullable=False, comment='Тип события (имя класса)'),
+        sa.Column('aggregate_type', sa.String(length=100), nullable=False, comment='Тип агрегата'),
+        sa.Column('aggregate_id', sa.String(length=64), nullable=False, comment='ID агрегата'),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Данные события'),
+        sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False, comment='Время возникновения события'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'), comment='Время записи в outbox'),
+        sa.Column('available_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'), comment='Не доставлять раньше этого времени (backoff после ошибки)'),
+        sa.Column('dispatched_at', sa.DateTime(timezone=True), nullable=True, comment='Время успешной доставки'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0', comment='Количество неудачных попыток доставки'),
+        sa.Column('last_error', sa.Text(), nullable=True, comment='Последняя ошибка доставки'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('event_id', name='uq_outbox_events_event_id'),
+    )
+
+    # Частичный индекс только по недоставленным событиям (для диспетчера)
+    op.create_index(
+        'idx_outbox_events_pending',
+        'outbox_events',
+        ['available_at', 'id'],
+        postgresql_where=sa.text('dispatched_at IS NULL'),
+    )
+    op.create_index(
+        'idx_outbox_events_aggregate',
+        'outbox_events',
+        ['aggregate_type', 'aggregate_id'],
+    )
+
+
+def downgrade() -> None:
+    """Удаление таблицы outbox_events."""
+    op.drop_index('idx_outbox_events_aggregate', table_name='outbox_events')
+    op.drop_index('idx_outbox_events_pending', table_name='outbox_events')
+    op.drop_table('outbox_events')
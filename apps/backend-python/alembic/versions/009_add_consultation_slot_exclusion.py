@@ -0,0 +1,93 @@
+"""add_consultation_slot_exclusion
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-01-22 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Интервальный слот консультации и запрет двойного бронирования.
+
+    - Колонка slot (tstzrange [scheduled_start, scheduled_start + duration))
+    - Exclusion constraint (lawyer_id WITH =, slot WITH &&) для незавершенных
+      статусов. Constraint создает GiST индекс, который используется и для
+      проверки конфликтов в find_scheduled_in_timeframe.
+    """
+    # btree_gist нужен для оператора = по uuid внутри GiST индекса
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    op.add_column(
+        'consultations',
+        sa.Column(
+            'slot',
+            postgresql.TSTZRANGE(),
+            nullable=True,
+            comment='Интервал [начало, конец) запланированной консультации',
+        ),
+    )
+
+    # Заполняем slot для существующих запланированных консультаций
+    op.execute(
+        """
+        UPDATE consultations
+        SET slot = tstzrange(
+            scheduled_start,
+            scheduled_start + make_interval(mins => duration_minutes),
+            '[)'
+        )
+        WHERE scheduled_start IS NOT NULL AND duration_minutes IS NOT NULL
+        """
+    )
+
+    # Понятная ошибка вместо нарушения constraint, если в данных уже есть
+    # пересекающиеся бронирования - их нужно разрешить вручную
+    conflicts = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT count(*)
+            FROM consultations a
+            JOIN consultations b
+              ON a.lawyer_id = b.lawyer_id
+             AND a.id < b.id
+             AND a.slot && b.slot
+            WHERE a.status IN ('pending', 'confirmed', 'active')
+              AND b.status IN ('pending', 'confirmed', 'active')
+            """
+        )
+    ).scalar()
+    if conflicts:
+        raise RuntimeError(
+            f"Found {conflicts} overlapping consultation bookings; "
+            "cancel the duplicates before applying this migration"
+        )
+
+    op.execute(
+        """
+        ALTER TABLE consultations
+        ADD CONSTRAINT excl_consultations_lawyer_slot
+        EXCLUDE USING gist (lawyer_id WITH =, slot WITH &&)
+        WHERE (status IN ('pending', 'confirmed', 'active'))
+        """
+    )
+
+
+def downgrade() -> None:
+    """Удаление exclusion constraint и колонки slot."""
+    op.execute(
+        'ALTER TABLE consultations DROP CONSTRAINT IF EXISTS excl_consultations_lawyer_slot'
+    )
+    op.drop_column('consultations', 'slot')
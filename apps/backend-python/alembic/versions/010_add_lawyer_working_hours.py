@@ -0,0 +1,49 @@
+"""add_lawyer_working_hours
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-01-23 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Рабочие часы и часовой пояс юриста (для расчета свободных слотов).
+    """
+    op.add_column(
+        'lawyers',
+        sa.Column(
+            'working_hours',
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment='Рабочие часы по дням недели: {"mon": [["09:00", "18:00"]], ...} (NULL - по умолчанию)',
+        ),
+    )
+    op.add_column(
+        'lawyers',
+        sa.Column(
+            'timezone',
+            sa.String(length=64),
+            nullable=False,
+            server_default='Europe/Moscow',
+            comment='Часовой пояс юриста (IANA)',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Удаление рабочих часов юриста."""
+    op.drop_column('lawyers', 'timezone')
+    op.drop_column('lawyers', 'working_hours')
@@ -0,0 +1,68 @@
+"""add_consultation_single_active_index
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-01-24 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Юрист ведет не больше одной активной консультации.
+
+    Частичный уникальный индекс делает проверку при старте консультации
+    безопасной при конкурентных запросах. Он заменяет неуникальный
+    idx_consultations_lawyer_active (005) с тем же условием: поиск
+    активной консультации юриста использует новый индекс.
+    """
+    duplicates = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT count(*)
+            FROM (
+                SELECT lawyer_id
+                FROM consultations
+                WHERE status = 'active'
+                GROUP BY lawyer_id
+                HAVING count(*) > 1
+            ) AS d
+            """
+        )
+    ).scalar()
+    if duplicates:
+        raise RuntimeError(
+            f"Found {duplicates} lawyers with several active consultations; "
+            "complete the extra ones before applying this migration"
+        )
+
+    op.create_index(
+        'uq_consultations_lawyer_active',
+        'consultations',
+        ['lawyer_id'],
+        unique=True,
+        postgresql_where=sa.text("status = 'active'"),
+    )
+    op.drop_index('idx_consultations_lawyer_active', table_name='consultations')
+
+
+def downgrade() -> None:
+    """Вернуть неуникальный индекс активных консультаций (005)."""
+    op.create_index(
+        'idx_consultations_lawyer_active',
+        'consultations',
+        ['lawyer_id', 'status'],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'"),
+    )
+    op.drop_index('uq_consultations_lawyer_active', table_name='consultations')
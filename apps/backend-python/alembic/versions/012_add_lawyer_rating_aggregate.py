@@ -0,0 +1,53 @@
+"""add_lawyer_rating_aggregate
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-01-25 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Инкрементальный агрегат оценок юриста (сумма и распределение по звездам).
+
+    Существующие оценки переносятся фоновой задачей
+    backfill_lawyer_ratings_job.
+    """
+    op.add_column(
+        'lawyers',
+        sa.Column(
+            'rating_sum',
+            sa.Integer(),
+            nullable=False,
+            server_default='0',
+            comment='Сумма оценок (для инкрементального среднего)',
+        ),
+    )
+    op.add_column(
+        'lawyers',
+        sa.Column(
+            'rating_histogram',
+            postgresql.ARRAY(sa.Integer()),
+            nullable=False,
+            server_default='{0,0,0,0,0}',
+            comment='Количество оценок по звездам [1..5]',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Удаление агрегата оценок юриста."""
+    op.drop_column('lawyers', 'rating_histogram')
+    op.drop_column('lawyers', 'rating_sum')
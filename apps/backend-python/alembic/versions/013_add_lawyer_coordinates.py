@@ -0,0 +1,49 @@
+"""add_lawyer_coordinates
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-01-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Координаты юриста и geohash для поиска рядом.
+
+    Существующие юристы геокодируются по городу задачей обслуживания
+    lawyer.geocode-missing.
+    """
+    op.add_column(
+        'lawyers',
+        sa.Column('latitude', sa.Float(), nullable=True,
+                  comment='Широта (NULL - город не геокодирован)'),
+    )
+    op.add_column(
+        'lawyers',
+        sa.Column('longitude', sa.Float(), nullable=True, comment='Долгота'),
+    )
+    op.add_column(
+        'lawyers',
+        sa.Column('geohash', sa.String(12, collation='C'), nullable=True,
+                  comment='Geohash координат'),
+    )
+    op.create_index('idx_lawyers_geohash', 'lawyers', ['geohash'])
+
+
+def downgrade() -> None:
+    """Удалить координаты юриста."""
+    op.drop_index('idx_lawyers_geohash', table_name='lawyers')
+    op.drop_column('lawyers', 'geohash')
+    op.drop_column('lawyers', 'longitude')
+    op.drop_column('lawyers', 'latitude')
@@ -0,0 +1,91 @@
+"""create_document_chunks_table
+
+Revision ID: 014
+Revises: 013
+Create Date: 2025-01-27 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Чанки документов для гибридного RAG поиска.
+
+    - content_tsv: генерируемый tsvector (russian) + GIN индекс
+    - embedding: vector(1536) + HNSW индекс (cosine distance)
+
+    Существующие документы индексируются повторно задачей index_document_job.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+
+    op.create_table(
+        'document_chunks',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('document_id', sa.String(36), nullable=False),
+        sa.Column('owner_id', sa.String(36), nullable=False),
+        sa.Column('chunk_index', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column(
+            'metadata',
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default='{}',
+        ),
+        sa.Column(
+            'content_tsv',
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('russian'::regconfig, content)", persisted=True),
+        ),
+        sa.Column('embedding', Vector(1536), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id', name='pk_document_chunks'),
+        sa.ForeignKeyConstraint(
+            ['document_id'],
+            ['documents.id'],
+            name='fk_document_chunks_document_id',
+            ondelete='CASCADE',  # При удалении документа удаляются его чанки
+        ),
+    )
+
+    op.create_index('ix_document_chunks_owner_id', 'document_chunks', ['owner_id'])
+    op.create_index(
+        'uq_document_chunks_document_index',
+        'document_chunks',
+        ['document_id', 'chunk_index'],
+        unique=True,
+    )
+    op.create_index(
+        'idx_document_chunks_tsv',
+        'document_chunks',
+        ['content_tsv'],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'idx_document_chunks_embedding',
+        'document_chunks',
+        ['embedding'],
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Удалить таблицу document_chunks."""
+    op.drop_index('idx_document_chunks_embedding', table_name='document_chunks')
+    op.drop_index('idx_document_chunks_tsv', table_name='document_chunks')
+    op.drop_index('uq_document_chunks_document_index', table_name='document_chunks')
+    op.drop_index('ix_document_chunks_owner_id', table_name='document_chunks')
+    op.drop_table('document_chunks')
@@ -0,0 +1,36 @@
+"""add_message_content_tokens
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-01-28 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Размер текста сообщения в токенах LLM.
+
+    Существующие сообщения считаются при первом использовании в истории
+    беседы и сохраняются вместе с ней.
+    """
+    op.add_column(
+        'messages',
+        sa.Column('content_tokens', sa.Integer(), nullable=True,
+                  comment='Размер текста в токенах LLM (кеш для бюджета истории)'),
+    )
+
+
+def downgrade() -> None:
+    """Удалить content_tokens."""
+    op.drop_column('messages', 'content_tokens')
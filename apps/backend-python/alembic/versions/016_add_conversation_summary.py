@@ -0,0 +1,62 @@
+"""add_conversation_summary
+
+Revision ID: 016
+Revises: 015
+Create Date: 2025-01-29 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Rolling summary беседы и счетчик сообщений.
+
+    message_count заполняется по существующим сообщениям: беседа больше
+    не загружается со всеми сообщениями, и лимит сообщений проверяется
+    по счетчику.
+    """
+    op.add_column(
+        'conversations',
+        sa.Column('message_count', sa.Integer(), nullable=False, server_default='0',
+                  comment='Количество сообщений (без загрузки сообщений)'),
+    )
+    op.add_column(
+        'conversations',
+        sa.Column('summary', sa.Text(), nullable=True,
+                  comment='Краткое содержание старых сообщений (rolling summary)'),
+    )
+    op.add_column(
+        'conversations',
+        sa.Column('summary_until', sa.DateTime(timezone=True), nullable=True,
+                  comment='created_at последнего сообщения, вошедшего в summary'),
+    )
+
+    op.execute(
+        """
+        UPDATE conversations c
+        SET message_count = m.cnt
+        FROM (
+            SELECT conversation_id, COUNT(*) AS cnt
+            FROM messages
+            GROUP BY conversation_id
+        ) m
+        WHERE m.conversation_id = c.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Удалить summary и счетчик сообщений."""
+    op.drop_column('conversations', 'summary_until')
+    op.drop_column('conversations', 'summary')
+    op.drop_column('conversations', 'message_count')
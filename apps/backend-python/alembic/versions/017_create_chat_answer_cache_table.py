@@ -0,0 +1,65 @@
+"""create_chat_answer_cache_table
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-01-30 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Семантический кеш ответов на общие вопросы.
+
+    - question_embedding: vector(1536) + HNSW индекс (cosine distance)
+    - (locale, expires_at): очистка устаревших записей и purge по локали
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+
+    op.create_table(
+        'chat_answer_cache',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('locale', sa.String(10), nullable=False),
+        sa.Column('question', sa.Text(), nullable=False),
+        sa.Column('question_embedding', Vector(1536), nullable=False),
+        sa.Column('answer', sa.Text(), nullable=False),
+        sa.Column('token_count', sa.Integer(), nullable=False,
+                  comment='Токены LLM, потраченные на ответ (экономия на каждом попадании)'),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_hit_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='pk_chat_answer_cache'),
+    )
+
+    op.create_index(
+        'idx_chat_answer_cache_locale_expires',
+        'chat_answer_cache',
+        ['locale', 'expires_at'],
+    )
+    op.create_index(
+        'idx_chat_answer_cache_embedding',
+        'chat_answer_cache',
+        ['question_embedding'],
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'question_embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Удалить таблицу chat_answer_cache."""
+    op.drop_index('idx_chat_answer_cache_embedding', table_name='chat_answer_cache')
+    op.drop_index('idx_chat_answer_cache_locale_expires', table_name='chat_answer_cache')
+    op.drop_table('chat_answer_cache')
@@ -0,0 +1,107 @@
+"""create_knowledge_base_tables
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-01-31 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Общая правовая база знаний для RAG (только чтение для API).
+
+    - kb_sources: источники (файлы корпуса) с SHA-256 содержимого
+    - kb_chunks: чанки с tsvector (GIN) и embedding (HNSW, cosine),
+      как document_chunks
+
+    Заполняется CLI: python -m scripts.ingest_knowledge_base.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+
+    op.create_table(
+        'kb_sources',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('source_key', sa.String(500), nullable=False,
+                  comment='Ключ источника (путь файла относительно корня корпуса)'),
+        sa.Column('title', sa.String(500), nullable=False),
+        sa.Column('source_type', sa.String(30), nullable=False,
+                  comment='Тип источника (code, federal_law, court_practice, other)'),
+        sa.Column('content_hash', sa.String(64), nullable=False, comment='SHA-256 исходного файла'),
+        sa.Column('chunk_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('ingested_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='pk_kb_sources'),
+        sa.UniqueConstraint('source_key', name='uq_kb_sources_source_key'),
+    )
+
+    op.create_table(
+        'kb_chunks',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('source_id', sa.String(36), nullable=False),
+        sa.Column('chunk_index', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('content_hash', sa.String(64), nullable=False),
+        sa.Column(
+            'metadata',
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default='{}',
+        ),
+        sa.Column(
+            'content_tsv',
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('russian'::regconfig, content)", persisted=True),
+        ),
+        sa.Column('embedding', Vector(1536), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id', name='pk_kb_chunks'),
+        sa.ForeignKeyConstraint(
+            ['source_id'],
+            ['kb_sources.id'],
+            name='fk_kb_chunks_source_id',
+            ondelete='CASCADE',
+        ),
+    )
+
+    op.create_index(
+        'uq_kb_chunks_source_index',
+        'kb_chunks',
+        ['source_id', 'chunk_index'],
+        unique=True,
+    )
+    op.create_index(
+        'idx_kb_chunks_tsv',
+        'kb_chunks',
+        ['content_tsv'],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'idx_kb_chunks_embedding',
+        'kb_chunks',
+        ['embedding'],
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Удалить таблицы базы знаний."""
+    op.drop_index('idx_kb_chunks_embedding', table_name='kb_chunks')
+    op.drop_index('idx_kb_chunks_tsv', table_name='kb_chunks')
+    op.drop_index('uq_kb_chunks_source_index', table_name='kb_chunks')
+    op.drop_table('kb_chunks')
+    op.drop_table('kb_sources')
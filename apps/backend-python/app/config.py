@@ -74,6 +74,104 @@ class Settings(BaseSettings):
         default="gpt-4-turbo-preview",
         description="Модель LLM для чата"
     )
+    openai_context_window_tokens: int = Field(
+        default=128000,
+        description="Окно контекста LLM модели (токены)"
+    )
+    chat_history_max_tokens: int = Field(
+        default=8000,
+        description="Максимум токенов истории беседы в запросе к LLM"
+    )
+    chat_history_tail_messages: int = Field(
+        default=20,
+        description="Сколько последних сообщений беседы загружать для истории"
+    )
+    chat_summary_keep_messages: int = Field(
+        default=8,
+        description="Последние сообщения, которые не сворачиваются в summary"
+    )
+    chat_summary_trigger_messages: int = Field(
+        default=6,
+        description="Новых сообщений вне keep для обновления summary беседы"
+    )
+    chat_summary_max_tokens: int = Field(
+        default=500,
+        description="Максимальный размер summary беседы (токены)"
+    )
+    chat_summary_lock_seconds: int = Field(
+        default=600,
+        description="TTL блокировки повторной постановки задачи summary (секунды)"
+    )
+
+    @field_validator("chat_summary_keep_messages")
+    @classmethod
+    def validate_summary_keep_messages(cls, v: int) -> int:
+        """Хотя бы последнее сообщение не сворачивается (ConversationContextWindow)."""
+        if v < 1:
+            raise ValueError("chat_summary_keep_messages must be >= 1")
+        return v
+
+    # LLM Gateway (общий клиент OpenAI)
+    llm_http2: bool = Field(default=True, description="HTTP/2 для соединений с OpenAI")
+    llm_max_connections: int = Field(
+        default=100,
+        description="Размер пула HTTP соединений с OpenAI на процесс"
+    )
+    llm_max_concurrency: int = Field(
+        default=32,
+        description="Параллельных вызовов LLM на процесс"
+    )
+    llm_user_max_concurrency: int = Field(
+        default=2,
+        description="Параллельных вызовов LLM на пользователя"
+    )
+    llm_request_timeout_seconds: float = Field(
+        default=60.0,
+        description="Таймаут одной попытки вызова LLM (секунды)"
+    )
+    llm_timeout_budget_seconds: float = Field(
+        default=120.0,
+        description="Бюджет вызова LLM с ожиданием слота и retry (секунды)"
+    )
+    llm_max_attempts: int = Field(default=3, description="Попыток вызова LLM (с первой)")
+    llm_retry_base_seconds: float = Field(
+        default=0.5,
+        description="Базовая задержка retry вызова LLM (экспоненциальная, с jitter)"
+    )
+    llm_retry_max_seconds: float = Field(
+        default=8.0,
+        description="Максимальная задержка retry вызова LLM (секунды)"
+    )
+    llm_circuit_failure_threshold: int = Field(
+        default=5,
+        description="Сбоев OpenAI подряд до открытия circuit breaker"
+    )
+    llm_circuit_reset_seconds: float = Field(
+        default=30.0,
+        description="Время в открытом состоянии circuit breaker (секунды)"
+    )
+
+    # LLM Scheduler (очередь запросов ответа AI)
+    llm_scheduler_enabled: bool = Field(
+        default=True,
+        description="Очередь запросов к LLM с fair queuing по пользователям"
+    )
+    llm_scheduler_max_concurrency: int = Field(
+        default=16,
+        description="Одновременных запросов ответа AI на воркер"
+    )
+    llm_scheduler_max_queue: int = Field(
+        default=1000,
+        description="Максимум запросов в очереди планировщика на воркер"
+    )
+    llm_scheduler_max_wait_seconds: float = Field(
+        default=30.0,
+        description="Дедлайн ожидания в очереди, после которого запрос отбрасывается"
+    )
+    llm_scheduler_tokens_per_minute: int = Field(
+        default=300000,
+        description="Глобальный бюджет токенов LLM в минуту (квота провайдера)"
+    )
 
     # Celery
     celery_broker_url: str = Field(
@@ -85,6 +183,259 @@ class Settings(BaseSettings):
         description="Result backend для Celery"
     )
 
+    # Rate Limiting
+    rate_limit_enabled: bool = Field(default=True, description="Включить rate limiting")
+    rate_limit_auth_per_minute: int = Field(
+        default=10,
+        description="Лимит запросов регистрации/входа в минуту (на IP)"
+    )
+    rate_limit_otp_per_minute: int = Field(
+        default=5,
+        description="Лимит проверок OTP в минуту (на IP)"
+    )
+    rate_limit_otp_per_hour: int = Field(
+        default=10,
+        description="Лимит проверок OTP в час (на телефон/email)"
+    )
+    rate_limit_chat_messages_per_minute: int = Field(
+        default=20,
+        description="Лимит сообщений в чат в минуту (на пользователя)"
+    )
+    rate_limit_chat_route_per_minute: int = Field(
+        default=600,
+        description="Общий лимит сообщений в чат в минуту (на весь сервис)"
+    )
+    rate_limit_llm_tokens_per_hour: int = Field(
+        default=200_000,
+        description="Бюджет LLM токенов в час (на пользователя)"
+    )
+    rate_limit_trusted_proxy_hops: int = Field(
+        default=1,
+        description="Число доверенных прокси перед API (nginx) для определения IP клиента"
+    )
+
+    # Idempotency
+    idempotency_ttl_hours: int = Field(
+        default=24,
+        description="Время хранения ответов идемпотентных запросов (часы)"
+    )
+    idempotency_lock_ttl_seconds: int = Field(
+        default=60,
+        description="Время жизни in-flight ключа идемпотентности (секунды)"
+    )
+    idempotency_wait_timeout_seconds: float = Field(
+        default=10.0,
+        description="Сколько ждать результат дублирующего in-flight запроса (секунды)"
+    )
+
+    # Outbox (доменные события)
+    outbox_dispatcher_enabled: bool = Field(
+        default=True,
+        description="Запускать диспетчер outbox в процессе приложения"
+    )
+    outbox_batch_size: int = Field(default=100, description="Размер батча диспетчера outbox")
+    outbox_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="Интервал опроса outbox при пустой очереди (секунды)"
+    )
+    outbox_max_attempts: int = Field(
+        default=10,
+        description="Максимум попыток доставки события"
+    )
+    outbox_stream_name: str = Field(
+        default="domain-events",
+        description="Redis Stream для доменных событий (пусто - не публиковать)"
+    )
+    outbox_retention_days: int = Field(
+        default=7,
+        description="Сколько дней хранить доставленные события outbox"
+    )
+
+    # Background Jobs
+    jobs_eager: bool = Field(
+        default=False,
+        description="Выполнять фоновые задачи в процессе приложения (без брокера)"
+    )
+    jobs_result_ttl_seconds: int = Field(
+        default=3600,
+        description="Время хранения результатов задач (секунды)"
+    )
+    jobs_time_limit_seconds: int = Field(
+        default=900,
+        description="Жесткий лимит времени выполнения задачи (секунды)"
+    )
+    jobs_visibility_timeout_seconds: int = Field(
+        default=3600,
+        description="Visibility timeout Redis broker (секунды)"
+    )
+
+    # Scheduler (периодические задачи обслуживания)
+    scheduler_enabled: bool = Field(
+        default=True,
+        description="Запускать планировщик (выполняет только реплика-лидер)"
+    )
+    scheduler_chunk_size: int = Field(default=200, description="Размер чанка при обработке")
+    scheduler_max_chunks: int = Field(
+        default=50,
+        description="Максимум чанков за один запуск задачи"
+    )
+    subscription_renewal_grace_days: int = Field(
+        default=3,
+        description="Льготный период для продления подписки с auto_renew (дни)"
+    )
+    consultation_pending_timeout_minutes: int = Field(
+        default=24 * 60,
+        description="Через сколько минут отменять неподтвержденную консультацию"
+    )
+    document_processing_timeout_minutes: int = Field(
+        default=30,
+        description="Через сколько минут документ в PROCESSING считается зависшим"
+    )
+
+    # Availability (свободные слоты юристов)
+    availability_slot_step_minutes: int = Field(
+        default=30,
+        description="Шаг сетки начала слотов (минуты)"
+    )
+    availability_buffer_minutes: int = Field(
+        default=15,
+        description="Буфер до и после каждой консультации (минуты)"
+    )
+    availability_min_notice_minutes: int = Field(
+        default=60,
+        description="Минимальное время до начала бронируемого слота (минуты)"
+    )
+    availability_max_range_days: int = Field(
+        default=31,
+        description="Максимальный диапазон запроса свободных слотов (дни)"
+    )
+    availability_max_lawyers: int = Field(
+        default=50,
+        description="Максимум юристов в одном запросе свободных слотов"
+    )
+    availability_cache_ttl_seconds: int = Field(
+        default=300,
+        description="TTL кеша свободных слотов (секунды)"
+    )
+
+    # Lawyer Stats (дашборд юриста)
+    lawyer_stats_cache_ttl_seconds: int = Field(
+        default=600,
+        description="TTL кеша статистики юриста (секунды)"
+    )
+
+    # Lawyer Search Index (in-memory индекс поиска юристов)
+    lawyer_search_index_enabled: bool = Field(
+        default=True,
+        description="Отвечать на поиск юристов из in-memory индекса процесса"
+    )
+    lawyer_search_index_refresh_seconds: int = Field(
+        default=300,
+        description="Период полной перестройки индекса поиска юристов (секунды)"
+    )
+    lawyer_facets_cache_ttl_seconds: int = Field(
+        default=120,
+        description="TTL кеша facet counts поиска юристов (секунды)"
+    )
+
+    # Lawyer Geocoding (координаты для поиска рядом)
+    lawyer_geocoder_url: str = Field(
+        default="",
+        description="URL Nominatim-совместимого геокодера (пусто - только справочник городов)"
+    )
+    lawyer_geocoder_timeout_seconds: float = Field(
+        default=5.0,
+        description="Таймаут запроса к геокодеру (секунды)"
+    )
+    lawyer_geocoder_min_interval_seconds: float = Field(
+        default=1.0,
+        description="Минимальный интервал между запросами к геокодеру (секунды)"
+    )
+
+    # Emergency Dispatch (экстренные консультации)
+    emergency_offer_fanout: int = Field(
+        default=3,
+        description="Сколько юристов одновременно получают экстренный запрос"
+    )
+    emergency_offer_timeout_seconds: float = Field(
+        default=15.0,
+        description="Время на принятие предложения юристом (секунды)"
+    )
+    emergency_search_timeout_seconds: float = Field(
+        default=120.0,
+        description="Общее время поиска юриста для экстренного запроса (секунды)"
+    )
+    emergency_assignment_hold_minutes: int = Field(
+        default=120,
+        description="Максимальная занятость юриста экстренной консультацией (минуты)"
+    )
+
+    # RAG (индексация и гибридный поиск по документам)
+    rag_chunk_max_tokens: int = Field(
+        default=512,
+        description="Максимальный размер чанка документа (токены модели embeddings)"
+    )
+    rag_chunk_min_tokens: int = Field(
+        default=128,
+        description="Минимальный размер чанка перед границей статьи (токены)"
+    )
+    rag_candidates_per_leg: int = Field(
+        default=30,
+        description="Кандидатов из полнотекстовой и векторной ветки поиска"
+    )
+    rag_rrf_k: int = Field(
+        default=60,
+        description="Константа k reciprocal rank fusion"
+    )
+    rag_mmr_lambda: float = Field(
+        default=0.7,
+        description="Баланс релевантности и разнообразия MMR (1.0 - без диверсификации)"
+    )
+    rag_hnsw_ef_search: int = Field(
+        default=100,
+        description="hnsw.ef_search для векторной ветки (точность ANN)"
+    )
+    rag_hnsw_owner_ef_search: int = Field(
+        default=400,
+        description="hnsw.ef_search для документов пользователя (фильтр по владельцу после HNSW)"
+    )
+    rag_knowledge_base_enabled: bool = Field(
+        default=True,
+        description="Искать также в общей правовой базе знаний (kb_chunks)"
+    )
+
+    # Семантический кеш ответов чата
+    chat_answer_cache_enabled: bool = Field(
+        default=True,
+        description="Отдавать ответы на общие вопросы из семантического кеша"
+    )
+    chat_answer_cache_similarity_threshold: float = Field(
+        default=0.95,
+        description="Минимальное cosine similarity вопросов для ответа из кеша"
+    )
+    chat_answer_cache_ttl_seconds: int = Field(
+        default=604800,
+        description="Время жизни ответа в кеше (секунды)"
+    )
+    chat_answer_cache_max_question_chars: int = Field(
+        default=500,
+        description="Более длинные вопросы не кешируются"
+    )
+
+    # Chat WebSocket
+    chat_ws_send_queue_size: int = Field(
+        default=100,
+        description="Размер очереди отправки соединения (переполнение - отключение)"
+    )
+    chat_ws_send_timeout_seconds: float = Field(
+        default=10.0,
+        description="Таймаут отправки одного сообщения клиенту (секунды)"
+    )
+    chat_ws_heartbeat_seconds: float = Field(
+        default=20.0,
+        description="Интервал ping при простое соединения (секунды)"
+    )
+
     # JWT
     jwt_secret_key: str = Field(..., description="Секретный ключ для JWT")
     jwt_algorithm: str = Field(default="HS256", description="Алгоритм JWT")
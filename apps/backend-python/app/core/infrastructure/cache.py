@@ -39,6 +39,27 @@ class RedisClient:
         """Закрыть подключение к Redis."""
         if self._redis:
             await self._redis.close()
+            self._redis = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Проверка наличия подключения к Redis."""
+        return self._redis is not None
+
+    @property
+    def client(self) -> Redis:
+        """
+        Низкоуровневый Redis клиент (для Lua скриптов, pipeline, pub/sub).
+
+        Returns:
+            Экземпляр redis.asyncio.Redis
+
+        Raises:
+            RuntimeError: Если подключение не установлено
+        """
+        if not self._redis:
+            raise RuntimeError("Redis not connected")
+        return self._redis
 
     async def get(self, key: str) -> Optional[str]:
         """
@@ -0,0 +1,107 @@
+"""
+Event Bus
+
+Реестр подписчиков на доменные события.
+
+События доставляются подписчикам асинхронно через transactional outbox
+(см. app.core.infrastructure.outbox) с семантикой at-least-once,
+поэтому обработчики должны быть идемпотентными.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EventEnvelope:
+    """
+    Сериализованное доменное событие, доставляемое подписчикам.
+
+    Attributes:
+        event_id: Уникальный ID события (для дедупликации)
+        event_type: Тип события (имя класса, например "PaymentSucceededEvent")
+        aggregate_type: Тип агрегата (например, "Payment")
+        aggregate_id: ID агрегата
+        payload: Данные события
+        occurred_at: Время возникновения события
+    """
+
+    event_id: str
+    event_type: str
+    aggregate_type: str
+    aggregate_id: str
+    payload: Dict[str, Any]
+    occurred_at: datetime
+
+
+EventHandler = Callable[[EventEnvelope], Awaitable[None]]
+
+
+class EventBus:
+    """
+    In-process реестр подписчиков.
+
+    Example:
+        ```python
+        async def on_payment_succeeded(event: EventEnvelope) -> None:
+            ...
+
+        event_bus.subscribe("PaymentSucceededEvent", on_payment_succeeded)
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[str, List[EventHandler]] = defaultdict(list)
+
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """
+        Подписать обработчик на тип события.
+
+        Args:
+            event_type: Тип события (имя класса)
+            handler: Асинхронный обработчик
+        """
+        if handler not in self._handlers[event_type]:
+            self._handlers[event_type].append(handler)
+
+    def handlers_for(self, event_type: str) -> List[EventHandler]:
+        """
+        Получить обработчики события.
+
+        Args:
+            event_type: Тип события
+
+        Returns:
+            Список обработчиков
+        """
+        return list(self._handlers.get(event_type, []))
+
+    async def publish(self, event: EventEnvelope) -> None:
+        """
+        Доставить событие всем подписчикам.
+
+        Args:
+            event: Событие
+
+        Raises:
+            Exception: Ошибка первого упавшего обработчика (событие будет
+                доставлено повторно, включая уже успешные обработчики)
+        """
+        for handler in self.handlers_for(event.event_type):
+            try:
+                await handler(event)
+            except Exception:
+                logger.exception(
+                    f"Event handler {getattr(handler, '__qualname__', handler)} "
+                    f"failed for {event.event_type} ({event.event_id})"
+                )
+                raise
+
+
+# Глобальный event bus
+event_bus = EventBus()
@@ -0,0 +1,384 @@
+"""
+Idempotency Infrastructure
+
+Поддержка заголовка Idempotency-Key для небезопасных операций
+(платежи, бронирования).
+
+Как работает:
+1. Dependency `idempotent(scope)` вычисляет fingerprint запроса и
+   атомарно захватывает ключ в Redis (SET NX) со статусом "in_flight".
+2. Повторный запрос с тем же ключом:
+   - ответ уже сохранен -> возвращается сохраненный ответ (handler не вызывается)
+   - запрос еще выполняется -> ожидаем результат in-flight запроса
+   - другой fingerprint -> 422 (ключ переиспользован для другого запроса)
+3. IdempotencyMiddleware перехватывает ответ и сохраняет его в Redis с TTL.
+   Ответы 5xx не сохраняются - ключ освобождается для повторной попытки.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Header, HTTPException, Request, status
+from fastapi.responses import Response
+from redis.exceptions import RedisError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.core.infrastructure.cache import RedisClient, redis_client
+
+logger = logging.getLogger(__name__)
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+_STATE_IN_FLIGHT = "in_flight"
+_STATE_COMPLETED = "completed"
+
+# Заголовки ответа, которые сохраняются вместе с телом
+_REPLAYED_HEADERS = {"content-type", "location"}
+
+
+@dataclass(frozen=True)
+class IdempotencyContext:
+    """
+    Контекст идемпотентного запроса (хранится в request.state).
+
+    Attributes:
+        storage_key: Ключ в Redis
+        fingerprint: Fingerprint запроса
+    """
+
+    storage_key: str
+    fingerprint: str
+
+
+class IdempotentReplay(Exception):
+    """Запрос уже выполнен - нужно вернуть сохраненный ответ."""
+
+    def __init__(self, record: dict) -> None:
+        self.record = record
+        super().__init__("Idempotent replay")
+
+
+class IdempotencyStore:
+    """
+    Хранилище идемпотентных ключей в Redis.
+
+    Запись: JSON {"state", "fingerprint", "status_code", "headers", "body"}.
+    """
+
+    KEY_PREFIX = "idempotency"
+
+    def __init__(
+        self,
+        redis: RedisClient,
+        ttl: timedelta,
+        lock_ttl: timedelta,
+        wait_timeout: float,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """
+        Args:
+            redis: Redis клиент
+            ttl: Время хранения сохраненного ответа
+            lock_ttl: Время жизни in-flight записи (защита от "зависших" запросов)
+            wait_timeout: Сколько ждать завершения in-flight дубликата (секунды)
+            poll_interval: Интервал опроса при ожидании (секунды)
+        """
+        self._redis = redis
+        self._ttl = ttl
+        self._lock_ttl = lock_ttl
+        self._wait_timeout = wait_timeout
+        self._poll_interval = poll_interval
+
+    @property
+    def available(self) -> bool:
+        """Доступно ли хранилище."""
+        return self._redis.is_connected
+
+    def storage_key(self, scope: str, principal: str, key: str) -> str:
+        """Ключ в Redis: scope + клиент + Idempotency-Key."""
+        return f"{self.KEY_PREFIX}:{scope}:{principal}:{key}"
+
+    async def begin(self, storage_key: str, fingerprint: str) -> Optional[dict]:
+        """
+        Захватить ключ или получить результат предыдущего запроса.
+
+        Args:
+            storage_key: Ключ в Redis
+            fingerprint: Fingerprint текущего запроса
+
+        Returns:
+            None если ключ захвачен (нужно выполнить handler),
+            иначе сохраненная запись завершенного запроса
+
+        Raises:
+            HTTPException: 422 при несовпадении fingerprint,
+                409 если in-flight запрос не завершился за wait_timeout
+        """
+        record = {"state": _STATE_IN_FLIGHT, "fingerprint": fingerprint}
+        acquired = await self._redis.client.set(
+            storage_key, json.dumps(record), nx=True, px=int(self._lock_ttl.total_seconds() * 1000)
+        )
+        if acquired:
+            return None
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._wait_timeout
+
+        while True:
+            raw = await self._redis.client.get(storage_key)
+            if raw is None:
+                # In-flight запрос завершился ошибкой 5xx или истек - пробуем захватить снова
+                acquired = await self._redis.client.set(
+                    storage_key,
+                    json.dumps(record),
+                    nx=True,
+                    px=int(self._lock_ttl.total_seconds() * 1000),
+                )
+                if acquired:
+                    return None
+                # Ключ захватил параллельный запрос - ждем его как in-flight
+            else:
+                existing = json.loads(raw)
+                if existing.get("fingerprint") != fingerprint:
+                    raise HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail=f"{IDEMPOTENCY_HEADER} was already used for a different request",
+                    )
+
+                if existing.get("state") == _STATE_COMPLETED:
+                    return existing
+
+            if loop.time() >= deadline:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="A request with the same Idempotency-Key is still in progress",
+                )
+
+            await asyncio.sleep(self._poll_interval)
+
+    async def complete(
+        self,
+        storage_key: str,
+        fingerprint: str,
+        status_code: int,
+        headers: dict,
+        body: bytes,
+    ) -> None:
+        """
+        Сохранить ответ выполненного запроса.
+
+        Args:
+            storage_key: Ключ в Redis
+            fingerprint: Fingerprint запроса
+            status_code: HTTP статус ответа
+            headers: Сохраняемые заголовки ответа
+            body: Тело ответа
+        """
+        record = {
+            "state": _STATE_COMPLETED,
+            "fingerprint": fingerprint,
+            "status_code": status_code,
+            "headers": headers,
+            "body": base64.b64encode(body).decode("ascii"),
+        }
+        await self._redis.client.set(
+            storage_key, json.dumps(record), px=int(self._ttl.total_seconds() * 1000)
+        )
+
+    async def release(self, storage_key: str) -> None:
+        """Освободить ключ (запрос не выполнен, повтор разрешен)."""
+        await self._redis.client.delete(storage_key)
+
+
+# Глобальное хранилище идемпотентных ключей
+idempotency_store = IdempotencyStore(
+    redis_client,
+    ttl=timedelta(hours=settings.idempotency_ttl_hours),
+    lock_ttl=timedelta(seconds=settings.idempotency_lock_ttl_seconds),
+    wait_timeout=settings.idempotency_wait_timeout_seconds,
+)
+
+
+def _principal(request: Request) -> str:
+    """
+    Идентификатор клиента для изоляции ключей разных пользователей.
+
+    Используется хеш Authorization заголовка, чтобы не зависеть от
+    конкретной реализации аутентификации.
+    """
+    authorization = request.headers.get("authorization", "")
+    return hashlib.sha256(authorization.encode()).hexdigest()[:32]
+
+
+async def _fingerprint(request: Request) -> str:
+    """Fingerprint запроса: метод + путь + query + тело."""
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(request.url.path.encode())
+    digest.update(request.url.query.encode())
+    digest.update(await request.body())
+    return digest.hexdigest()
+
+
+def idempotent(scope: str) -> Callable[..., Awaitable[None]]:
+    """
+    Dependency factory для идемпотентных endpoints.
+
+    Заголовок Idempotency-Key опционален: без него запрос выполняется как обычно.
+
+    Args:
+        scope: Область ключей (например, "payments:consultation")
+
+    Returns:
+        FastAPI dependency
+
+    Example:
+        ```python
+        @router.post("/payments", dependencies=[Depends(idempotent("payments"))])
+        async def create_payment(...): ...
+        ```
+    """
+
+    async def dependency(
+        request: Request,
+        idempotency_key: Optional[str] = Header(
+            default=None,
+            alias=IDEMPOTENCY_HEADER,
+            description="Уникальный ключ запроса для безопасных повторов",
+        ),
+    ) -> None:
+        if not idempotency_key:
+            return
+
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{IDEMPOTENCY_HEADER} is too long (maximum {MAX_KEY_LENGTH} characters)",
+            )
+
+        if not idempotency_store.available:
+            logger.warning("Idempotency store is unavailable, executing request without key")
+            return
+
+        storage_key = idempotency_store.storage_key(scope, _principal(request), idempotency_key)
+        fingerprint = await _fingerprint(request)
+
+        try:
+            record = await idempotency_store.begin(storage_key, fingerprint)
+        except RedisError as e:
+            logger.warning(f"Idempotency store error, executing request without key: {e}")
+            return
+
+        if record is not None:
+            raise IdempotentReplay(record)
+
+        request.state.idempotency = IdempotencyContext(
+            storage_key=storage_key,
+            fingerprint=fingerprint,
+        )
+
+    return dependency
+
+
+async def idempotent_replay_handler(request: Request, exc: IdempotentReplay) -> Response:
+    """
+    Exception handler: вернуть сохраненный ответ.
+
+    Args:
+        request: HTTP запрос
+        exc: IdempotentReplay с сохраненной записью
+
+    Returns:
+        Сохраненный ответ с заголовком Idempotent-Replayed
+    """
+    record = exc.record
+    headers = dict(record.get("headers") or {})
+    headers["Idempotent-Replayed"] = "true"
+    media_type = headers.pop("content-type", None)
+    return Response(
+        content=base64.b64decode(record["body"]),
+        status_code=record["status_code"],
+        headers=headers,
+        media_type=media_type,
+    )
+
+
+class IdempotencyMiddleware:
+    """
+    ASGI middleware: сохраняет ответы идемпотентных запросов.
+
+    Активируется только если dependency `idempotent()` захватил ключ
+    (request.state.idempotency), остальные запросы проходят без буферизации.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_start: Optional[Message] = None
+        body_chunks: list[bytes] = []
+
+        def context() -> Optional[IdempotencyContext]:
+            return scope.get("state", {}).get("idempotency")
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_start
+            if context() is not None:
+                if message["type"] == "http.response.start":
+                    response_start = message
+                elif message["type"] == "http.response.body":
+                    body_chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            ctx = context()
+            if ctx is not None:
+                await self._release(ctx)
+            raise
+
+        ctx = context()
+        if ctx is None:
+            return
+
+        if response_start is None or response_start["status"] >= 500:
+            await self._release(ctx)
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in response_start.get("headers", [])
+            if name.decode("latin-1").lower() in _REPLAYED_HEADERS
+        }
+        try:
+            await idempotency_store.complete(
+                ctx.storage_key,
+                ctx.fingerprint,
+                response_start["status"],
+                headers,
+                b"".join(body_chunks),
+            )
+        except RedisError as e:
+            logger.error(f"Failed to store idempotent response: {e}")
+
+    @staticmethod
+    async def _release(ctx: IdempotencyContext) -> None:
+        try:
+            await idempotency_store.release(ctx.storage_key)
+        except RedisError as e:
+            logger.error(f"Failed to release idempotency key: {e}")
+
@@ -0,0 +1,324 @@
+"""
+Background Jobs Infrastructure
+
+Runtime фоновых задач на Celery (broker/result backend - Redis из config.py).
+
+Очереди по типу нагрузки:
+- cpu: тяжелые вычисления (извлечение текста, chunking)
+- io: сетевые операции и БД (уведомления, обслуживание)
+- llm: вызовы OpenAI (embeddings, суммаризация) - отдельно, чтобы
+  ограничивать параллелизм и не блокировать остальные задачи
+
+Задачи объявляются как обычные async функции через декоратор @job и
+ставятся в очередь типизированным вызовом `my_job.enqueue(...)`.
+
+В eager режиме (settings.jobs_eager) задачи выполняются в текущем
+процессе без брокера - для тестов и локальной разработки.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum, IntEnum
+from typing import Any, Awaitable, Callable, Generic, Optional, ParamSpec, Set, TypeVar
+from uuid import uuid4
+
+from celery import Celery, Task
+from celery.signals import worker_process_init, worker_process_shutdown
+from kombu import Queue
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class JobQueue(str, Enum):
+    """Очереди задач по типу нагрузки."""
+
+    CPU = "cpu"
+    IO = "io"
+    LLM = "llm"
+
+
+class JobPriority(IntEnum):
+    """
+    Приоритет задачи.
+
+    Для Redis broker меньшее значение = более высокий приоритет.
+    """
+
+    HIGH = 0
+    NORMAL = 5
+    LOW = 9
+
+
+class PermanentJobError(Exception):
+    """Ошибка, при которой повтор задачи бессмысленен (retry не выполняется)."""
+
+
+# Модули с задачами (импортируются воркером при старте)
+JOB_MODULES = [
+    "app.modules.chat.infrastructure.jobs",
+    "app.modules.consultation.infrastructure.jobs",
+]
+
+
+celery_app = Celery(
+    "advocata",
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
+    include=JOB_MODULES,
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    timezone="UTC",
+    enable_utc=True,
+    task_queues=[Queue(queue.value, routing_key=queue.value) for queue in JobQueue],
+    task_default_queue=JobQueue.IO.value,
+    task_default_priority=JobPriority.NORMAL.value,
+    # Приоритеты для Redis broker
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+        "visibility_timeout": settings.jobs_visibility_timeout_seconds,
+    },
+    # Надежность: подтверждение после выполнения, по одной задаче на процесс
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    # Результаты храним ограниченное время
+    result_expires=settings.jobs_result_ttl_seconds,
+    task_time_limit=settings.jobs_time_limit_seconds,
+    task_soft_time_limit=max(1, settings.jobs_time_limit_seconds - 30),
+)
+
+
+# Event loop воркера: один на процесс, чтобы пул соединений SQLAlchemy/Redis
+# не привязывался к уже закрытому loop.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run_coroutine(coro: Awaitable[R]) -> R:
+    """Выполнить coroutine в event loop воркера."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**_: Any) -> None:
+    """Инициализация дочернего процесса воркера (после fork)."""
+    from app.core.infrastructure.cache import redis_client
+    from app.core.infrastructure.database import engine
+
+    # Соединения, унаследованные от родителя, использовать нельзя
+    engine.sync_engine.dispose(close=False)
+
+    async def _connect() -> None:
+        try:
+            await redis_client.connect()
+        except Exception as e:
+            logger.warning(f"Worker could not connect to Redis: {e}")
+
+    _run_coroutine(_connect())
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**_: Any) -> None:
+    """Закрытие ресурсов дочернего процесса воркера."""
+    from app.core.infrastructure.cache import redis_client
+    from app.core.infrastructure.database import engine
+
+    async def _close() -> None:
+        await redis_client.disconnect()
+        await engine.dispose()
+
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        _run_coroutine(_close())
+        _worker_loop.close()
+
+
+@dataclass(frozen=True)
+class JobOptions:
+    """
+    Параметры постановки задачи в очередь.
+
+    Attributes:
+        priority: Приоритет (по умолчанию - приоритет задачи)
+        countdown: Задержка перед выполнением (секунды)
+        eta: Время выполнения
+    """
+
+    priority: Optional[JobPriority] = None
+    countdown: Optional[float] = None
+    eta: Optional[datetime] = None
+
+
+# Задачи, запущенные в eager режиме (ссылки, чтобы их не собрал GC)
+_eager_tasks: Set[asyncio.Task] = set()
+
+
+class Job(Generic[P, R]):
+    """
+    Фоновая задача.
+
+    Оборачивает async функцию в Celery task и предоставляет типизированный
+    enqueue с той же сигнатурой, что и у функции.
+    """
+
+    def __init__(
+        self,
+        func: Callable[P, Awaitable[R]],
+        name: str,
+        queue: JobQueue,
+        priority: JobPriority,
+        max_retries: int,
+        retry_backoff_max: int,
+        ignore_result: bool,
+    ) -> None:
+        self._func = func
+        self.name = name
+        self.queue = queue
+        self.priority = priority
+
+        def run(task: Task, *args: Any, **kwargs: Any) -> Any:
+            logger.info(f"Job {name} started (id={task.request.id}, retry={task.request.retries})")
+            return _run_coroutine(func(*args, **kwargs))
+
+        run.__name__ = func.__name__
+        run.__doc__ = func.__doc__
+
+        self.task: Task = celery_app.task(
+            run,
+            name=name,
+            bind=True,
+            queue=queue.value,
+            priority=priority.value,
+            autoretry_for=(Exception,),
+            dont_autoretry_for=(PermanentJobError,),
+            max_retries=max_retries,
+            retry_backoff=True,
+            retry_backoff_max=retry_backoff_max,
+            retry_jitter=True,
+            ignore_result=ignore_result,
+        )
+
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Выполнить задачу inline (в текущем процессе)."""
+        return await self._func(*args, **kwargs)
+
+    def enqueue(self, *args: P.args, **kwargs: P.kwargs) -> str:
+        """
+        Поставить задачу в очередь.
+
+        Returns:
+            ID задачи
+        """
+        return self._submit(JobOptions(), args, kwargs)
+
+    def enqueue_with(self, options: JobOptions) -> Callable[P, str]:
+        """
+        Поставить задачу в очередь с параметрами (приоритет, задержка).
+
+        Example:
+            ```python
+            index_document_job.enqueue_with(JobOptions(priority=JobPriority.HIGH))(doc_id)
+            ```
+        """
+
+        def submit(*args: P.args, **kwargs: P.kwargs) -> str:
+            return self._submit(options, args, kwargs)
+
+        return submit
+
+    def _submit(self, options: JobOptions, args: tuple, kwargs: dict) -> str:
+        if settings.jobs_eager:
+            return self._run_eager(args, kwargs)
+
+        result = self.task.apply_async(
+            args=args,
+            kwargs=kwargs,
+            queue=self.queue.value,
+            priority=(options.priority or self.priority).value,
+            countdown=options.countdown,
+            eta=options.eta,
+        )
+        return result.id
+
+    def _run_eager(self, args: tuple, kwargs: dict) -> str:
+        """Выполнить задачу в текущем процессе (без брокера)."""
+        job_id = str(uuid4())
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._func(*args, **kwargs))
+            return job_id
+
+        async def runner() -> None:
+            try:
+                await self._func(*args, **kwargs)
+            except Exception:
+                logger.exception(f"Eager job {self.name} failed (id={job_id})")
+
+        task = loop.create_task(runner(), name=f"job:{self.name}:{job_id}")
+        _eager_tasks.add(task)
+        task.add_done_callback(_eager_tasks.discard)
+        return job_id
+
+
+def job(
+    name: Optional[str] = None,
+    queue: JobQueue = JobQueue.IO,
+    priority: JobPriority = JobPriority.NORMAL,
+    max_retries: int = 5,
+    retry_backoff_max: int = 600,
+    ignore_result: bool = True,
+) -> Callable[[Callable[P, Awaitable[R]]], Job[P, R]]:
+    """
+    Декоратор для объявления фоновой задачи.
+
+    Аргументы задачи должны быть JSON-сериализуемыми (передавайте ID, а не сущности).
+
+    Args:
+        name: Имя задачи (по умолчанию module.function)
+        queue: Очередь
+        priority: Приоритет по умолчанию
+        max_retries: Максимум повторов при ошибке
+        retry_backoff_max: Максимальная задержка между повторами (секунды)
+        ignore_result: Не сохранять результат в result backend
+
+    Returns:
+        Декоратор
+
+    Example:
+        ```python
+        @job(queue=JobQueue.LLM)
+        async def index_document_job(document_id: str) -> None:
+            ...
+
+        index_document_job.enqueue(document_id="...")
+        ```
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Job[P, R]:
+        return Job(
+            func,
+            name=name or f"{func.__module__}.{func.__name__}",
+            queue=queue,
+            priority=priority,
+            max_retries=max_retries,
+            retry_backoff_max=retry_backoff_max,
+            ignore_result=ignore_result,
+        )
+
+    return decorator
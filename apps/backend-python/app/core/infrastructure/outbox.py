@@ -0,0 +1,401 @@
+"""
+Transactional Outbox
+
+Доменные события агрегата записываются в таблицу outbox_events в той же
+транзакции, что и сам агрегат. Фоновый OutboxDispatcher читает таблицу
+батчами (FOR UPDATE SKIP LOCKED, безопасно для нескольких реплик) и
+доставляет события in-process подписчикам (event_bus) и в Redis Stream.
+
+Семантика доставки: at-least-once. Публикация в Redis Stream - best
+effort: без Redis (или при его ошибке) событие доставляется только
+in-process подписчикам и все равно помечается доставленным, чтобы
+подписчики не выполнялись повторно. Доставленные записи удаляет
+периодическая задача prune_dispatched_events.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from redis.exceptions import RedisError
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, delete, func, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config import settings
+from app.core.domain.aggregate_root import AggregateRoot
+from app.core.domain.domain_event import DomainEvent
+from app.core.infrastructure.cache import RedisClient, redis_client
+from app.core.infrastructure.database import Base, async_session_factory
+from app.core.infrastructure.event_bus import EventBus, EventEnvelope, event_bus
+from app.core.infrastructure.scheduler import run_in_chunks
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxEventModel(Base):
+    """
+    SQLAlchemy модель записи outbox.
+
+    Table: outbox_events
+    """
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+        comment="Порядковый номер записи",
+    )
+    event_id: Mapped[str] = mapped_column(
+        String(36),
+        nullable=False,
+        unique=True,
+        comment="ID события (для дедупликации у подписчиков)",
+    )
+    event_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Тип события (имя класса)",
+    )
+    aggregate_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Тип агрегата",
+    )
+    aggregate_id: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="ID агрегата",
+    )
+    payload: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Данные события",
+    )
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Время возникновения события",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Время записи в outbox",
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Не доставлять раньше этого времени (backoff после ошибки)",
+    )
+    dispatched_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Время успешной доставки",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Количество неудачных попыток доставки",
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Последняя ошибка доставки",
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_outbox_events_pending",
+            "available_at",
+            "id",
+            postgresql_where=dispatched_at.is_(None),
+        ),
+        Index("idx_outbox_events_aggregate", "aggregate_type", "aggregate_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxEvent(id={self.id}, type={self.event_type}, aggregate={self.aggregate_id})>"
+
+
+def _json_default(value: Any) -> Any:
+    """Сериализация нестандартных типов в JSON."""
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+def serialize_event(event: DomainEvent) -> Dict[str, Any]:
+    """
+    Сериализовать доменное событие в JSON-совместимый словарь.
+
+    Поддерживает оба вида событий в кодовой базе: dataclass события и
+    события на базе DomainEvent.__init__ с to_dict().
+
+    Args:
+        event: Доменное событие
+
+    Returns:
+        Словарь с данными события
+    """
+    if dataclasses.is_dataclass(event):
+        data = dataclasses.asdict(event)
+    elif hasattr(event, "to_dict"):
+        data = event.to_dict()
+    else:
+        data = dict(vars(event))
+    return json.loads(json.dumps(data, default=_json_default))
+
+
+def record_events(session: AsyncSession, aggregate: AggregateRoot) -> None:
+    """
+    Записать события агрегата в outbox (в текущей транзакции сессии).
+
+    Вызывается репозиторием в save() до flush. После записи события
+    удаляются из агрегата, чтобы не быть записанными повторно.
+
+    Args:
+        session: Сессия, в которой сохраняется агрегат
+        aggregate: Агрегат с накопленными событиями
+    """
+    events = aggregate.domain_events
+    if not events:
+        return
+
+    aggregate_type = type(aggregate).__name__
+    now = datetime.utcnow()
+
+    for event in events:
+        session.add(
+            OutboxEventModel(
+                event_id=str(getattr(event, "event_id", None) or uuid4()),
+                event_type=type(event).__name__,
+                aggregate_type=aggregate_type,
+                aggregate_id=str(getattr(event, "aggregate_id", None) or aggregate.id),
+                payload=serialize_event(event),
+                occurred_at=getattr(event, "occurred_at", None) or now,
+            )
+        )
+
+    aggregate.clear_domain_events()
+
+
+class OutboxDispatcher:
+    """
+    Фоновый диспетчер outbox.
+
+    Забирает батч недоставленных событий с блокировкой строк
+    (FOR UPDATE SKIP LOCKED), доставляет их и помечает доставленными
+    в той же транзакции. Несколько реплик обрабатывают разные батчи.
+
+    При ошибке событие откладывается с экспоненциальным backoff.
+    После max_attempts событие остается в таблице (dead letter) для
+    ручного разбора.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        bus: EventBus = event_bus,
+        redis: RedisClient = redis_client,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+        stream_name: Optional[str] = "domain-events",
+        stream_maxlen: int = 100_000,
+    ) -> None:
+        """
+        Args:
+            session_factory: Фабрика сессий БД
+            bus: Event bus с in-process подписчиками
+            redis: Redis клиент (для публикации в stream)
+            batch_size: Размер батча
+            poll_interval: Пауза между опросами при пустой очереди (секунды)
+            max_attempts: Максимум попыток доставки
+            stream_name: Имя Redis Stream (None - не публиковать)
+            stream_maxlen: Приблизительная максимальная длина stream
+        """
+        self._session_factory = session_factory
+        self._bus = bus
+        self._redis = redis
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._stream_name = stream_name
+        self._stream_maxlen = stream_maxlen
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        """Запустить диспетчер в фоне."""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run(), name="outbox-dispatcher")
+
+    async def stop(self) -> None:
+        """Остановить диспетчер (дожидается текущего батча)."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def run(self) -> None:
+        """Основной цикл: батчи подряд, пока очередь не пуста, затем пауза."""
+        logger.info("Outbox dispatcher started")
+        while not self._stopping.is_set():
+            try:
+                processed = await self.dispatch_batch()
+            except Exception:
+                logger.exception("Outbox dispatch batch failed")
+                processed = 0
+
+            if processed < self._batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        logger.info("Outbox dispatcher stopped")
+
+    async def dispatch_batch(self) -> int:
+        """
+        Доставить один батч событий.
+
+        Returns:
+            Количество обработанных записей
+        """
+        async with self._session_factory() as session:
+            async with session.begin():
+                stmt = (
+                    select(OutboxEventModel)
+                    .where(
+                        OutboxEventModel.dispatched_at.is_(None),
+                        OutboxEventModel.available_at <= func.now(),
+                        OutboxEventModel.attempts < self._max_attempts,
+                    )
+                    .order_by(OutboxEventModel.id)
+                    .limit(self._batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                rows: List[OutboxEventModel] = list((await session.execute(stmt)).scalars())
+
+                for row in rows:
+                    try:
+                        await self._deliver(row)
+                        row.dispatched_at = datetime.utcnow()
+                        row.last_error = None
+                    except Exception as e:
+                        row.attempts += 1
+                        row.last_error = str(e)[:2000]
+                        row.available_at = datetime.utcnow() + timedelta(
+                            seconds=min(2 ** row.attempts, 600)
+                        )
+                        if row.attempts >= self._max_attempts:
+                            logger.error(
+                                f"Outbox event {row.event_id} ({row.event_type}) "
+                                f"moved to dead letter after {row.attempts} attempts"
+                            )
+
+                return len(rows)
+
+    async def _deliver(self, row: OutboxEventModel) -> None:
+        """Доставить одно событие подписчикам и в Redis Stream."""
+        envelope = EventEnvelope(
+            event_id=row.event_id,
+            event_type=row.event_type,
+            aggregate_type=row.aggregate_type,
+            aggregate_id=row.aggregate_id,
+            payload=row.payload,
+            occurred_at=row.occurred_at,
+        )
+
+        await self._bus.publish(envelope)
+
+        if self._stream_name and self._redis.is_connected:
+            await self._publish_stream(envelope)
+
+    async def _publish_stream(self, envelope: EventEnvelope) -> None:
+        """
+        Опубликовать событие в Redis Stream (best effort).
+
+        Ошибка Redis не должна возвращать событие в очередь: подписчики
+        уже отработали, повторная доставка продублирует их эффекты.
+        """
+        try:
+            await self._redis.client.xadd(
+                self._stream_name,
+                {
+                    "event_id": envelope.event_id,
+                    "event_type": envelope.event_type,
+                    "aggregate_type": envelope.aggregate_type,
+                    "aggregate_id": envelope.aggregate_id,
+                    "occurred_at": envelope.occurred_at.isoformat(),
+                    "payload": json.dumps(envelope.payload),
+                },
+                maxlen=self._stream_maxlen,
+                approximate=True,
+            )
+        except (RedisError, OSError) as e:
+            logger.warning(
+                f"Outbox event {envelope.event_id} was not published to stream "
+                f"{self._stream_name}: {e}"
+            )
+
+
+async def prune_dispatched_events() -> int:
+    """
+    Удалить доставленные события старше срока хранения.
+
+    Dead letter записи (не доставлены) не удаляются.
+
+    Returns:
+        Количество удаленных записей
+    """
+    chunk_size = settings.scheduler_chunk_size
+    dispatched_before = datetime.utcnow() - timedelta(days=settings.outbox_retention_days)
+
+    async def process_chunk() -> int:
+        async with async_session_factory() as session:
+            async with session.begin():
+                ids = (
+                    select(OutboxEventModel.id)
+                    .where(OutboxEventModel.dispatched_at < dispatched_before)
+                    .order_by(OutboxEventModel.id)
+                    .limit(chunk_size)
+                    .scalar_subquery()
+                )
+                result = await session.execute(
+                    delete(OutboxEventModel).where(OutboxEventModel.id.in_(ids))
+                )
+                return result.rowcount
+
+    return await run_in_chunks(process_chunk, chunk_size, settings.scheduler_max_chunks)
+
+
+# Глобальный диспетчер outbox
+outbox_dispatcher = OutboxDispatcher(
+    batch_size=settings.outbox_batch_size,
+    poll_interval=settings.outbox_poll_interval_seconds,
+    max_attempts=settings.outbox_max_attempts,
+    stream_name=settings.outbox_stream_name or None,
+)
@@ -0,0 +1,451 @@
+"""
+Rate Limiter Infrastructure
+
+Распределенный rate limiter на основе token bucket в Redis.
+
+Корзины хранятся в Redis hash и обновляются атомарным Lua скриптом,
+поэтому лимиты общие для всех воркеров. Если Redis недоступен,
+используется in-process fallback (лимиты становятся per-process).
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Optional, Sequence
+
+from fastapi import HTTPException, Request, status
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.core.infrastructure.cache import RedisClient, redis_client
+
+logger = logging.getLogger(__name__)
+
+
+# Атомарная проверка нескольких корзин за один round-trip.
+# Токены списываются только если ВСЕ корзины разрешают запрос.
+# KEYS: ключи корзин
+# ARGV: [capacity, refill_rate, cost, allow_debt] * len(KEYS)
+# Время берется из Redis (TIME), чтобы не зависеть от расхождения часов воркеров.
+TOKEN_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local n = #KEYS
+local tokens = {}
+local allowed = 1
+local retry_after = 0
+local remaining = -1
+
+for i = 1, n do
+    local base = (i - 1) * 4
+    local capacity = tonumber(ARGV[base + 1])
+    local rate = tonumber(ARGV[base + 2])
+    local cost = tonumber(ARGV[base + 3])
+    local allow_debt = tonumber(ARGV[base + 4])
+
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local current = tonumber(state[1])
+    local ts = tonumber(state[2])
+    if current == nil then
+        current = capacity
+        ts = now
+    end
+    current = math.min(capacity, current + math.max(0, now - ts) * rate)
+    tokens[i] = current
+
+    if allow_debt == 0 and current < cost then
+        allowed = 0
+        local wait = (cost - current) / rate
+        if wait > retry_after then
+            retry_after = wait
+        end
+    end
+end
+
+for i = 1, n do
+    local base = (i - 1) * 4
+    local capacity = tonumber(ARGV[base + 1])
+    local rate = tonumber(ARGV[base + 2])
+    local cost = tonumber(ARGV[base + 3])
+    local current = tokens[i]
+    if allowed == 1 then
+        current = math.max(-capacity, current - cost)
+    end
+    redis.call('HSET', KEYS[i], 'tokens', current, 'ts', now)
+    redis.call('PEXPIRE', KEYS[i], math.ceil((capacity * 2 / rate) * 1000) + 1000)
+    if remaining < 0 or current < remaining then
+        remaining = current
+    end
+end
+
+return {allowed, tostring(remaining), tostring(retry_after)}
+"""
+
+
+class RateLimitScope(str, Enum):
+    """Область действия лимита."""
+
+    USER = "user"  # Отдельная корзина на пользователя
+    IP = "ip"  # Отдельная корзина на IP адрес
+    GLOBAL = "global"  # Одна корзина на весь route
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    Правило ограничения (параметры token bucket).
+
+    Attributes:
+        name: Имя правила (входит в ключ корзины, например "auth:login")
+        capacity: Размер корзины (максимальный burst)
+        refill_rate: Скорость пополнения (токенов в секунду)
+        scope: Область действия лимита
+    """
+
+    name: str
+    capacity: float
+    refill_rate: float
+    scope: RateLimitScope = RateLimitScope.USER
+
+    @classmethod
+    def per_minute(
+        cls,
+        name: str,
+        limit: float,
+        scope: RateLimitScope = RateLimitScope.USER,
+        burst: Optional[float] = None,
+    ) -> "RateLimitRule":
+        """Создает правило "limit запросов в минуту"."""
+        return cls(name=name, capacity=burst or limit, refill_rate=limit / 60, scope=scope)
+
+    @classmethod
+    def per_hour(
+        cls,
+        name: str,
+        limit: float,
+        scope: RateLimitScope = RateLimitScope.USER,
+        burst: Optional[float] = None,
+    ) -> "RateLimitRule":
+        """Создает правило "limit единиц в час" (например, LLM токенов)."""
+        return cls(name=name, capacity=burst or limit, refill_rate=limit / 3600, scope=scope)
+
+
+@dataclass(frozen=True)
+class RateLimitCheck:
+    """
+    Одна проверка: правило + идентификатор + стоимость.
+
+    Attributes:
+        rule: Правило ограничения
+        identity: Идентификатор (user_id, IP или route)
+        cost: Сколько токенов списать
+        allow_debt: Списать без проверки (пост-фактум учет стоимости)
+    """
+
+    rule: RateLimitRule
+    identity: str
+    cost: float = 1.0
+    allow_debt: bool = False
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Результат проверки лимита."""
+
+    allowed: bool
+    remaining: float
+    retry_after: float
+
+
+class RateLimitExceeded(Exception):
+    """Лимит запросов превышен."""
+
+    def __init__(self, rule_name: str, retry_after: float) -> None:
+        self.rule_name = rule_name
+        self.retry_after = retry_after
+        super().__init__(f"Rate limit exceeded for {rule_name}. Retry after {retry_after:.1f}s")
+
+
+class InMemoryTokenBucketStore:
+    """
+    In-process хранилище корзин (fallback при недоступности Redis).
+
+    Семантика совпадает с Lua скриптом. Количество корзин ограничено (LRU),
+    чтобы не расти бесконечно при большом числе пользователей.
+    """
+
+    def __init__(self, max_buckets: int = 10_000) -> None:
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._max_buckets = max_buckets
+
+    def _refill(self, key: str, rule: RateLimitRule, now: float) -> float:
+        tokens, ts = self._buckets.get(key, (rule.capacity, now))
+        return min(rule.capacity, tokens + max(0.0, now - ts) * rule.refill_rate)
+
+    def acquire(self, keys: Sequence[str], checks: Sequence[RateLimitCheck]) -> RateLimitResult:
+        """
+        Проверить и списать токены из нескольких корзин атомарно.
+
+        Args:
+            keys: Ключи корзин
+            checks: Проверки (в том же порядке)
+
+        Returns:
+            RateLimitResult
+        """
+        now = time.monotonic()
+        current = [self._refill(key, check.rule, now) for key, check in zip(keys, checks, strict=True)]
+
+        retry_after = 0.0
+        for tokens, check in zip(current, checks, strict=True):
+            if not check.allow_debt and tokens < check.cost:
+                retry_after = max(retry_after, (check.cost - tokens) / check.rule.refill_rate)
+        allowed = retry_after == 0.0
+
+        for key, tokens, check in zip(keys, current, checks, strict=True):
+            if allowed:
+                tokens = max(-check.rule.capacity, tokens - check.cost)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+        while len(self._buckets) > self._max_buckets:
+            self._buckets.popitem(last=False)
+
+        remaining = min(self._buckets[key][0] for key in keys)
+        return RateLimitResult(allowed=allowed, remaining=remaining, retry_after=retry_after)
+
+
+class RateLimiter:
+    """
+    Распределенный rate limiter (token bucket).
+
+    Поддерживает:
+    - per-user / per-IP / per-route лимиты (RateLimitScope)
+    - лимиты по стоимости (например, LLM токены): предварительная проверка
+      с cost=0 (бюджет не исчерпан) и списание фактической стоимости
+      после выполнения через charge()
+    - in-process fallback при недоступности Redis
+    """
+
+    KEY_PREFIX = "ratelimit"
+
+    def __init__(self, redis: RedisClient, enabled: bool = True) -> None:
+        """
+        Args:
+            redis: Redis клиент
+            enabled: Включен ли rate limiting
+        """
+        self._redis = redis
+        self._enabled = enabled
+        self._fallback = InMemoryTokenBucketStore()
+        self._script = None
+
+    def _key(self, check: RateLimitCheck) -> str:
+        return f"{self.KEY_PREFIX}:{check.rule.name}:{check.identity}"
+
+    async def acquire(self, checks: Sequence[RateLimitCheck]) -> RateLimitResult:
+        """
+        Проверить и списать токены из всех корзин атомарно.
+
+        Args:
+            checks: Проверки
+
+        Returns:
+            RateLimitResult (allowed=False если хотя бы одна корзина пуста)
+        """
+        if not self._enabled or not checks:
+            return RateLimitResult(allowed=True, remaining=float("inf"), retry_after=0.0)
+
+        keys = [self._key(check) for check in checks]
+
+        if self._redis.is_connected:
+            try:
+                return await self._acquire_redis(keys, checks)
+            except (RedisError, OSError) as e:
+                logger.warning(f"Rate limiter falls back to in-process buckets: {e}")
+
+        return self._fallback.acquire(keys, checks)
+
+    async def _acquire_redis(
+        self,
+        keys: Sequence[str],
+        checks: Sequence[RateLimitCheck],
+    ) -> RateLimitResult:
+        if self._script is None:
+            self._script = self._redis.client.register_script(TOKEN_BUCKET_SCRIPT)
+
+        args: list[float] = []
+        for check in checks:
+            args.extend(
+                [check.rule.capacity, check.rule.refill_rate, check.cost, int(check.allow_debt)]
+            )
+
+        allowed, remaining, retry_after = await self._script(keys=list(keys), args=args)
+        return RateLimitResult(
+            allowed=bool(int(allowed)),
+            remaining=float(remaining),
+            retry_after=float(retry_after),
+        )
+
+    async def enforce(self, checks: Sequence[RateLimitCheck]) -> RateLimitResult:
+        """
+        Как acquire(), но выбрасывает исключение при превышении лимита.
+
+        Raises:
+            RateLimitExceeded: Если лимит превышен
+        """
+        result = await self.acquire(checks)
+        if not result.allowed:
+            rule_names = ",".join(check.rule.name for check in checks)
+            raise RateLimitExceeded(rule_names, result.retry_after)
+        return result
+
+    async def charge(self, rule: RateLimitRule, identity: str, cost: float) -> None:
+        """
+        Списать фактическую стоимость без проверки (корзина может уйти в минус).
+
+        Используется для бюджетов по LLM токенам: стоимость известна только
+        после ответа модели. Пока корзина в минусе, предварительная проверка
+        с cost=0 будет отклонять запросы.
+
+        Args:
+            rule: Правило
+            identity: Идентификатор
+            cost: Фактическая стоимость
+        """
+        if cost <= 0:
+            return
+        await self.acquire([RateLimitCheck(rule, identity, cost=cost, allow_debt=True)])
+
+
+# Правила по умолчанию
+class RateLimits:
+    """Набор правил rate limiting приложения."""
+
+    AUTH_REGISTER = RateLimitRule.per_minute(
+        "auth:register", settings.rate_limit_auth_per_minute, scope=RateLimitScope.IP
+    )
+    AUTH_LOGIN = RateLimitRule.per_minute(
+        "auth:login", settings.rate_limit_auth_per_minute, scope=RateLimitScope.IP
+    )
+    # OTP: и по IP, и по номеру телефона/email (защита от перебора кода)
+    OTP_VERIFY_IP = RateLimitRule.per_minute(
+        "otp:verify:ip", settings.rate_limit_otp_per_minute, scope=RateLimitScope.IP
+    )
+    OTP_VERIFY_TARGET = RateLimitRule.per_hour(
+        "otp:verify:target", settings.rate_limit_otp_per_hour, scope=RateLimitScope.USER
+    )
+    CHAT_MESSAGE = RateLimitRule.per_minute(
+        "chat:message", settings.rate_limit_chat_messages_per_minute
+    )
+    CHAT_ROUTE = RateLimitRule.per_minute(
+        "chat:route",
+        settings.rate_limit_chat_route_per_minute,
+        scope=RateLimitScope.GLOBAL,
+    )
+    CHAT_LLM_TOKENS = RateLimitRule.per_hour(
+        "chat:llm_tokens", settings.rate_limit_llm_tokens_per_hour
+    )
+    # Квота провайдера LLM (общая для всех воркеров)
+    LLM_TOKENS_PER_MINUTE = RateLimitRule.per_minute(
+        "llm:tokens",
+        settings.llm_scheduler_tokens_per_minute,
+        scope=RateLimitScope.GLOBAL,
+    )
+
+
+# Глобальный экземпляр rate limiter
+rate_limiter = RateLimiter(redis_client, enabled=settings.rate_limit_enabled)
+
+
+def client_ip(request: Request) -> str:
+    """
+    Определить IP клиента за доверенными прокси.
+
+    X-Real-IP выставляет nginx ($remote_addr). В X-Forwarded-For каждый
+    прокси дописывает адрес справа, а левые значения присылает клиент,
+    поэтому берется N-е значение справа (N - число доверенных прокси).
+    Без доверенных прокси заголовки игнорируются.
+
+    Args:
+        request: HTTP запрос
+
+    Returns:
+        IP адрес
+    """
+    hops = settings.rate_limit_trusted_proxy_hops
+    if hops > 0:
+        real_ip = request.headers.get("x-real-ip")
+        if real_ip:
+            return real_ip.strip()
+        forwarded = [
+            value.strip()
+            for value in request.headers.get("x-forwarded-for", "").split(",")
+            if value.strip()
+        ]
+        if forwarded:
+            return forwarded[-min(hops, len(forwarded))]
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(
+    *rules: RateLimitRule,
+    identity: Optional[Callable[[Request], str]] = None,
+    cost: float = 1.0,
+) -> Callable[[Request], Awaitable[None]]:
+    """
+    Dependency factory для ограничения частоты запросов.
+
+    Идентификатор корзины определяется scope правила:
+    USER - через identity(request) (по умолчанию IP), IP - IP клиента,
+    GLOBAL - путь маршрута.
+
+    Args:
+        rules: Правила (проверяются атомарно)
+        identity: Функция получения идентификатора пользователя
+        cost: Стоимость запроса
+
+    Returns:
+        FastAPI dependency
+
+    Example:
+        ```python
+        @router.post("/login", dependencies=[Depends(rate_limit(RateLimits.AUTH_LOGIN))])
+        async def login(...): ...
+        ```
+    """
+    resolve_identity = identity or client_ip
+
+    async def dependency(request: Request) -> None:
+        checks = []
+        for rule in rules:
+            if rule.scope == RateLimitScope.GLOBAL:
+                route = request.scope.get("route")
+                key = getattr(route, "path", request.url.path)
+            elif rule.scope == RateLimitScope.IP:
+                key = client_ip(request)
+            else:
+                key = resolve_identity(request)
+            checks.append(RateLimitCheck(rule=rule, identity=key, cost=cost))
+
+        try:
+            await rate_limiter.enforce(checks)
+        except RateLimitExceeded as e:
+            raise_too_many_requests(e)
+
+    return dependency
+
+
+def raise_too_many_requests(error: RateLimitExceeded) -> None:
+    """
+    Преобразовать RateLimitExceeded в HTTP 429.
+
+    Raises:
+        HTTPException: 429 с заголовком Retry-After
+    """
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests. Please try again later.",
+        headers={"Retry-After": str(max(1, int(error.retry_after + 0.999)))},
+    )
@@ -0,0 +1,401 @@
+"""
+Scheduler Infrastructure
+
+Cron-планировщик периодических задач обслуживания, работающий внутри
+процессов API/воркеров.
+
+- Лидер выбирается через Postgres advisory lock: задачи выполняет только
+  одна реплика, добавление реплик не умножает работу. При потере
+  соединения лидерство переходит к другой реплике.
+- Защита от наложения: задача не запускается, если предыдущий запуск
+  еще выполняется (локальный флаг + advisory lock на время выполнения).
+- Jitter: случайная задержка перед запуском, чтобы задачи с одинаковым
+  расписанием не стартовали одновременно.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.infrastructure.database import engine as default_engine
+
+logger = logging.getLogger(__name__)
+
+
+def advisory_lock_key(name: str) -> int:
+    """Стабильный 64-битный ключ advisory lock по имени."""
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+
+
+class CronExpression:
+    """
+    Cron выражение из 5 полей: минута, час, день месяца, месяц, день недели.
+
+    Поддерживается: `*`, `*/n`, `a-b`, `a-b/n`, `a/n` (= `a-max/n`),
+    списки через запятую.
+    День недели: 0-6 (0 = воскресенье).
+
+    Example:
+        ```python
+        CronExpression("*/5 * * * *").next_after(datetime.utcnow())
+        ```
+    """
+
+    _RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression: str) -> None:
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Invalid cron expression (expected 5 fields): {expression}")
+
+        self.expression = expression
+        fields = [self._parse_field(part, lo, hi) for part, (lo, hi) in zip(parts, self._RANGES, strict=True)]
+        self._minutes, self._hours, self._days, self._months, self._weekdays = fields
+        # Как в cron: если заданы и день месяца, и день недели - достаточно любого
+        self._day_any = parts[2] == "*"
+        self._weekday_any = parts[4] == "*"
+
+    @staticmethod
+    def _parse_field(part: str, lo: int, hi: int) -> FrozenSet[int]:
+        values = set()
+        for item in part.split(","):
+            step = None
+            if "/" in item:
+                item, step_str = item.split("/", 1)
+                step = int(step_str)
+            if item == "*":
+                start, end = lo, hi
+            elif "-" in item:
+                start_str, end_str = item.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = int(item)
+                # Как в cron: "a/n" - от a до конца диапазона с шагом n
+                end = hi if step is not None else start
+            step = 1 if step is None else step
+            if start < lo or end > hi or start > end or step < 1:
+                raise ValueError(f"Cron field out of range: {part}")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, dt: datetime) -> bool:
+        weekday = (dt.weekday() + 1) % 7  # Python: 0 = понедельник
+        day_ok = dt.day in self._days
+        weekday_ok = weekday in self._weekdays
+        if self._day_any or self._weekday_any:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Ближайшее время запуска строго после moment.
+
+        Args:
+            moment: Точка отсчета (UTC)
+
+        Returns:
+            Время следующего запуска
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+
+        while candidate < limit:
+            if candidate.month not in self._months or not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self._hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self._minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"Cron expression never fires: {self.expression}")
+
+
+@dataclass
+class ScheduledJob:
+    """
+    Периодическая задача.
+
+    Attributes:
+        name: Уникальное имя задачи
+        func: Async функция без аргументов
+        cron: Расписание
+        jitter_seconds: Максимальная случайная задержка перед запуском
+        timeout_seconds: Максимальное время выполнения
+    """
+
+    name: str
+    func: Callable[[], Awaitable[object]]
+    cron: CronExpression
+    jitter_seconds: float = 30.0
+    timeout_seconds: float = 600.0
+    next_run_at: Optional[datetime] = None
+    running: bool = field(default=False, init=False)
+
+
+class LeaderElection:
+    """
+    Выбор лидера через session-level advisory lock Postgres.
+
+    Лок удерживается на выделенном соединении, пока процесс жив.
+    Если соединение рвется, Postgres освобождает лок автоматически.
+    """
+
+    def __init__(self, engine: AsyncEngine, name: str) -> None:
+        self._engine = engine
+        self._key = advisory_lock_key(f"scheduler-leader:{name}")
+        self._connection: Optional[AsyncConnection] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._connection is not None
+
+    async def try_acquire(self) -> bool:
+        """Попытаться стать лидером (или проверить, что лидерство сохранено)."""
+        if self._connection is not None:
+            try:
+                await self._connection.execute(text("SELECT 1"))
+                # Не оставляем соединение "idle in transaction": его закроет
+                # idle_in_transaction_session_timeout вместе с локом
+                await self._connection.commit()
+                return True
+            except Exception as e:
+                logger.warning(f"Scheduler lost leadership: {e}")
+                await self.release()
+                return False
+
+        connection = await self._engine.connect()
+        try:
+            acquired = (
+                await connection.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key}
+                )
+            ).scalar()
+            # Завершаем неявную транзакцию, лок session-level остается
+            await connection.commit()
+        except Exception:
+            await connection.close()
+            raise
+
+        if not acquired:
+            await connection.close()
+            return False
+
+        self._connection = connection
+        logger.info("Scheduler leadership acquired")
+        return True
+
+    async def release(self) -> None:
+        """Отказаться от лидерства."""
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        try:
+            await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._key})
+            await connection.commit()
+        except Exception:
+            pass
+        finally:
+            await connection.close()
+
+
+class Scheduler:
+    """
+    Планировщик периодических задач с выбором лидера.
+
+    Example:
+        ```python
+        scheduler.register("expire-subscriptions", "*/5 * * * *", expire_subscriptions)
+        scheduler.start()
+        ```
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine = default_engine,
+        name: str = "maintenance",
+        tick_seconds: float = 5.0,
+        election_interval_seconds: float = 15.0,
+    ) -> None:
+        """
+        Args:
+            engine: SQLAlchemy async engine (для advisory locks)
+            name: Имя группы планировщика (один лидер на группу)
+            tick_seconds: Период проверки расписания
+            election_interval_seconds: Период попыток стать лидером
+        """
+        self._engine = engine
+        self._election = LeaderElection(engine, name)
+        self._tick_seconds = tick_seconds
+        self._election_interval = election_interval_seconds
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._running_tasks: List[asyncio.Task] = []
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def jobs(self) -> List[ScheduledJob]:
+        return list(self._jobs.values())
+
+    def register(
+        self,
+        name: str,
+        cron: str,
+        func: Callable[[], Awaitable[object]],
+        jitter_seconds: float = 30.0,
+        timeout_seconds: float = 600.0,
+    ) -> None:
+        """
+        Зарегистрировать периодическую задачу.
+
+        Args:
+            name: Уникальное имя
+            cron: Cron выражение (UTC)
+            func: Async функция без аргументов
+            jitter_seconds: Максимальная случайная задержка перед запуском
+            timeout_seconds: Максимальное время выполнения
+        """
+        if name in self._jobs:
+            raise ValueError(f"Scheduled job already registered: {name}")
+        self._jobs[name] = ScheduledJob(
+            name=name,
+            func=func,
+            cron=CronExpression(cron),
+            jitter_seconds=jitter_seconds,
+            timeout_seconds=timeout_seconds,
+        )
+
+    def start(self) -> None:
+        """Запустить планировщик в фоне."""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="scheduler")
+
+    async def stop(self) -> None:
+        """Остановить планировщик и дождаться выполняющихся задач."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        if self._running_tasks:
+            await asyncio.gather(*self._running_tasks, return_exceptions=True)
+        await self._election.release()
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self) -> None:
+        logger.info(f"Scheduler started with {len(self._jobs)} jobs")
+        while not self._stopping.is_set():
+            try:
+                is_leader = await self._election.try_acquire()
+            except Exception as e:
+                logger.warning(f"Scheduler leader election failed: {e}")
+                is_leader = False
+
+            if not is_leader:
+                # Сбрасываем расписание: новый лидер планирует запуски заново
+                for job in self._jobs.values():
+                    job.next_run_at = None
+                await self._sleep(self._election_interval)
+                continue
+
+            now = datetime.utcnow()
+            for job in self._jobs.values():
+                if job.next_run_at is None:
+                    job.next_run_at = job.cron.next_after(now)
+                elif job.next_run_at <= now:
+                    job.next_run_at = job.cron.next_after(now)
+                    if job.running:
+                        logger.warning(f"Scheduled job {job.name} skipped: previous run in progress")
+                        continue
+                    task = asyncio.create_task(self._execute(job), name=f"scheduled:{job.name}")
+                    self._running_tasks.append(task)
+
+            self._running_tasks = [t for t in self._running_tasks if not t.done()]
+            await self._sleep(self._tick_seconds)
+        logger.info("Scheduler stopped")
+
+    async def _execute(self, job: ScheduledJob) -> None:
+        """Выполнить задачу с jitter, advisory lock и таймаутом."""
+        job.running = True
+        try:
+            if job.jitter_seconds > 0:
+                await self._sleep(random.uniform(0, job.jitter_seconds))
+            if self._stopping.is_set():
+                return
+
+            # Advisory lock на время выполнения: защищает от наложения при
+            # смене лидера, пока предыдущий лидер еще выполняет задачу
+            async with self._engine.connect() as connection:
+                key = advisory_lock_key(f"scheduled-job:{job.name}")
+                acquired = (
+                    await connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})
+                ).scalar()
+                await connection.commit()
+                if not acquired:
+                    logger.warning(f"Scheduled job {job.name} is running elsewhere, skipping")
+                    return
+
+                started = asyncio.get_running_loop().time()
+                try:
+                    result = await asyncio.wait_for(job.func(), timeout=job.timeout_seconds)
+                    elapsed = asyncio.get_running_loop().time() - started
+                    logger.info(f"Scheduled job {job.name} finished in {elapsed:.2f}s: {result}")
+                except asyncio.TimeoutError:
+                    logger.error(f"Scheduled job {job.name} timed out after {job.timeout_seconds}s")
+                except Exception:
+                    logger.exception(f"Scheduled job {job.name} failed")
+                finally:
+                    await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                    await connection.commit()
+        finally:
+            job.running = False
+
+
+async def run_in_chunks(
+    process_chunk: Callable[[], Awaitable[int]],
+    chunk_size: int,
+    max_chunks: int,
+) -> int:
+    """
+    Выполнять обработку чанками, пока чанк заполнен целиком.
+
+    Каждый чанк - отдельная короткая транзакция, чтобы не держать
+    блокировки на всем наборе строк.
+
+    Args:
+        process_chunk: Обрабатывает один чанк и возвращает количество строк
+        chunk_size: Размер чанка
+        max_chunks: Максимум чанков за один запуск
+
+    Returns:
+        Общее количество обработанных строк
+    """
+    total = 0
+    for _ in range(max_chunks):
+        processed = await process_chunk()
+        total += processed
+        if processed < chunk_size:
+            break
+        # Отдаем управление event loop между чанками
+        await asyncio.sleep(0)
+    return total
+
+
+# Глобальный планировщик
+scheduler = Scheduler()
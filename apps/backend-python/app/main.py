@@ -8,12 +8,23 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, WebSocket, Query, Depends
+from fastapi import FastAPI, WebSocket, Query, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import settings
 from app.core.infrastructure.database import init_db, close_db
+from app.core.infrastructure.cache import redis_client
+from app.core.infrastructure.event_bus import event_bus
+from app.core.infrastructure.outbox import outbox_dispatcher, prune_dispatched_events
+from app.core.infrastructure.scheduler import scheduler
+from app.core.infrastructure.idempotency import (
+    IdempotencyMiddleware,
+    IdempotentReplay,
+    idempotent_replay_handler,
+)
+from app.modules.consultation.presentation import availability_router, emergency_router
+from app.modules.identity.infrastructure.services.jwt_service import JWTService
 
 # Настройка логирования
 logging.basicConfig(
@@ -42,12 +53,89 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Initializing database...")
         await init_db()
 
+    # Подключение к Redis (при недоступности rate limiter работает in-process)
+    try:
+        await redis_client.connect()
+        await redis_client.client.ping()
+    except Exception as e:
+        logger.warning(f"Redis is unavailable, falling back to in-process mode: {e}")
+        await redis_client.disconnect()
+
+    # Подписчики на доменные события
+    from app.modules.chat.infrastructure.event_handlers import (
+        register_event_handlers as register_chat_event_handlers,
+    )
+    from app.modules.consultation.infrastructure.event_handlers import (
+        register_event_handlers as register_consultation_event_handlers,
+    )
+    from app.modules.lawyer.infrastructure.event_handlers import (
+        register_event_handlers as register_lawyer_event_handlers,
+    )
+
+    register_chat_event_handlers(event_bus)
+    register_consultation_event_handlers(event_bus)
+    register_lawyer_event_handlers(event_bus)
+
+    # Поиск юристов для экстренных консультаций (нужен Redis)
+    from app.modules.consultation.infrastructure import emergency_dispatcher
+
+    emergency_dispatcher.start()
+
+    # Доставка сообщений чата соединениям на других воркерах (нужен Redis)
+    from app.modules.chat.presentation.websocket import manager as chat_ws_manager
+
+    chat_ws_manager.start()
+
+    # In-memory индекс поиска юристов (строится из БД при старте)
+    from app.modules.lawyer.infrastructure import lawyer_search_index
+
+    if settings.lawyer_search_index_enabled:
+        await lawyer_search_index.start()
+
+    # Доставка доменных событий из outbox
+    if settings.outbox_dispatcher_enabled:
+        outbox_dispatcher.start()
+
+    # Периодические задачи обслуживания (выполняет только реплика-лидер)
+    if settings.scheduler_enabled:
+        from app.modules.consultation.infrastructure.maintenance import (
+            register_maintenance_jobs as register_consultation_jobs,
+        )
+        from app.modules.document.infrastructure.maintenance import (
+            register_maintenance_jobs as register_document_jobs,
+        )
+        from app.modules.lawyer.infrastructure.maintenance import (
+            register_maintenance_jobs as register_lawyer_jobs,
+        )
+        from app.modules.payment.infrastructure.maintenance import (
+            register_maintenance_jobs as register_payment_jobs,
+        )
+
+        scheduler.register("outbox.prune-dispatched", "40 3 * * *", prune_dispatched_events)
+        register_payment_jobs(scheduler)
+        register_consultation_jobs(scheduler)
+        register_document_jobs(scheduler)
+        register_lawyer_jobs(scheduler)
+        scheduler.start()
+
     logger.info("Application started successfully")
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    await scheduler.stop()
+    await outbox_dispatcher.stop()
+    await emergency_dispatcher.stop()
+    await chat_ws_manager.stop()
+    await lawyer_search_index.stop()
+
+    from app.modules.chat.infrastructure.services.llm_gateway import llm_gateway
+    from app.modules.chat.infrastructure.services.llm_scheduler import llm_scheduler
+
+    await llm_scheduler.stop()
+    await llm_gateway.close()
+    await redis_client.disconnect()
     await close_db()
     logger.info("Application shut down successfully")
 
@@ -98,6 +186,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Idempotency-Key: сохранение ответов платежей и бронирований
+app.add_middleware(IdempotencyMiddleware)
+app.add_exception_handler(IdempotentReplay, idempotent_replay_handler)
+
+# Prometheus метрики (HTTP и метрики модулей, например время назначения
+# экстренных консультаций) - GET /metrics
+if settings.enable_prometheus:
+    from prometheus_fastapi_instrumentator import Instrumentator
+
+    Instrumentator().instrument(app).expose(app, include_in_schema=False)
+
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
@@ -143,9 +242,12 @@ from app.modules.payment.presentation import payment_router, subscription_router
 
 # Регистрация роутеров
 app.include_router(auth_router, prefix=f"{settings.api_v1_prefix}")
+# До lawyer_router: /lawyers/slots не должен совпасть с /lawyers/{lawyer_id}
+app.include_router(availability_router, prefix=f"{settings.api_v1_prefix}")
 app.include_router(lawyer_router, prefix=f"{settings.api_v1_prefix}")
 app.include_router(document_router, prefix=f"{settings.api_v1_prefix}")
 app.include_router(chat_router, prefix=f"{settings.api_v1_prefix}")
+app.include_router(emergency_router, prefix=f"{settings.api_v1_prefix}")
 app.include_router(consultation_router, prefix=f"{settings.api_v1_prefix}")
 app.include_router(payment_router, prefix=f"{settings.api_v1_prefix}")
 app.include_router(subscription_router, prefix=f"{settings.api_v1_prefix}")
@@ -160,23 +262,31 @@ from app.core.infrastructure.database import get_db
 async def chat_websocket(
     websocket: WebSocket,
     conversation_id: str,
-    user_id: str = Query(..., description="ID пользователя"),
+    token: str = Query(..., description="JWT access токен"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     WebSocket endpoint для real-time чата с AI ассистентом.
 
+    Браузер не передает заголовок Authorization при открытии WebSocket,
+    поэтому access токен передается в query. Невалидный токен или чужая
+    беседа - соединение закрывается с кодом 1008.
+
     Args:
         websocket: WebSocket соединение
         conversation_id: UUID беседы
-        user_id: UUID пользователя (для авторизации)
+        token: JWT access токен пользователя
         db: Database session
 
     Example:
-        ws://localhost:8000/ws/chat/550e8400-e29b-41d4-a716-446655440000?user_id=123e4567-e89b-12d3-a456-426614174000
+        ws://localhost:8000/ws/chat/550e8400-e29b-41d4-a716-446655440000?token=<access_token>
     """
-    await websocket_endpoint(websocket, conversation_id, user_id, db)
+    user_id = JWTService().verify_access_token(token)
+    if not user_id:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
 
+    await websocket_endpoint(websocket, conversation_id, user_id, db)
 
 if __name__ == "__main__":
     import uvicorn
@@ -16,9 +16,13 @@ class SendMessageCommand:
         user_id: ID пользователя (для проверки прав)
         message_content: Текст сообщения от пользователя
         use_rag: Использовать ли RAG для контекста (по умолчанию True)
+        locale: Локаль ответа (раздел кеша ответов)
+        subscription_plan: План подписки пользователя (приоритет в очереди LLM)
     """
 
     conversation_id: str
     user_id: str
     message_content: str
     use_rag: bool = True
+    locale: str = "ru"
+    subscription_plan: str = "free"
@@ -3,10 +3,13 @@ Send Message Handler
 
 Обработчик команды отправки сообщения с AI ответом.
 """
+import asyncio
+import time
+from contextlib import contextmanager
 from uuid import UUID
-from typing import Protocol
+from typing import Callable, Iterator, Optional, Protocol
 
-from app.shared.domain.result import Result
+from app.core.domain.result import Result
 from app.modules.chat.application.commands.send_message_command import (
     SendMessageCommand,
 )
@@ -14,8 +17,20 @@ from app.modules.chat.application.dtos.conversation_dto import ConversationDTO
 from app.modules.chat.domain.repositories.conversation_repository import (
     IConversationRepository,
 )
+from app.modules.chat.domain.entities.conversation import Conversation
+from app.modules.chat.domain.services.answer_cache import IAnswerCache
+from app.modules.chat.domain.services.context_window import (
+    ContextWindow,
+    ConversationContextWindow,
+)
 from app.modules.chat.domain.services.rag_service import IRAGService
 
+# Системное сообщение с кратким содержанием старой части беседы
+SUMMARY_MESSAGE_PREFIX = "Краткое содержание предыдущей части беседы:\n"
+
+# Наблюдатель длительности этапов обработки: (этап, секунды)
+StageObserver = Callable[[str, float], None]
+
 
 class IAIService(Protocol):
     """
@@ -29,6 +44,8 @@ class IAIService(Protocol):
         self,
         conversation_history: list[dict],
         context: str | None = None,
+        user_id: str | None = None,
+        subscription_plan: str | None = None,
     ) -> Result[tuple[str, int]]:
         """
         Генерирует ответ от AI на основе истории беседы.
@@ -36,25 +53,59 @@ class IAIService(Protocol):
         Args:
             conversation_history: История сообщений в формате OpenAI
             context: Дополнительный контекст из документов (RAG)
+            user_id: ID пользователя (лимит параллельных вызовов LLM)
+            subscription_plan: План подписки (приоритет в очереди LLM)
 
         Returns:
             Result с кортежем (текст_ответа, количество_токенов) или ошибкой
         """
         ...
 
+    # Служебные токены chat API на одно сообщение истории
+    message_token_overhead: int
+
+    async def count_tokens(self, text: str) -> int:
+        """
+        Подсчитывает токены текста tokenizer'ом модели.
+
+        Args:
+            text: Текст
+
+        Returns:
+            Количество токенов
+        """
+        ...
+
+    def history_token_budget(self, context: str | None = None) -> int:
+        """
+        Токены, доступные для истории беседы при данном контексте RAG.
+
+        Args:
+            context: Контекст из документов (RAG)
+
+        Returns:
+            Бюджет истории в токенах
+        """
+        ...
+
 
 class SendMessageHandler:
     """
     Handler для команды отправки сообщения.
 
     Orchestrates:
-    1. Загрузка беседы
-    2. Проверка прав доступа
-    3. Добавление сообщения пользователя
-    4. Поиск релевантных документов (RAG)
-    5. Генерация ответа от AI
+    1. Поиск релевантных документов (RAG) - запускается сразу и идет
+       параллельно с загрузкой беседы (нужны только user_id и текст)
+    2. Загрузка беседы (только последние сообщения)
+    3. Проверка прав доступа (при отказе поиск отменяется)
+    4. Добавление сообщения пользователя
+    5. Ответ из кеша (общий вопрос) или генерация ответа от AI
     6. Добавление ответа ассистента
-    7. Сохранение беседы
+    7. Сохранение беседы (и запрос обновления summary)
+
+    Этапы: load_conversation, retrieval, retrieval_wait (ожидание поиска
+    после загрузки беседы - остаток, не перекрытый загрузкой),
+    answer_cache, generate, save, total.
     """
 
     def __init__(
@@ -62,6 +113,10 @@ class SendMessageHandler:
         conversation_repository: IConversationRepository,
         ai_service: IAIService,
         rag_service: IRAGService,
+        context_window: Optional[ConversationContextWindow] = None,
+        answer_cache: Optional[IAnswerCache] = None,
+        answer_cache_max_question_chars: int = 500,
+        stage_observer: Optional[StageObserver] = None,
     ):
         """
         Инициализирует handler.
@@ -70,10 +125,19 @@ class SendMessageHandler:
             conversation_repository: Репозиторий бесед
             ai_service: AI сервис (OpenAI)
             rag_service: RAG сервис (поиск документов)
+            context_window: Окно контекста беседы (по умолчанию - стандартное)
+            answer_cache: Семантический кеш ответов (None - отключен)
+            answer_cache_max_question_chars: Более длинные вопросы не кешируются
+                (подробные вопросы часто содержат личные данные)
+            stage_observer: Наблюдатель длительности этапов (метрики)
         """
         self.conversation_repository = conversation_repository
         self.ai_service = ai_service
         self.rag_service = rag_service
+        self.context_window = context_window or ConversationContextWindow()
+        self.answer_cache = answer_cache
+        self.answer_cache_max_question_chars = answer_cache_max_question_chars
+        self.stage_observer = stage_observer
 
     async def handle(self, command: SendMessageCommand) -> Result[ConversationDTO]:
         """
@@ -85,36 +149,155 @@ class SendMessageHandler:
         Returns:
             Result с обновленным ConversationDTO или ошибкой
         """
-        # 1. Загружаем беседу
+        started = time.perf_counter()
+
+        # 1. Поиск контекста не зависит от беседы - запускаем сразу
+        retrieval: Optional[asyncio.Task] = None
+        if command.use_rag:
+            retrieval = asyncio.create_task(self._retrieve(command))
+
+        try:
+            result = await self._handle(command, retrieval)
+        finally:
+            # Беседа не найдена, нет доступа или ошибка - поиск не нужен
+            if retrieval is not None and not retrieval.done():
+                retrieval.cancel()
+
+        if result.is_success:
+            self._observe("total", time.perf_counter() - started)
+        return result
+
+    async def _handle(
+        self,
+        command: SendMessageCommand,
+        retrieval: Optional[asyncio.Task],
+    ) -> Result[ConversationDTO]:
+        """
+        Обработка команды (поиск контекста уже запущен).
+
+        Args:
+            command: Команда отправки сообщения
+            retrieval: Задача поиска контекста (None - без RAG)
+
+        Returns:
+            Result с обновленным ConversationDTO или ошибкой
+        """
+        # 2. Загружаем беседу (старые сообщения представлены summary)
         conversation_id = UUID(command.conversation_id)
-        conversation = await self.conversation_repository.find_by_id(
-            conversation_id, include_messages=True
-        )
+        with self._stage("load_conversation"):
+            conversation = await self.conversation_repository.find_by_id_with_recent_messages(
+                conversation_id, limit=self.context_window.tail_messages
+            )
 
         if conversation is None:
             return Result.fail(f"Conversation not found: {command.conversation_id}")
 
-        # 2. Проверяем права доступа
+        # 3. Проверяем права доступа
         if str(conversation.user_id) != command.user_id:
             return Result.fail(
                 "Access denied. You can only send messages to your own conversations."
             )
 
-        # 3. Добавляем сообщение пользователя
+        # 4. Добавляем сообщение пользователя
         user_message_result = conversation.add_user_message(command.message_content)
 
         if not user_message_result.is_success:
             return Result.fail(user_message_result.error)
 
-        user_message = user_message_result.value
+        # Контекст из документов (поиск шел параллельно с загрузкой беседы)
+        context = None
+        referenced_documents: list[str] = []
+        if retrieval is not None:
+            with self._stage("retrieval_wait"):
+                context, referenced_documents = await retrieval
+
+        # 5. Общий вопрос без персонального контекста - ищем ответ в кеше
+        cache_question = self._answer_cache_question(
+            conversation, has_personal_context=bool(referenced_documents)
+        )
+        cached_answer = None
+        if cache_question is not None:
+            with self._stage("answer_cache"):
+                cache_result = await self.answer_cache.lookup(cache_question, command.locale)
+            if cache_result.is_success:
+                cached_answer = cache_result.value
+
+        window = None
+        if cached_answer is not None:
+            # Токены LLM не расходуются
+            response_text, token_count = cached_answer.answer, 0
+        else:
+            # 6. Формируем историю беседы (в пределах бюджета токенов)
+            # и генерируем ответ от AI
+            window = await self._select_context_window(
+                conversation,
+                max_tokens=self.ai_service.history_token_budget(context),
+            )
+            conversation_history = self._build_conversation_history(window)
+
+            with self._stage("generate"):
+                ai_response_result = await self.ai_service.generate_response(
+                    conversation_history=conversation_history,
+                    context=context,
+                    user_id=command.user_id,
+                    subscription_plan=command.subscription_plan,
+                )
+
+            if not ai_response_result.is_success:
+                return Result.fail(f"AI response failed: {ai_response_result.error}")
 
-        # 4. Поиск релевантных документов (RAG)
+            response_text, token_count = ai_response_result.value
+
+            if cache_question is not None:
+                # Ошибка записи в кеш не влияет на ответ
+                await self.answer_cache.store(
+                    cache_question, command.locale, response_text, token_count
+                )
+
+        # 7. Добавляем ответ ассистента
+        assistant_message_result = conversation.add_assistant_message(
+            content=response_text,
+            token_count=token_count,
+            referenced_documents=referenced_documents if referenced_documents else None,
+        )
+
+        if not assistant_message_result.is_success:
+            return Result.fail(assistant_message_result.error)
+
+        # 8. Старые сообщения не помещаются в окно - обновляем summary в фоне
+        if window is not None and window.needs_summary:
+            conversation.request_summary(window.pending_messages)
+
+        # 9. Сохраняем обновленную беседу
+        with self._stage("save"):
+            updated_conversation = await self.conversation_repository.save(conversation)
+
+        # 10. Возвращаем DTO
+        return Result.ok(ConversationDTO.from_entity(updated_conversation))
+
+    async def _retrieve(
+        self,
+        command: SendMessageCommand,
+    ) -> tuple[Optional[str], list[str]]:
+        """
+        Поиск релевантных документов и построение контекста (RAG).
+
+        Использует только user_id и текст сообщения, поэтому выполняется
+        параллельно с загрузкой беседы (поиск работает в собственных
+        сессиях БД).
+
+        Args:
+            command: Команда отправки сообщения
+
+        Returns:
+            Кортеж (контекст или None, ID документов пользователя в контексте)
+        """
         context = None
-        referenced_documents = []
+        referenced_documents: list[str] = []
 
-        if command.use_rag:
+        with self._stage("retrieval"):
             rag_result = await self.rag_service.search_relevant_documents(
-                user_id=conversation.user_id,
+                user_id=UUID(command.user_id),
                 query=command.message_content,
                 top_k=5,
                 min_similarity=0.7,
@@ -128,55 +311,118 @@ class SendMessageHandler:
                     chunks=chunks,
                     max_tokens=4000,
                 )
-                # Сохраняем ID документов для метаданных
-                referenced_documents = [chunk.document_id for chunk in chunks]
+                # Сохраняем ID документов пользователя для метаданных
+                # (чанки базы знаний - не документы пользователя)
+                referenced_documents = list(dict.fromkeys(
+                    chunk.document_id for chunk in chunks if chunk.is_personal
+                ))
+
+        return context, referenced_documents
+
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """Замеряет длительность этапа (только при успешном завершении)."""
+        started = time.perf_counter()
+        yield
+        self._observe(name, time.perf_counter() - started)
+
+    def _observe(self, stage: str, seconds: float) -> None:
+        """Передает длительность этапа наблюдателю."""
+        if self.stage_observer is not None:
+            self.stage_observer(stage, seconds)
+
+    def _answer_cache_question(
+        self,
+        conversation: Conversation,
+        has_personal_context: bool,
+    ) -> Optional[str]:
+        """
+        Вопрос для кеша ответов, если ответ не зависит от пользователя.
 
-        # 5. Формируем историю беседы для OpenAI
-        conversation_history = self._build_conversation_history(conversation)
+        Кешируются только беседы без документов пользователя в контексте
+        (база знаний общая для всех), без ответов ассистента и без
+        summary: вопрос - все сообщения пользователя.
 
-        # 6. Генерируем ответ от AI
-        ai_response_result = await self.ai_service.generate_response(
-            conversation_history=conversation_history,
-            context=context,
-        )
+        Args:
+            conversation: Беседа (с новым сообщением пользователя)
+            has_personal_context: В контексте есть документы пользователя
 
-        if not ai_response_result.is_success:
-            return Result.fail(f"AI response failed: {ai_response_result.error}")
+        Returns:
+            Текст вопроса или None, если кеш не применим
+        """
+        if self.answer_cache is None or has_personal_context or conversation.summary:
+            return None
+
+        messages = conversation.messages
+        # Загружены не все сообщения - беседа не новая
+        if len(messages) != conversation.messages_count:
+            return None
+        if any(message.role.is_assistant for message in messages):
+            return None
+
+        question = "\n".join(message.content.strip() for message in messages)
+        if len(question) > self.answer_cache_max_question_chars:
+            return None
+        return question
+
+    async def _select_context_window(
+        self,
+        conversation: Conversation,
+        max_tokens: int,
+    ) -> ContextWindow:
+        """
+        Выбирает историю беседы в пределах бюджета.
 
-        response_text, token_count = ai_response_result.value
+        Размер текста сообщения считается один раз и кешируется в
+        Message.content_tokens (сохраняется вместе с беседой).
 
-        # 7. Добавляем ответ ассистента
-        assistant_message_result = conversation.add_assistant_message(
-            content=response_text,
-            token_count=token_count,
-            referenced_documents=referenced_documents if referenced_documents else None,
-        )
+        Args:
+            conversation: Беседа с последними сообщениями
+            max_tokens: Бюджет истории в токенах
 
-        if not assistant_message_result.is_success:
-            return Result.fail(assistant_message_result.error)
+        Returns:
+            ContextWindow
+        """
+        for message in conversation.unsummarized_messages:
+            if message.content_tokens is None:
+                message.cache_content_tokens(
+                    await self.ai_service.count_tokens(message.content)
+                )
 
-        # 8. Сохраняем обновленную беседу
-        updated_conversation = await self.conversation_repository.save(conversation)
+        summary_tokens = 0
+        if conversation.summary:
+            summary_tokens = (
+                await self.ai_service.count_tokens(SUMMARY_MESSAGE_PREFIX + conversation.summary)
+                + self.ai_service.message_token_overhead
+            )
 
-        # 9. Возвращаем DTO
-        return Result.ok(ConversationDTO.from_entity(updated_conversation))
+        return self.context_window.select(
+            conversation,
+            max_tokens=max_tokens,
+            message_overhead=self.ai_service.message_token_overhead,
+            summary_tokens=summary_tokens,
+        )
 
-    def _build_conversation_history(self, conversation) -> list[dict]:
+    @staticmethod
+    def _build_conversation_history(window: ContextWindow) -> list[dict]:
         """
         Строит историю беседы в формате OpenAI.
 
         Args:
-            conversation: Беседа с сообщениями
+            window: Выбранное окно контекста
 
         Returns:
-            Список сообщений в формате OpenAI
+            Список сообщений (summary первым системным сообщением, затем
+            сообщения в хронологическом порядке)
         """
         history = []
-
-        for message in conversation.messages:
+        if window.summary:
             history.append({
-                "role": message.role.value.value,
-                "content": message.content,
+                "role": "system",
+                "content": SUMMARY_MESSAGE_PREFIX + window.summary,
             })
-
+        history.extend(
+            {"role": message.role.value.value, "content": message.content}
+            for message in window.messages
+        )
         return history
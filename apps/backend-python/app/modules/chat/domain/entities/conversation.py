@@ -3,7 +3,7 @@ Conversation Entity (Aggregate Root)
 
 Доменная сущность беседы с AI ассистентом.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List
 from uuid import UUID, uuid4
 
@@ -15,6 +15,9 @@ from app.modules.chat.domain.value_objects.message_role import MessageRole
 from app.modules.chat.domain.events.conversation_started import ConversationStartedEvent
 from app.modules.chat.domain.events.message_sent import MessageSentEvent
 from app.modules.chat.domain.events.conversation_archived import ConversationArchivedEvent
+from app.modules.chat.domain.events.conversation_summary_requested import (
+    ConversationSummaryRequestedEvent,
+)
 
 
 class Conversation(AggregateRoot):
@@ -31,6 +34,8 @@ class Conversation(AggregateRoot):
     4. Максимум 100 сообщений в одной беседе
     5. Беседа может быть архивирована или удалена
     6. Только активные беседы могут принимать новые сообщения
+    7. Сообщения до summary_until покрыты кратким содержанием (summary),
+       поэтому беседа может быть загружена только с последними сообщениями
     """
 
     MAX_MESSAGES = 100  # Максимум сообщений в беседе
@@ -46,6 +51,9 @@ class Conversation(AggregateRoot):
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         last_message_at: Optional[datetime] = None,
+        message_count: Optional[int] = None,
+        summary: Optional[str] = None,
+        summary_until: Optional[datetime] = None,
     ):
         """
         Создает экземпляр беседы.
@@ -60,6 +68,10 @@ class Conversation(AggregateRoot):
             created_at: Дата создания
             updated_at: Дата обновления
             last_message_at: Дата последнего сообщения
+            message_count: Количество сообщений в беседе (None - len(messages));
+                messages может содержать только последние сообщения
+            summary: Краткое содержание старых сообщений
+            summary_until: Дата последнего сообщения, вошедшего в summary
         """
         super().__init__(id)
         self._user_id = user_id
@@ -70,6 +82,11 @@ class Conversation(AggregateRoot):
         self._created_at = created_at or datetime.utcnow()
         self._updated_at = updated_at or datetime.utcnow()
         self._last_message_at = last_message_at
+        self._message_count = (
+            message_count if message_count is not None else len(self._messages)
+        )
+        self._summary = summary
+        self._summary_until = summary_until
 
     @classmethod
     def start(
@@ -116,6 +133,7 @@ class Conversation(AggregateRoot):
 
         message = message_result.value
         conversation._messages.append(message)
+        conversation._message_count += 1
         conversation._last_message_at = message.created_at
 
         # Публикуем событие начала беседы
@@ -146,7 +164,7 @@ class Conversation(AggregateRoot):
             )
 
         # Проверяем лимит сообщений
-        if len(self._messages) >= self.MAX_MESSAGES:
+        if self._message_count >= self.MAX_MESSAGES:
             return Result.fail(
                 f"Conversation has reached maximum messages limit: {self.MAX_MESSAGES}"
             )
@@ -169,6 +187,7 @@ class Conversation(AggregateRoot):
 
         message = message_result.value
         self._messages.append(message)
+        self._message_count += 1
         self._last_message_at = message.created_at
         self._updated_at = datetime.utcnow()
 
@@ -208,7 +227,7 @@ class Conversation(AggregateRoot):
             )
 
         # Проверяем лимит сообщений
-        if len(self._messages) >= self.MAX_MESSAGES:
+        if self._message_count >= self.MAX_MESSAGES:
             return Result.fail(
                 f"Conversation has reached maximum messages limit: {self.MAX_MESSAGES}"
             )
@@ -233,6 +252,7 @@ class Conversation(AggregateRoot):
 
         message = message_result.value
         self._messages.append(message)
+        self._message_count += 1
         self._last_message_at = message.created_at
         self._updated_at = datetime.utcnow()
 
@@ -254,6 +274,20 @@ class Conversation(AggregateRoot):
 
         return Result.ok(message)
 
+    def request_summary(self, pending_messages: int) -> None:
+        """
+        Запрашивает обновление краткого содержания беседы.
+
+        Args:
+            pending_messages: Сообщений вне окна контекста без summary
+        """
+        self.add_domain_event(
+            ConversationSummaryRequestedEvent(
+                conversation_id=str(self.id),
+                pending_messages=pending_messages,
+            )
+        )
+
     def update_title(self, title: str) -> Result[None]:
         """
         Обновляет название беседы.
@@ -338,13 +372,31 @@ class Conversation(AggregateRoot):
 
     @property
     def messages(self) -> List[Message]:
-        """Список сообщений (копия)"""
+        """Список загруженных сообщений (копия)"""
         return self._messages.copy()
 
     @property
     def messages_count(self) -> int:
-        """Количество сообщений"""
-        return len(self._messages)
+        """Количество сообщений в беседе (включая незагруженные)"""
+        return self._message_count
+
+    @property
+    def summary(self) -> Optional[str]:
+        """Краткое содержание старых сообщений"""
+        return self._summary
+
+    @property
+    def summary_until(self) -> Optional[datetime]:
+        """Дата последнего сообщения, вошедшего в summary"""
+        return self._summary_until
+
+    @property
+    def unsummarized_messages(self) -> List[Message]:
+        """Загруженные сообщения, не вошедшие в summary"""
+        if self._summary_until is None:
+            return self._messages.copy()
+        until = _utc(self._summary_until)
+        return [m for m in self._messages if _utc(m.created_at) > until]
 
     @property
     def total_tokens(self) -> int:
@@ -377,3 +429,8 @@ class Conversation(AggregateRoot):
             f"Conversation(id={self.id}, user_id={self._user_id}, "
             f"messages={self.messages_count}, status={self._status})"
         )
+
+
+def _utc(value: datetime) -> datetime:
+    """Приводит дату к aware UTC (новые сообщения создаются с naive utcnow)."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
@@ -24,6 +24,7 @@ class Message(Entity):
     2. Контент не может быть пустым
     3. Сообщение может ссылаться на документы (для RAG)
     4. Token count используется для отслеживания использования API
+    5. Content tokens - размер текста в токенах LLM (кеш для бюджета истории)
     """
 
     def __init__(
@@ -36,6 +37,7 @@ class Message(Entity):
         referenced_documents: Optional[list[str]] = None,
         metadata: Optional[dict] = None,
         created_at: Optional[datetime] = None,
+        content_tokens: Optional[int] = None,
     ):
         """
         Создает экземпляр сообщения.
@@ -49,6 +51,7 @@ class Message(Entity):
             referenced_documents: ID документов, использованных для ответа
             metadata: Дополнительные метаданные
             created_at: Дата создания
+            content_tokens: Размер текста в токенах (None - еще не посчитан)
         """
         super().__init__(id)
         self._conversation_id = conversation_id
@@ -58,6 +61,7 @@ class Message(Entity):
         self._referenced_documents = referenced_documents or []
         self._metadata = metadata or {}
         self._created_at = created_at or datetime.utcnow()
+        self._content_tokens = content_tokens
 
     @classmethod
     def create(
@@ -129,6 +133,28 @@ class Message(Entity):
         """Количество токенов"""
         return self._token_count
 
+    @property
+    def content_tokens(self) -> Optional[int]:
+        """Размер текста в токенах LLM (None - еще не посчитан)"""
+        return self._content_tokens
+
+    def cache_content_tokens(self, tokens: int) -> None:
+        """
+        Запоминает размер текста в токенах.
+
+        Текст сообщения не меняется, поэтому значение считается один раз
+        и сохраняется вместе с сообщением.
+
+        Args:
+            tokens: Количество токенов текста
+
+        Raises:
+            ValueError: Если tokens отрицательное
+        """
+        if tokens < 0:
+            raise ValueError("Content tokens cannot be negative")
+        self._content_tokens = tokens
+
     @property
     def referenced_documents(self) -> list[str]:
         """ID документов, использованных для ответа"""
@@ -2,9 +2,13 @@
 from app.modules.chat.domain.events.conversation_started import ConversationStartedEvent
 from app.modules.chat.domain.events.message_sent import MessageSentEvent
 from app.modules.chat.domain.events.conversation_archived import ConversationArchivedEvent
+from app.modules.chat.domain.events.conversation_summary_requested import (
+    ConversationSummaryRequestedEvent,
+)
 
 __all__ = [
     "ConversationStartedEvent",
     "MessageSentEvent",
     "ConversationArchivedEvent",
+    "ConversationSummaryRequestedEvent",
 ]
@@ -0,0 +1,29 @@
+"""
+Conversation Summary Requested Event
+
+Событие запроса обновления краткого содержания беседы.
+"""
+from dataclasses import dataclass
+
+from app.shared.domain.domain_event import DomainEvent
+
+
+@dataclass(frozen=True)
+class ConversationSummaryRequestedEvent(DomainEvent):
+    """
+    Событие: Старые сообщения беседы не помещаются в окно контекста.
+
+    Публикуется, когда накопилось достаточно сообщений вне окна, не
+    вошедших в краткое содержание.
+
+    Use cases:
+    - Фоновое обновление rolling summary (LLM)
+    """
+
+    conversation_id: str
+    pending_messages: int
+
+    @property
+    def event_name(self) -> str:
+        """Имя события"""
+        return "conversation.summary_requested"
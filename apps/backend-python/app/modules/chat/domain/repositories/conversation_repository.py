@@ -52,6 +52,24 @@ class IConversationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_by_id_with_recent_messages(
+        self,
+        conversation_id: UUID,
+        limit: int,
+    ) -> Optional[Conversation]:
+        """
+        Находит беседу по ID только с последними сообщениями.
+
+        Args:
+            conversation_id: ID беседы
+            limit: Сколько последних сообщений загрузить
+
+        Returns:
+            Беседа (сообщения в хронологическом порядке) или None
+        """
+        pass
+
     @abstractmethod
     async def find_by_user(
         self,
@@ -1,7 +1,22 @@
 """Domain Services exports"""
+from app.modules.chat.domain.services.answer_cache import (
+    CachedAnswer,
+    IAnswerCache,
+)
+from app.modules.chat.domain.services.context_window import (
+    ContextWindow,
+    ConversationContextWindow,
+)
 from app.modules.chat.domain.services.rag_service import (
     IRAGService,
     DocumentChunk,
 )
 
-__all__ = ["IRAGService", "DocumentChunk"]
+__all__ = [
+    "CachedAnswer",
+    "IAnswerCache",
+    "ContextWindow",
+    "ConversationContextWindow",
+    "IRAGService",
+    "DocumentChunk",
+]
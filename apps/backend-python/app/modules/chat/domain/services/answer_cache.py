@@ -0,0 +1,88 @@
+"""
+Answer Cache Interface
+
+Доменный сервис кеша ответов AI на общие вопросы.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.domain.result import Result
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    """
+    Ответ из кеша.
+
+    Attributes:
+        question: Вопрос, на который был сгенерирован ответ
+        answer: Текст ответа
+        token_count: Токены LLM, потраченные на ответ (сэкономлены)
+        similarity: Сходство вопросов (0.0-1.0)
+    """
+
+    question: str
+    answer: str
+    token_count: int
+    similarity: float
+
+
+class IAnswerCache(ABC):
+    """
+    Интерфейс семантического кеша ответов.
+
+    Кешируются только ответы без персонального контекста: без
+    документов пользователя (RAG) и без истории беседы. Записи
+    разделены по локали и устаревают по TTL.
+    """
+
+    @abstractmethod
+    async def lookup(self, question: str, locale: str) -> Result[Optional[CachedAnswer]]:
+        """
+        Ищет ответ на близкий по смыслу вопрос.
+
+        Args:
+            question: Вопрос пользователя
+            locale: Локаль ответа (ru, en, ...)
+
+        Returns:
+            Result с ответом (None - промах) или ошибкой
+        """
+        pass
+
+    @abstractmethod
+    async def store(
+        self,
+        question: str,
+        locale: str,
+        answer: str,
+        token_count: int,
+    ) -> Result[None]:
+        """
+        Сохраняет ответ на вопрос.
+
+        Args:
+            question: Вопрос пользователя
+            locale: Локаль ответа
+            answer: Ответ AI
+            token_count: Токены LLM, потраченные на ответ
+
+        Returns:
+            Result с успехом или ошибкой
+        """
+        pass
+
+    @abstractmethod
+    async def purge(self, locale: Optional[str] = None, expired_only: bool = False) -> int:
+        """
+        Удаляет записи кеша.
+
+        Args:
+            locale: Только записи локали (None - все локали)
+            expired_only: Только устаревшие записи
+
+        Returns:
+            Количество удаленных записей
+        """
+        pass
@@ -0,0 +1,108 @@
+"""
+Conversation Context Window
+
+Доменный сервис выбора истории беседы для запроса к LLM.
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.modules.chat.domain.entities.conversation import Conversation
+from app.modules.chat.domain.entities.message import Message
+
+
+@dataclass(frozen=True)
+class ContextWindow:
+    """
+    История беседы для одного запроса к LLM.
+
+    Attributes:
+        summary: Краткое содержание старых сообщений (None - нет)
+        messages: Сообщения дословно (в хронологическом порядке)
+        pending_messages: Сообщений без summary сверх keep_messages
+        needs_summary: Нужно обновить summary в фоне
+    """
+
+    summary: Optional[str]
+    messages: List[Message] = field(default_factory=list)
+    pending_messages: int = 0
+    needs_summary: bool = False
+
+
+class ConversationContextWindow:
+    """
+    Окно контекста беседы: rolling summary + последние сообщения.
+
+    Сообщения после summary_until берутся с конца, пока помещаются в
+    бюджет токенов (последнее - вопрос пользователя - всегда). Более
+    старые сообщения представлены summary, которое обновляется фоновой
+    задачей: она оставляет последние keep_messages сообщений дословными
+    и сворачивает остальные.
+
+    Business Rules:
+    1. Беседа загружается только с последними tail_messages сообщениями
+    2. Summary обновляется, когда сообщений без summary сверх
+       keep_messages накопилось не меньше summarize_after, или когда
+       такие сообщения не поместились в бюджет
+    """
+
+    def __init__(
+        self,
+        tail_messages: int = 20,
+        keep_messages: int = 8,
+        summarize_after: int = 6,
+    ):
+        """
+        Args:
+            tail_messages: Сколько последних сообщений загружать
+            keep_messages: Сколько последних сообщений не сворачивать в summary
+            summarize_after: Минимум новых сообщений для обновления summary
+        """
+        if keep_messages < 1 or tail_messages < keep_messages:
+            raise ValueError("Expected 1 <= keep_messages <= tail_messages")
+        self.tail_messages = tail_messages
+        self.keep_messages = keep_messages
+        self.summarize_after = max(summarize_after, 1)
+
+    def select(
+        self,
+        conversation: Conversation,
+        max_tokens: int,
+        message_overhead: int = 0,
+        summary_tokens: int = 0,
+    ) -> ContextWindow:
+        """
+        Выбирает историю беседы в пределах бюджета.
+
+        Args:
+            conversation: Беседа с последними сообщениями (content_tokens
+                посчитаны)
+            max_tokens: Бюджет истории в токенах
+            message_overhead: Служебные токены на сообщение
+            summary_tokens: Токены сообщения с summary (0 - summary нет)
+
+        Returns:
+            ContextWindow
+        """
+        candidates = conversation.unsummarized_messages
+        budget = max_tokens - (summary_tokens if conversation.summary else 0)
+
+        selected: List[Message] = []
+        used = 0
+        for message in reversed(candidates):
+            tokens = (message.content_tokens or 0) + message_overhead
+            if selected and used + tokens > budget:
+                break
+            selected.append(message)
+            used += tokens
+        selected.reverse()
+
+        pending = len(candidates) - self.keep_messages
+        dropped = len(candidates) - len(selected)
+        needs_summary = pending >= self.summarize_after or (pending > 0 and dropped > 0)
+
+        return ContextWindow(
+            summary=conversation.summary,
+            messages=selected,
+            pending_messages=max(pending, 0),
+            needs_summary=needs_summary,
+        )
@@ -7,7 +7,7 @@ from abc import ABC, abstractmethod
 from typing import List
 from uuid import UUID
 
-from app.shared.domain.result import Result
+from app.core.domain.result import Result
 
 
 class DocumentChunk:
@@ -18,12 +18,18 @@ class DocumentChunk:
     в AI модель для генерации ответа.
     """
 
+    # Источник чанка: документы пользователя или общая база знаний
+    SOURCE_USER = "user"
+    SOURCE_KNOWLEDGE_BASE = "knowledge_base"
+
     def __init__(
         self,
         document_id: str,
         content: str,
         similarity_score: float,
         metadata: dict,
+        document_title: str = "",
+        source: str = SOURCE_USER,
     ):
         """
         Создает чанк документа.
@@ -33,11 +39,20 @@ class DocumentChunk:
             content: Текст фрагмента
             similarity_score: Оценка релевантности (0.0-1.0)
             metadata: Метаданные документа
+            document_title: Название документа (для контекста AI)
+            source: Источник (user / knowledge_base)
         """
         self.document_id = document_id
+        self.document_title = document_title
         self.content = content
         self.similarity_score = similarity_score
         self.metadata = metadata
+        self.source = source
+
+    @property
+    def is_personal(self) -> bool:
+        """Фрагмент документа пользователя (не общей базы знаний)"""
+        return self.source == self.SOURCE_USER
 
     def __repr__(self) -> str:
         """Представление для отладки"""
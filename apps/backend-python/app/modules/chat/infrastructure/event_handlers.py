@@ -0,0 +1,57 @@
+"""
+Chat Event Handlers
+
+Подписчики Chat Module на доменные события (доставляются через outbox).
+"""
+from app.config import settings
+from app.core.infrastructure.cache import redis_client
+from app.core.infrastructure.event_bus import EventBus, EventEnvelope
+from app.modules.chat.infrastructure.jobs import (
+    SUMMARY_LOCK_KEY,
+    index_document_job,
+    remove_document_chunks_job,
+    summarize_conversation_job,
+)
+
+
+async def on_document_processed(event: EventEnvelope) -> None:
+    """Поставить индексацию документа в очередь после извлечения текста."""
+    if event.payload.get("has_extracted_text"):
+        index_document_job.enqueue(document_id=event.payload["document_id"])
+
+
+async def on_document_deleted(event: EventEnvelope) -> None:
+    """Поставить удаление чанков документа из индекса RAG в очередь."""
+    remove_document_chunks_job.enqueue(document_id=event.payload["document_id"])
+
+
+async def on_conversation_summary_requested(event: EventEnvelope) -> None:
+    """
+    Поставить обновление summary беседы в очередь.
+
+    Событие публикуется при каждом сообщении, пока summary не обновлено;
+    блокировка в Redis не дает поставить задачу повторно.
+    """
+    conversation_id = event.payload["conversation_id"]
+    if redis_client.is_connected:
+        acquired = await redis_client.client.set(
+            SUMMARY_LOCK_KEY.format(conversation_id=conversation_id),
+            event.event_id,
+            nx=True,
+            ex=settings.chat_summary_lock_seconds,
+        )
+        if not acquired:
+            return
+    summarize_conversation_job.enqueue(conversation_id=conversation_id)
+
+
+def register_event_handlers(bus: EventBus) -> None:
+    """
+    Зарегистрировать подписчиков Chat Module.
+
+    Args:
+        bus: Event bus
+    """
+    bus.subscribe("DocumentProcessedEvent", on_document_processed)
+    bus.subscribe("DocumentDeletedEvent", on_document_deleted)
+    bus.subscribe("ConversationSummaryRequestedEvent", on_conversation_summary_requested)
@@ -0,0 +1,165 @@
+"""
+Chat Background Jobs
+
+Фоновые задачи Chat Module (индексация документов для RAG, summary бесед).
+"""
+import logging
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import noload
+
+from app.config import settings
+from app.core.infrastructure.cache import redis_client
+from app.core.infrastructure.database import async_session_factory
+from app.core.infrastructure.jobs import JobQueue, PermanentJobError, job
+from app.modules.chat.infrastructure.persistence.models.conversation_model import (
+    ConversationModel,
+)
+from app.modules.chat.infrastructure.persistence.models.message_model import (
+    MessageModel,
+)
+from app.modules.chat.infrastructure.services.openai_service import OpenAIService
+from app.modules.chat.infrastructure.services.rag_service import RAGServiceImpl
+from app.modules.document.domain.value_objects.document_status import DocumentStatusEnum
+from app.modules.document.infrastructure.persistence.models.document_model import (
+    DocumentModel,
+)
+
+logger = logging.getLogger(__name__)
+
+# Блокировка: задача summary беседы уже в очереди
+SUMMARY_LOCK_KEY = "chat_summary:pending:{conversation_id}"
+
+
+@job(queue=JobQueue.LLM, max_retries=5)
+async def index_document_job(document_id: str) -> None:
+    """
+    Индексирует извлеченный текст документа (chunking + embeddings).
+
+    Args:
+        document_id: ID документа
+
+    Raises:
+        PermanentJobError: Если документ не найден, удален или не содержит текста
+    """
+    async with async_session_factory() as session:
+        async with session.begin():
+            document = await session.get(DocumentModel, document_id)
+            if document is None:
+                raise PermanentJobError(f"Document {document_id} not found")
+            if document.status == DocumentStatusEnum.DELETED.value:
+                raise PermanentJobError(f"Document {document_id} is deleted")
+            if not document.extracted_text:
+                raise PermanentJobError(f"Document {document_id} has no extracted text")
+
+            rag_service = RAGServiceImpl(session)
+            result = await rag_service.index_document(
+                document_id=document.id,
+                content=document.extracted_text,
+                metadata={
+                    "owner_id": document.owner_id,
+                    "title": document.title,
+                    "document_type": document.document_type,
+                    "category": document.category,
+                },
+            )
+            if not result.is_success:
+                # Временная ошибка (OpenAI/БД) - задача будет повторена
+                raise RuntimeError(result.error)
+
+    logger.info(f"Document {document_id} indexed")
+
+
+@job(queue=JobQueue.IO, max_retries=5)
+async def remove_document_chunks_job(document_id: str) -> None:
+    """
+    Удаляет чанки удаленного документа из индекса RAG.
+
+    Args:
+        document_id: ID документа
+    """
+    async with async_session_factory() as session:
+        async with session.begin():
+            result = await RAGServiceImpl(session).remove_document(document_id)
+            if not result.is_success:
+                # Временная ошибка БД - задача будет повторена
+                raise RuntimeError(result.error)
+
+    logger.info(f"Document {document_id} removed from RAG index")
+
+
+@job(queue=JobQueue.LLM, max_retries=3)
+async def summarize_conversation_job(conversation_id: str) -> None:
+    """
+    Сворачивает старые сообщения беседы в rolling summary.
+
+    В summary добавляются сообщения после summary_until, кроме последних
+    chat_summary_keep_messages. Транзакция не держится во время запроса
+    к LLM; результат записывается, только если summary_until не
+    сдвинулся дальше (параллельная задача).
+
+    Args:
+        conversation_id: ID беседы
+
+    Raises:
+        PermanentJobError: Если беседа не найдена
+    """
+    try:
+        async with async_session_factory() as session:
+            conversation = await session.get(
+                ConversationModel,
+                conversation_id,
+                options=[noload(ConversationModel.messages)],
+            )
+            if conversation is None:
+                raise PermanentJobError(f"Conversation {conversation_id} not found")
+            previous_summary = conversation.summary
+            previous_until = conversation.summary_until
+
+            stmt = select(MessageModel).where(MessageModel.conversation_id == conversation_id)
+            if previous_until is not None:
+                stmt = stmt.where(MessageModel.created_at > previous_until)
+            result = await session.execute(
+                stmt.order_by(MessageModel.created_at, MessageModel.id)
+            )
+            messages = list(result.scalars().all())
+
+        messages = messages[:-settings.chat_summary_keep_messages]
+        if not messages:
+            return
+
+        ai_service = OpenAIService(model=settings.openai_llm_model)
+        summary_result = await ai_service.summarize(
+            previous_summary,
+            [{"role": m.role, "content": m.content} for m in messages],
+            max_tokens=settings.chat_summary_max_tokens,
+        )
+        if not summary_result.is_success:
+            # Временная ошибка OpenAI - задача будет повторена
+            raise RuntimeError(summary_result.error)
+
+        summary_until = messages[-1].created_at
+        async with async_session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    update(ConversationModel)
+                    .where(ConversationModel.id == conversation_id)
+                    .where(
+                        or_(
+                            ConversationModel.summary_until.is_(None),
+                            ConversationModel.summary_until < summary_until,
+                        )
+                    )
+                    .values(summary=summary_result.value, summary_until=summary_until)
+                )
+
+        if result.rowcount:
+            logger.info(
+                f"Conversation {conversation_id} summary updated "
+                f"({len(messages)} messages)"
+            )
+    finally:
+        if redis_client.is_connected:
+            await redis_client.delete(
+                SUMMARY_LOCK_KEY.format(conversation_id=conversation_id)
+            )
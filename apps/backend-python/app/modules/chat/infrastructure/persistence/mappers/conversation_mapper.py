@@ -4,7 +4,7 @@ Conversation Mapper
 Mapper для конвертации между Conversation Entity и ConversationModel ORM.
 """
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 from app.modules.chat.domain.entities.conversation import Conversation
 from app.modules.chat.domain.entities.message import Message
@@ -29,13 +29,19 @@ class ConversationMapper:
     """
 
     @staticmethod
-    def to_domain(model: ConversationModel, include_messages: bool = True) -> Conversation:
+    def to_domain(
+        model: ConversationModel,
+        include_messages: bool = True,
+        messages: Optional[List[Message]] = None,
+    ) -> Conversation:
         """
         Конвертирует ORM модель в доменную сущность.
 
         Args:
             model: ORM модель ConversationModel
             include_messages: Загружать ли сообщения
+            messages: Уже загруженные сообщения (например, последние N);
+                model.messages в этом случае не читается
 
         Returns:
             Conversation entity
@@ -50,12 +56,13 @@ class ConversationMapper:
         status = status_result.value
 
         # Конвертируем сообщения если нужно
-        messages: List[Message] = []
-        if include_messages and model.messages:
-            messages = [
-                MessageMapper.to_domain(message_model)
-                for message_model in model.messages
-            ]
+        if messages is None:
+            messages = []
+            if include_messages and model.messages:
+                messages = [
+                    MessageMapper.to_domain(message_model)
+                    for message_model in model.messages
+                ]
 
         # Создаем доменную сущность через конструктор
         # (не через start, т.к. это восстановление из БД)
@@ -69,6 +76,9 @@ class ConversationMapper:
             created_at=model.created_at,
             updated_at=model.updated_at,
             last_message_at=model.last_message_at,
+            message_count=model.message_count,
+            summary=model.summary,
+            summary_until=model.summary_until,
         )
 
         # Очищаем domain events (они уже обработаны при сохранении)
@@ -98,6 +108,9 @@ class ConversationMapper:
             created_at=conversation.created_at,
             updated_at=conversation.updated_at,
             last_message_at=conversation.last_message_at,
+            message_count=conversation.messages_count,
+            summary=conversation.summary,
+            summary_until=conversation.summary_until,
         )
 
         # Конвертируем сообщения если нужно
@@ -132,6 +145,9 @@ class ConversationMapper:
         model.total_tokens = conversation.total_tokens
         model.updated_at = conversation.updated_at
         model.last_message_at = conversation.last_message_at
+        model.message_count = conversation.messages_count
+        model.summary = conversation.summary
+        model.summary_until = conversation.summary_until
 
         # Обновляем сообщения если нужно
         if include_messages:
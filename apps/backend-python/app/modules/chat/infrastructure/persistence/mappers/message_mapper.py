@@ -51,6 +51,7 @@ class MessageMapper:
             token_count=model.token_count,
             referenced_documents=model.referenced_documents if model.referenced_documents else [],
             created_at=model.created_at,
+            content_tokens=model.content_tokens,
         )
 
         # Очищаем domain events (они уже обработаны при сохранении)
@@ -75,6 +76,7 @@ class MessageMapper:
             role=message.role.value.value,
             content=message.content,
             token_count=message.token_count,
+            content_tokens=message.content_tokens,
             referenced_documents=message.referenced_documents if message.referenced_documents else [],
             created_at=message.created_at,
         )
@@ -96,6 +98,7 @@ class MessageMapper:
         # Обновляем только изменяемые поля (на самом деле сообщения immutable)
         model.content = message.content
         model.token_count = message.token_count
+        model.content_tokens = message.content_tokens
         model.referenced_documents = message.referenced_documents if message.referenced_documents else []
 
         return model
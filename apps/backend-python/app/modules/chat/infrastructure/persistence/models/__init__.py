@@ -1,12 +1,22 @@
 """
 ORM Models для Chat Module
 """
+from app.modules.chat.infrastructure.persistence.models.answer_cache_model import (
+    AnswerCacheModel,
+)
 from app.modules.chat.infrastructure.persistence.models.conversation_model import (
     ConversationModel,
 )
+from app.modules.chat.infrastructure.persistence.models.knowledge_base_model import (
+    KnowledgeChunkModel,
+    KnowledgeSourceModel,
+)
 from app.modules.chat.infrastructure.persistence.models.message_model import MessageModel
 
 __all__ = [
+    "AnswerCacheModel",
     "ConversationModel",
+    "KnowledgeChunkModel",
+    "KnowledgeSourceModel",
     "MessageModel",
 ]
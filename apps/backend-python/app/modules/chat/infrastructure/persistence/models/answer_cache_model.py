@@ -0,0 +1,76 @@
+"""
+Answer Cache ORM Model
+
+SQLAlchemy модель семантического кеша ответов AI ассистента.
+"""
+from datetime import datetime
+from typing import Optional
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.infrastructure.database import Base
+from app.modules.document.infrastructure.persistence.models.chunk_model import (
+    EMBEDDING_DIMENSIONS,
+)
+
+
+class AnswerCacheModel(Base):
+    """
+    ORM модель для таблицы chat_answer_cache.
+
+    Ответ на общий вопрос (без документов пользователя и истории
+    беседы). Поиск - по cosine similarity embedding вопроса внутри
+    локали (HNSW индекс), устаревшие записи отсекаются по expires_at.
+    """
+
+    __tablename__ = "chat_answer_cache"
+
+    # Primary Key
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+
+    # Partition
+    locale: Mapped[str] = mapped_column(String(10), nullable=False)
+
+    # Content
+    question: Mapped[str] = mapped_column(Text, nullable=False)
+    question_embedding: Mapped[list] = mapped_column(
+        Vector(EMBEDDING_DIMENSIONS), nullable=False
+    )
+    answer: Mapped[str] = mapped_column(Text, nullable=False)
+    token_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Токены LLM, потраченные на ответ (экономия на каждом попадании)",
+    )
+
+    # Statistics
+    hit_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_hit_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("idx_chat_answer_cache_locale_expires", "locale", "expires_at"),
+        Index(
+            "idx_chat_answer_cache_embedding",
+            "question_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"question_embedding": "vector_cosine_ops"},
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """Строковое представление модели."""
+        return f"<AnswerCacheModel(id={self.id}, locale={self.locale}, hits={self.hit_count})>"
@@ -61,6 +61,27 @@ class ConversationModel(Base):
         comment="Общее количество токенов использовано",
     )
 
+    message_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Количество сообщений (без загрузки сообщений)",
+    )
+
+    # Context Window
+    summary: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Краткое содержание старых сообщений (rolling summary)",
+    )
+
+    summary_until: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="created_at последнего сообщения, вошедшего в summary",
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
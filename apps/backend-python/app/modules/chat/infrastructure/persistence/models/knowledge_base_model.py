@@ -0,0 +1,128 @@
+"""
+Knowledge Base ORM Models
+
+SQLAlchemy модели общей правовой базы знаний (кодексы, федеральные
+законы, судебная практика) для RAG.
+"""
+from datetime import datetime
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.infrastructure.database import Base
+from app.modules.document.infrastructure.persistence.models.chunk_model import (
+    EMBEDDING_DIMENSIONS,
+    TEXT_SEARCH_CONFIG,
+)
+
+# Типы источников базы знаний
+KB_SOURCE_TYPES = ("code", "federal_law", "court_practice", "other")
+
+
+class KnowledgeSourceModel(Base):
+    """
+    ORM модель для таблицы kb_sources.
+
+    Источник базы знаний (один файл корпуса). content_hash - SHA-256
+    исходного файла: неизменившийся источник при повторной загрузке
+    пропускается.
+    """
+
+    __tablename__ = "kb_sources"
+
+    # Primary Key
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+
+    # Identity
+    source_key: Mapped[str] = mapped_column(
+        String(500),
+        nullable=False,
+        unique=True,
+        comment="Ключ источника (путь файла относительно корня корпуса)",
+    )
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    source_type: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+        comment="Тип источника (code, federal_law, court_practice, other)",
+    )
+
+    # Ingestion
+    content_hash: Mapped[str] = mapped_column(
+        String(64), nullable=False, comment="SHA-256 исходного файла"
+    )
+    chunk_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    ingested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        """Строковое представление модели."""
+        return f"<KnowledgeSourceModel(id={self.id}, source_key={self.source_key})>"
+
+
+class KnowledgeChunkModel(Base):
+    """
+    ORM модель для таблицы kb_chunks.
+
+    Фрагмент источника базы знаний, индексы как у document_chunks
+    (tsvector + GIN, embedding + HNSW). content_hash - SHA-256 текста
+    чанка: при изменении источника embeddings неизменившихся чанков
+    переиспользуются.
+    """
+
+    __tablename__ = "kb_chunks"
+
+    # Primary Key
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+
+    # Source
+    source_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("kb_sources.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Content
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    chunk_metadata: Mapped[dict] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+
+    # Search
+    content_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, content)", persisted=True),
+    )
+    embedding: Mapped[list] = mapped_column(Vector(EMBEDDING_DIMENSIONS), nullable=False)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("uq_kb_chunks_source_index", "source_id", "chunk_index", unique=True),
+        Index("idx_kb_chunks_tsv", "content_tsv", postgresql_using="gin"),
+        Index(
+            "idx_kb_chunks_embedding",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """Строковое представление модели."""
+        return (
+            f"<KnowledgeChunkModel(id={self.id}, source_id={self.source_id}, "
+            f"chunk_index={self.chunk_index})>"
+        )
@@ -60,6 +60,12 @@ class MessageModel(Base):
         comment="Количество токенов в ответе (для assistant)",
     )
 
+    content_tokens: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Размер текста в токенах LLM (кеш для бюджета истории)",
+    )
+
     # RAG References (для ассистента - какие документы использовались)
     referenced_documents: Mapped[List[str]] = mapped_column(
         ARRAY(String(36)),
@@ -8,8 +8,9 @@ from uuid import UUID
 
 from sqlalchemy import select, func, delete as sql_delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
+from app.core.infrastructure.outbox import record_events
 from app.modules.chat.domain.entities.conversation import Conversation
 from app.modules.chat.domain.repositories.conversation_repository import (
     IConversationRepository,
@@ -26,6 +27,9 @@ from app.modules.chat.infrastructure.persistence.models.message_model import (
 from app.modules.chat.infrastructure.persistence.mappers.conversation_mapper import (
     ConversationMapper,
 )
+from app.modules.chat.infrastructure.persistence.mappers.message_mapper import (
+    MessageMapper,
+)
 
 
 class ConversationRepositoryImpl(IConversationRepository):
@@ -52,36 +56,74 @@ class ConversationRepositoryImpl(IConversationRepository):
         """
         Сохраняет беседу (создание или обновление).
 
+        Беседа может быть загружена только с последними сообщениями,
+        поэтому при обновлении сообщения не пересоздаются: загруженные
+        обновляются, новые добавляются, остальные не затрагиваются.
+
         Args:
             conversation: Беседа для сохранения
 
         Returns:
             Сохраненная беседа
         """
-        # Проверяем, существует ли беседа
+        # Проверяем, существует ли беседа (без загрузки сообщений)
         existing = await self.session.get(
             ConversationModel,
             str(conversation.id),
-            options=[selectinload(ConversationModel.messages)],
+            options=[noload(ConversationModel.messages)],
         )
 
         if existing:
-            # Обновляем существующую беседу
-            updated_model = ConversationMapper.update_model(
-                existing, conversation, include_messages=True
-            )
-            self.session.add(updated_model)
+            # Обновляем поля беседы
+            ConversationMapper.update_model(existing, conversation, include_messages=False)
+            message_models = await self._sync_messages(conversation)
         else:
             # Создаем новую беседу
             model = ConversationMapper.to_model(conversation, include_messages=True)
             self.session.add(model)
+            message_models = list(model.messages)
+
+        # Доменные события - в outbox в той же транзакции
+        record_events(self.session, conversation)
 
         await self.session.flush()
-        await self.session.refresh(existing if existing else model)
 
-        # Возвращаем обновленную доменную сущность
+        # Возвращаем обновленную доменную сущность (с теми же сообщениями)
         saved_model = existing if existing else model
-        return ConversationMapper.to_domain(saved_model, include_messages=True)
+        await self.session.refresh(
+            saved_model,
+            attribute_names=["created_at", "updated_at"],
+        )
+        return ConversationMapper.to_domain(
+            saved_model,
+            messages=[MessageMapper.to_domain(message_model) for message_model in message_models],
+        )
+
+    async def _sync_messages(self, conversation: Conversation) -> List[MessageModel]:
+        """
+        Обновляет загруженные сообщения беседы и добавляет новые.
+
+        Returns:
+            Модели сообщений в порядке conversation.messages
+        """
+        ids = [str(message.id) for message in conversation.messages]
+        if not ids:
+            return []
+
+        stmt = select(MessageModel).where(MessageModel.id.in_(ids))
+        result = await self.session.execute(stmt)
+        existing = {model.id: model for model in result.scalars()}
+
+        models: List[MessageModel] = []
+        for message in conversation.messages:
+            model = existing.get(str(message.id))
+            if model is None:
+                model = MessageMapper.to_model(message)
+                self.session.add(model)
+            else:
+                MessageMapper.update_model(model, message)
+            models.append(model)
+        return models
 
     async def find_by_id(
         self,
@@ -108,14 +150,59 @@ class ConversationRepositoryImpl(IConversationRepository):
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
         else:
-            # Без сообщений
-            model = await self.session.get(ConversationModel, str(conversation_id))
+            # Без сообщений (relationship по умолчанию lazy="selectin")
+            model = await self.session.get(
+                ConversationModel,
+                str(conversation_id),
+                options=[noload(ConversationModel.messages)],
+            )
 
         if model is None:
             return None
 
         return ConversationMapper.to_domain(model, include_messages=include_messages)
 
+    async def find_by_id_with_recent_messages(
+        self,
+        conversation_id: UUID,
+        limit: int,
+    ) -> Optional[Conversation]:
+        """
+        Находит беседу по ID только с последними сообщениями.
+
+        Использует индекс (conversation_id, created_at): читается limit
+        строк вместо всей беседы.
+
+        Args:
+            conversation_id: ID беседы
+            limit: Сколько последних сообщений загрузить
+
+        Returns:
+            Беседа (сообщения в хронологическом порядке) или None
+        """
+        model = await self.session.get(
+            ConversationModel,
+            str(conversation_id),
+            options=[noload(ConversationModel.messages)],
+        )
+        if model is None:
+            return None
+
+        stmt = (
+            select(MessageModel)
+            .where(MessageModel.conversation_id == str(conversation_id))
+            .order_by(MessageModel.created_at.desc(), MessageModel.id.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        message_models = list(result.scalars().all())
+        message_models.reverse()
+
+        return ConversationMapper.to_domain(
+            model,
+            messages=[MessageMapper.to_domain(message_model) for message_model in message_models],
+        )
+
     async def find_by_user(
         self,
         user_id: UUID,
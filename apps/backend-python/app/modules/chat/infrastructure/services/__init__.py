@@ -1,10 +1,50 @@
 """
 Services для Chat Module Infrastructure Layer
 """
+from app.modules.chat.infrastructure.services.answer_cache import SemanticAnswerCache
+from app.modules.chat.infrastructure.services.hybrid_retriever import HybridRetriever
+from app.modules.chat.infrastructure.services.knowledge_base import (
+    IngestionReport,
+    KnowledgeBaseIngestor,
+)
+from app.modules.chat.infrastructure.services.legal_chunker import LegalTextChunker, TextChunk
+from app.modules.chat.infrastructure.services.llm_gateway import (
+    CircuitBreaker,
+    LLMGateway,
+    LLMGatewayError,
+    LLMTimeoutError,
+    LLMUnavailableError,
+    llm_gateway,
+)
+from app.modules.chat.infrastructure.services.llm_scheduler import (
+    LLMRequestDroppedError,
+    LLMScheduler,
+    llm_scheduler,
+)
 from app.modules.chat.infrastructure.services.openai_service import OpenAIService
+from app.modules.chat.infrastructure.services.pipeline_metrics import observe_chat_stage
 from app.modules.chat.infrastructure.services.rag_service import RAGServiceImpl
+from app.modules.chat.infrastructure.services.tokenizer import TokenBudget, TokenCounter
 
 __all__ = [
+    "CircuitBreaker",
+    "HybridRetriever",
+    "IngestionReport",
+    "KnowledgeBaseIngestor",
+    "LegalTextChunker",
+    "LLMGateway",
+    "LLMGatewayError",
+    "LLMRequestDroppedError",
+    "LLMScheduler",
+    "LLMTimeoutError",
+    "LLMUnavailableError",
+    "llm_gateway",
+    "llm_scheduler",
+    "observe_chat_stage",
+    "TextChunk",
     "OpenAIService",
     "RAGServiceImpl",
+    "SemanticAnswerCache",
+    "TokenBudget",
+    "TokenCounter",
 ]
@@ -0,0 +1,196 @@
+"""
+Semantic Answer Cache
+
+Кеш ответов AI на общие вопросы по сходству embedding вопроса (pgvector).
+
+Многие вопросы почти дословно повторяются ("как оспорить штраф ГИБДД"),
+а каждый ответ - полный запрос к LLM. Ответ на вопрос без документов
+пользователя и без истории беседы не зависит от пользователя, поэтому
+ответ на близкий вопрос (cosine similarity не ниже порога) той же
+локали отдается из кеша.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, List, Optional
+from uuid import uuid4
+
+from prometheus_client import Counter
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.domain.result import Result
+from app.core.infrastructure.database import async_session_factory
+from app.modules.chat.domain.services.answer_cache import CachedAnswer, IAnswerCache
+from app.modules.chat.infrastructure.persistence.models.answer_cache_model import (
+    AnswerCacheModel,
+)
+
+# Embedding вопроса (RAGServiceImpl.embed_query - тот же вектор, что для поиска)
+QueryEmbedder = Callable[[str], Awaitable[Result[List[float]]]]
+
+CHAT_ANSWER_CACHE_LOOKUPS = Counter(
+    "chat_answer_cache_lookups_total",
+    "Обращения к семантическому кешу ответов",
+    ["locale", "result"],
+)
+CHAT_ANSWER_CACHE_TOKENS_SAVED = Counter(
+    "chat_answer_cache_tokens_saved_total",
+    "Токены LLM, сэкономленные ответами из кеша",
+    ["locale"],
+)
+
+
+class SemanticAnswerCache(IAnswerCache):
+    """
+    Семантический кеш ответов в chat_answer_cache (HNSW, cosine).
+
+    Работает в собственных коротких транзакциях: запись в кеш и счетчик
+    попаданий не зависят от транзакции запроса.
+
+    Метрики Prometheus: chat_answer_cache_lookups_total{result=hit|miss}
+    (hit rate) и chat_answer_cache_tokens_saved_total.
+    """
+
+    def __init__(
+        self,
+        embed: QueryEmbedder,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        similarity_threshold: float = settings.chat_answer_cache_similarity_threshold,
+        ttl: timedelta = timedelta(seconds=settings.chat_answer_cache_ttl_seconds),
+    ):
+        """
+        Args:
+            embed: Embedding вопроса
+            session_factory: Фабрика сессий
+            similarity_threshold: Минимальное cosine similarity вопросов
+            ttl: Время жизни записи
+        """
+        self._embed = embed
+        self._session_factory = session_factory
+        self._threshold = similarity_threshold
+        self._ttl = ttl
+
+    async def lookup(self, question: str, locale: str) -> Result[Optional[CachedAnswer]]:
+        """
+        Ищет ответ на близкий по смыслу вопрос той же локали.
+
+        Args:
+            question: Вопрос пользователя
+            locale: Локаль ответа
+
+        Returns:
+            Result с ответом (None - промах) или ошибкой
+        """
+        embedding_result = await self._embed(question)
+        if not embedding_result.is_success:
+            return Result.fail(embedding_result.error)
+
+        try:
+            distance = AnswerCacheModel.question_embedding.cosine_distance(
+                embedding_result.value
+            )
+            stmt = (
+                select(AnswerCacheModel, distance.label("distance"))
+                .where(AnswerCacheModel.locale == locale)
+                .where(AnswerCacheModel.expires_at > func.now())
+                .order_by(distance)
+                .limit(1)
+            )
+
+            async with self._session_factory() as session:
+                async with session.begin():
+                    row = (await session.execute(stmt)).first()
+                    similarity = 1.0 - float(row.distance) if row else 0.0
+                    if row is None or similarity < self._threshold:
+                        CHAT_ANSWER_CACHE_LOOKUPS.labels(locale=locale, result="miss").inc()
+                        return Result.ok(None)
+
+                    entry: AnswerCacheModel = row[0]
+                    await session.execute(
+                        update(AnswerCacheModel)
+                        .where(AnswerCacheModel.id == entry.id)
+                        .values(
+                            hit_count=AnswerCacheModel.hit_count + 1,
+                            last_hit_at=datetime.now(timezone.utc),
+                        )
+                    )
+                    cached = CachedAnswer(
+                        question=entry.question,
+                        answer=entry.answer,
+                        token_count=entry.token_count,
+                        similarity=similarity,
+                    )
+
+            CHAT_ANSWER_CACHE_LOOKUPS.labels(locale=locale, result="hit").inc()
+            CHAT_ANSWER_CACHE_TOKENS_SAVED.labels(locale=locale).inc(cached.token_count)
+            return Result.ok(cached)
+
+        except Exception as e:
+            return Result.fail(f"Answer cache lookup error: {str(e)}")
+
+    async def store(
+        self,
+        question: str,
+        locale: str,
+        answer: str,
+        token_count: int,
+    ) -> Result[None]:
+        """
+        Сохраняет ответ на вопрос (embedding берется из кеша embedder'а).
+
+        Args:
+            question: Вопрос пользователя
+            locale: Локаль ответа
+            answer: Ответ AI
+            token_count: Токены LLM, потраченные на ответ
+
+        Returns:
+            Result с успехом или ошибкой
+        """
+        embedding_result = await self._embed(question)
+        if not embedding_result.is_success:
+            return Result.fail(embedding_result.error)
+
+        try:
+            now = datetime.now(timezone.utc)
+            async with self._session_factory() as session:
+                async with session.begin():
+                    session.add(
+                        AnswerCacheModel(
+                            id=str(uuid4()),
+                            locale=locale,
+                            question=question,
+                            question_embedding=embedding_result.value,
+                            answer=answer,
+                            token_count=token_count,
+                            hit_count=0,
+                            created_at=now,
+                            expires_at=now + self._ttl,
+                        )
+                    )
+            return Result.ok(None)
+
+        except Exception as e:
+            return Result.fail(f"Answer cache store error: {str(e)}")
+
+    async def purge(self, locale: Optional[str] = None, expired_only: bool = False) -> int:
+        """
+        Удаляет записи кеша (например, после изменения законодательства).
+
+        Args:
+            locale: Только записи локали (None - все локали)
+            expired_only: Только устаревшие записи
+
+        Returns:
+            Количество удаленных записей
+        """
+        stmt = delete(AnswerCacheModel)
+        if locale is not None:
+            stmt = stmt.where(AnswerCacheModel.locale == locale)
+        if expired_only:
+            stmt = stmt.where(AnswerCacheModel.expires_at <= func.now())
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(stmt)
+        return result.rowcount or 0
@@ -0,0 +1,468 @@
+"""
+Hybrid Retriever
+
+Гибридный поиск по чанкам документов для RAG.
+
+Ищет одновременно в документах пользователя (document_chunks) и в общей
+правовой базе знаний (kb_chunks).
+
+Полнотекстовый поиск Postgres находит точные совпадения (номера статей,
+термины, названия), которые теряет векторный поиск, а pgvector -
+перефразированные вопросы без общих слов с текстом. Обе ветки
+выполняются параллельно, списки объединяются reciprocal rank fusion
+(по рангам, шкалы ts_rank и cosine distance несравнимы), затем MMR
+убирает почти одинаковые чанки (перекрытие чанков, копии документа).
+"""
+import asyncio
+import re
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import cast, func, select, text
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.infrastructure.database import async_session_factory
+from app.modules.chat.infrastructure.persistence.models.knowledge_base_model import (
+    KnowledgeChunkModel,
+    KnowledgeSourceModel,
+)
+from app.modules.document.domain.value_objects.document_status import DocumentStatusEnum
+from app.modules.document.infrastructure.persistence.models.chunk_model import (
+    TEXT_SEARCH_CONFIG,
+    ChunkModel,
+)
+from app.modules.document.infrastructure.persistence.models.document_model import (
+    DocumentModel,
+)
+
+# Слова запроса для to_tsquery: только \w, спецсимволы tsquery не попадают
+_TERM_RE = re.compile(r"\w+")
+_MAX_QUERY_TERMS = 32
+
+# ts_rank_cd normalization 32: rank / (rank + 1)
+_RANK_NORMALIZATION = 32
+
+# Источник чанка
+SOURCE_USER = "user"
+SOURCE_KNOWLEDGE_BASE = "knowledge_base"
+
+
+@dataclass(frozen=True)
+class RetrievedChunk:
+    """
+    Чанк, найденный гибридным поиском.
+
+    Attributes:
+        chunk_id: ID чанка
+        document_id: ID документа (для базы знаний - ID источника)
+        document_title: Название документа
+        content: Текст чанка
+        metadata: Метаданные чанка
+        embedding: Вектор чанка (для MMR)
+        similarity: Cosine similarity с запросом
+        score: RRF score (0 - чанк не прошел fusion)
+        source: Индекс, из которого найден чанк (user / knowledge_base)
+    """
+
+    chunk_id: str
+    document_id: str
+    document_title: str
+    content: str
+    metadata: dict
+    embedding: np.ndarray
+    similarity: float = 0.0
+    score: float = 0.0
+    source: str = SOURCE_USER
+
+
+def build_or_tsquery(query: str) -> Optional[str]:
+    """
+    Строит tsquery "слово | слово | ..." из запроса пользователя.
+
+    websearch_to_tsquery объединяет слова через AND, и длинный вопрос на
+    естественном языке почти никогда не совпадает целиком; OR + ts_rank_cd
+    ранжирует чанки по числу и близости совпавших слов.
+
+    Args:
+        query: Запрос пользователя
+
+    Returns:
+        Строка для to_tsquery или None, если слов нет
+    """
+    terms = list(dict.fromkeys(term.lower() for term in _TERM_RE.findall(query)))
+    if not terms:
+        return None
+    return " | ".join(terms[:_MAX_QUERY_TERMS])
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[RetrievedChunk]],
+    k: int = 60,
+) -> List[RetrievedChunk]:
+    """
+    Объединяет ранжированные списки: score(d) = sum(1 / (k + rank_i(d))).
+
+    Args:
+        rankings: Списки чанков, каждый отсортирован по релевантности
+        k: Константа сглаживания (больше - меньше вес первых мест)
+
+    Returns:
+        Уникальные чанки по убыванию RRF score
+    """
+    fused: Dict[str, RetrievedChunk] = {}
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, chunk in enumerate(ranking, start=1):
+            fused.setdefault(chunk.chunk_id, chunk)
+            scores[chunk.chunk_id] = scores.get(chunk.chunk_id, 0.0) + 1.0 / (k + rank)
+
+    ordered = sorted(fused, key=lambda chunk_id: (-scores[chunk_id], chunk_id))
+    return [replace(fused[chunk_id], score=scores[chunk_id]) for chunk_id in ordered]
+
+
+def mmr(
+    query_embedding: Sequence[float],
+    candidates: Sequence[RetrievedChunk],
+    top_k: int,
+    lambda_: float = 0.7,
+) -> List[RetrievedChunk]:
+    """
+    Maximal Marginal Relevance: жадно выбирает чанки с максимумом
+    lambda * relevance - (1 - lambda) * max_sim(выбранные).
+
+    Релевантность - RRF score, нормированный на максимум: чанк, найденный
+    только полнотекстовой веткой, не проигрывает из-за низкого cosine.
+
+    Args:
+        query_embedding: Вектор запроса
+        candidates: Кандидаты после fusion
+        top_k: Сколько чанков выбрать
+        lambda_: 1.0 - только релевантность, 0.0 - только разнообразие
+
+    Returns:
+        Выбранные чанки (similarity заполнена cosine similarity с запросом)
+    """
+    if not candidates or top_k <= 0:
+        return []
+
+    vectors = _normalize(np.vstack([chunk.embedding for chunk in candidates]))
+    query = _normalize(np.asarray(query_embedding, dtype=np.float32)[np.newaxis, :])[0]
+    similarity = vectors @ query
+
+    scores = np.array([chunk.score for chunk in candidates], dtype=np.float64)
+    relevance = scores / scores.max() if scores.max() > 0 else similarity
+
+    selected: List[int] = []
+    # Максимальное сходство кандидата с уже выбранными
+    redundancy = np.full(len(candidates), -np.inf)
+    available = np.ones(len(candidates), dtype=bool)
+    for _ in range(min(top_k, len(candidates))):
+        penalty = np.where(np.isfinite(redundancy), redundancy, 0.0)
+        marginal = lambda_ * relevance - (1.0 - lambda_) * penalty
+        marginal[~available] = -np.inf
+        best = int(np.argmax(marginal))
+        selected.append(best)
+        available[best] = False
+        redundancy = np.maximum(redundancy, vectors @ vectors[best])
+
+    return [replace(candidates[i], similarity=float(similarity[i])) for i in selected]
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """Нормирует строки матрицы (нулевые векторы остаются нулевыми)."""
+    matrix = matrix.astype(np.float32, copy=False)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+class HybridRetriever:
+    """
+    Гибридный поиск по document_chunks и kb_chunks (full-text + pgvector,
+    RRF, MMR).
+
+    Каждая ветка открывает собственную сессию: AsyncSession не выполняет
+    запросы параллельно.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        candidates_per_leg: int = settings.rag_candidates_per_leg,
+        rrf_k: int = settings.rag_rrf_k,
+        mmr_lambda: float = settings.rag_mmr_lambda,
+        ef_search: int = settings.rag_hnsw_ef_search,
+        owner_ef_search: int = settings.rag_hnsw_owner_ef_search,
+        knowledge_base: bool = settings.rag_knowledge_base_enabled,
+    ):
+        """
+        Args:
+            session_factory: Фабрика сессий
+            candidates_per_leg: Кандидатов из каждой ветки
+            rrf_k: Константа reciprocal rank fusion
+            mmr_lambda: Баланс релевантности и разнообразия
+            ef_search: hnsw.ef_search векторной ветки
+            owner_ef_search: hnsw.ef_search для документов владельца
+            knowledge_base: Искать ли в общей базе знаний
+        """
+        self._session_factory = session_factory
+        self._candidates = candidates_per_leg
+        self._rrf_k = rrf_k
+        self._mmr_lambda = mmr_lambda
+        self._ef_search = ef_search
+        self._owner_ef_search = owner_ef_search
+        self._knowledge_base = knowledge_base
+
+    async def retrieve(
+        self,
+        owner_id: str,
+        query: str,
+        query_embedding: Sequence[float],
+        top_k: int = 5,
+        min_similarity: float = 0.0,
+        include_knowledge_base: Optional[bool] = None,
+    ) -> List[RetrievedChunk]:
+        """
+        Гибридный поиск: все ветки параллельно, затем RRF и MMR.
+
+        Документы пользователя и база знаний ранжируются отдельными
+        списками и объединяются одним RRF: в контекст попадают и
+        собственные документы, и статьи законов.
+
+        Args:
+            owner_id: ID владельца документов
+            query: Запрос пользователя
+            query_embedding: Вектор запроса
+            top_k: Количество чанков
+            min_similarity: Порог cosine similarity векторных веток
+                (полнотекстовые совпадения не отсекаются)
+            include_knowledge_base: Искать в базе знаний (None - по настройке)
+
+        Returns:
+            Список чанков для контекста
+        """
+        if include_knowledge_base is None:
+            include_knowledge_base = self._knowledge_base
+
+        async with asyncio.TaskGroup() as group:
+            legs = [
+                group.create_task(self.lexical_search(owner_id, query, self._candidates)),
+                group.create_task(
+                    self.vector_search(owner_id, query_embedding, self._candidates, min_similarity)
+                ),
+            ]
+            if include_knowledge_base:
+                legs.append(
+                    group.create_task(self.knowledge_lexical_search(query, self._candidates))
+                )
+                legs.append(
+                    group.create_task(
+                        self.knowledge_vector_search(
+                            query_embedding, self._candidates, min_similarity
+                        )
+                    )
+                )
+
+        fused = reciprocal_rank_fusion([leg.result() for leg in legs], k=self._rrf_k)
+        return mmr(query_embedding, fused, top_k, self._mmr_lambda)
+
+    async def lexical_search(
+        self,
+        owner_id: str,
+        query: str,
+        limit: int,
+    ) -> List[RetrievedChunk]:
+        """
+        Полнотекстовый поиск по документам пользователя (GIN по
+        content_tsv, ранжирование ts_rank_cd).
+
+        Args:
+            owner_id: ID владельца документов
+            query: Запрос пользователя
+            limit: Количество кандидатов
+
+        Returns:
+            Чанки по убыванию ts_rank_cd
+        """
+        return await self._lexical(
+            self._select_chunks().where(ChunkModel.owner_id == owner_id),
+            ChunkModel,
+            query,
+            limit,
+            SOURCE_USER,
+        )
+
+    async def vector_search(
+        self,
+        owner_id: str,
+        query_embedding: Sequence[float],
+        limit: int,
+        min_similarity: float = 0.0,
+    ) -> List[RetrievedChunk]:
+        """
+        ANN поиск по документам пользователя (HNSW, cosine distance).
+
+        Фильтр по владельцу применяется к кандидатам HNSW, поэтому
+        ветка использует увеличенный ef_search (owner_ef_search): при
+        обычном большинство кандидатов принадлежит другим пользователям.
+
+        Args:
+            owner_id: ID владельца документов
+            query_embedding: Вектор запроса
+            limit: Количество кандидатов
+            min_similarity: Порог cosine similarity
+
+        Returns:
+            Чанки по убыванию similarity
+        """
+        distance = ChunkModel.embedding.cosine_distance(list(query_embedding))
+        return await self._vector(
+            self._select_chunks(distance.label("distance")).where(ChunkModel.owner_id == owner_id),
+            distance,
+            limit,
+            min_similarity,
+            SOURCE_USER,
+            ef_search=self._owner_ef_search,
+        )
+
+    async def knowledge_lexical_search(self, query: str, limit: int) -> List[RetrievedChunk]:
+        """
+        Полнотекстовый поиск по базе знаний.
+
+        Args:
+            query: Запрос пользователя
+            limit: Количество кандидатов
+
+        Returns:
+            Чанки по убыванию ts_rank_cd
+        """
+        return await self._lexical(
+            self._select_knowledge_chunks(),
+            KnowledgeChunkModel,
+            query,
+            limit,
+            SOURCE_KNOWLEDGE_BASE,
+        )
+
+    async def knowledge_vector_search(
+        self,
+        query_embedding: Sequence[float],
+        limit: int,
+        min_similarity: float = 0.0,
+    ) -> List[RetrievedChunk]:
+        """
+        ANN поиск по базе знаний (HNSW, cosine distance).
+
+        Args:
+            query_embedding: Вектор запроса
+            limit: Количество кандидатов
+            min_similarity: Порог cosine similarity
+
+        Returns:
+            Чанки по убыванию similarity
+        """
+        distance = KnowledgeChunkModel.embedding.cosine_distance(list(query_embedding))
+        return await self._vector(
+            self._select_knowledge_chunks(distance.label("distance")),
+            distance,
+            limit,
+            min_similarity,
+            SOURCE_KNOWLEDGE_BASE,
+        )
+
+    async def _lexical(
+        self,
+        stmt,
+        model,
+        query: str,
+        limit: int,
+        source: str,
+    ) -> List[RetrievedChunk]:
+        """Полнотекстовая ветка по content_tsv модели чанков."""
+        or_query = build_or_tsquery(query)
+        if or_query is None:
+            return []
+
+        tsquery = func.to_tsquery(cast(TEXT_SEARCH_CONFIG, REGCONFIG), or_query)
+        rank = func.ts_rank_cd(model.content_tsv, tsquery, _RANK_NORMALIZATION)
+        stmt = (
+            stmt.where(model.content_tsv.op("@@")(tsquery))
+            .order_by(rank.desc(), model.id)
+            .limit(limit)
+        )
+
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            return [self._to_chunk(row, source=source) for row in result]
+
+    async def _vector(
+        self,
+        stmt,
+        distance,
+        limit: int,
+        min_similarity: float,
+        source: str,
+        ef_search: Optional[int] = None,
+    ) -> List[RetrievedChunk]:
+        """Векторная ветка (SET LOCAL hnsw.ef_search в своей транзакции)."""
+        stmt = stmt.order_by(distance).limit(limit)
+        ef_search = max(int(ef_search or self._ef_search), limit)
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                await session.execute(
+                    text(f"SET LOCAL hnsw.ef_search = {ef_search}")
+                )
+                result = await session.execute(stmt)
+                chunks = [
+                    self._to_chunk(row, similarity=1.0 - float(row.distance), source=source)
+                    for row in result
+                ]
+
+        return [chunk for chunk in chunks if chunk.similarity >= min_similarity]
+
+    @staticmethod
+    def _select_chunks(*extra):
+        """SELECT чанков с названием документа (без content_tsv и удаленных документов)."""
+        return (
+            select(
+                ChunkModel.id,
+                ChunkModel.document_id,
+                ChunkModel.content,
+                ChunkModel.chunk_metadata,
+                ChunkModel.embedding,
+                DocumentModel.title,
+                *extra,
+            )
+            .join(DocumentModel, DocumentModel.id == ChunkModel.document_id)
+            .where(DocumentModel.status != DocumentStatusEnum.DELETED.value)
+        )
+
+    @staticmethod
+    def _select_knowledge_chunks(*extra):
+        """SELECT чанков базы знаний с названием источника (колонки как у _select_chunks)."""
+        return select(
+            KnowledgeChunkModel.id,
+            KnowledgeChunkModel.source_id.label("document_id"),
+            KnowledgeChunkModel.content,
+            KnowledgeChunkModel.chunk_metadata,
+            KnowledgeChunkModel.embedding,
+            KnowledgeSourceModel.title,
+            *extra,
+        ).join(KnowledgeSourceModel, KnowledgeSourceModel.id == KnowledgeChunkModel.source_id)
+
+    @staticmethod
+    def _to_chunk(row, similarity: float = 0.0, source: str = SOURCE_USER) -> RetrievedChunk:
+        """Строка результата -> RetrievedChunk."""
+        return RetrievedChunk(
+            chunk_id=row.id,
+            document_id=row.document_id,
+            document_title=row.title,
+            content=row.content,
+            metadata=row.chunk_metadata or {},
+            embedding=np.asarray(row.embedding, dtype=np.float32),
+            similarity=similarity,
+            source=source,
+        )
@@ -0,0 +1,302 @@
+"""
+Knowledge Base Ingestor
+
+Загрузка общей правовой базы знаний (кодексы, федеральные законы,
+судебная практика) в kb_sources / kb_chunks.
+
+Файл источника читается потоково (LegalTextChunker принимает итератор
+строк), embeddings создаются батчами, чанки пишутся в kb_chunks через
+COPY (asyncpg copy_records_to_table) - на порядок быстрее INSERT для
+кодекса на тысячи чанков.
+
+Повторная загрузка инкрементальная:
+- источник с тем же SHA-256 файла пропускается
+- в измененном источнике embeddings чанков с тем же SHA-256 текста
+  переиспользуются (поправка в одну статью не пересчитывает кодекс)
+
+Источник заменяется в одной транзакции: поиск видит либо старую, либо
+новую версию.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from uuid import uuid4
+
+from pgvector.asyncpg import register_vector
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.domain.result import Result
+from app.core.infrastructure.database import async_session_factory
+from app.modules.chat.infrastructure.persistence.models.knowledge_base_model import (
+    KB_SOURCE_TYPES,
+    KnowledgeChunkModel,
+    KnowledgeSourceModel,
+)
+from app.modules.chat.infrastructure.services.legal_chunker import (
+    LegalTextChunker,
+    TextChunk,
+)
+from app.modules.chat.infrastructure.services.llm_gateway import LLMGateway, llm_gateway
+from app.modules.chat.infrastructure.services.rag_service import RAGServiceImpl
+
+# Колонки COPY (content_tsv - генерируемая, created_at - default)
+_COPY_COLUMNS = (
+    "id",
+    "source_id",
+    "chunk_index",
+    "content",
+    "content_hash",
+    "metadata",
+    "embedding",
+)
+
+_HASH_BLOCK_SIZE = 1 << 20
+_MAX_TITLE_CHARS = 500
+
+
+@dataclass(frozen=True)
+class IngestionReport:
+    """
+    Результат загрузки источника.
+
+    Attributes:
+        source_key: Ключ источника
+        status: ingested / unchanged
+        chunks: Количество чанков
+        embedded: Чанков с новыми embeddings
+        reused: Чанков с переиспользованными embeddings
+    """
+
+    source_key: str
+    status: str
+    chunks: int = 0
+    embedded: int = 0
+    reused: int = 0
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 файла (блоками, без чтения целиком)."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while block := file.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def text_sha256(text: str) -> str:
+    """SHA-256 текста чанка."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def read_title(path: Path) -> str:
+    """Название источника: первая непустая строка файла или имя файла."""
+    with path.open(encoding="utf-8", errors="replace") as file:
+        for line in file:
+            if line.strip():
+                return line.strip()[:_MAX_TITLE_CHARS]
+    return path.stem[:_MAX_TITLE_CHARS]
+
+
+class KnowledgeBaseIngestor:
+    """
+    Загрузка источников базы знаний (chunking + embeddings + COPY).
+
+    Example:
+        >>> ingestor = KnowledgeBaseIngestor()
+        >>> result = await ingestor.ingest_file(
+        ...     Path("corpus/codes/tk_rf.txt"), "codes/tk_rf.txt", "code"
+        ... )
+        >>> result.value.status
+        'ingested'
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        gateway: Optional[LLMGateway] = None,
+        chunker: Optional[LegalTextChunker] = None,
+    ):
+        """
+        Args:
+            session_factory: Фабрика сессий
+            gateway: LLM gateway (по умолчанию - общий для процесса)
+            chunker: Чанкер (по умолчанию - с настройками RAG)
+        """
+        self._session_factory = session_factory
+        self._gateway = gateway or llm_gateway
+        self._chunker = chunker or LegalTextChunker(
+            model=RAGServiceImpl.EMBEDDING_MODEL,
+            max_tokens=settings.rag_chunk_max_tokens,
+            min_tokens=settings.rag_chunk_min_tokens,
+        )
+
+    async def ingest_file(
+        self,
+        path: Path,
+        source_key: str,
+        source_type: str,
+        title: Optional[str] = None,
+        force: bool = False,
+    ) -> Result[IngestionReport]:
+        """
+        Загружает (или обновляет) источник из текстового файла UTF-8.
+
+        Args:
+            path: Путь к файлу
+            source_key: Ключ источника (стабильный между загрузками)
+            source_type: Тип источника (code, federal_law, court_practice, other)
+            title: Название (по умолчанию - первая строка файла)
+            force: Загрузить, даже если файл не изменился
+
+        Returns:
+            Result с IngestionReport или ошибкой
+        """
+        if source_type not in KB_SOURCE_TYPES:
+            return Result.fail(f"Unknown source type: {source_type}")
+
+        content_hash = file_sha256(path)
+        title = (title or read_title(path))[:_MAX_TITLE_CHARS]
+
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    source = (
+                        await session.execute(
+                            select(KnowledgeSourceModel)
+                            .where(KnowledgeSourceModel.source_key == source_key)
+                            .with_for_update()
+                        )
+                    ).scalar_one_or_none()
+
+                    if source is not None and source.content_hash == content_hash and not force:
+                        return Result.ok(IngestionReport(source_key, "unchanged", source.chunk_count))
+
+                    reusable: Dict[str, Sequence[float]] = {}
+                    if source is None:
+                        source = KnowledgeSourceModel(id=str(uuid4()), source_key=source_key)
+                        session.add(source)
+                    else:
+                        reusable = await self._existing_embeddings(session, source.id)
+                        await session.execute(
+                            delete(KnowledgeChunkModel).where(
+                                KnowledgeChunkModel.source_id == source.id
+                            )
+                        )
+
+                    source.title = title
+                    source.source_type = source_type
+                    source.content_hash = content_hash
+                    source.ingested_at = datetime.now(timezone.utc)
+                    source.chunk_count = 0
+                    # Строка источника до COPY чанков (FK)
+                    await session.flush()
+
+                    report = await self._copy_chunks(session, source, path, reusable)
+                    source.chunk_count = report.chunks
+
+            return Result.ok(report)
+
+        except Exception as e:
+            return Result.fail(f"Knowledge base ingestion error ({source_key}): {str(e)}")
+
+    async def _existing_embeddings(
+        self,
+        session: AsyncSession,
+        source_id: str,
+    ) -> Dict[str, Sequence[float]]:
+        """Embeddings текущих чанков источника по SHA-256 текста."""
+        result = await session.execute(
+            select(KnowledgeChunkModel.content_hash, KnowledgeChunkModel.embedding)
+            .where(KnowledgeChunkModel.source_id == source_id)
+        )
+        return {row.content_hash: row.embedding for row in result}
+
+    async def _copy_chunks(
+        self,
+        session: AsyncSession,
+        source: KnowledgeSourceModel,
+        path: Path,
+        reusable: Dict[str, Sequence[float]],
+    ) -> IngestionReport:
+        """Чанкирует файл потоком и пишет чанки батчами через COPY."""
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+        await register_vector(driver)
+
+        metadata = {"title": source.title, "source_type": source.source_type}
+        chunks = embedded = reused = 0
+
+        batch: List[TextChunk] = []
+        batch_tokens = 0
+
+        async def flush() -> None:
+            nonlocal chunks, embedded, reused
+            hashes = [text_sha256(chunk.content) for chunk in batch]
+            missing = [i for i, value in enumerate(hashes) if value not in reusable]
+            vectors = await self._create_embeddings([batch[i].content for i in missing])
+            new_vectors = dict(zip(missing, vectors, strict=True))
+
+            records = [
+                (
+                    str(uuid4()),
+                    source.id,
+                    chunk.index,
+                    chunk.content,
+                    hashes[i],
+                    json.dumps(
+                        {**metadata, **chunk.section, "token_count": chunk.token_count},
+                        ensure_ascii=False,
+                    ),
+                    new_vectors[i] if i in new_vectors else reusable[hashes[i]],
+                )
+                for i, chunk in enumerate(batch)
+            ]
+            await driver.copy_records_to_table(
+                KnowledgeChunkModel.__tablename__,
+                records=records,
+                columns=_COPY_COLUMNS,
+            )
+
+            chunks += len(batch)
+            embedded += len(missing)
+            reused += len(batch) - len(missing)
+
+        with path.open(encoding="utf-8", errors="replace") as file:
+            for chunk in self._chunker.chunks(file):
+                if batch and (
+                    len(batch) >= RAGServiceImpl.EMBEDDING_BATCH_SIZE
+                    or batch_tokens + chunk.token_count > RAGServiceImpl.EMBEDDING_BATCH_TOKENS
+                ):
+                    await flush()
+                    batch, batch_tokens = [], 0
+                batch.append(chunk)
+                batch_tokens += chunk.token_count
+
+        if batch:
+            await flush()
+
+        return IngestionReport(source.source_key, "ingested", chunks, embedded, reused)
+
+    async def _create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embeddings батча одним запросом (в порядке texts).
+
+        Raises:
+            RuntimeError: Если API вернул не все embeddings
+        """
+        if not texts:
+            return []
+        response = await self._gateway.embeddings(
+            operation="embedding_knowledge_base",
+            model=RAGServiceImpl.EMBEDDING_MODEL,
+            input=texts,
+        )
+        if len(response.data) != len(texts):
+            raise RuntimeError(f"Expected {len(texts)} embeddings, got {len(response.data)}")
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
@@ -0,0 +1,340 @@
+"""
+Legal Text Chunker
+
+Разбиение текста юридических документов на чанки для RAG индексации.
+
+Размер чанка измеряется токенами модели embeddings (tiktoken), а не
+символами: для кириллицы один и тот же размер в символах дает в 2-3 раза
+разное число токенов. Границы чанков по возможности совпадают со
+структурой документа (раздел / глава / статья / часть / пункт), и каждый
+чанк несет метаданные раздела, в котором он начинается.
+
+Текст обрабатывается потоково: в памяти только текущий абзац и текущий
+чанк, поэтому кодекс на 1000 страниц не удваивает потребление памяти.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from app.modules.chat.infrastructure.services.tokenizer import get_encoding
+
+_SECTION_RE = re.compile(r"^(?:Раздел|РАЗДЕЛ)\s+([IVXLCDM]+|\d+)\b")
+_CHAPTER_RE = re.compile(r"^(?:Глава|ГЛАВА)\s+(\d+(?:\.\d+)*)\b")
+_ARTICLE_RE = re.compile(r"^(?:Статья|СТАТЬЯ)\s+(\d+(?:\.\d+)*)\b")
+# "Пункт 3", "1.2. ...", "1) ...", "а) ..."
+_POINT_RE = re.compile(
+    r"^(?:Пункт\s+(\d+(?:\.\d+)*)\b|(\d+(?:\.\d+)+)\.?\s|(\d+)\)\s|([а-я])\)\s)"
+)
+# "Часть 2", "2. ..." (в статье - часть, вне статьи - пункт договора)
+_PART_RE = re.compile(r"^(?:Часть\s+(\d+)\b|(\d+)\.\s)")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?;:])\s+")
+
+# Максимальная длина заголовка, переносимого в продолжение статьи
+_MAX_HEADING_CHARS = 200
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """
+    Чанк документа.
+
+    Attributes:
+        index: Порядковый номер в документе
+        content: Текст чанка
+        token_count: Размер в токенах модели embeddings
+        section: Структура, в которой начинается чанк
+            (section / chapter / article / part / point / heading)
+    """
+
+    index: int
+    content: str
+    token_count: int
+    section: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _Unit:
+    """Абзац или структурный элемент документа."""
+
+    text: str
+    section: Dict[str, str]
+    heading: Optional[str]
+    opens_article: bool
+
+
+class _SectionState:
+    """Текущее положение в структуре документа."""
+
+    def __init__(self) -> None:
+        self.section: Optional[str] = None
+        self.chapter: Optional[str] = None
+        self.article: Optional[str] = None
+        self.part: Optional[str] = None
+        self.point: Optional[str] = None
+        self.heading: Optional[str] = None
+
+    def apply(self, line: str) -> Optional[str]:
+        """
+        Обновляет положение по строке.
+
+        Returns:
+            Тип структурного элемента, который открывает строка, или None
+        """
+        if match := _SECTION_RE.match(line):
+            self.section = match.group(1)
+            self.chapter = self.article = self.part = self.point = self.heading = None
+            return "section"
+        if match := _CHAPTER_RE.match(line):
+            self.chapter = match.group(1)
+            self.article = self.part = self.point = None
+            self.heading = line[:_MAX_HEADING_CHARS]
+            return "chapter"
+        if match := _ARTICLE_RE.match(line):
+            self.article = match.group(1)
+            self.part = self.point = None
+            self.heading = line[:_MAX_HEADING_CHARS]
+            return "article"
+        if match := _POINT_RE.match(line):
+            self.point = next(group for group in match.groups() if group)
+            return "point"
+        if match := _PART_RE.match(line):
+            number = match.group(1) or match.group(2)
+            if self.article is None and match.group(1) is None:
+                self.point = number
+                return "point"
+            self.part = number
+            self.point = None
+            return "part"
+        return None
+
+    def snapshot(self) -> Dict[str, str]:
+        """Положение в виде метаданных (только заданные уровни)."""
+        values = {
+            "section": self.section,
+            "chapter": self.chapter,
+            "article": self.article,
+            "part": self.part,
+            "point": self.point,
+            "heading": self.heading,
+        }
+        return {key: value for key, value in values.items() if value is not None}
+
+
+class LegalTextChunker:
+    """
+    Потоковый token-aware чанкер юридических текстов.
+
+    Правила упаковки:
+    - абзацы добавляются в чанк, пока он помещается в max_tokens
+    - новая статья/глава/раздел начинает новый чанк, если текущий уже
+      не меньше min_tokens (мелкие статьи упаковываются вместе)
+    - чанк, начинающийся в середине статьи, получает ее заголовок
+      первой строкой (контекст для поиска и модели)
+    - абзац больше max_tokens режется по предложениям, а предложение
+      больше max_tokens - по токенам
+
+    Example:
+        >>> chunker = LegalTextChunker("text-embedding-3-small", max_tokens=512)
+        >>> for chunk in chunker.chunks(document.extracted_text):
+        ...     print(chunk.index, chunk.token_count, chunk.section.get("article"))
+    """
+
+    # Токенов на разделитель абзацев "\n"
+    _SEPARATOR_TOKENS = 1
+
+    def __init__(self, model: str, max_tokens: int = 512, min_tokens: int = 128):
+        """
+        Args:
+            model: Модель embeddings (определяет tokenizer)
+            max_tokens: Максимальный размер чанка
+            min_tokens: Минимальный размер чанка перед границей статьи
+        """
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        self._encoding = get_encoding(model)
+        self._max_tokens = max_tokens
+        self._min_tokens = min(min_tokens, max_tokens)
+        # Заголовок длиннее этого не переносится (съедает бюджет чанка)
+        self._max_heading_tokens = max_tokens // 8
+
+    def count_tokens(self, text: str) -> int:
+        """Количество токенов текста."""
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def chunks(self, text: Union[str, Iterable[str]]) -> Iterator[TextChunk]:
+        """
+        Разбивает текст на чанки.
+
+        Args:
+            text: Текст или итератор строк (например, открытый файл)
+
+        Yields:
+            TextChunk по порядку документа
+        """
+        lines = _iter_lines(text) if isinstance(text, str) else text
+        parts: List[str] = []
+        tokens = 0
+        section: Dict[str, str] = {}
+        index = 0
+        heading_tokens: Tuple[Optional[str], int] = (None, 0)
+
+        for unit in self._units(lines):
+            unit_tokens = self.count_tokens(unit.text)
+
+            if parts and (
+                (unit.opens_article and tokens >= self._min_tokens)
+                or tokens + self._SEPARATOR_TOKENS + unit_tokens > self._max_tokens
+            ):
+                yield TextChunk(index, "\n".join(parts), tokens, section)
+                index += 1
+                parts, tokens = [], 0
+
+            if not parts:
+                section = unit.section
+                # Заголовок статьи для чанков, начинающихся в ее середине
+                carry: Optional[str] = None
+                carry_tokens = 0
+                if unit.heading:
+                    if heading_tokens[0] != unit.heading:
+                        heading_tokens = (unit.heading, self.count_tokens(unit.heading))
+                    if heading_tokens[1] <= self._max_heading_tokens:
+                        carry = unit.heading
+                        carry_tokens = heading_tokens[1] + self._SEPARATOR_TOKENS
+
+                if unit_tokens > self._max_tokens or (
+                    carry
+                    and not unit.text.startswith(carry)
+                    and unit_tokens + carry_tokens > self._max_tokens
+                ):
+                    pieces = self._split_oversized(unit.text, self._max_tokens - carry_tokens)
+                    for piece, piece_tokens in pieces:
+                        if carry and not piece.startswith(carry):
+                            piece = f"{carry}\n{piece}"
+                            piece_tokens += carry_tokens
+                        if parts:
+                            yield TextChunk(index, parts[0], tokens, section)
+                            index += 1
+                        # Последний кусок остается в буфере и добирается абзацами
+                        parts, tokens = [piece], piece_tokens
+                    continue
+
+                if carry and not unit.text.startswith(carry):
+                    parts.append(carry)
+                    tokens = carry_tokens
+            else:
+                tokens += self._SEPARATOR_TOKENS
+
+            parts.append(unit.text)
+            tokens += unit_tokens
+
+        if parts:
+            yield TextChunk(index, "\n".join(parts), tokens, section)
+
+    def _units(self, lines: Iterable[str]) -> Iterator[_Unit]:
+        """
+        Группирует строки в абзацы.
+
+        Абзац заканчивается пустой строкой или строкой, открывающей
+        структурный элемент. Очень длинный абзац без переносов (PDF без
+        разметки) отдается частями, чтобы не держать его целиком.
+        """
+        state = _SectionState()
+        current: List[str] = []
+        current_chars = 0
+        current_section: Dict[str, str] = {}
+        current_heading: Optional[str] = None
+        opens_article = False
+        max_chars = self._max_tokens * 8
+
+        for raw in lines:
+            line = raw.strip()
+            if not line:
+                if current:
+                    yield _Unit("\n".join(current), current_section, current_heading, opens_article)
+                    current, current_chars = [], 0
+                continue
+
+            kind = state.apply(line)
+            if kind is not None or current_chars >= max_chars:
+                if current:
+                    yield _Unit("\n".join(current), current_section, current_heading, opens_article)
+                    current, current_chars = [], 0
+
+            if not current:
+                current_section = state.snapshot()
+                current_heading = state.heading
+                opens_article = kind in ("section", "chapter", "article")
+            current.append(line)
+            current_chars += len(line)
+
+        if current:
+            yield _Unit("\n".join(current), current_section, current_heading, opens_article)
+
+    def _split_oversized(self, text: str, budget: int) -> Iterator[Tuple[str, int]]:
+        """Режет абзац больше бюджета: по предложениям, затем по токенам."""
+        budget = max(budget, 1)
+        parts: List[str] = []
+        tokens = 0
+        for sentence in _SENTENCE_END_RE.split(text):
+            sentence_tokens = self.count_tokens(sentence)
+            separator = 1 if parts else 0
+            if parts and tokens + separator + sentence_tokens > budget:
+                yield " ".join(parts), tokens
+                parts, tokens, separator = [], 0, 0
+            if sentence_tokens > budget:
+                yield from self._split_tokens(sentence, budget)
+                continue
+            parts.append(sentence)
+            tokens += separator + sentence_tokens
+        if parts:
+            yield " ".join(parts), tokens
+
+    def _split_tokens(self, text: str, budget: int) -> Iterator[Tuple[str, int]]:
+        """Режет текст по токенам, не разрывая UTF-8 символы."""
+        token_ids = self._encoding.encode(text, disallowed_special=())
+        pending = b""
+        for start in range(0, len(token_ids), budget):
+            window = token_ids[start:start + budget]
+            data = pending + self._encoding.decode_bytes(window)
+            cut = _complete_utf8_prefix(data)
+            pending = data[cut:]
+            piece = data[:cut].decode("utf-8").strip()
+            if piece:
+                yield piece, len(window)
+        if pending:
+            piece = pending.decode("utf-8", errors="ignore").strip()
+            if piece:
+                yield piece, self.count_tokens(piece)
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Строки текста без копирования всего текста (в отличие от splitlines)."""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        if end == -1:
+            end = length
+        yield text[start:end]
+        start = end + 1
+
+
+def _complete_utf8_prefix(data: bytes) -> int:
+    """Длина префикса data, заканчивающегося целым UTF-8 символом."""
+    end = len(data)
+    lead = end
+    # Пропускаем байты продолжения (10xxxxxx), не больше 3
+    while lead > 0 and end - lead < 3 and data[lead - 1] & 0xC0 == 0x80:
+        lead -= 1
+    if lead == 0:
+        return end
+    first = data[lead - 1]
+    if first < 0x80:
+        size = 1
+    elif first >= 0xF0:
+        size = 4
+    elif first >= 0xE0:
+        size = 3
+    else:
+        size = 2
+    return end if end - (lead - 1) >= size else lead - 1
@@ -0,0 +1,493 @@
+"""
+LLM Gateway
+
+Общий для процесса клиент OpenAI (chat completions и embeddings).
+
+Раньше каждый WebSocket и каждый REST запрос создавал свой AsyncOpenAI со
+своим пулом соединений, без ограничения параллельных вызовов. Gateway:
+- один httpx.AsyncClient (HTTP/2, keep-alive) на event loop процесса
+- глобальный и per-user семафоры параллельных вызовов
+- retry с экспоненциальной задержкой и jitter (tenacity) для
+  сетевых ошибок, 429 и 5xx; общий бюджет времени вызова
+- circuit breaker: после серии сбоев вызовы сразу отклоняются
+- метрики Prometheus: длительность, ожидание слота, токены, retry
+
+Ретраи SDK отключены (max_retries=0), повторы выполняет gateway.
+"""
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+from openai.types import CreateEmbeddingResponse
+from openai.types.chat import ChatCompletion
+from prometheus_client import Counter, Gauge, Histogram
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+LLM_REQUESTS = Counter(
+    "llm_requests_total",
+    "Вызовы LLM через gateway",
+    ["operation", "outcome"],
+)
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "Длительность вызова LLM (с ожиданием слота и retry)",
+    ["operation"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 60, 120),
+)
+LLM_QUEUE_WAIT = Histogram(
+    "llm_queue_wait_seconds",
+    "Ожидание слота параллельных вызовов LLM",
+    ["operation"],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30),
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "Токены LLM (prompt / completion)",
+    ["operation", "kind"],
+)
+LLM_RETRIES = Counter(
+    "llm_retries_total",
+    "Повторные попытки вызовов LLM",
+    ["operation"],
+)
+LLM_IN_FLIGHT = Gauge(
+    "llm_requests_in_flight",
+    "Выполняющиеся вызовы LLM",
+)
+LLM_CIRCUIT_OPEN = Gauge(
+    "llm_circuit_open",
+    "Circuit breaker LLM открыт (1) или закрыт (0)",
+)
+
+
+class LLMGatewayError(Exception):
+    """Базовая ошибка LLM gateway."""
+
+
+class LLMUnavailableError(LLMGatewayError):
+    """Circuit breaker открыт: LLM временно недоступен."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"LLM is temporarily unavailable, retry after {retry_after:.0f}s")
+
+
+class LLMTimeoutError(LLMGatewayError):
+    """Вызов не уложился в бюджет времени (с ожиданием слота и retry)."""
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Ошибки, после которых вызов повторяется (сеть, таймаут, 429, 5xx)."""
+    return isinstance(
+        error,
+        (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError),
+    )
+
+
+def _is_upstream_failure(error: BaseException) -> bool:
+    """Ошибки, которые считает circuit breaker (сеть, таймаут, 5xx)."""
+    return isinstance(error, (openai.APIConnectionError, openai.InternalServerError))
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker (closed -> open -> half-open).
+
+    После failure_threshold сбоев подряд вызовы отклоняются reset_timeout
+    секунд, затем пропускается один пробный вызов: успех закрывает
+    breaker, сбой снова открывает. Пробный вызов, не вернувший результата,
+    через reset_timeout заменяется новым.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_threshold: Сбоев подряд до открытия
+            reset_timeout: Время в открытом состоянии (секунды)
+            clock: Монотонные часы
+        """
+        self._threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Текущее состояние."""
+        return self._state
+
+    def retry_after(self) -> float:
+        """Секунд до пробного вызова (0 - вызов разрешен)."""
+        if self._state == self.CLOSED:
+            return 0.0
+        started = self._opened_at if self._state == self.OPEN else self._probe_started_at
+        return max(0.0, started + self._reset_timeout - self._clock())
+
+    def before_call(self) -> None:
+        """
+        Проверяет, разрешен ли вызов.
+
+        Raises:
+            LLMUnavailableError: Если breaker открыт или идет пробный вызов
+        """
+        if self._state == self.CLOSED:
+            return
+        wait = self.retry_after()
+        if wait > 0:
+            raise LLMUnavailableError(wait)
+        self._state = self.HALF_OPEN
+        self._probe_started_at = self._clock()
+
+    def record_success(self) -> None:
+        """Upstream ответил: breaker закрывается."""
+        if self._state != self.CLOSED:
+            logger.info("LLM circuit breaker closed")
+            LLM_CIRCUIT_OPEN.set(0)
+        self._state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Сбой upstream: после порога (или в half-open) breaker открывается."""
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self._threshold:
+            if self._state != self.OPEN:
+                logger.warning(f"LLM circuit breaker opened after {self._failures} failures")
+                LLM_CIRCUIT_OPEN.set(1)
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+
+
+@dataclass
+class _UserSlot:
+    """Семафор пользователя и число ожидающих/выполняющихся вызовов."""
+
+    semaphore: asyncio.Semaphore
+    holders: int = 0
+
+
+@dataclass
+class _LoopState:
+    """Клиент и семафоры, привязанные к event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    http_client: httpx.AsyncClient
+    client: AsyncOpenAI
+    semaphore: asyncio.Semaphore
+    user_slots: Dict[str, _UserSlot] = field(default_factory=dict)
+
+
+class LLMGateway:
+    """
+    Общий клиент OpenAI с лимитами параллельности, retry и circuit breaker.
+
+    Клиент и семафоры создаются лениво в текущем event loop: API
+    использует один loop, воркер Celery - свой; при смене loop (eager
+    задачи через asyncio.run) состояние создается заново.
+
+    Example:
+        >>> response = await llm_gateway.chat_completion(
+        ...     operation="chat",
+        ...     user_id=user_id,
+        ...     model="gpt-4-turbo-preview",
+        ...     messages=[{"role": "user", "content": "..."}],
+        ... )
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_connections: int = settings.llm_max_connections,
+        max_concurrency: int = settings.llm_max_concurrency,
+        user_max_concurrency: int = settings.llm_user_max_concurrency,
+        request_timeout: float = settings.llm_request_timeout_seconds,
+        timeout_budget: float = settings.llm_timeout_budget_seconds,
+        max_attempts: int = settings.llm_max_attempts,
+        retry_base: float = settings.llm_retry_base_seconds,
+        retry_max: float = settings.llm_retry_max_seconds,
+        http2: bool = settings.llm_http2,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        Args:
+            api_key: OpenAI API ключ (по умолчанию из настроек)
+            max_connections: Размер пула HTTP соединений
+            max_concurrency: Параллельных вызовов на процесс
+            user_max_concurrency: Параллельных вызовов на пользователя
+            request_timeout: Таймаут одной попытки (секунды)
+            timeout_budget: Бюджет вызова с ожиданием слота и retry (секунды)
+            max_attempts: Попыток вызова (с первой)
+            retry_base: Базовая задержка retry (секунды)
+            retry_max: Максимальная задержка retry (секунды)
+            http2: Использовать HTTP/2
+            circuit_breaker: Circuit breaker (по умолчанию - из настроек)
+        """
+        self._api_key = api_key
+        self._max_connections = max_connections
+        self._max_concurrency = max_concurrency
+        self._user_max_concurrency = user_max_concurrency
+        self._request_timeout = request_timeout
+        self._timeout_budget = timeout_budget
+        self._max_attempts = max_attempts
+        self._retry_base = retry_base
+        self._retry_max = retry_max
+        self._http2 = http2
+        self._breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=settings.llm_circuit_failure_threshold,
+            reset_timeout=settings.llm_circuit_reset_seconds,
+        )
+        self._state: Optional[_LoopState] = None
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Circuit breaker gateway."""
+        return self._breaker
+
+    async def chat_completion(
+        self,
+        *,
+        operation: str = "chat",
+        user_id: Optional[str] = None,
+        **params: Any,
+    ) -> ChatCompletion:
+        """
+        Chat completion (параметры - как у client.chat.completions.create).
+
+        Args:
+            operation: Операция (метка метрик: chat, summary, ...)
+            user_id: ID пользователя (per-user лимит; None - без лимита)
+            **params: Параметры запроса
+
+        Returns:
+            ChatCompletion
+
+        Raises:
+            LLMUnavailableError: Если circuit breaker открыт
+            LLMTimeoutError: Если вызов не уложился в бюджет времени
+            openai.OpenAIError: Ошибка API после всех попыток
+        """
+        response: ChatCompletion = await self._execute(
+            operation,
+            user_id,
+            lambda client: client.chat.completions.create(**params),
+        )
+        if response.usage:
+            LLM_TOKENS.labels(operation=operation, kind="prompt").inc(response.usage.prompt_tokens)
+            LLM_TOKENS.labels(operation=operation, kind="completion").inc(
+                response.usage.completion_tokens
+            )
+        return response
+
+    async def embeddings(
+        self,
+        *,
+        operation: str = "embedding",
+        user_id: Optional[str] = None,
+        **params: Any,
+    ) -> CreateEmbeddingResponse:
+        """
+        Embeddings (параметры - как у client.embeddings.create).
+
+        Args:
+            operation: Операция (метка метрик)
+            user_id: ID пользователя (per-user лимит; None - без лимита)
+            **params: Параметры запроса
+
+        Returns:
+            CreateEmbeddingResponse
+
+        Raises:
+            LLMUnavailableError: Если circuit breaker открыт
+            LLMTimeoutError: Если вызов не уложился в бюджет времени
+            openai.OpenAIError: Ошибка API после всех попыток
+        """
+        response: CreateEmbeddingResponse = await self._execute(
+            operation,
+            user_id,
+            lambda client: client.embeddings.create(**params),
+        )
+        if response.usage:
+            LLM_TOKENS.labels(operation=operation, kind="prompt").inc(response.usage.prompt_tokens)
+        return response
+
+    async def close(self) -> None:
+        """Закрывает пул соединений (при остановке приложения)."""
+        state, self._state = self._state, None
+        if state is not None and state.loop is asyncio.get_running_loop():
+            await state.http_client.aclose()
+
+    async def _execute(
+        self,
+        operation: str,
+        user_id: Optional[str],
+        call: Callable[[AsyncOpenAI], Awaitable[T]],
+    ) -> T:
+        """Вызов с лимитами, retry, circuit breaker и метриками."""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            # Открытый breaker отклоняет вызов до ожидания слота
+            if self._breaker.state == CircuitBreaker.OPEN and self._breaker.retry_after() > 0:
+                raise LLMUnavailableError(self._breaker.retry_after())
+
+            state = self._loop_state()
+            try:
+                async with asyncio.timeout(self._timeout_budget):
+                    async with self._slot(state, operation, user_id):
+                        response = await self._with_retry(operation, state.client, call)
+            except TimeoutError:
+                outcome = "timeout"
+                raise LLMTimeoutError(
+                    f"LLM {operation} call exceeded {self._timeout_budget:.0f}s budget"
+                ) from None
+
+            outcome = "success"
+            return response
+
+        except LLMUnavailableError:
+            outcome = "rejected"
+            raise
+        finally:
+            LLM_REQUESTS.labels(operation=operation, outcome=outcome).inc()
+            LLM_REQUEST_DURATION.labels(operation=operation).observe(
+                time.perf_counter() - started
+            )
+
+    async def _with_retry(
+        self,
+        operation: str,
+        client: AsyncOpenAI,
+        call: Callable[[AsyncOpenAI], Awaitable[T]],
+    ) -> T:
+        """Попытки вызова (tenacity) с учетом circuit breaker."""
+
+        def on_retry(retry_state: RetryCallState) -> None:
+            LLM_RETRIES.labels(operation=operation).inc()
+            logger.warning(
+                f"LLM {operation} attempt {retry_state.attempt_number} failed, retrying: "
+                f"{retry_state.outcome.exception() if retry_state.outcome else ''}"
+            )
+
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self._max_attempts),
+            wait=wait_random_exponential(multiplier=self._retry_base, max=self._retry_max),
+            retry=retry_if_exception(_is_retryable),
+            before_sleep=on_retry,
+            reraise=True,
+        )
+        async for attempt in retrying:
+            with attempt:
+                self._breaker.before_call()
+                try:
+                    response = await call(client)
+                except Exception as e:
+                    if _is_upstream_failure(e):
+                        self._breaker.record_failure()
+                    elif isinstance(e, openai.APIStatusError):
+                        # 4xx/429: upstream доступен
+                        self._breaker.record_success()
+                    raise
+                self._breaker.record_success()
+                return response
+
+        raise AssertionError("unreachable")
+
+    @contextlib.asynccontextmanager
+    async def _slot(
+        self,
+        state: _LoopState,
+        operation: str,
+        user_id: Optional[str],
+    ) -> AsyncIterator[None]:
+        """Слот вызова: сначала семафор пользователя, затем глобальный."""
+        user_slot: Optional[_UserSlot] = None
+        if user_id is not None:
+            user_slot = state.user_slots.get(user_id)
+            if user_slot is None:
+                user_slot = _UserSlot(asyncio.Semaphore(self._user_max_concurrency))
+                state.user_slots[user_id] = user_slot
+            user_slot.holders += 1
+
+        waited = time.perf_counter()
+        try:
+            # Пользователь, исчерпавший свой лимит, не занимает глобальные слоты
+            async with user_slot.semaphore if user_slot else contextlib.nullcontext():
+                async with state.semaphore:
+                    LLM_QUEUE_WAIT.labels(operation=operation).observe(
+                        time.perf_counter() - waited
+                    )
+                    LLM_IN_FLIGHT.inc()
+                    try:
+                        yield
+                    finally:
+                        LLM_IN_FLIGHT.dec()
+        finally:
+            if user_slot is not None:
+                user_slot.holders -= 1
+                if user_slot.holders == 0:
+                    state.user_slots.pop(user_id, None)
+
+    def _loop_state(self) -> _LoopState:
+        """Клиент и семафоры текущего event loop (создаются при первом вызове)."""
+        loop = asyncio.get_running_loop()
+        if self._state is not None and self._state.loop is loop:
+            return self._state
+
+        api_key = self._api_key or settings.openai_api_key
+        if not api_key:
+            raise ValueError("OpenAI API key is required")
+
+        http_client = httpx.AsyncClient(
+            http2=self._http2,
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections,
+            ),
+            timeout=httpx.Timeout(self._request_timeout, connect=10.0),
+        )
+        self._state = _LoopState(
+            loop=loop,
+            http_client=http_client,
+            client=AsyncOpenAI(
+                api_key=api_key,
+                http_client=http_client,
+                max_retries=0,
+                timeout=self._request_timeout,
+            ),
+            semaphore=asyncio.Semaphore(self._max_concurrency),
+        )
+        return self._state
+
+
+# Глобальный экземпляр gateway
+llm_gateway = LLMGateway()
@@ -0,0 +1,361 @@
+"""
+LLM Request Scheduler
+
+Очередь запросов ответа AI ассистента с weighted fair queuing.
+
+Без очереди несколько пользователей с длинными RAG запросами занимают
+всю квоту провайдера, и задержка растет у всех. Планировщик:
+- поток (flow) - пользователь, вес - план подписки
+  (SubscriptionPlan.get_llm_priority_weight): платные планы получают
+  большую долю пропускной способности, но бесплатные не голодают
+- стоимость запроса - оценка токенов (prompt + max_tokens), порядок -
+  виртуальное время окончания (start-time fair queuing)
+- глобальный бюджет токенов в минуту (квота провайдера) - общий для
+  воркеров token bucket rate limiter'а (RateLimits.LLM_TOKENS_PER_MINUTE);
+  фактический расход досписывается после ответа
+- запрос, не получивший слот до дедлайна, отбрасывается (в том числе
+  сразу, если бюджет восстановится только после дедлайна)
+
+Очередь - in-process (на воркер API), бюджет токенов - общий.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config import settings
+from app.core.infrastructure.rate_limiter import (
+    RateLimitCheck,
+    RateLimiter,
+    RateLimits,
+    rate_limiter,
+)
+from app.modules.chat.infrastructure.services.llm_gateway import LLMGatewayError
+from app.modules.payment.domain import SubscriptionPlan, SubscriptionPlanEnum
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Ключ глобальной корзины токенов
+BUDGET_IDENTITY = "llm"
+# Максимальная пауза диспетчера при исчерпанном бюджете
+_BUDGET_POLL_SECONDS = 1.0
+# Порог очистки виртуального времени неактивных пользователей
+_MAX_TRACKED_FLOWS = 10_000
+
+
+LLM_SCHEDULER_QUEUE_DEPTH = Gauge(
+    "llm_scheduler_queue_depth",
+    "Запросы в очереди планировщика LLM",
+)
+LLM_SCHEDULER_WAIT = Histogram(
+    "llm_scheduler_wait_seconds",
+    "Ожидание слота в очереди планировщика LLM",
+    ["plan"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60),
+)
+LLM_SCHEDULER_DROPPED = Counter(
+    "llm_scheduler_dropped_total",
+    "Запросы, отброшенные планировщиком LLM",
+    ["plan", "reason"],
+)
+
+
+class LLMRequestDroppedError(LLMGatewayError):
+    """Запрос отброшен планировщиком (дедлайн или переполнение очереди)."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(f"LLM is temporarily unavailable: request dropped ({reason})")
+
+
+@dataclass(order=True)
+class _Ticket:
+    """Запрос в очереди (порядок - виртуальное время окончания)."""
+
+    finish: float
+    seq: int
+    start: float = field(compare=False)
+    user_id: str = field(compare=False)
+    plan: str = field(compare=False)
+    tokens: int = field(compare=False)
+    deadline: float = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: "asyncio.Future[None]" = field(compare=False)
+
+
+def plan_weight(plan: Optional[str]) -> int:
+    """Вес плана подписки (неизвестный план - как FREE)."""
+    try:
+        return SubscriptionPlan(value=SubscriptionPlanEnum(plan)).get_llm_priority_weight()
+    except ValueError:
+        return SubscriptionPlan.free().get_llm_priority_weight()
+
+
+class LLMScheduler:
+    """
+    Планировщик запросов к LLM (WFQ по пользователям, бюджет токенов).
+
+    Example:
+        >>> response = await llm_scheduler.run(
+        ...     user_id, "pro", estimated_tokens,
+        ...     lambda: llm_gateway.chat_completion(...),
+        ... )
+        >>> await llm_scheduler.charge(estimated_tokens, response.usage.total_tokens)
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter = rate_limiter,
+        enabled: bool = settings.llm_scheduler_enabled,
+        max_concurrency: int = settings.llm_scheduler_max_concurrency,
+        max_queue: int = settings.llm_scheduler_max_queue,
+        max_wait: float = settings.llm_scheduler_max_wait_seconds,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            limiter: Rate limiter (глобальный бюджет токенов в минуту)
+            enabled: Включен ли планировщик (иначе запросы идут напрямую)
+            max_concurrency: Одновременных запросов к LLM
+            max_queue: Максимум запросов в очереди
+            max_wait: Дедлайн ожидания слота (секунды)
+            clock: Монотонные часы
+        """
+        self._limiter = limiter
+        self._enabled = enabled
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self._clock = clock
+
+        self._queue: List[_Ticket] = []
+        self._seq = itertools.count()
+        self._virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+        self._in_flight = 0
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    async def run(
+        self,
+        user_id: str,
+        plan: Optional[str],
+        estimated_tokens: int,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Выполняет запрос к LLM в порядке очереди.
+
+        Args:
+            user_id: ID пользователя (поток очереди)
+            plan: План подписки пользователя (вес потока)
+            estimated_tokens: Оценка токенов запроса (prompt + ответ)
+            call: Запрос к LLM
+
+        Returns:
+            Результат call
+
+        Raises:
+            LLMRequestDroppedError: Если запрос отброшен
+        """
+        if not self._enabled:
+            return await call()
+
+        ticket = self._enqueue(user_id, plan or SubscriptionPlanEnum.FREE.value, estimated_tokens)
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(ticket.future),
+                timeout=max(0.0, ticket.deadline - self._clock()),
+            )
+        except asyncio.TimeoutError as exc:
+            if not ticket.future.done():
+                ticket.future.cancel()
+                self._drop(ticket, "deadline", resolve=False)
+                raise LLMRequestDroppedError("deadline") from exc
+        except asyncio.CancelledError:
+            # Клиент отключился: слот, выданный одновременно с отменой, освобождаем
+            if ticket.future.done() and not ticket.future.cancelled():
+                if ticket.future.exception() is None:
+                    self._release()
+            else:
+                ticket.future.cancel()
+                self._refund(ticket)
+            raise
+
+        # Исключение future - отброшен диспетчером
+        ticket.future.result()
+        LLM_SCHEDULER_WAIT.labels(plan=ticket.plan).observe(self._clock() - ticket.enqueued_at)
+        try:
+            return await call()
+        finally:
+            self._release()
+
+    async def charge(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Досписывает из бюджета токены сверх оценки (после ответа модели).
+
+        Args:
+            estimated_tokens: Оценка, списанная при выдаче слота
+            actual_tokens: Фактический расход
+        """
+        if not self._enabled:
+            return
+        await self._limiter.charge(
+            RateLimits.LLM_TOKENS_PER_MINUTE,
+            BUDGET_IDENTITY,
+            actual_tokens - estimated_tokens,
+        )
+
+    async def stop(self) -> None:
+        """Останавливает диспетчер, ожидающие запросы отбрасываются."""
+        dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None:
+            dispatcher.cancel()
+            try:
+                await dispatcher
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        while self._queue:
+            ticket = heapq.heappop(self._queue)
+            if not ticket.future.done():
+                ticket.future.set_exception(LLMRequestDroppedError("shutdown"))
+        LLM_SCHEDULER_QUEUE_DEPTH.set(0)
+
+    def _enqueue(self, user_id: str, plan: str, estimated_tokens: int) -> _Ticket:
+        """Ставит запрос в очередь (тег виртуального времени потока)."""
+        self._ensure_dispatcher()
+
+        if len(self._queue) >= self._max_queue:
+            LLM_SCHEDULER_DROPPED.labels(plan=plan, reason="queue_full").inc()
+            raise LLMRequestDroppedError("queue_full")
+
+        # Запрос больше корзины никогда не пройдет проверку бюджета
+        tokens = max(1, min(estimated_tokens, settings.llm_scheduler_tokens_per_minute))
+        start = max(self._virtual_time, self._last_finish.get(user_id, 0.0))
+        finish = start + tokens / plan_weight(plan)
+        self._last_finish[user_id] = finish
+
+        now = self._clock()
+        ticket = _Ticket(
+            finish=finish,
+            seq=next(self._seq),
+            start=start,
+            user_id=user_id,
+            plan=plan,
+            tokens=tokens,
+            deadline=now + self._max_wait,
+            enqueued_at=now,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queue, ticket)
+        LLM_SCHEDULER_QUEUE_DEPTH.set(len(self._queue))
+        self._wakeup.set()
+        return ticket
+
+    def _release(self) -> None:
+        """Освобождает слот выполнения."""
+        self._in_flight -= 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _refund(self, ticket: _Ticket) -> None:
+        """
+        Возвращает потоку стоимость невыполненного запроса.
+
+        Иначе отброшенные запросы сдвигают виртуальное время пользователя,
+        и после перегрузки он ждет дольше других за неполученные ответы.
+        """
+        last_finish = self._last_finish.get(ticket.user_id)
+        if last_finish is not None:
+            self._last_finish[ticket.user_id] = max(
+                self._virtual_time, last_finish - (ticket.finish - ticket.start)
+            )
+
+    def _drop(self, ticket: _Ticket, reason: str, resolve: bool = True) -> None:
+        """Отбрасывает запрос (resolve - сообщить ожидающему)."""
+        LLM_SCHEDULER_DROPPED.labels(plan=ticket.plan, reason=reason).inc()
+        self._refund(ticket)
+        if resolve and not ticket.future.done():
+            ticket.future.set_exception(LLMRequestDroppedError(reason))
+
+    def _ensure_dispatcher(self) -> None:
+        """Запускает диспетчер в текущем event loop (лениво)."""
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is not None and self._dispatcher.get_loop() is loop:
+            if not self._dispatcher.done():
+                return
+            logger.error("LLM scheduler dispatcher stopped unexpectedly, restarting")
+        else:
+            # Новый event loop: очередь и слоты прежнего loop недействительны
+            self._wakeup = asyncio.Event()
+            self._queue = []
+            self._in_flight = 0
+        self._dispatcher = loop.create_task(self._dispatch(), name="llm-scheduler")
+
+    async def _dispatch(self) -> None:
+        """Выдает слоты в порядке виртуального времени в пределах бюджета."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._queue and self._in_flight < self._max_concurrency:
+                ticket = self._queue[0]
+                if ticket.future.done():
+                    # Отменен ожидающим (дедлайн, отключение клиента)
+                    heapq.heappop(self._queue)
+                    continue
+
+                now = self._clock()
+                if now >= ticket.deadline:
+                    heapq.heappop(self._queue)
+                    self._drop(ticket, "deadline")
+                    continue
+
+                try:
+                    budget = await self._limiter.acquire([
+                        RateLimitCheck(
+                            rule=RateLimits.LLM_TOKENS_PER_MINUTE,
+                            identity=BUDGET_IDENTITY,
+                            cost=ticket.tokens,
+                        )
+                    ])
+                except Exception as e:
+                    logger.warning(f"LLM scheduler budget check failed, admitting request: {e}")
+                    budget = None
+
+                if budget is not None and not budget.allowed:
+                    if now + budget.retry_after >= ticket.deadline:
+                        heapq.heappop(self._queue)
+                        self._drop(ticket, "budget")
+                        continue
+                    await asyncio.sleep(min(budget.retry_after, _BUDGET_POLL_SECONDS))
+                    continue
+
+                heapq.heappop(self._queue)
+                if ticket.future.done():
+                    # Отменен во время проверки бюджета (токены уже списаны)
+                    continue
+                self._virtual_time = max(self._virtual_time, ticket.start)
+                self._in_flight += 1
+                ticket.future.set_result(None)
+
+            LLM_SCHEDULER_QUEUE_DEPTH.set(len(self._queue))
+            if len(self._last_finish) > _MAX_TRACKED_FLOWS:
+                # Потоки, отставшие от виртуального времени, начнут с него
+                self._last_finish = {
+                    user_id: finish
+                    for user_id, finish in self._last_finish.items()
+                    if finish > self._virtual_time
+                }
+
+
+# Глобальный экземпляр планировщика
+llm_scheduler = LLMScheduler()
@@ -4,12 +4,14 @@ OpenAI Service Implementation
 Сервис для взаимодействия с OpenAI API (GPT-4).
 """
 from typing import Optional
-import os
 
-from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 
-from app.shared.domain.result import Result
+from app.config import settings
+from app.core.domain.result import Result
+from app.modules.chat.infrastructure.services.llm_gateway import LLMGateway, llm_gateway
+from app.modules.chat.infrastructure.services.llm_scheduler import LLMScheduler, llm_scheduler
+from app.modules.chat.infrastructure.services.tokenizer import TokenCounter
 
 
 class OpenAIService:
@@ -19,8 +21,11 @@ class OpenAIService:
     Implements IAIService protocol из Application Layer.
 
     Features:
-    - Async API вызовы к OpenAI
-    - Автоматический подсчет токенов
+    - Async API вызовы к OpenAI через общий LLMGateway (пул соединений,
+      лимиты параллельности, retry, circuit breaker)
+    - Очередь ответов LLMScheduler (fair queuing по пользователям и
+      планам подписки, бюджет токенов в минуту)
+    - Точный подсчет токенов (tiktoken) и бюджет истории беседы
     - Обработка ошибок
     - Поддержка контекста из RAG
     """
@@ -29,35 +34,47 @@ class OpenAIService:
     DEFAULT_MAX_TOKENS = 1500
     DEFAULT_TEMPERATURE = 0.7
 
+    SUMMARY_PROMPT = (
+        "Вы ведете краткое содержание беседы пользователя с юридическим "
+        "AI-ассистентом. Объедините текущее краткое содержание и новые "
+        "сообщения в одно краткое содержание: факты ситуации пользователя, "
+        "даты, суммы, стороны, упомянутые документы и статьи законов, "
+        "выводы ассистента и открытые вопросы. Пишите от третьего лица, "
+        "без вступлений, не более нескольких абзацев."
+    )
+
     def __init__(
         self,
-        api_key: Optional[str] = None,
+        gateway: Optional[LLMGateway] = None,
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        scheduler: Optional[LLMScheduler] = None,
     ):
         """
         Инициализирует OpenAI сервис.
 
         Args:
-            api_key: OpenAI API ключ (если None, берется из env OPENAI_API_KEY)
+            gateway: LLM gateway (по умолчанию - общий для процесса)
             model: Модель для использования (default: gpt-4-turbo-preview)
             max_tokens: Максимальное количество токенов в ответе
             temperature: Temperature для генерации (0.0-2.0)
+            scheduler: Очередь запросов ответа (по умолчанию - общая)
         """
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required")
-
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.gateway = gateway or llm_gateway
+        self.scheduler = scheduler or llm_scheduler
         self.model = model or self.DEFAULT_MODEL
         self.max_tokens = max_tokens or self.DEFAULT_MAX_TOKENS
         self.temperature = temperature or self.DEFAULT_TEMPERATURE
+        self.token_counter = TokenCounter.for_model(self.model)
+        self.message_token_overhead = TokenCounter.MESSAGE_OVERHEAD
 
     async def generate_response(
         self,
         conversation_history: list[dict],
         context: Optional[str] = None,
+        user_id: Optional[str] = None,
+        subscription_plan: Optional[str] = None,
     ) -> Result[tuple[str, int]]:
         """
         Генерирует ответ от AI на основе истории беседы.
@@ -66,6 +83,8 @@ class OpenAIService:
             conversation_history: История сообщений в формате OpenAI
                 [{"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}]
             context: Дополнительный контекст из документов (RAG)
+            user_id: ID пользователя (per-user лимит и очередь запросов)
+            subscription_plan: План подписки пользователя (приоритет в очереди)
 
         Returns:
             Result с кортежем (текст_ответа, количество_токенов) или ошибкой
@@ -74,12 +93,24 @@ class OpenAIService:
             # Подготавливаем messages для OpenAI
             messages = self._prepare_messages(conversation_history, context)
 
-            # Вызываем OpenAI API
-            response: ChatCompletion = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
+            # Вызываем OpenAI API в порядке очереди (оценка: prompt + ответ)
+            estimated_tokens = self._estimate_tokens(messages)
+            response: ChatCompletion = await self.scheduler.run(
+                user_id or "anonymous",
+                subscription_plan,
+                estimated_tokens,
+                lambda: self.gateway.chat_completion(
+                    operation="chat",
+                    user_id=user_id,
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                ),
+            )
+            await self.scheduler.charge(
+                estimated_tokens,
+                response.usage.total_tokens if response.usage else 0,
             )
 
             # Извлекаем ответ
@@ -98,6 +129,67 @@ class OpenAIService:
         except Exception as e:
             return Result.fail(f"OpenAI API error: {str(e)}")
 
+    async def summarize(
+        self,
+        previous_summary: Optional[str],
+        messages: list[dict],
+        max_tokens: int = 500,
+    ) -> Result[str]:
+        """
+        Обновляет краткое содержание беседы (rolling summary).
+
+        Args:
+            previous_summary: Текущее краткое содержание (None - нет)
+            messages: Новые сообщения [{"role": ..., "content": ...}]
+            max_tokens: Максимальный размер краткого содержания
+
+        Returns:
+            Result с новым кратким содержанием или ошибкой
+        """
+        transcript = "\n\n".join(
+            f"{'Пользователь' if m['role'] == 'user' else 'Ассистент'}: {m['content']}"
+            for m in messages
+        )
+        prompt = ""
+        if previous_summary:
+            prompt += f"Текущее краткое содержание беседы:\n{previous_summary}\n\n"
+        prompt += f"Новые сообщения:\n{transcript}"
+
+        try:
+            response: ChatCompletion = await self.gateway.chat_completion(
+                operation="summary",
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": self.SUMMARY_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=max_tokens,
+                temperature=0.2,
+            )
+
+            if not response.choices or not response.choices[0].message.content:
+                return Result.fail("Empty summary from OpenAI")
+
+            return Result.ok(response.choices[0].message.content.strip())
+
+        except Exception as e:
+            return Result.fail(f"OpenAI API error: {str(e)}")
+
+    def _estimate_tokens(self, messages: list[dict]) -> int:
+        """
+        Оценка токенов запроса для очереди: prompt и максимальный ответ.
+
+        Args:
+            messages: Сообщения запроса
+
+        Returns:
+            Количество токенов
+        """
+        prompt_tokens = sum(
+            self.token_counter.count_message(message["content"]) for message in messages
+        )
+        return prompt_tokens + TokenCounter.REPLY_PRIMING + self.max_tokens
+
     def _prepare_messages(
         self,
         conversation_history: list[dict],
@@ -158,15 +250,34 @@ class OpenAIService:
 
     async def count_tokens(self, text: str) -> int:
         """
-        Подсчитывает количество токенов в тексте.
-
-        Note: Это упрощенная оценка. Для точного подсчета используйте tiktoken.
+        Подсчитывает количество токенов в тексте (tokenizer модели).
 
         Args:
             text: Текст для подсчета
 
         Returns:
-            Приблизительное количество токенов
+            Количество токенов
+        """
+        return self.token_counter.count(text)
+
+    def history_token_budget(self, context: Optional[str] = None) -> int:
+        """
+        Токены, доступные для истории беседы.
+
+        Окно модели минус ответ (max_tokens), system prompt с контекстом
+        RAG и начало ответа; не больше settings.chat_history_max_tokens.
+
+        Args:
+            context: Контекст из документов (RAG)
+
+        Returns:
+            Бюджет истории в токенах (с учетом служебных токенов сообщений)
         """
-        # Упрощенная оценка: ~4 символа = 1 токен для русского языка
-        return len(text) // 4
+        prompt_tokens = self.token_counter.count_message(self._build_system_prompt(context))
+        available = (
+            settings.openai_context_window_tokens
+            - self.max_tokens
+            - prompt_tokens
+            - TokenCounter.REPLY_PRIMING
+        )
+        return max(min(available, settings.chat_history_max_tokens), 0)
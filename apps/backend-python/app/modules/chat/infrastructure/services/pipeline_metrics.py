@@ -0,0 +1,28 @@
+"""
+Chat Pipeline Metrics
+
+Метрики Prometheus этапов обработки сообщения (SendMessageHandler).
+
+Перекрытие поиска контекста с загрузкой беседы видно по соотношению
+retrieval и retrieval_wait: retrieval_wait - часть поиска, не скрытая
+загрузкой беседы.
+"""
+from prometheus_client import Histogram
+
+CHAT_PIPELINE_STAGE_SECONDS = Histogram(
+    "chat_pipeline_stage_seconds",
+    "Длительность этапов обработки сообщения чата",
+    ["stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+
+def observe_chat_stage(stage: str, seconds: float) -> None:
+    """
+    Записывает длительность этапа (StageObserver для SendMessageHandler).
+
+    Args:
+        stage: Этап (load_conversation, retrieval, retrieval_wait, ...)
+        seconds: Длительность в секундах
+    """
+    CHAT_PIPELINE_STAGE_SECONDS.labels(stage=stage).observe(seconds)
@@ -3,18 +3,24 @@ RAG Service Implementation
 
 Сервис для Retrieval-Augmented Generation с использованием pgvector.
 """
-from typing import List, Optional
-from uuid import UUID
-import os
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
 
-from openai import AsyncOpenAI
-from sqlalchemy import select, text, func
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.domain.result import Result
+from app.config import settings
+from app.core.domain.result import Result
 from app.modules.chat.domain.services.rag_service import IRAGService, DocumentChunk
-from app.modules.document.infrastructure.persistence.models.document_model import (
-    DocumentModel,
+from app.modules.chat.infrastructure.services.hybrid_retriever import HybridRetriever
+from app.modules.chat.infrastructure.services.legal_chunker import (
+    LegalTextChunker,
+    TextChunk,
+)
+from app.modules.chat.infrastructure.services.llm_gateway import LLMGateway, llm_gateway
+from app.modules.chat.infrastructure.services.tokenizer import TokenCounter
+from app.modules.document.infrastructure.persistence.models.chunk_model import (
+    ChunkModel,
 )
 
 
@@ -23,38 +29,75 @@ class RAGServiceImpl(IRAGService):
     Реализация RAG сервиса с использованием pgvector и OpenAI Embeddings.
 
     Features:
-    - Векторный поиск по документам (semantic search)
-    - Создание embeddings через OpenAI
+    - Гибридный поиск по документам пользователя и правовой базе знаний
+      (full-text + vector, RRF + MMR)
+    - Создание embeddings через OpenAI (батчами)
     - Построение контекста для AI
-    - Чанкирование документов (разбиение на части)
+    - Чанкирование документов по токенам и структуре (статья/часть/пункт)
     """
 
     # OpenAI Embeddings модель
     EMBEDDING_MODEL = "text-embedding-3-small"  # 1536 dimensions
     EMBEDDING_DIMENSIONS = 1536
 
-    # Чанкирование
-    CHUNK_SIZE = 1000  # Символов в одном чанке
-    CHUNK_OVERLAP = 200  # Перекрытие между чанками
+    # Батч запроса embeddings (лимит API - 2048 текстов, 300k токенов)
+    EMBEDDING_BATCH_SIZE = 128
+    EMBEDDING_BATCH_TOKENS = 100_000
+
+    # Контекст для LLM
+    CONTEXT_SEPARATOR = "\n---\n"
+    # Обрезанный чанк короче этого не добавляется в контекст
+    MIN_PARTIAL_CHUNK_TOKENS = 64
 
     def __init__(
         self,
         session: AsyncSession,
-        openai_api_key: Optional[str] = None,
+        gateway: Optional[LLMGateway] = None,
+        retriever: Optional[HybridRetriever] = None,
     ):
         """
         Инициализирует RAG сервис.
 
         Args:
-            session: Async SQLAlchemy сессия
-            openai_api_key: OpenAI API ключ (если None, берется из env)
+            session: Async SQLAlchemy сессия (запись чанков при индексации)
+            gateway: LLM gateway (по умолчанию - общий для процесса)
+            retriever: Гибридный поиск (по умолчанию - с настройками из settings)
         """
         self.session = session
-        self.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required for RAG")
+        self.retriever = retriever or HybridRetriever()
+        self.chunker = LegalTextChunker(
+            model=self.EMBEDDING_MODEL,
+            max_tokens=settings.rag_chunk_max_tokens,
+            min_tokens=settings.rag_chunk_min_tokens,
+        )
+        self.gateway = gateway or llm_gateway
+        # Embeddings запросов в рамках экземпляра (поиск и кеш ответов
+        # используют один вектор)
+        self._query_embeddings: Dict[str, List[float]] = {}
+
+    async def embed_query(
+        self,
+        query: str,
+        user_id: Optional[str] = None,
+    ) -> Result[List[float]]:
+        """
+        Embedding запроса пользователя (один запрос к API на текст).
+
+        Args:
+            query: Запрос пользователя
+            user_id: ID пользователя (per-user лимит параллельных вызовов)
+
+        Returns:
+            Result с вектором или ошибкой
+        """
+        cached = self._query_embeddings.get(query)
+        if cached is not None:
+            return Result.ok(cached)
 
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        result = await self._create_embedding(query, user_id=user_id)
+        if result.is_success:
+            self._query_embeddings[query] = result.value
+        return result
 
     async def search_relevant_documents(
         self,
@@ -77,22 +120,30 @@ class RAGServiceImpl(IRAGService):
         """
         try:
             # 1. Создаем embedding для запроса
-            query_embedding_result = await self._create_embedding(query)
+            query_embedding_result = await self.embed_query(query, user_id=str(user_id))
             if not query_embedding_result.is_success:
                 return Result.fail(query_embedding_result.error)
 
-            query_embedding = query_embedding_result.value
-
-            # 2. Выполняем векторный поиск
-            # Note: Требуется таблица document_embeddings с колонкой embedding типа vector
-            # Для MVP используем простой text search по extracted_text
-            # TODO: Заменить на полноценный vector search когда будет миграция
-            chunks = await self._simple_text_search(
-                user_id=user_id,
+            # 2. Full-text и vector поиск параллельно, RRF + MMR
+            retrieved = await self.retriever.retrieve(
+                owner_id=str(user_id),
                 query=query,
+                query_embedding=query_embedding_result.value,
                 top_k=top_k,
+                min_similarity=min_similarity,
             )
 
+            chunks = [
+                DocumentChunk(
+                    document_id=chunk.document_id,
+                    document_title=chunk.document_title,
+                    content=chunk.content,
+                    similarity_score=chunk.similarity,
+                    metadata=chunk.metadata,
+                    source=chunk.source,
+                )
+                for chunk in retrieved
+            ]
             return Result.ok(chunks)
 
         except Exception as e:
@@ -105,38 +156,126 @@ class RAGServiceImpl(IRAGService):
         metadata: dict,
     ) -> Result[None]:
         """
-        Индексирует документ (создает embeddings).
+        Индексирует документ (создает embeddings и сохраняет чанки).
+
+        Старые чанки документа заменяются в той же транзакции сессии.
 
         Args:
             document_id: ID документа
             content: Текст документа
-            metadata: Метаданные документа
+            metadata: Метаданные документа (owner_id обязателен)
 
         Returns:
             Result с None или ошибкой
         """
+        owner_id = metadata.get("owner_id")
+        if not owner_id:
+            return Result.fail("owner_id is required in document metadata")
+
+        chunk_metadata = {
+            key: value for key, value in metadata.items() if key != "owner_id"
+        }
+
         try:
-            # 1. Разбиваем документ на чанки
-            chunks = self._chunk_text(content)
-
-            # 2. Создаем embeddings для каждого чанка
-            for i, chunk_text in enumerate(chunks):
-                embedding_result = await self._create_embedding(chunk_text)
-                if not embedding_result.is_success:
-                    return Result.fail(
-                        f"Failed to create embedding for chunk {i}: {embedding_result.error}"
+            await self.session.execute(
+                delete(ChunkModel).where(ChunkModel.document_id == document_id)
+            )
+
+            # Чанки потоком: embeddings и вставка батчами, в памяти один батч
+            batch: List[TextChunk] = []
+            batch_tokens = 0
+            for chunk in self.chunker.chunks(content):
+                if batch and (
+                    len(batch) >= self.EMBEDDING_BATCH_SIZE
+                    or batch_tokens + chunk.token_count > self.EMBEDDING_BATCH_TOKENS
+                ):
+                    result = await self._store_chunks(
+                        document_id, str(owner_id), chunk_metadata, batch
                     )
+                    if not result.is_success:
+                        return result
+                    batch, batch_tokens = [], 0
+                batch.append(chunk)
+                batch_tokens += chunk.token_count
+
+            if batch:
+                result = await self._store_chunks(
+                    document_id, str(owner_id), chunk_metadata, batch
+                )
+                if not result.is_success:
+                    return result
 
-                embedding = embedding_result.value
+            return Result.ok(None)
 
-                # 3. Сохраняем в БД (document_embeddings table)
-                # TODO: Реализовать сохранение когда будет миграция
-                # await self._save_embedding(document_id, i, chunk_text, embedding, metadata)
+        except Exception as e:
+            return Result.fail(f"Document indexing error: {str(e)}")
+
+    async def _store_chunks(
+        self,
+        document_id: str,
+        owner_id: str,
+        metadata: dict,
+        chunks: List[TextChunk],
+    ) -> Result[None]:
+        """
+        Создает embeddings батча одним запросом и вставляет чанки.
+
+        Args:
+            document_id: ID документа
+            owner_id: ID владельца
+            metadata: Метаданные документа
+            chunks: Батч чанков
+
+        Returns:
+            Result с None или ошибкой
+        """
+        embedding_result = await self._create_embeddings([chunk.content for chunk in chunks])
+        if not embedding_result.is_success:
+            return Result.fail(
+                f"Failed to create embeddings for chunks {chunks[0].index}-"
+                f"{chunks[-1].index}: {embedding_result.error}"
+            )
+
+        # Core INSERT: ORM объекты не копятся в identity map сессии
+        await self.session.execute(
+            insert(ChunkModel),
+            [
+                {
+                    "id": str(uuid4()),
+                    "document_id": document_id,
+                    "owner_id": owner_id,
+                    "chunk_index": chunk.index,
+                    "content": chunk.content,
+                    "chunk_metadata": {
+                        **metadata,
+                        **chunk.section,
+                        "token_count": chunk.token_count,
+                    },
+                    "embedding": embedding,
+                }
+                for chunk, embedding in zip(chunks, embedding_result.value, strict=True)
+            ],
+        )
+        return Result.ok(None)
+
+    async def remove_document(self, document_id: str) -> Result[None]:
+        """
+        Удаляет чанки документа из индекса.
 
+        Args:
+            document_id: ID документа
+
+        Returns:
+            Result с None или ошибкой
+        """
+        try:
+            await self.session.execute(
+                delete(ChunkModel).where(ChunkModel.document_id == document_id)
+            )
             return Result.ok(None)
 
         except Exception as e:
-            return Result.fail(f"Document indexing error: {str(e)}")
+            return Result.fail(f"Document removal error: {str(e)}")
 
     async def build_context(
         self,
@@ -150,50 +289,66 @@ class RAGServiceImpl(IRAGService):
         Args:
             query: Поисковый запрос
             chunks: Список найденных чанков
-            max_tokens: Максимальное количество токенов
+            max_tokens: Максимальное количество токенов (tokenizer LLM модели)
 
         Returns:
-            Контекст в текстовом формате
+            Контекст в текстовом формате (последний чанк может быть обрезан)
         """
         if not chunks:
             return ""
 
-        # Оцениваем количество символов (~4 символа = 1 токен)
-        max_chars = max_tokens * 4
+        counter = TokenCounter.for_model(settings.openai_llm_model)
+        budget = counter.budget(max_tokens)
+        separator_tokens = counter.count(self.CONTEXT_SEPARATOR)
 
         context_parts = []
-        current_length = 0
-
         for chunk in chunks:
-            # Форматируем чанк
-            chunk_text = f"[Документ: {chunk.document_title}]\n{chunk.content}\n"
-            chunk_length = len(chunk_text)
-
-            # Проверяем лимит
-            if current_length + chunk_length > max_chars:
-                break
-
-            context_parts.append(chunk_text)
-            current_length += chunk_length
-
-        # Собираем контекст
-        context = "\n---\n".join(context_parts)
-
-        return context
-
-    async def _create_embedding(self, text: str) -> Result[List[float]]:
+            header = f"[Документ: {self._source_label(chunk)}]\n"
+            cost = separator_tokens if context_parts else 0
+            chunk_tokens = counter.count(header) + counter.count(chunk.content) + cost
+
+            if budget.try_add(chunk_tokens):
+                context_parts.append(f"{header}{chunk.content}\n")
+                continue
+
+            # Остаток бюджета заполняем началом чанка, если он заметный
+            remaining = budget.remaining - cost - counter.count(header)
+            if remaining >= self.MIN_PARTIAL_CHUNK_TOKENS:
+                context_parts.append(f"{header}{counter.truncate(chunk.content, remaining)}\n")
+            break
+
+        return self.CONTEXT_SEPARATOR.join(context_parts)
+
+    @staticmethod
+    def _source_label(chunk: DocumentChunk) -> str:
+        """Название документа и положение чанка ("Трудовой кодекс, ст. 81, ч. 1")."""
+        parts = [chunk.document_title]
+        for key, label in (("article", "ст."), ("part", "ч."), ("point", "п.")):
+            value = chunk.metadata.get(key)
+            if value:
+                parts.append(f"{label} {value}")
+        return ", ".join(parts)
+
+    async def _create_embedding(
+        self,
+        text: str,
+        user_id: Optional[str] = None,
+    ) -> Result[List[float]]:
         """
         Создает embedding для текста через OpenAI.
 
         Args:
             text: Текст для embedding
+            user_id: ID пользователя (per-user лимит параллельных вызовов)
 
         Returns:
             Result со списком float (вектор) или ошибкой
         """
         try:
             # Вызываем OpenAI Embeddings API
-            response = await self.client.embeddings.create(
+            response = await self.gateway.embeddings(
+                operation="embedding_query",
+                user_id=user_id,
                 model=self.EMBEDDING_MODEL,
                 input=text,
             )
@@ -207,89 +362,30 @@ class RAGServiceImpl(IRAGService):
         except Exception as e:
             return Result.fail(f"Embedding creation error: {str(e)}")
 
-    def _chunk_text(self, text: str) -> List[str]:
-        """
-        Разбивает текст на чанки с перекрытием.
-
-        Args:
-            text: Исходный текст
-
-        Returns:
-            Список чанков
-        """
-        chunks = []
-        start = 0
-
-        while start < len(text):
-            # Извлекаем чанк
-            end = start + self.CHUNK_SIZE
-            chunk = text[start:end]
-
-            # Пытаемся разбить по предложению (точка + пробел)
-            if end < len(text):
-                last_period = chunk.rfind(". ")
-                if last_period > self.CHUNK_SIZE // 2:
-                    end = start + last_period + 1
-                    chunk = text[start:end]
-
-            chunks.append(chunk.strip())
-
-            # Следующий чанк с перекрытием
-            start = end - self.CHUNK_OVERLAP
-
-        return chunks
-
-    async def _simple_text_search(
-        self,
-        user_id: UUID,
-        query: str,
-        top_k: int,
-    ) -> List[DocumentChunk]:
+    async def _create_embeddings(self, texts: List[str]) -> Result[List[List[float]]]:
         """
-        Простой текстовый поиск (временная реализация для MVP).
-
-        Note: Это не настоящий semantic search, а простой ILIKE поиск.
-        Заменить на vector search когда будет миграция с document_embeddings.
+        Создает embeddings для нескольких текстов одним запросом.
 
         Args:
-            user_id: ID пользователя
-            query: Поисковый запрос
-            top_k: Количество результатов
+            texts: Тексты (не больше EMBEDDING_BATCH_SIZE)
 
         Returns:
-            Список DocumentChunk
+            Result со списком векторов в порядке texts или ошибкой
         """
-        # Поиск документов с текстом похожим на запрос
-        search_pattern = f"%{query}%"
-
-        stmt = (
-            select(DocumentModel)
-            .where(DocumentModel.owner_id == str(user_id))
-            .where(DocumentModel.extracted_text.ilike(search_pattern))
-            .where(DocumentModel.extracted_text.isnot(None))
-            .limit(top_k)
-        )
+        try:
+            response = await self.gateway.embeddings(
+                operation="embedding_index",
+                model=self.EMBEDDING_MODEL,
+                input=texts,
+            )
 
-        result = await self.session.execute(stmt)
-        documents = result.scalars().all()
-
-        # Конвертируем в DocumentChunk
-        chunks = []
-        for doc in documents:
-            if doc.extracted_text:
-                # Берем первые N символов как чанк
-                chunk_content = doc.extracted_text[:1000]
-
-                chunk = DocumentChunk(
-                    document_id=doc.id,
-                    document_title=doc.title,
-                    content=chunk_content,
-                    similarity_score=0.8,  # Dummy score для MVP
-                    metadata={
-                        "document_type": doc.document_type,
-                        "category": doc.category,
-                    },
+            if len(response.data) != len(texts):
+                return Result.fail(
+                    f"Expected {len(texts)} embeddings, got {len(response.data)}"
                 )
-                chunks.append(chunk)
 
-        return chunks
+            ordered = sorted(response.data, key=lambda item: item.index)
+            return Result.ok([item.embedding for item in ordered])
+
+        except Exception as e:
+            return Result.fail(f"Embedding creation error: {str(e)}")
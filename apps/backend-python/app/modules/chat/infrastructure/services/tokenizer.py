@@ -0,0 +1,160 @@
+"""
+Tokenizer
+
+Точный подсчет токенов моделей OpenAI (tiktoken).
+
+Encoder загружается один раз на модель и процесс. Оценка "4 символа =
+1 токен" для русского текста ошибается в 2-3 раза, поэтому бюджеты
+контекста (RAG, история беседы) считаются только здесь.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import tiktoken
+
+# Encoding моделей, которых нет в tiktoken.model (новые/кастомные имена)
+DEFAULT_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """
+    Возвращает encoder модели (один на процесс).
+
+    Загрузка BPE таблицы занимает десятки миллисекунд, поэтому encoder
+    создается один раз на модель.
+
+    Args:
+        model: Имя модели OpenAI (gpt-4-turbo-preview, text-embedding-3-small, ...)
+
+    Returns:
+        tiktoken.Encoding
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+class TokenCounter:
+    """
+    Подсчет токенов текста и сообщений chat completions.
+
+    Формат сообщения chat API добавляет служебные токены: ~3 на
+    сообщение (роль, разделители) и 3 на начало ответа ассистента.
+
+    Example:
+        >>> counter = TokenCounter.for_model("gpt-4-turbo-preview")
+        >>> budget = counter.budget(4000)
+        >>> budget.try_add(counter.count_message("Как обжаловать штраф?"))
+        True
+    """
+
+    # Служебные токены на сообщение chat API
+    MESSAGE_OVERHEAD = 3
+    # Служебные токены начала ответа (<|start|>assistant<|message|>)
+    REPLY_PRIMING = 3
+
+    def __init__(self, model: str):
+        """
+        Args:
+            model: Имя модели OpenAI
+        """
+        self.model = model
+        self._encoding = get_encoding(model)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def for_model(cls, model: str) -> "TokenCounter":
+        """Счетчик модели (один на процесс)."""
+        return cls(model)
+
+    def count(self, text: str) -> int:
+        """
+        Количество токенов текста.
+
+        Args:
+            text: Текст
+
+        Returns:
+            Количество токенов
+        """
+        if not text:
+            return 0
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def count_message(self, content: str, content_tokens: Optional[int] = None) -> int:
+        """
+        Токены сообщения chat API (текст + служебные токены).
+
+        Args:
+            content: Текст сообщения
+            content_tokens: Уже посчитанные токены текста (кеш)
+
+        Returns:
+            Количество токенов сообщения
+        """
+        if content_tokens is None:
+            content_tokens = self.count(content)
+        return content_tokens + self.MESSAGE_OVERHEAD
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Обрезает текст до max_tokens токенов.
+
+        Args:
+            text: Текст
+            max_tokens: Лимит токенов
+
+        Returns:
+            Текст, укладывающийся в лимит (без разорванных символов)
+        """
+        if max_tokens <= 0:
+            return ""
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        data = self._encoding.decode_bytes(tokens[:max_tokens])
+        return data.decode("utf-8", errors="ignore")
+
+    def budget(self, limit: int) -> "TokenBudget":
+        """Новый бюджет токенов."""
+        return TokenBudget(limit)
+
+
+class TokenBudget:
+    """
+    Инкрементальный бюджет токенов.
+
+    Части промпта добавляются по одной; посчитанные ранее части не
+    пересчитываются.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Args:
+            limit: Лимит токенов
+        """
+        self.limit = limit
+        self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        """Оставшиеся токены."""
+        return max(self.limit - self.used, 0)
+
+    def fits(self, tokens: int) -> bool:
+        """Помещается ли еще tokens токенов."""
+        return self.used + tokens <= self.limit
+
+    def try_add(self, tokens: int) -> bool:
+        """
+        Добавляет tokens, если они помещаются.
+
+        Returns:
+            True, если добавлено
+        """
+        if not self.fits(tokens):
+            return False
+        self.used += tokens
+        return True
@@ -8,7 +8,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.modules.identity.presentation.dependencies.auth_deps import get_current_user
+from app.config import settings
+from app.modules.identity.presentation.dependencies.auth_deps import (
+    get_current_user,
+    require_role,
+)
 from app.modules.identity.application.dtos.user_dto import UserDTO
 
 # Application Layer imports
@@ -41,7 +45,9 @@ from app.modules.chat.application.queries.get_conversations_by_user_handler impo
 from app.modules.chat.infrastructure.persistence.repositories.conversation_repository_impl import (
     ConversationRepositoryImpl,
 )
+from app.modules.chat.infrastructure.services.answer_cache import SemanticAnswerCache
 from app.modules.chat.infrastructure.services.openai_service import OpenAIService
+from app.modules.chat.infrastructure.services.pipeline_metrics import observe_chat_stage
 from app.modules.chat.infrastructure.services.rag_service import RAGServiceImpl
 
 # Presentation Layer imports
@@ -49,6 +55,11 @@ from app.modules.chat.presentation.dependencies import (
     OpenAIServiceDep,
     RAGServiceDep,
     ConversationRepositoryDep,
+    ContextWindowDep,
+    AnswerCacheDep,
+    SubscriptionPlanDep,
+    charge_llm_tokens,
+    enforce_chat_rate_limit,
 )
 from app.modules.chat.presentation.schemas.requests import (
     StartConversationRequest,
@@ -61,6 +72,7 @@ from app.modules.chat.presentation.schemas.responses import (
     MessageResponse,
     ErrorResponse,
     TokenUsageResponse,
+    AnswerCachePurgeResponse,
 )
 
 
@@ -186,6 +198,7 @@ async def start_conversation(
     "/conversations/{conversation_id}/messages",
     response_model=ConversationResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(enforce_chat_rate_limit)],
     summary="Отправить сообщение",
     description="""
     Отправляет сообщение в беседу и получает ответ от AI.
@@ -194,11 +207,14 @@ async def start_conversation(
     1. Проверяется доступ пользователя к беседе
     2. Добавляется сообщение пользователя
     3. Поиск релевантных документов (RAG) если use_rag=true
-    4. Генерация ответа от GPT-4 с контекстом
+    4. Ответ из семантического кеша (общий вопрос без документов и
+       истории) или генерация ответа от GPT-4 с контекстом
     5. Добавляется ответ ассистента
     6. Возвращается обновленная беседа
 
     **Права:** Требуется аутентификация + владение беседой
+
+    **Лимиты:** сообщения в минуту и бюджет LLM токенов в час на пользователя (429)
     """,
 )
 async def send_message(
@@ -208,6 +224,9 @@ async def send_message(
     repository: ConversationRepositoryDep,
     ai_service: OpenAIServiceDep,
     rag_service: RAGServiceDep,
+    context_window: ContextWindowDep,
+    answer_cache: AnswerCacheDep,
+    subscription_plan: SubscriptionPlanDep,
 ) -> ConversationResponse:
     """
     Отправить сообщение в беседу.
@@ -219,15 +238,26 @@ async def send_message(
         repository: Conversation repository (injected)
         ai_service: OpenAI service (injected)
         rag_service: RAG service (injected)
+        context_window: Окно контекста беседы (injected)
+        answer_cache: Семантический кеш ответов (injected, None - отключен)
+        subscription_plan: План подписки (приоритет в очереди LLM)
 
     Returns:
         ConversationResponse
 
     Raises:
-        HTTPException: 400/403/404 при ошибках
+        HTTPException: 400/403/404 при ошибках, 503 при перегрузке LLM
     """
     # Создаем handler
-    handler = SendMessageHandler(repository, ai_service, rag_service)
+    handler = SendMessageHandler(
+        repository,
+        ai_service,
+        rag_service,
+        context_window,
+        answer_cache=answer_cache,
+        answer_cache_max_question_chars=settings.chat_answer_cache_max_question_chars,
+        stage_observer=observe_chat_stage,
+    )
 
     # Создаем команду
     command = SendMessageCommand(
@@ -235,6 +265,8 @@ async def send_message(
         user_id=current_user.id,
         message_content=request.message_content,
         use_rag=request.use_rag,
+        locale=request.locale,
+        subscription_plan=subscription_plan,
     )
 
     # Выполняем команду
@@ -246,6 +278,9 @@ async def send_message(
             status_code = status.HTTP_404_NOT_FOUND
         elif "access denied" in result.error.lower():
             status_code = status.HTTP_403_FORBIDDEN
+        elif "temporarily unavailable" in result.error.lower():
+            # Circuit breaker LLM gateway открыт
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         else:
             status_code = status.HTTP_400_BAD_REQUEST
 
@@ -254,6 +289,9 @@ async def send_message(
             detail=result.error,
         )
 
+    # Учитываем израсходованные токены в бюджете пользователя
+    await charge_llm_tokens(current_user.id, result.value)
+
     # Конвертируем DTO в Response
     return _to_conversation_response(result.value)
 
@@ -434,3 +472,42 @@ async def get_token_usage(
         total_tokens=total_tokens,
         total_conversations=total_conversations,
     )
+
+
+@router.delete(
+    "/admin/answer-cache",
+    response_model=AnswerCachePurgeResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Очистить кеш ответов (Admin)",
+    description="""
+    Удаляет записи семантического кеша ответов, например после изменения
+    законодательства или system prompt.
+
+    **Параметры:**
+    - locale: только записи локали (по умолчанию - все)
+    - expired_only: только устаревшие записи
+
+    **Права:** ADMIN
+    """,
+)
+async def purge_answer_cache(
+    current_user: Annotated[UserDTO, Depends(require_role("ADMIN"))],
+    rag_service: RAGServiceDep,
+    locale: Annotated[str | None, Query(max_length=10)] = None,
+    expired_only: bool = False,
+) -> AnswerCachePurgeResponse:
+    """
+    Очистить семантический кеш ответов.
+
+    Args:
+        current_user: Текущий администратор
+        rag_service: RAG service (injected)
+        locale: Локаль (None - все)
+        expired_only: Только устаревшие записи
+
+    Returns:
+        AnswerCachePurgeResponse
+    """
+    cache = SemanticAnswerCache(embed=rag_service.embed_query)
+    deleted = await cache.purge(locale=locale, expired_only=expired_only)
+    return AnswerCachePurgeResponse(deleted=deleted, locale=locale)
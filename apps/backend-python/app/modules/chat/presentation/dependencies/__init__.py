@@ -5,16 +5,36 @@ from app.modules.chat.presentation.dependencies.chat_deps import (
     get_openai_service,
     get_rag_service,
     get_conversation_repository,
+    get_context_window,
+    get_answer_cache,
+    get_subscription_plan,
+    resolve_subscription_plan,
     OpenAIServiceDep,
     RAGServiceDep,
+    ContextWindowDep,
+    AnswerCacheDep,
+    SubscriptionPlanDep,
     ConversationRepositoryDep,
+    chat_message_limits,
+    charge_llm_tokens,
+    enforce_chat_rate_limit,
 )
 
 __all__ = [
     "get_openai_service",
     "get_rag_service",
     "get_conversation_repository",
+    "get_context_window",
+    "get_answer_cache",
+    "get_subscription_plan",
+    "resolve_subscription_plan",
     "OpenAIServiceDep",
     "RAGServiceDep",
+    "ContextWindowDep",
+    "AnswerCacheDep",
+    "SubscriptionPlanDep",
     "ConversationRepositoryDep",
+    "chat_message_limits",
+    "charge_llm_tokens",
+    "enforce_chat_rate_limit",
 ]
@@ -4,12 +4,29 @@ Chat Dependencies
 Dependency Injection для Chat Module.
 """
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, List, Optional
+from uuid import UUID
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.infrastructure.database import get_db
+from app.core.infrastructure.rate_limiter import (
+    RateLimitCheck,
+    RateLimitExceeded,
+    RateLimits,
+    raise_too_many_requests,
+    rate_limiter,
+)
+from app.modules.chat.application.dtos.conversation_dto import ConversationDTO
+from app.modules.chat.domain.services.context_window import ConversationContextWindow
+from app.modules.identity.application.dtos.user_dto import UserDTO
+from app.modules.payment.domain import SubscriptionPlanEnum
+from app.modules.payment.infrastructure.persistence.repositories import (
+    SubscriptionRepositoryImpl,
+)
+from app.modules.identity.presentation.dependencies.auth_deps import get_current_user
+from app.modules.chat.infrastructure.services.answer_cache import SemanticAnswerCache
 from app.modules.chat.infrastructure.services.openai_service import OpenAIService
 from app.modules.chat.infrastructure.services.rag_service import RAGServiceImpl
 from app.modules.chat.infrastructure.persistence.repositories.conversation_repository_impl import (
@@ -29,13 +46,27 @@ def get_openai_service() -> OpenAIService:
         OpenAIService instance
     """
     return OpenAIService(
-        api_key=settings.openai_api_key,
         model=settings.openai_llm_model,
         max_tokens=1500,
         temperature=0.7,
     )
 
 
+@lru_cache()
+def get_context_window() -> ConversationContextWindow:
+    """
+    Singleton окна контекста беседы (настройки истории и summary).
+
+    Returns:
+        ConversationContextWindow instance
+    """
+    return ConversationContextWindow(
+        tail_messages=settings.chat_history_tail_messages,
+        keep_messages=settings.chat_summary_keep_messages,
+        summarize_after=settings.chat_summary_trigger_messages,
+    )
+
+
 def get_rag_service(
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> RAGServiceImpl:
@@ -50,10 +81,27 @@ def get_rag_service(
     Returns:
         RAGServiceImpl instance
     """
-    return RAGServiceImpl(
-        session=db,
-        openai_api_key=settings.openai_api_key,
-    )
+    return RAGServiceImpl(session=db)
+
+
+def get_answer_cache(
+    rag_service: Annotated[RAGServiceImpl, Depends(get_rag_service)],
+) -> Optional[SemanticAnswerCache]:
+    """
+    Factory для семантического кеша ответов.
+
+    Использует embedding запроса RAG сервиса: при поиске по документам
+    и обращении к кешу вектор создается один раз.
+
+    Args:
+        rag_service: RAG сервис запроса
+
+    Returns:
+        SemanticAnswerCache или None, если кеш отключен
+    """
+    if not settings.chat_answer_cache_enabled:
+        return None
+    return SemanticAnswerCache(embed=rag_service.embed_query)
 
 
 def get_conversation_repository(
@@ -71,9 +119,93 @@ def get_conversation_repository(
     return ConversationRepositoryImpl(db)
 
 
+async def resolve_subscription_plan(db: AsyncSession, user_id: str) -> str:
+    """
+    План подписки пользователя (приоритет в очереди LLM).
+
+    Args:
+        db: Database session
+        user_id: ID пользователя
+
+    Returns:
+        Значение SubscriptionPlanEnum (без активной подписки - free)
+    """
+    subscription = await SubscriptionRepositoryImpl(db).find_active_by_user(UUID(user_id))
+    if subscription is None:
+        return SubscriptionPlanEnum.FREE.value
+    return subscription.plan.value.value
+
+
+async def get_subscription_plan(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserDTO, Depends(get_current_user)],
+) -> str:
+    """
+    Dependency: план подписки текущего пользователя.
+
+    Returns:
+        Значение SubscriptionPlanEnum
+    """
+    return await resolve_subscription_plan(db, current_user.id)
+
+
+def chat_message_limits(user_id: str) -> List[RateLimitCheck]:
+    """
+    Проверки rate limiting для одного сообщения в чат.
+
+    Включает per-user лимит сообщений, общий лимит маршрута и
+    бюджет LLM токенов (cost=0: пропускает, пока бюджет не ушел в минус).
+
+    Args:
+        user_id: ID пользователя
+
+    Returns:
+        Список проверок для rate_limiter.enforce()
+    """
+    return [
+        RateLimitCheck(rule=RateLimits.CHAT_MESSAGE, identity=user_id),
+        RateLimitCheck(rule=RateLimits.CHAT_ROUTE, identity="chat:messages"),
+        RateLimitCheck(rule=RateLimits.CHAT_LLM_TOKENS, identity=user_id, cost=0),
+    ]
+
+
+async def charge_llm_tokens(user_id: str, conversation: ConversationDTO) -> None:
+    """
+    Списать фактически израсходованные LLM токены из бюджета пользователя.
+
+    Args:
+        user_id: ID пользователя
+        conversation: Беседа после ответа ассистента
+    """
+    for message in reversed(conversation.messages or []):
+        if message.role == "assistant":
+            await rate_limiter.charge(
+                RateLimits.CHAT_LLM_TOKENS, user_id, message.token_count or 0
+            )
+            return
+
+
+async def enforce_chat_rate_limit(
+    current_user: Annotated[UserDTO, Depends(get_current_user)],
+) -> None:
+    """
+    Dependency: rate limiting отправки сообщений в чат.
+
+    Raises:
+        HTTPException: 429 при превышении лимита
+    """
+    try:
+        await rate_limiter.enforce(chat_message_limits(current_user.id))
+    except RateLimitExceeded as e:
+        raise_too_many_requests(e)
+
+
 # Type aliases для удобства
 OpenAIServiceDep = Annotated[OpenAIService, Depends(get_openai_service)]
 RAGServiceDep = Annotated[RAGServiceImpl, Depends(get_rag_service)]
+ContextWindowDep = Annotated[ConversationContextWindow, Depends(get_context_window)]
+AnswerCacheDep = Annotated[Optional[SemanticAnswerCache], Depends(get_answer_cache)]
+SubscriptionPlanDep = Annotated[str, Depends(get_subscription_plan)]
 ConversationRepositoryDep = Annotated[
     ConversationRepositoryImpl,
     Depends(get_conversation_repository),
@@ -15,6 +15,7 @@ from app.modules.chat.presentation.schemas.responses import (
     ConversationSearchResponse,
     ErrorResponse,
     TokenUsageResponse,
+    AnswerCachePurgeResponse,
 )
 
 __all__ = [
@@ -31,4 +32,5 @@ __all__ = [
     "ConversationSearchResponse",
     "ErrorResponse",
     "TokenUsageResponse",
+    "AnswerCachePurgeResponse",
 ]
@@ -41,6 +41,7 @@ class SendMessageRequest(BaseModel):
     Attributes:
         message_content: Текст сообщения
         use_rag: Использовать ли RAG (поиск по документам)
+        locale: Локаль ответа
     """
 
     message_content: str = Field(
@@ -56,6 +57,13 @@ class SendMessageRequest(BaseModel):
         description="Использовать ли RAG (поиск по документам пользователя)",
     )
 
+    locale: str = Field(
+        "ru",
+        pattern=r"^[a-z]{2}(-[A-Z]{2})?$",
+        description="Локаль ответа (раздел кеша ответов на общие вопросы)",
+        examples=["ru"],
+    )
+
 
 class GetConversationsRequest(BaseModel):
     """
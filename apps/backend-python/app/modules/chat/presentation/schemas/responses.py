@@ -166,3 +166,16 @@ class TokenUsageResponse(BaseModel):
     user_id: str = Field(..., description="UUID пользователя")
     total_tokens: int = Field(..., description="Общее количество токенов")
     total_conversations: int = Field(..., description="Количество бесед")
+
+
+class AnswerCachePurgeResponse(BaseModel):
+    """
+    Схема ответа очистки кеша ответов.
+
+    Attributes:
+        deleted: Количество удаленных записей
+        locale: Локаль (None - все локали)
+    """
+
+    deleted: int = Field(..., description="Количество удаленных записей")
+    locale: Optional[str] = Field(None, description="Локаль (None - все локали)")
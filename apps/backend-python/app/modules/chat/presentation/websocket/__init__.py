@@ -3,8 +3,11 @@ WebSocket для Chat Module
 """
 from app.modules.chat.presentation.websocket.chat_websocket import (
     websocket_endpoint,
-    ConnectionManager,
     ChatWebSocketHandler,
+)
+from app.modules.chat.presentation.websocket.connection_manager import (
+    ConnectionManager,
+    WebSocketConnection,
     manager,
 )
 
@@ -12,5 +15,6 @@ __all__ = [
     "websocket_endpoint",
     "ConnectionManager",
     "ChatWebSocketHandler",
+    "WebSocketConnection",
     "manager",
 ]
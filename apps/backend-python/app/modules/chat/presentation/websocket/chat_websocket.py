@@ -4,8 +4,7 @@ Chat WebSocket Handler
 WebSocket handler для real-time чата с AI ассистентом.
 """
 
-import json
-from typing import Dict, Optional
+from typing import Optional
 from uuid import UUID
 
 from fastapi import WebSocket, WebSocketDisconnect, status
@@ -20,73 +19,19 @@ from app.modules.chat.application.commands.send_message_handler import (
 from app.modules.chat.infrastructure.persistence.repositories.conversation_repository_impl import (
     ConversationRepositoryImpl,
 )
-from app.modules.chat.infrastructure.services.openai_service import OpenAIService
+from app.config import settings
+from app.modules.chat.infrastructure.services.answer_cache import SemanticAnswerCache
+from app.modules.chat.infrastructure.services.pipeline_metrics import observe_chat_stage
 from app.modules.chat.infrastructure.services.rag_service import RAGServiceImpl
-
-
-class ConnectionManager:
-    """
-    Менеджер WebSocket подключений.
-
-    Управляет активными соединениями для real-time чата.
-    """
-
-    def __init__(self):
-        """Инициализирует менеджер."""
-        self.active_connections: Dict[str, WebSocket] = {}
-
-    async def connect(self, conversation_id: str, websocket: WebSocket):
-        """
-        Подключает клиента к беседе.
-
-        Args:
-            conversation_id: ID беседы
-            websocket: WebSocket соединение
-        """
-        await websocket.accept()
-        self.active_connections[conversation_id] = websocket
-
-    def disconnect(self, conversation_id: str):
-        """
-        Отключает клиента от беседы.
-
-        Args:
-            conversation_id: ID беседы
-        """
-        if conversation_id in self.active_connections:
-            del self.active_connections[conversation_id]
-
-    async def send_message(self, conversation_id: str, message: dict):
-        """
-        Отправляет сообщение клиенту.
-
-        Args:
-            conversation_id: ID беседы
-            message: Сообщение в формате dict
-        """
-        if conversation_id in self.active_connections:
-            websocket = self.active_connections[conversation_id]
-            await websocket.send_json(message)
-
-    async def send_error(self, conversation_id: str, error: str):
-        """
-        Отправляет ошибку клиенту.
-
-        Args:
-            conversation_id: ID беседы
-            error: Описание ошибки
-        """
-        await self.send_message(
-            conversation_id,
-            {
-                "type": "error",
-                "error": error,
-            },
-        )
-
-
-# Глобальный менеджер соединений
-manager = ConnectionManager()
+from app.modules.chat.presentation.dependencies.chat_deps import (
+    chat_message_limits,
+    charge_llm_tokens,
+    get_context_window,
+    get_openai_service,
+    resolve_subscription_plan,
+)
+from app.modules.chat.presentation.websocket.connection_manager import manager
+from app.core.infrastructure.rate_limiter import RateLimitExceeded, rate_limiter
 
 
 class ChatWebSocketHandler:
@@ -116,13 +61,24 @@ class ChatWebSocketHandler:
 
         # Создаем dependencies
         self.repository = ConversationRepositoryImpl(db)
-        self.ai_service = OpenAIService()
+        # OpenAI клиент общий для процесса (LLMGateway)
+        self.ai_service = get_openai_service()
         self.rag_service = RAGServiceImpl(db)
         self.handler = SendMessageHandler(
             self.repository,
             self.ai_service,
             self.rag_service,
+            get_context_window(),
+            answer_cache=(
+                SemanticAnswerCache(embed=self.rag_service.embed_query)
+                if settings.chat_answer_cache_enabled
+                else None
+            ),
+            answer_cache_max_question_chars=settings.chat_answer_cache_max_question_chars,
+            stage_observer=observe_chat_stage,
         )
+        # План подписки (приоритет в очереди LLM), загружается при первом сообщении
+        self.subscription_plan: Optional[str] = None
 
     async def handle_message(self, data: dict) -> Optional[dict]:
         """
@@ -133,7 +89,8 @@ class ChatWebSocketHandler:
                 {
                     "type": "message",
                     "content": "текст сообщения",
-                    "use_rag": true
+                    "use_rag": true,
+                    "locale": "ru"
                 }
 
         Returns:
@@ -150,6 +107,24 @@ class ChatWebSocketHandler:
                 return {"type": "error", "error": "Message content is required"}
 
             use_rag = data.get("use_rag", True)
+            locale = data.get("locale") or "ru"
+            if not isinstance(locale, str) or len(locale) > 10:
+                return {"type": "error", "error": "Invalid locale"}
+
+            # Rate limiting (те же лимиты, что и у REST endpoint)
+            try:
+                await rate_limiter.enforce(chat_message_limits(self.user_id))
+            except RateLimitExceeded as e:
+                return {
+                    "type": "error",
+                    "error": "Rate limit exceeded",
+                    "retry_after": round(e.retry_after, 1),
+                }
+
+            if self.subscription_plan is None:
+                self.subscription_plan = await resolve_subscription_plan(
+                    self.db, self.user_id
+                )
 
             # Создаем команду
             command = SendMessageCommand(
@@ -157,6 +132,8 @@ class ChatWebSocketHandler:
                 user_id=self.user_id,
                 message_content=content,
                 use_rag=use_rag,
+                locale=locale,
+                subscription_plan=self.subscription_plan,
             )
 
             # Выполняем команду
@@ -167,6 +144,7 @@ class ChatWebSocketHandler:
 
             # Формируем ответ
             conversation_dto = result.value
+            await charge_llm_tokens(self.user_id, conversation_dto)
 
             # Находим последнее сообщение ассистента
             assistant_message = None
@@ -201,6 +179,28 @@ class ChatWebSocketHandler:
             return {"type": "error", "error": f"Internal error: {str(e)}"}
 
 
+async def is_conversation_owner(db: AsyncSession, conversation_id: str, user_id: str) -> bool:
+    """
+    Проверяет, что беседа принадлежит пользователю.
+
+    Args:
+        db: Database session
+        conversation_id: ID беседы
+        user_id: ID пользователя
+
+    Returns:
+        True, если беседа существует и принадлежит пользователю
+    """
+    try:
+        conversation_uuid = UUID(conversation_id)
+    except ValueError:
+        return False
+    conversation = await ConversationRepositoryImpl(db).find_by_id(
+        conversation_uuid, include_messages=False
+    )
+    return conversation is not None and str(conversation.user_id) == user_id
+
+
 async def websocket_endpoint(
     websocket: WebSocket,
     conversation_id: str,
@@ -210,27 +210,40 @@ async def websocket_endpoint(
     """
     WebSocket endpoint для чата.
 
+    Ответ ассистента отправляется всем соединениям беседы (другие
+    вкладки, другие воркеры), ошибки - только отправившему соединению.
+    Клиентские {"type": "ping"} получают {"type": "pong"}, ответы на
+    heartbeat сервера ({"type": "pong"}) пропускаются.
+
+    Чужая или несуществующая беседа - соединение закрывается с кодом
+    1008 (Policy Violation) до регистрации в менеджере.
+
     Args:
         websocket: WebSocket соединение
         conversation_id: ID беседы
-        user_id: ID пользователя
+        user_id: ID пользователя (из проверенного access токена)
         db: Database session
     """
+    if not await is_conversation_owner(db, conversation_id, user_id):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
     # Подключаем клиента
-    await manager.connect(conversation_id, websocket)
+    connection = await manager.connect(websocket, conversation_id, user_id)
 
     # Создаем handler
     chat_handler = ChatWebSocketHandler(db, conversation_id, user_id)
 
+    close_code = status.WS_1000_NORMAL_CLOSURE
+    final_message = None
     try:
         # Отправляем приветственное сообщение
-        await manager.send_message(
-            conversation_id,
+        connection.send(
             {
                 "type": "connected",
                 "conversation_id": conversation_id,
                 "message": "Connected to chat",
-            },
+            }
         )
 
         # Обрабатываем входящие сообщения
@@ -238,19 +251,31 @@ async def websocket_endpoint(
             # Получаем сообщение
             data = await websocket.receive_json()
 
+            # Heartbeat
+            message_type = data.get("type") if isinstance(data, dict) else None
+            if message_type == "ping":
+                connection.send({"type": "pong"})
+                continue
+            if message_type == "pong":
+                continue
+
             # Обрабатываем сообщение
             response = await chat_handler.handle_message(data)
 
             # Отправляем ответ
-            if response:
-                await manager.send_message(conversation_id, response)
+            if response and response.get("type") == "message":
+                await manager.send_to_conversation(conversation_id, response)
+            elif response:
+                connection.send(response)
 
     except WebSocketDisconnect:
         # Клиент отключился
-        manager.disconnect(conversation_id)
+        pass
 
     except Exception as e:
         # Ошибка - отправляем и отключаемся
-        await manager.send_error(conversation_id, f"WebSocket error: {str(e)}")
-        manager.disconnect(conversation_id)
-        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        close_code = status.WS_1011_INTERNAL_ERROR
+        final_message = {"type": "error", "error": f"WebSocket error: {str(e)}"}
+
+    finally:
+        await manager.disconnect(connection, code=close_code, final_message=final_message)
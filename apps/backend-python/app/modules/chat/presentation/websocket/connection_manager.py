@@ -0,0 +1,387 @@
+"""
+WebSocket Connection Manager
+
+Реестр WebSocket соединений чата с доставкой между воркерами.
+
+- несколько соединений на беседу и на пользователя (вкладки, устройства)
+- сообщение беседе/пользователю доставляется локальным соединениям сразу
+  и публикуется в Redis pub/sub (канал chat:ws) для остальных воркеров;
+  без Redis доставка только в своем процессе (локальный broker)
+- у каждого соединения ограниченная очередь отправки и отдельная задача
+  отправки: медленный клиент не блокирует обработку сообщений
+- переполнение очереди или таймаут отправки - соединение закрывается
+  (1013 Try Again Later), клиент переподключается; соединение, закрытое
+  сервером или с ошибкой отправки, сразу снимается с регистрации
+- heartbeat: при простое клиенту отправляется {"type": "ping"}
+  (держит соединение через прокси и выявляет мертвые соединения)
+"""
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Optional, Set
+from uuid import uuid4
+
+from fastapi import WebSocket, status
+from prometheus_client import Counter, Gauge
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.core.infrastructure.cache import RedisClient, redis_client
+
+logger = logging.getLogger(__name__)
+
+
+BROADCAST_CHANNEL = "chat:ws"
+
+TARGET_CONVERSATION = "conversation"
+TARGET_USER = "user"
+
+
+CHAT_WS_CONNECTIONS = Gauge(
+    "chat_ws_connections",
+    "Открытые WebSocket соединения чата (воркер)",
+)
+CHAT_WS_DISCONNECTS = Counter(
+    "chat_ws_forced_disconnects_total",
+    "Соединения, закрытые сервером",
+    ["reason"],
+)
+
+
+class WebSocketConnection:
+    """
+    Соединение клиента с очередью отправки.
+
+    Сообщения отправляет только задача отправки соединения, поэтому
+    send() не блокирует вызывающего.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        conversation_id: str,
+        user_id: str,
+        queue_size: int = settings.chat_ws_send_queue_size,
+        send_timeout: float = settings.chat_ws_send_timeout_seconds,
+        heartbeat_interval: float = settings.chat_ws_heartbeat_seconds,
+        on_close: Optional[Callable[["WebSocketConnection"], None]] = None,
+    ):
+        """
+        Args:
+            websocket: WebSocket соединение (принятое)
+            conversation_id: ID беседы
+            user_id: ID пользователя
+            queue_size: Размер очереди отправки
+            send_timeout: Таймаут отправки одного сообщения (секунды)
+            heartbeat_interval: Интервал ping при простое (секунды)
+            on_close: Вызывается при закрытии (снятие с регистрации)
+        """
+        self.id = str(uuid4())
+        self.websocket = websocket
+        self.conversation_id = conversation_id
+        self.user_id = user_id
+
+        self._queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=queue_size)
+        self._send_timeout = send_timeout
+        self._heartbeat_interval = heartbeat_interval
+        self._sender: Optional[asyncio.Task] = None
+        self._on_close = on_close
+        self._closed = False
+
+    @property
+    def is_closed(self) -> bool:
+        """Соединение закрыто или закрывается."""
+        return self._closed
+
+    def start(self) -> None:
+        """Запускает задачу отправки."""
+        self._sender = asyncio.create_task(self._send_loop(), name=f"chat-ws-sender:{self.id}")
+
+    def send(self, message: dict) -> bool:
+        """
+        Ставит сообщение в очередь отправки.
+
+        Переполненная очередь - медленный клиент: соединение закрывается.
+
+        Args:
+            message: Сообщение
+
+        Returns:
+            True, если сообщение поставлено в очередь
+        """
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(
+                f"Chat WebSocket {self.id} (user {self.user_id}) is too slow, disconnecting"
+            )
+            self._schedule_close(status.WS_1013_TRY_AGAIN_LATER, "slow_consumer")
+            return False
+
+    async def close(
+        self,
+        code: int = status.WS_1000_NORMAL_CLOSURE,
+        final_message: Optional[dict] = None,
+    ) -> None:
+        """
+        Закрывает соединение (задача отправки останавливается).
+
+        Args:
+            code: Код закрытия WebSocket
+            final_message: Сообщение перед закрытием (например, ошибка)
+        """
+        self._closed = True
+        if self._on_close is not None:
+            self._on_close(self)
+        sender, self._sender = self._sender, None
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+        try:
+            if final_message is not None:
+                await asyncio.wait_for(
+                    self.websocket.send_json(final_message), timeout=self._send_timeout
+                )
+            await self.websocket.close(code=code)
+        except (RuntimeError, OSError, asyncio.TimeoutError):
+            # Уже закрыто клиентом
+            pass
+
+    def _schedule_close(self, code: int, reason: str) -> None:
+        """Закрывает соединение в фоне (из синхронного кода или задачи отправки)."""
+        if self._closed:
+            return
+        self._closed = True
+        CHAT_WS_DISCONNECTS.labels(reason=reason).inc()
+        asyncio.get_running_loop().create_task(self.close(code))
+
+    async def _send_loop(self) -> None:
+        """Отправляет сообщения очереди; при простое - heartbeat."""
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    self._queue.get(), timeout=self._heartbeat_interval
+                )
+            except asyncio.TimeoutError:
+                message = {"type": "ping"}
+
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_json(message), timeout=self._send_timeout
+                )
+            except asyncio.TimeoutError:
+                self._schedule_close(status.WS_1013_TRY_AGAIN_LATER, "send_timeout")
+                return
+            except Exception as e:
+                # Клиент отключился: закрываем, чтобы не доставлять в мертвое соединение
+                logger.debug(f"Chat WebSocket {self.id} send failed: {e}")
+                self._schedule_close(status.WS_1011_INTERNAL_ERROR, "send_failed")
+                return
+
+
+class ConnectionManager:
+    """
+    Реестр WebSocket соединений чата (по беседам и пользователям).
+
+    Доставка между воркерами - Redis pub/sub; каждый воркер доставляет
+    сообщение своим соединениям. Сообщения собственного воркера из канала
+    пропускаются (уже доставлены локально).
+    """
+
+    def __init__(self, redis: RedisClient = redis_client):
+        """
+        Args:
+            redis: Redis клиент (pub/sub между воркерами)
+        """
+        self._redis = redis
+        self._worker_id = f"{os.getpid()}:{uuid4().hex[:8]}"
+        self._by_conversation: Dict[str, Set[WebSocketConnection]] = {}
+        self._by_user: Dict[str, Set[WebSocketConnection]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    # ========== Lifecycle ==========
+
+    def start(self) -> None:
+        """Запустить слушателя канала доставки между воркерами (pub/sub)."""
+        if self._listener is None and self._redis.is_connected:
+            self._stopping.clear()
+            self._listener = asyncio.create_task(self._listen(), name="chat-ws-listener")
+
+    async def stop(self) -> None:
+        """Остановить слушателя и закрыть все соединения воркера."""
+        self._stopping.set()
+        if self._listener is not None:
+            await self._listener
+            self._listener = None
+
+        connections = {
+            connection
+            for connections in self._by_conversation.values()
+            for connection in connections
+        }
+        await asyncio.gather(
+            *(connection.close(status.WS_1001_GOING_AWAY) for connection in connections),
+            return_exceptions=True,
+        )
+        self._by_conversation.clear()
+        self._by_user.clear()
+        CHAT_WS_CONNECTIONS.set(0)
+
+    # ========== Connections ==========
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        conversation_id: str,
+        user_id: str,
+    ) -> WebSocketConnection:
+        """
+        Принимает соединение и регистрирует его.
+
+        Args:
+            websocket: WebSocket соединение
+            conversation_id: ID беседы
+            user_id: ID пользователя
+
+        Returns:
+            WebSocketConnection
+        """
+        await websocket.accept()
+        connection = WebSocketConnection(
+            websocket, conversation_id, user_id, on_close=self._unregister
+        )
+        connection.start()
+
+        self._by_conversation.setdefault(conversation_id, set()).add(connection)
+        self._by_user.setdefault(user_id, set()).add(connection)
+        CHAT_WS_CONNECTIONS.inc()
+        return connection
+
+    async def disconnect(
+        self,
+        connection: WebSocketConnection,
+        code: int = status.WS_1000_NORMAL_CLOSURE,
+        final_message: Optional[dict] = None,
+    ) -> None:
+        """
+        Снимает соединение с регистрации и закрывает его.
+
+        Args:
+            connection: Соединение
+            code: Код закрытия WebSocket
+            final_message: Сообщение перед закрытием (например, ошибка)
+        """
+        self._unregister(connection)
+        await connection.close(code, final_message)
+
+    def _unregister(self, connection: WebSocketConnection) -> None:
+        """Снимает соединение с регистрации (повторный вызов ничего не делает)."""
+        removed = self._discard(self._by_conversation, connection.conversation_id, connection)
+        self._discard(self._by_user, connection.user_id, connection)
+        if removed:
+            CHAT_WS_CONNECTIONS.dec()
+
+    def connection_count(self, conversation_id: str) -> int:
+        """Количество соединений беседы на этом воркере."""
+        return len(self._by_conversation.get(conversation_id, ()))
+
+    # ========== Delivery ==========
+
+    async def send_to_conversation(self, conversation_id: str, message: dict) -> None:
+        """
+        Отправляет сообщение всем соединениям беседы (на всех воркерах).
+
+        Args:
+            conversation_id: ID беседы
+            message: Сообщение
+        """
+        await self._broadcast(TARGET_CONVERSATION, conversation_id, message)
+
+    async def send_to_user(self, user_id: str, message: dict) -> None:
+        """
+        Отправляет сообщение всем соединениям пользователя (на всех воркерах).
+
+        Args:
+            user_id: ID пользователя
+            message: Сообщение
+        """
+        await self._broadcast(TARGET_USER, user_id, message)
+
+    async def _broadcast(self, target: str, target_id: str, message: dict) -> None:
+        """Доставляет локально и публикует для остальных воркеров."""
+        self._deliver(target, target_id, message)
+
+        if not self._redis.is_connected:
+            return
+        payload = json.dumps(
+            {
+                "origin": self._worker_id,
+                "target": target,
+                "id": target_id,
+                "message": message,
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+        try:
+            await self._redis.client.publish(BROADCAST_CHANNEL, payload)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Chat WebSocket broadcast failed, delivered locally only: {e}")
+
+    def _deliver(self, target: str, target_id: str, message: dict) -> None:
+        """Ставит сообщение в очереди локальных соединений."""
+        registry = self._by_conversation if target == TARGET_CONVERSATION else self._by_user
+        for connection in list(registry.get(target_id, ())):
+            connection.send(message)
+
+    async def _listen(self) -> None:
+        """Доставлять сообщения, опубликованные другими воркерами."""
+        while not self._stopping.is_set():
+            pubsub = self._redis.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(BROADCAST_CHANNEL)
+                while not self._stopping.is_set():
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    self._handle_broadcast(message["data"])
+            except (RedisError, RuntimeError) as e:
+                logger.warning(f"Chat WebSocket listener failed: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+
+    def _handle_broadcast(self, data: str) -> None:
+        """Разбирает сообщение канала и доставляет его локально."""
+        try:
+            envelope: Dict[str, Any] = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("Chat WebSocket listener got malformed payload")
+            return
+        if envelope.get("origin") == self._worker_id:
+            return
+        self._deliver(envelope["target"], envelope["id"], envelope["message"])
+
+    @staticmethod
+    def _discard(
+        registry: Dict[str, Set[WebSocketConnection]],
+        key: str,
+        connection: WebSocketConnection,
+    ) -> bool:
+        """Удаляет соединение из реестра (пустые записи удаляются)."""
+        connections = registry.get(key)
+        if not connections or connection not in connections:
+            return False
+        connections.discard(connection)
+        if not connections:
+            del registry[key]
+        return True
+
+
+# Глобальный менеджер соединений
+manager = ConnectionManager()
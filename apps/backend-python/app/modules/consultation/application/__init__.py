@@ -18,6 +18,10 @@ from app.modules.consultation.application.commands import (
     CancelConsultationHandler,
     RateConsultationCommand,
     RateConsultationHandler,
+    RequestEmergencyConsultationCommand,
+    RequestEmergencyConsultationHandler,
+    AcceptEmergencyOfferCommand,
+    AcceptEmergencyOfferHandler,
 )
 
 # Queries
@@ -30,6 +34,13 @@ from app.modules.consultation.application.queries import (
     GetConsultationsByLawyerHandler,
     GetPendingConsultationsQuery,
     GetPendingConsultationsHandler,
+    AvailabilityWindow,
+    IAvailabilityCache,
+    GetAvailableSlotsQuery,
+    GetAvailableSlotsHandler,
+    ILawyerStatsCache,
+    GetLawyerStatsQuery,
+    GetLawyerStatsHandler,
 )
 
 # DTOs
@@ -41,6 +52,12 @@ from app.modules.consultation.application.dtos import (
     ConfirmConsultationRequestDTO,
     CancelConsultationRequestDTO,
     RateConsultationRequestDTO,
+    AvailableSlotDTO,
+    LawyerAvailabilityDTO,
+    LawyerStatsDTO,
+    EmergencyRequestDTO,
+    EmergencyOfferDTO,
+    CreateEmergencyRequestDTO,
 )
 
 __all__ = [
@@ -57,6 +74,10 @@ __all__ = [
     "CancelConsultationHandler",
     "RateConsultationCommand",
     "RateConsultationHandler",
+    "RequestEmergencyConsultationCommand",
+    "RequestEmergencyConsultationHandler",
+    "AcceptEmergencyOfferCommand",
+    "AcceptEmergencyOfferHandler",
     # Queries
     "GetConsultationByIdQuery",
     "GetConsultationByIdHandler",
@@ -66,6 +87,13 @@ __all__ = [
     "GetConsultationsByLawyerHandler",
     "GetPendingConsultationsQuery",
     "GetPendingConsultationsHandler",
+    "AvailabilityWindow",
+    "IAvailabilityCache",
+    "GetAvailableSlotsQuery",
+    "GetAvailableSlotsHandler",
+    "ILawyerStatsCache",
+    "GetLawyerStatsQuery",
+    "GetLawyerStatsHandler",
     # DTOs
     "ConsultationDTO",
     "ConsultationListItemDTO",
@@ -74,4 +102,10 @@ __all__ = [
     "ConfirmConsultationRequestDTO",
     "CancelConsultationRequestDTO",
     "RateConsultationRequestDTO",
+    "AvailableSlotDTO",
+    "LawyerAvailabilityDTO",
+    "LawyerStatsDTO",
+    "EmergencyRequestDTO",
+    "EmergencyOfferDTO",
+    "CreateEmergencyRequestDTO",
 ]
@@ -25,6 +25,14 @@ from app.modules.consultation.application.commands.rate_consultation import (
     RateConsultationCommand,
     RateConsultationHandler,
 )
+from app.modules.consultation.application.commands.request_emergency_consultation import (
+    RequestEmergencyConsultationCommand,
+    RequestEmergencyConsultationHandler,
+)
+from app.modules.consultation.application.commands.accept_emergency_offer import (
+    AcceptEmergencyOfferCommand,
+    AcceptEmergencyOfferHandler,
+)
 
 __all__ = [
     # Book Consultation
@@ -45,4 +53,9 @@ __all__ = [
     # Rate Consultation
     "RateConsultationCommand",
     "RateConsultationHandler",
+    # Emergency Dispatch
+    "RequestEmergencyConsultationCommand",
+    "RequestEmergencyConsultationHandler",
+    "AcceptEmergencyOfferCommand",
+    "AcceptEmergencyOfferHandler",
 ]
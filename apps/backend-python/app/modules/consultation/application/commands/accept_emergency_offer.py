@@ -0,0 +1,128 @@
+"""
+Accept Emergency Offer Command
+
+Команда для принятия юристом предложения экстренной консультации.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+from app.core.application.command import ICommand, ICommandHandler
+from app.core.domain.result import Result
+from app.modules.consultation.domain import (
+    Consultation,
+    ConsultationType,
+    ConsultationTypeEnum,
+    EmergencyRequest,
+    IConsultationRepository,
+    IEmergencyDispatcher,
+    Price,
+)
+
+
+@dataclass(frozen=True)
+class AcceptEmergencyOfferCommand(ICommand):
+    """
+    Команда принятия предложения экстренной консультации.
+
+    Attributes:
+        request_id: ID экстренного запроса
+        lawyer_user_id: ID пользователя юриста
+    """
+
+    request_id: UUID
+    lawyer_user_id: UUID
+
+
+class AcceptEmergencyOfferHandler(
+    ICommandHandler[AcceptEmergencyOfferCommand, Consultation]
+):
+    """
+    Обработчик принятия предложения.
+
+    Первый принявший юрист атомарно захватывает запрос в диспетчере,
+    после чего создается уже подтвержденная консультация.
+    """
+
+    def __init__(
+        self,
+        repository: IConsultationRepository,
+        dispatcher: IEmergencyDispatcher,
+    ):
+        self._repository = repository
+        self._dispatcher = dispatcher
+
+    async def handle(
+        self, command: AcceptEmergencyOfferCommand
+    ) -> Result[Consultation]:
+        """
+        Обрабатывает принятие предложения.
+
+        Args:
+            command: Команда
+
+        Returns:
+            Result с созданной консультацией или ошибкой
+        """
+        claim_result = await self._dispatcher.claim(
+            request_id=command.request_id,
+            lawyer_user_id=command.lawyer_user_id,
+        )
+        if claim_result.is_failure:
+            return Result.fail(claim_result.error)
+
+        assignment = claim_result.value
+        request = assignment.request
+
+        # consultations.lawyer_id - ID пользователя юриста (как при обычном
+        # бронировании): по нему юрист подтверждает и проводит консультацию
+        consultation_result = self._book(
+            command.lawyer_user_id, request, assignment.price_amount
+        )
+        if consultation_result.is_failure:
+            await self._dispatcher.complete_assignment(request.id, None)
+            return Result.fail(consultation_result.error)
+
+        consultation = consultation_result.value
+        try:
+            saved_consultation = await self._repository.save(consultation)
+        except Exception:
+            await self._dispatcher.complete_assignment(request.id, None)
+            raise
+
+        await self._dispatcher.complete_assignment(request.id, saved_consultation.id)
+
+        return Result.ok(saved_consultation)
+
+    @staticmethod
+    def _book(
+        lawyer_user_id: UUID,
+        request: EmergencyRequest,
+        price_amount: Decimal,
+    ) -> Result[Consultation]:
+        """Создать подтвержденную экстренную консультацию."""
+        price_result = Price.create(amount=price_amount)
+        if price_result.is_failure:
+            return Result.fail(price_result.error)
+
+        consultation_type_result = ConsultationType.create(ConsultationTypeEnum.EMERGENCY)
+        if consultation_type_result.is_failure:
+            return Result.fail(consultation_type_result.error)
+
+        consultation_result = Consultation.book(
+            client_id=request.client_id,
+            lawyer_id=lawyer_user_id,
+            consultation_type=consultation_type_result.value,
+            price=price_result.value,
+            description=request.description,
+        )
+        if consultation_result.is_failure:
+            return consultation_result
+
+        # Юрист уже принял запрос - подтверждение не требуется
+        consultation = consultation_result.value
+        confirm_result = consultation.confirm()
+        if confirm_result.is_failure:
+            return Result.fail(confirm_result.error)
+
+        return Result.ok(consultation)
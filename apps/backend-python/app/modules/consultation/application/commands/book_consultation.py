@@ -18,6 +18,7 @@ from app.modules.consultation.domain import (
     Price,
     TimeSlot,
     IConsultationRepository,
+    ScheduleConflictError,
 )
 
 
@@ -94,7 +95,9 @@ class BookConsultationHandler(ICommandHandler[BookConsultationCommand, Consultat
 
             time_slot = time_slot_result.value
 
-            # Проверяем конфликты расписания юриста
+            # Быстрая проверка конфликтов расписания юриста (индексный запрос).
+            # Гонку двух одновременных бронирований отсекает exclusion
+            # constraint в БД - см. обработку ScheduleConflictError ниже.
             conflicts = await self._repository.find_scheduled_in_timeframe(
                 lawyer_id=command.lawyer_id,
                 start_time=time_slot.start_time,
@@ -119,6 +122,9 @@ class BookConsultationHandler(ICommandHandler[BookConsultationCommand, Consultat
             return Result.fail(consultation_result.error)
 
         # Сохраняем в репозитории
-        saved_consultation = await self._repository.save(consultation_result.value)
+        try:
+            saved_consultation = await self._repository.save(consultation_result.value)
+        except ScheduleConflictError as e:
+            return Result.fail(str(e))
 
         return Result.ok(saved_consultation)
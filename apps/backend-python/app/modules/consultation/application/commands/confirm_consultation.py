@@ -8,7 +8,11 @@ from uuid import UUID
 
 from app.core.application.command import ICommand, ICommandHandler
 from app.core.domain.result import Result
-from app.modules.consultation.domain import Consultation, IConsultationRepository
+from app.modules.consultation.domain import (
+    Consultation,
+    ConsultationTransition,
+    IConsultationRepository,
+)
 
 
 @dataclass(frozen=True)
@@ -47,21 +51,24 @@ class ConfirmConsultationHandler(
         Returns:
             Result с обновленной консультацией или ошибкой
         """
-        # Находим консультацию
+        # Подтверждаем одним UPDATE (проверка статуса и прав - в условии)
+        saved_consultation = await self._repository.transition(
+            command.consultation_id,
+            ConsultationTransition.confirm(lawyer_id=command.lawyer_id),
+        )
+        if saved_consultation:
+            return Result.ok(saved_consultation)
+
+        # Переход не выполнен - объясняем причину по текущему состоянию
         consultation = await self._repository.find_by_id(command.consultation_id)
         if not consultation:
             return Result.fail(f"Consultation {command.consultation_id} not found")
 
-        # Проверяем права доступа
         if consultation.lawyer_id != command.lawyer_id:
             return Result.fail("Only the assigned lawyer can confirm this consultation")
 
-        # Подтверждаем консультацию
         confirm_result = consultation.confirm()
         if confirm_result.is_failure:
             return Result.fail(confirm_result.error)
 
-        # Сохраняем изменения
-        saved_consultation = await self._repository.save(consultation)
-
-        return Result.ok(saved_consultation)
+        return Result.fail("Consultation was modified concurrently, please retry")
@@ -9,7 +9,11 @@ from uuid import UUID
 
 from app.core.application.command import ICommand, ICommandHandler
 from app.core.domain.result import Result
-from app.modules.consultation.domain import Consultation, IConsultationRepository
+from app.modules.consultation.domain import (
+    Consultation,
+    IConsultationRepository,
+    ILawyerRatingAggregator,
+)
 
 
 @dataclass(frozen=True)
@@ -33,10 +37,18 @@ class RateConsultationCommand(ICommand):
 class RateConsultationHandler(ICommandHandler[RateConsultationCommand, Consultation]):
     """
     Обработчик команды оценки консультации.
+
+    Оценка сохраняется условным UPDATE (только если консультация еще не
+    оценена) и в той же транзакции учитывается в агрегате рейтинга юриста.
     """
 
-    def __init__(self, repository: IConsultationRepository):
+    def __init__(
+        self,
+        repository: IConsultationRepository,
+        rating_aggregator: ILawyerRatingAggregator,
+    ):
         self._repository = repository
+        self._rating_aggregator = rating_aggregator
 
     async def handle(self, command: RateConsultationCommand) -> Result[Consultation]:
         """
@@ -62,7 +74,11 @@ class RateConsultationHandler(ICommandHandler[RateConsultationCommand, Consultat
         if rate_result.is_failure:
             return Result.fail(rate_result.error)
 
-        # Сохраняем изменения
-        saved_consultation = await self._repository.save(consultation)
+        # Сохраняем оценку (повторная конкурентная оценка не пройдет)
+        if not await self._repository.save_rating(consultation):
+            return Result.fail("Consultation already rated")
+
+        # Обновляем рейтинг юриста
+        await self._rating_aggregator.add(consultation.lawyer_id, command.rating)
 
-        return Result.ok(saved_consultation)
+        return Result.ok(consultation)
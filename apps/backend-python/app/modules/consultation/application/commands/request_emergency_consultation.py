@@ -0,0 +1,83 @@
+"""
+Request Emergency Consultation Command
+
+Команда для экстренного запроса консультации (без выбора юриста).
+"""
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.core.application.command import ICommand, ICommandHandler
+from app.core.domain.result import Result
+from app.modules.consultation.domain import (
+    Consultation,
+    EmergencyRequest,
+    IEmergencyDispatcher,
+)
+
+
+@dataclass(frozen=True)
+class RequestEmergencyConsultationCommand(ICommand):
+    """
+    Команда экстренного запроса консультации.
+
+    Attributes:
+        client_id: ID клиента
+        specialization: Специализация (SpecializationType name)
+        city: Город клиента
+        description: Описание проблемы
+    """
+
+    client_id: UUID
+    specialization: str
+    city: str
+    description: str
+
+
+class RequestEmergencyConsultationHandler(
+    ICommandHandler[RequestEmergencyConsultationCommand, EmergencyRequest]
+):
+    """
+    Обработчик экстренного запроса.
+
+    Создает запрос в диспетчере; поиск юриста идет в фоне, клиент
+    получает результат через статус запроса.
+    """
+
+    def __init__(self, dispatcher: IEmergencyDispatcher):
+        self._dispatcher = dispatcher
+
+    async def handle(
+        self, command: RequestEmergencyConsultationCommand
+    ) -> Result[EmergencyRequest]:
+        """
+        Обрабатывает экстренный запрос.
+
+        Args:
+            command: Команда
+
+        Returns:
+            Result с созданным запросом или ошибкой
+        """
+        # Описание валидируем сразу: консультация создается позже,
+        # когда юрист примет предложение
+        description = command.description.strip()
+        if len(description) < Consultation.MIN_DESCRIPTION_LENGTH:
+            return Result.fail(
+                f"Description too short: {len(description)} characters. "
+                f"Minimum: {Consultation.MIN_DESCRIPTION_LENGTH} characters"
+            )
+        if len(description) > Consultation.MAX_DESCRIPTION_LENGTH:
+            return Result.fail(
+                f"Description too long: {len(description)} characters. "
+                f"Maximum: {Consultation.MAX_DESCRIPTION_LENGTH} characters"
+            )
+
+        if not command.city.strip():
+            return Result.fail("City is required for emergency consultations")
+
+        return await self._dispatcher.submit(
+            client_id=command.client_id,
+            specialization=command.specialization,
+            city=command.city,
+            description=description,
+        )
@@ -8,7 +8,11 @@ from uuid import UUID
 
 from app.core.application.command import ICommand, ICommandHandler
 from app.core.domain.result import Result
-from app.modules.consultation.domain import Consultation, IConsultationRepository
+from app.modules.consultation.domain import (
+    Consultation,
+    ConsultationTransition,
+    IConsultationRepository,
+)
 
 
 @dataclass(frozen=True)
@@ -43,28 +47,31 @@ class StartConsultationHandler(ICommandHandler[StartConsultationCommand, Consult
         Returns:
             Result с обновленной консультацией или ошибкой
         """
-        # Находим консультацию
+        # Начинаем одним UPDATE: статус, права, окно начала и отсутствие
+        # другой активной консультации проверяются в условии
+        saved_consultation = await self._repository.transition(
+            command.consultation_id,
+            ConsultationTransition.start(lawyer_id=command.lawyer_id),
+        )
+        if saved_consultation:
+            return Result.ok(saved_consultation)
+
+        # Переход не выполнен - объясняем причину по текущему состоянию
         consultation = await self._repository.find_by_id(command.consultation_id)
         if not consultation:
             return Result.fail(f"Consultation {command.consultation_id} not found")
 
-        # Проверяем права доступа
         if consultation.lawyer_id != command.lawyer_id:
             return Result.fail("Only the assigned lawyer can start this consultation")
 
-        # Проверяем, что у юриста нет активных консультаций
         active_consultation = await self._repository.find_active_by_lawyer(
             command.lawyer_id
         )
         if active_consultation and active_consultation.id != consultation.id:
             return Result.fail("Lawyer already has an active consultation")
 
-        # Начинаем консультацию
         start_result = consultation.start()
         if start_result.is_failure:
             return Result.fail(start_result.error)
 
-        # Сохраняем изменения
-        saved_consultation = await self._repository.save(consultation)
-
-        return Result.ok(saved_consultation)
+        return Result.fail("Consultation was modified concurrently, please retry")
@@ -10,6 +10,16 @@ from app.modules.consultation.application.dtos.consultation_dto import (
     CancelConsultationRequestDTO,
     RateConsultationRequestDTO,
 )
+from app.modules.consultation.application.dtos.availability_dto import (
+    AvailableSlotDTO,
+    LawyerAvailabilityDTO,
+)
+from app.modules.consultation.application.dtos.lawyer_stats_dto import LawyerStatsDTO
+from app.modules.consultation.application.dtos.emergency_dto import (
+    CreateEmergencyRequestDTO,
+    EmergencyOfferDTO,
+    EmergencyRequestDTO,
+)
 
 __all__ = [
     # Main DTOs
@@ -21,4 +31,13 @@ __all__ = [
     "ConfirmConsultationRequestDTO",
     "CancelConsultationRequestDTO",
     "RateConsultationRequestDTO",
+    # Availability DTOs
+    "AvailableSlotDTO",
+    "LawyerAvailabilityDTO",
+    # Stats DTOs
+    "LawyerStatsDTO",
+    # Emergency DTOs
+    "EmergencyRequestDTO",
+    "EmergencyOfferDTO",
+    "CreateEmergencyRequestDTO",
 ]
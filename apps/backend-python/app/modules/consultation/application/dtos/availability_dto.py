@@ -0,0 +1,30 @@
+"""
+Availability DTOs
+
+DTOs свободных слотов юристов.
+"""
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class AvailableSlotDTO(BaseModel):
+    """
+    Свободный слот для бронирования.
+    """
+
+    start: datetime = Field(..., description="Начало слота (UTC)")
+    end: datetime = Field(..., description="Окончание слота (UTC)")
+
+
+class LawyerAvailabilityDTO(BaseModel):
+    """
+    Свободные слоты юриста в запрошенном диапазоне.
+    """
+
+    lawyer_id: UUID
+    timezone: str = Field(..., description="Часовой пояс юриста (IANA)")
+    duration_minutes: int = Field(..., description="Длительность слота в минутах")
+    slots: List[AvailableSlotDTO] = Field(default_factory=list)
@@ -0,0 +1,113 @@
+"""
+Emergency DTOs
+
+DTOs экстренных консультаций (запрос без выбора юриста).
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.modules.consultation.domain import (
+    EmergencyOffer,
+    EmergencyRequest,
+    EmergencyRequestStatus,
+)
+from app.modules.lawyer.domain import SpecializationType
+
+
+# ========== Response DTOs ==========
+
+
+class EmergencyRequestDTO(BaseModel):
+    """
+    DTO экстренного запроса (клиент опрашивает статус до назначения).
+    """
+
+    id: UUID
+    status: EmergencyRequestStatus
+    specialization: str = Field(..., description="Специализация (SpecializationType name)")
+    city: str
+    created_at: datetime
+    lawyer_id: Optional[UUID] = Field(None, description="ID профиля юриста")
+    consultation_id: Optional[UUID] = None
+    assigned_at: Optional[datetime] = None
+    time_to_assignment_seconds: Optional[float] = Field(
+        None, description="Время от запроса до принятия юристом"
+    )
+
+    @classmethod
+    def from_request(cls, request: EmergencyRequest) -> "EmergencyRequestDTO":
+        """
+        Создает DTO из экстренного запроса.
+
+        Args:
+            request: Экстренный запрос
+
+        Returns:
+            EmergencyRequestDTO
+        """
+        return cls(
+            id=request.id,
+            status=request.status,
+            specialization=request.specialization,
+            city=request.city,
+            created_at=request.created_at,
+            lawyer_id=request.lawyer_id,
+            consultation_id=request.consultation_id,
+            assigned_at=request.assigned_at,
+            time_to_assignment_seconds=(
+                request.time_to_assignment.total_seconds()
+                if request.time_to_assignment is not None
+                else None
+            ),
+        )
+
+
+class EmergencyOfferDTO(BaseModel):
+    """
+    DTO предложения экстренного запроса юристу.
+    """
+
+    request_id: UUID
+    specialization: str
+    city: str
+    description: str
+    created_at: datetime
+    expires_in_ms: int = Field(..., description="Сколько осталось до истечения предложения")
+
+    @classmethod
+    def from_offer(cls, offer: EmergencyOffer) -> "EmergencyOfferDTO":
+        """
+        Создает DTO из предложения.
+
+        Args:
+            offer: Предложение
+
+        Returns:
+            EmergencyOfferDTO
+        """
+        return cls(
+            request_id=offer.request.id,
+            specialization=offer.request.specialization,
+            city=offer.request.city,
+            description=offer.request.description,
+            created_at=offer.request.created_at,
+            expires_in_ms=offer.expires_in_ms,
+        )
+
+
+# ========== Request DTOs ==========
+
+
+class CreateEmergencyRequestDTO(BaseModel):
+    """
+    DTO для экстренного запроса консультации.
+    """
+
+    specialization: SpecializationType = Field(..., description="Специализация")
+    city: str = Field(..., min_length=2, max_length=100, description="Город клиента")
+    description: str = Field(
+        ..., min_length=10, max_length=2000, description="Описание проблемы"
+    )
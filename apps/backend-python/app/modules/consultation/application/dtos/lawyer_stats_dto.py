@@ -0,0 +1,51 @@
+"""
+Lawyer Stats DTOs
+
+DTO статистики консультаций юриста (дашборд).
+"""
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from app.modules.consultation.domain import ConsultationStatusEnum, LawyerStats
+
+
+class LawyerStatsDTO(BaseModel):
+    """
+    Статистика консультаций юриста.
+    """
+
+    total: int = Field(..., description="Всего консультаций")
+    pending: int = Field(..., description="Ожидают подтверждения")
+    confirmed: int = Field(..., description="Подтверждены")
+    active: int = Field(..., description="Идут сейчас")
+    completed: int = Field(..., description="Завершены")
+    cancelled: int = Field(..., description="Отменены")
+    failed: int = Field(..., description="Не состоялись")
+    expired: int = Field(..., description="Истекли")
+    earnings_total: Decimal = Field(..., description="Заработок за все время (RUB)")
+    earnings_month: Decimal = Field(..., description="Заработок за текущий месяц (RUB)")
+
+    @classmethod
+    def from_stats(cls, stats: LawyerStats) -> "LawyerStatsDTO":
+        """
+        Создает DTO из статистики.
+
+        Args:
+            stats: Статистика юриста
+
+        Returns:
+            LawyerStatsDTO
+        """
+        return cls(
+            total=stats.total,
+            pending=stats.count(ConsultationStatusEnum.PENDING),
+            confirmed=stats.count(ConsultationStatusEnum.CONFIRMED),
+            active=stats.count(ConsultationStatusEnum.ACTIVE),
+            completed=stats.count(ConsultationStatusEnum.COMPLETED),
+            cancelled=stats.count(ConsultationStatusEnum.CANCELLED),
+            failed=stats.count(ConsultationStatusEnum.FAILED),
+            expired=stats.count(ConsultationStatusEnum.EXPIRED),
+            earnings_total=stats.earnings_total,
+            earnings_month=stats.earnings_month,
+        )
@@ -17,6 +17,17 @@ from app.modules.consultation.application.queries.get_pending_consultations impo
     GetPendingConsultationsQuery,
     GetPendingConsultationsHandler,
 )
+from app.modules.consultation.application.queries.get_available_slots import (
+    AvailabilityWindow,
+    IAvailabilityCache,
+    GetAvailableSlotsQuery,
+    GetAvailableSlotsHandler,
+)
+from app.modules.consultation.application.queries.get_lawyer_stats import (
+    ILawyerStatsCache,
+    GetLawyerStatsQuery,
+    GetLawyerStatsHandler,
+)
 
 __all__ = [
     # Get By ID
@@ -31,4 +42,13 @@ __all__ = [
     # Get Pending
     "GetPendingConsultationsQuery",
     "GetPendingConsultationsHandler",
+    # Get Available Slots
+    "AvailabilityWindow",
+    "IAvailabilityCache",
+    "GetAvailableSlotsQuery",
+    "GetAvailableSlotsHandler",
+    # Get Lawyer Stats
+    "ILawyerStatsCache",
+    "GetLawyerStatsQuery",
+    "GetLawyerStatsHandler",
 ]
@@ -0,0 +1,238 @@
+"""
+Get Available Slots Query
+
+Запрос свободных слотов одного или нескольких юристов.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.core.application.query import IQuery, IQueryHandler
+from app.core.domain.result import Result
+from app.modules.consultation.application.dtos import (
+    AvailableSlotDTO,
+    LawyerAvailabilityDTO,
+)
+from app.modules.consultation.domain import (
+    AvailabilityService,
+    IConsultationRepository,
+    ILawyerScheduleReader,
+)
+
+
+@dataclass(frozen=True)
+class AvailabilityWindow:
+    """
+    Окно расчета слотов, выровненное по суткам UTC (ключ кеша).
+
+    Attributes:
+        start: Начало первого дня
+        end: Конец последнего дня
+        duration_minutes: Длительность слота
+    """
+
+    start: datetime
+    end: datetime
+    duration_minutes: int
+
+
+class IAvailabilityCache(ABC):
+    """
+    Интерфейс кеша свободных слотов (по юристу и окну).
+    """
+
+    @abstractmethod
+    async def get_many(
+        self,
+        lawyer_ids: Sequence[UUID],
+        window: AvailabilityWindow,
+    ) -> Tuple[Dict[UUID, LawyerAvailabilityDTO], Dict[UUID, str]]:
+        """
+        Получает закешированные слоты.
+
+        Args:
+            lawyer_ids: ID юристов
+            window: Окно расчета
+
+        Returns:
+            Кортеж (найденные в кеше слоты, версии юристов для set_many)
+        """
+        pass
+
+    @abstractmethod
+    async def set_many(
+        self,
+        window: AvailabilityWindow,
+        items: Sequence[LawyerAvailabilityDTO],
+        versions: Mapping[UUID, str],
+    ) -> None:
+        """
+        Сохраняет слоты в кеш.
+
+        Args:
+            window: Окно расчета
+            items: Слоты юристов
+            versions: Версии, полученные в get_many до расчета
+        """
+        pass
+
+
+@dataclass(frozen=True)
+class GetAvailableSlotsQuery(IQuery):
+    """
+    Запрос свободных слотов юристов.
+
+    Attributes:
+        lawyer_ids: ID юристов
+        range_start: Начало диапазона
+        range_end: Конец диапазона
+        duration_minutes: Длительность консультации
+    """
+
+    lawyer_ids: Tuple[UUID, ...]
+    range_start: datetime
+    range_end: datetime
+    duration_minutes: int = 60
+
+
+class GetAvailableSlotsHandler(
+    IQueryHandler[GetAvailableSlotsQuery, List[LawyerAvailabilityDTO]]
+):
+    """
+    Обработчик запроса свободных слотов.
+
+    Слоты считаются для окна, выровненного по суткам UTC, и кешируются
+    по юристу. Промахи кеша считаются пакетно: одно обращение за
+    расписаниями и один запрос занятых интервалов для всех юристов.
+    Ответ фильтруется по запрошенному диапазону и текущему времени.
+    """
+
+    def __init__(
+        self,
+        repository: IConsultationRepository,
+        schedule_reader: ILawyerScheduleReader,
+        service: AvailabilityService,
+        cache: Optional[IAvailabilityCache] = None,
+        max_range_days: int = 31,
+        max_lawyers: int = 50,
+    ):
+        self._repository = repository
+        self._schedule_reader = schedule_reader
+        self._service = service
+        self._cache = cache
+        self._max_range = timedelta(days=max_range_days)
+        self._max_lawyers = max_lawyers
+
+    async def handle(
+        self, query: GetAvailableSlotsQuery
+    ) -> Result[List[LawyerAvailabilityDTO]]:
+        """
+        Обрабатывает запрос свободных слотов.
+
+        Args:
+            query: Запрос
+
+        Returns:
+            Result со слотами юристов (в порядке запроса; юристы, не
+            принимающие консультации, в ответ не попадают)
+        """
+        lawyer_ids = list(dict.fromkeys(query.lawyer_ids))
+        if not lawyer_ids:
+            return Result.fail("At least one lawyer_id is required")
+        if len(lawyer_ids) > self._max_lawyers:
+            return Result.fail(f"Too many lawyers requested (maximum {self._max_lawyers})")
+
+        if query.duration_minutes < 15 or query.duration_minutes > 480:
+            return Result.fail("Duration must be between 15 and 480 minutes")
+
+        range_start = _as_utc(query.range_start)
+        range_end = _as_utc(query.range_end)
+        if range_start >= range_end:
+            return Result.fail("Range start must be before range end")
+        if range_end - range_start > self._max_range:
+            return Result.fail(
+                f"Range cannot exceed {self._max_range.days} days"
+            )
+
+        window = AvailabilityWindow(
+            start=datetime.combine(range_start.date(), time.min, timezone.utc),
+            end=datetime.combine(
+                (range_end - timedelta(microseconds=1)).date() + timedelta(days=1),
+                time.min,
+                timezone.utc,
+            ),
+            duration_minutes=query.duration_minutes,
+        )
+
+        cached: Dict[UUID, LawyerAvailabilityDTO] = {}
+        versions: Dict[UUID, str] = {}
+        if self._cache is not None:
+            cached, versions = await self._cache.get_many(lawyer_ids, window)
+
+        missing = [lawyer_id for lawyer_id in lawyer_ids if lawyer_id not in cached]
+        if missing:
+            computed = await self._compute(missing, window)
+            if self._cache is not None and computed:
+                await self._cache.set_many(window, computed, versions)
+            cached.update({item.lawyer_id: item for item in computed})
+
+        not_before = max(range_start, self._service.earliest_start())
+        return Result.ok(
+            [
+                cached[lawyer_id].model_copy(
+                    update={
+                        "slots": [
+                            slot
+                            for slot in cached[lawyer_id].slots
+                            if slot.start >= not_before and slot.end <= range_end
+                        ]
+                    }
+                )
+                for lawyer_id in lawyer_ids
+                if lawyer_id in cached
+            ]
+        )
+
+    async def _compute(
+        self,
+        lawyer_ids: List[UUID],
+        window: AvailabilityWindow,
+    ) -> List[LawyerAvailabilityDTO]:
+        """Пакетный расчет слотов для юристов, отсутствующих в кеше."""
+        working_hours = await self._schedule_reader.get_working_hours(lawyer_ids)
+        if not working_hours:
+            return []
+
+        busy = await self._repository.find_busy_intervals(
+            lawyer_ids=list(working_hours),
+            start_time=window.start,
+            end_time=window.end,
+        )
+
+        result = []
+        for lawyer_id, hours in working_hours.items():
+            slots = self._service.compute_slots(
+                working_hours=hours,
+                busy=busy.get(lawyer_id, []),
+                range_start=window.start,
+                range_end=window.end,
+                duration_minutes=window.duration_minutes,
+            )
+            result.append(
+                LawyerAvailabilityDTO(
+                    lawyer_id=lawyer_id,
+                    timezone=hours.timezone,
+                    duration_minutes=window.duration_minutes,
+                    slots=[AvailableSlotDTO(start=start, end=end) for start, end in slots],
+                )
+            )
+        return result
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Naive datetime считается UTC (как в остальном модуле)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,99 @@
+"""
+Get Lawyer Stats Query
+
+Запрос статистики консультаций юриста для дашборда.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from uuid import UUID
+
+from app.core.application.query import IQuery, IQueryHandler
+from app.core.domain.result import Result
+from app.modules.consultation.application.dtos import LawyerStatsDTO
+from app.modules.consultation.domain import IConsultationRepository
+
+
+class ILawyerStatsCache(ABC):
+    """
+    Интерфейс кеша статистики юриста.
+    """
+
+    @abstractmethod
+    async def get(self, lawyer_id: UUID) -> Tuple[Optional[LawyerStatsDTO], Optional[str]]:
+        """
+        Получает закешированную статистику.
+
+        Args:
+            lawyer_id: ID юриста
+
+        Returns:
+            Кортеж (статистика или None, версия юриста для set)
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, lawyer_id: UUID, stats: LawyerStatsDTO, version: Optional[str]) -> None:
+        """
+        Сохраняет статистику в кеш.
+
+        Args:
+            lawyer_id: ID юриста
+            stats: Статистика
+            version: Версия, полученная в get до расчета
+        """
+        pass
+
+
+@dataclass(frozen=True)
+class GetLawyerStatsQuery(IQuery):
+    """
+    Запрос статистики юриста.
+
+    Attributes:
+        lawyer_id: ID юриста
+    """
+
+    lawyer_id: UUID
+
+
+class GetLawyerStatsHandler(IQueryHandler[GetLawyerStatsQuery, LawyerStatsDTO]):
+    """
+    Обработчик запроса статистики юриста.
+
+    Статистика считается одним агрегирующим запросом и кешируется по
+    юристу до следующего события консультации или платежа.
+    """
+
+    def __init__(
+        self,
+        repository: IConsultationRepository,
+        cache: Optional[ILawyerStatsCache] = None,
+    ):
+        self._repository = repository
+        self._cache = cache
+
+    async def handle(self, query: GetLawyerStatsQuery) -> Result[LawyerStatsDTO]:
+        """
+        Обрабатывает запрос статистики юриста.
+
+        Args:
+            query: Запрос
+
+        Returns:
+            Result со статистикой
+        """
+        version = None
+        if self._cache is not None:
+            cached, version = await self._cache.get(query.lawyer_id)
+            if cached is not None:
+                return Result.ok(cached)
+
+        stats = LawyerStatsDTO.from_stats(
+            await self._repository.get_lawyer_stats(query.lawyer_id)
+        )
+
+        if self._cache is not None:
+            await self._cache.set(query.lawyer_id, stats, version)
+
+        return Result.ok(stats)
@@ -10,6 +10,8 @@ from app.modules.consultation.domain.value_objects import (
     ConsultationStatusEnum,
     ConsultationType,
     ConsultationTypeEnum,
+    ConsultationTransition,
+    LawyerStats,
     TimeSlot,
     Price,
 )
@@ -19,8 +21,23 @@ from app.modules.consultation.domain.events import (
     ConsultationStartedEvent,
     ConsultationCompletedEvent,
     ConsultationCancelledEvent,
+    ConsultationRatedEvent,
+)
+from app.modules.consultation.domain.services import (
+    AvailabilityService,
+    WorkingHours,
+    EmergencyAssignment,
+    EmergencyOffer,
+    EmergencyRequest,
+    EmergencyRequestStatus,
+    IEmergencyDispatcher,
+)
+from app.modules.consultation.domain.repositories import (
+    IConsultationRepository,
+    ILawyerScheduleReader,
+    ILawyerRatingAggregator,
+    ScheduleConflictError,
 )
-from app.modules.consultation.domain.repositories import IConsultationRepository
 
 __all__ = [
     # Entities
@@ -30,6 +47,8 @@ __all__ = [
     "ConsultationStatusEnum",
     "ConsultationType",
     "ConsultationTypeEnum",
+    "ConsultationTransition",
+    "LawyerStats",
     "TimeSlot",
     "Price",
     # Events
@@ -38,6 +57,18 @@ __all__ = [
     "ConsultationStartedEvent",
     "ConsultationCompletedEvent",
     "ConsultationCancelledEvent",
+    "ConsultationRatedEvent",
+    # Services
+    "AvailabilityService",
+    "WorkingHours",
+    "EmergencyAssignment",
+    "EmergencyOffer",
+    "EmergencyRequest",
+    "EmergencyRequestStatus",
+    "IEmergencyDispatcher",
     # Repositories
     "IConsultationRepository",
+    "ILawyerScheduleReader",
+    "ILawyerRatingAggregator",
+    "ScheduleConflictError",
 ]
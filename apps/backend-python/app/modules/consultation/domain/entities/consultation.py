@@ -11,10 +11,14 @@ from app.core.domain.aggregate_root import AggregateRoot
 from app.core.domain.result import Result
 from app.modules.consultation.domain.value_objects.consultation_status import (
     ConsultationStatus,
+    ConsultationStatusEnum,
 )
 from app.modules.consultation.domain.value_objects.consultation_type import (
     ConsultationType,
 )
+from app.modules.consultation.domain.value_objects.consultation_transition import (
+    ConsultationTransition,
+)
 from app.modules.consultation.domain.value_objects.time_slot import TimeSlot
 from app.modules.consultation.domain.value_objects.price import Price
 from app.modules.consultation.domain.events.consultation_booked import (
@@ -32,6 +36,9 @@ from app.modules.consultation.domain.events.consultation_completed import (
 from app.modules.consultation.domain.events.consultation_cancelled import (
     ConsultationCancelledEvent,
 )
+from app.modules.consultation.domain.events.consultation_rated import (
+    ConsultationRatedEvent,
+)
 
 
 class Consultation(AggregateRoot):
@@ -67,6 +74,7 @@ class Consultation(AggregateRoot):
         rating: Optional[int] = None,
         review: Optional[str] = None,
         cancellation_reason: Optional[str] = None,
+        cancelled_by: Optional[str] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         confirmed_at: Optional[datetime] = None,
@@ -89,6 +97,7 @@ class Consultation(AggregateRoot):
             rating: Оценка (1-5) после завершения
             review: Отзыв клиента
             cancellation_reason: Причина отмены
+            cancelled_by: Кто отменил
             created_at: Дата создания
             updated_at: Дата обновления
             confirmed_at: Дата подтверждения
@@ -107,6 +116,7 @@ class Consultation(AggregateRoot):
         self._rating = rating
         self._review = review
         self._cancellation_reason = cancellation_reason
+        self._cancelled_by = cancelled_by
         self._created_at = created_at or datetime.utcnow()
         self._updated_at = updated_at or datetime.utcnow()
         self._confirmed_at = confirmed_at
@@ -205,13 +215,7 @@ class Consultation(AggregateRoot):
         self._updated_at = datetime.utcnow()
 
         # Добавляем domain event
-        self.add_domain_event(
-            ConsultationConfirmedEvent(
-                consultation_id=str(self.id),
-                lawyer_id=str(self._lawyer_id),
-                confirmed_at=self._confirmed_at.isoformat(),
-            )
-        )
+        self.add_domain_event(self._confirmed_event())
 
         return Result.ok(None)
 
@@ -229,7 +233,9 @@ class Consultation(AggregateRoot):
             )
 
         # Для scheduled консультаций проверяем время
-        if self._time_slot and not self._time_slot.is_starting_soon(minutes=15):
+        if self._time_slot and not self._time_slot.is_starting_soon(
+            minutes=ConsultationTransition.START_WINDOW_MINUTES
+        ):
             time_until = self._time_slot.get_time_until_start()
             return Result.fail(
                 f"Cannot start consultation yet. "
@@ -243,14 +249,7 @@ class Consultation(AggregateRoot):
         self._updated_at = datetime.utcnow()
 
         # Добавляем domain event
-        self.add_domain_event(
-            ConsultationStartedEvent(
-                consultation_id=str(self.id),
-                client_id=str(self._client_id),
-                lawyer_id=str(self._lawyer_id),
-                started_at=self._started_at.isoformat(),
-            )
-        )
+        self.add_domain_event(self._started_event())
 
         return Result.ok(None)
 
@@ -273,15 +272,7 @@ class Consultation(AggregateRoot):
         self._updated_at = datetime.utcnow()
 
         # Добавляем domain event
-        self.add_domain_event(
-            ConsultationCompletedEvent(
-                consultation_id=str(self.id),
-                client_id=str(self._client_id),
-                lawyer_id=str(self._lawyer_id),
-                completed_at=self._completed_at.isoformat(),
-                duration_minutes=self._get_duration_minutes(),
-            )
-        )
+        self.add_domain_event(self._completed_event())
 
         return Result.ok(None)
 
@@ -309,6 +300,7 @@ class Consultation(AggregateRoot):
         # Изменяем статус
         self._status = ConsultationStatus.cancelled()
         self._cancellation_reason = reason
+        self._cancelled_by = cancelled_by
         self._cancelled_at = datetime.utcnow()
         self._updated_at = datetime.utcnow()
 
@@ -358,8 +350,61 @@ class Consultation(AggregateRoot):
         self._review = review
         self._updated_at = datetime.utcnow()
 
+        # Добавляем событие
+        self.add_domain_event(
+            ConsultationRatedEvent(
+                consultation_id=str(self.id),
+                client_id=str(self._client_id),
+                lawyer_id=str(self._lawyer_id),
+                rating=rating,
+            )
+        )
+
         return Result.ok(None)
 
+    def record_transition(self, transition: ConsultationTransition) -> None:
+        """
+        Добавляет domain event перехода, уже выполненного репозиторием.
+
+        Используется после compare-and-set обновления: guard проверен в
+        UPDATE, сущность восстановлена из возвращенной строки.
+
+        Args:
+            transition: Выполненный переход
+        """
+        if transition.target == ConsultationStatusEnum.CONFIRMED:
+            # Время подтверждения не хранится в БД
+            self._confirmed_at = self._confirmed_at or self._updated_at
+            self.add_domain_event(self._confirmed_event())
+        elif transition.target == ConsultationStatusEnum.ACTIVE:
+            self.add_domain_event(self._started_event())
+        elif transition.target == ConsultationStatusEnum.COMPLETED:
+            self.add_domain_event(self._completed_event())
+
+    def _confirmed_event(self) -> ConsultationConfirmedEvent:
+        return ConsultationConfirmedEvent(
+            consultation_id=str(self.id),
+            lawyer_id=str(self._lawyer_id),
+            confirmed_at=self._confirmed_at.isoformat(),
+        )
+
+    def _started_event(self) -> ConsultationStartedEvent:
+        return ConsultationStartedEvent(
+            consultation_id=str(self.id),
+            client_id=str(self._client_id),
+            lawyer_id=str(self._lawyer_id),
+            started_at=self._started_at.isoformat(),
+        )
+
+    def _completed_event(self) -> ConsultationCompletedEvent:
+        return ConsultationCompletedEvent(
+            consultation_id=str(self.id),
+            client_id=str(self._client_id),
+            lawyer_id=str(self._lawyer_id),
+            completed_at=self._completed_at.isoformat(),
+            duration_minutes=self._get_duration_minutes(),
+        )
+
     def _get_duration_minutes(self) -> Optional[int]:
         """Вычисляет длительность консультации в минутах."""
         if self._started_at and self._completed_at:
@@ -431,3 +476,16 @@ class Consultation(AggregateRoot):
     @property
     def cancelled_at(self) -> Optional[datetime]:
         return self._cancelled_at
+
+    @property
+    def cancelled_by(self) -> Optional[str]:
+        return self._cancelled_by
+
+    # Имена колонок БД (actual_start/actual_end)
+    @property
+    def actual_start(self) -> Optional[datetime]:
+        return self._started_at
+
+    @property
+    def actual_end(self) -> Optional[datetime]:
+        return self._completed_at
@@ -16,6 +16,9 @@ from app.modules.consultation.domain.events.consultation_completed import (
 from app.modules.consultation.domain.events.consultation_cancelled import (
     ConsultationCancelledEvent,
 )
+from app.modules.consultation.domain.events.consultation_rated import (
+    ConsultationRatedEvent,
+)
 
 __all__ = [
     "ConsultationBookedEvent",
@@ -23,4 +26,5 @@ __all__ = [
     "ConsultationStartedEvent",
     "ConsultationCompletedEvent",
     "ConsultationCancelledEvent",
+    "ConsultationRatedEvent",
 ]
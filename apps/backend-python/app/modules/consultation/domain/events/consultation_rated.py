@@ -0,0 +1,26 @@
+"""
+Consultation Rated Event
+
+Событие: клиент оценил консультацию.
+"""
+from dataclasses import dataclass
+
+from app.core.domain.domain_event import DomainEvent
+
+
+@dataclass(frozen=True)
+class ConsultationRatedEvent(DomainEvent):
+    """
+    Событие оценки консультации.
+
+    Attributes:
+        consultation_id: ID консультации
+        client_id: ID клиента
+        lawyer_id: ID юриста
+        rating: Оценка от 1 до 5
+    """
+
+    consultation_id: str
+    client_id: str
+    lawyer_id: str
+    rating: int
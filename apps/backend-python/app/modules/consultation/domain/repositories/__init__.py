@@ -3,8 +3,18 @@ Repositories для Consultation Domain
 """
 from app.modules.consultation.domain.repositories.consultation_repository import (
     IConsultationRepository,
+    ScheduleConflictError,
+)
+from app.modules.consultation.domain.repositories.lawyer_schedule_reader import (
+    ILawyerScheduleReader,
+)
+from app.modules.consultation.domain.repositories.lawyer_rating_aggregator import (
+    ILawyerRatingAggregator,
 )
 
 __all__ = [
     "IConsultationRepository",
+    "ScheduleConflictError",
+    "ILawyerScheduleReader",
+    "ILawyerRatingAggregator",
 ]
@@ -4,7 +4,7 @@ Consultation Repository Interface
 Интерфейс репозитория для консультаций.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -12,6 +12,23 @@ from app.modules.consultation.domain.entities.consultation import Consultation
 from app.modules.consultation.domain.value_objects.consultation_status import (
     ConsultationStatusEnum,
 )
+from app.modules.consultation.domain.value_objects.consultation_transition import (
+    ConsultationTransition,
+)
+from app.modules.consultation.domain.value_objects.lawyer_stats import LawyerStats
+
+
+class ScheduleConflictError(Exception):
+    """
+    Временной слот юриста уже занят другой консультацией.
+
+    Выбрасывается репозиторием при сохранении, если БД отклонила запись
+    по exclusion constraint (конкурентное бронирование того же слота).
+    """
+
+    def __init__(self, lawyer_id: UUID) -> None:
+        self.lawyer_id = lawyer_id
+        super().__init__("Lawyer already has a consultation scheduled at this time")
 
 
 class IConsultationRepository(ABC):
@@ -31,6 +48,48 @@ class IConsultationRepository(ABC):
 
         Returns:
             Сохраненная консультация
+
+        Raises:
+            ScheduleConflictError: Слот пересекается с другой консультацией юриста
+        """
+        pass
+
+    @abstractmethod
+    async def transition(
+        self,
+        consultation_id: UUID,
+        transition: ConsultationTransition,
+    ) -> Optional[Consultation]:
+        """
+        Атомарно переводит консультацию в новый статус (compare-and-set).
+
+        Один UPDATE ... WHERE <условия перехода> RETURNING вместо
+        загрузки, изменения и сохранения агрегата. Domain event перехода
+        записывается в outbox.
+
+        Args:
+            consultation_id: ID консультации
+            transition: Переход статуса
+
+        Returns:
+            Обновленная консультация или None, если консультация не найдена
+            или не удовлетворяет условиям перехода
+        """
+        pass
+
+    @abstractmethod
+    async def save_rating(self, consultation: Consultation) -> bool:
+        """
+        Сохраняет оценку консультации, если она еще не оценена.
+
+        Условие "еще не оценена" проверяется в самом UPDATE, поэтому
+        повторная или конкурентная оценка не учитывается дважды.
+
+        Args:
+            consultation: Консультация с выставленной оценкой
+
+        Returns:
+            True, если оценка сохранена этим вызовом
         """
         pass
 
@@ -127,6 +186,28 @@ class IConsultationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_stale_pending(
+        self,
+        created_before: datetime,
+        limit: int = 100,
+    ) -> List[Consultation]:
+        """
+        Находит "зависшие" pending консультации для автоотмены.
+
+        Консультация считается зависшей, если юрист не подтвердил ее до
+        created_before или ее запланированное время уже наступило.
+        Строки блокируются (FOR UPDATE SKIP LOCKED) до конца транзакции.
+
+        Args:
+            created_before: Граница времени создания
+            limit: Максимальное количество результатов
+
+        Returns:
+            Список pending консультаций
+        """
+        pass
+
     @abstractmethod
     async def find_scheduled_in_timeframe(
         self,
@@ -137,7 +218,9 @@ class IConsultationRepository(ABC):
         """
         Находит запланированные консультации юриста в определенном временном диапазоне.
 
-        Используется для проверки конфликтов расписания.
+        Используется для проверки конфликтов расписания. Учитываются только
+        консультации в статусах pending/confirmed/active, пересекающие
+        полуоткрытый интервал [start_time, end_time).
 
         Args:
             lawyer_id: ID юриста
@@ -149,6 +232,45 @@ class IConsultationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_busy_intervals(
+        self,
+        lawyer_ids: Sequence[UUID],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """
+        Находит занятые интервалы нескольких юристов одним запросом.
+
+        Используется для расчета свободных слотов. Возвращает только
+        границы интервалов (без загрузки сущностей).
+
+        Args:
+            lawyer_ids: ID юристов
+            start_time: Начало диапазона
+            end_time: Конец диапазона
+
+        Returns:
+            Словарь lawyer_id -> отсортированный список интервалов [start, end)
+        """
+        pass
+
+    @abstractmethod
+    async def get_lawyer_stats(self, lawyer_id: UUID) -> LawyerStats:
+        """
+        Получает статистику консультаций юриста одним запросом.
+
+        Количество по статусам и заработок по успешным платежам
+        (GROUP BY status вместо отдельного count на каждый статус).
+
+        Args:
+            lawyer_id: ID юриста
+
+        Returns:
+            Статистика юриста
+        """
+        pass
+
     @abstractmethod
     async def count_by_lawyer(
         self,
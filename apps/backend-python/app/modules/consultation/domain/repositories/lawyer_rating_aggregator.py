@@ -0,0 +1,30 @@
+"""
+Lawyer Rating Aggregator Interface
+
+Интерфейс инкрементального агрегата оценок юриста.
+"""
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class ILawyerRatingAggregator(ABC):
+    """
+    Интерфейс агрегата оценок юриста (сумма, количество, распределение).
+
+    Consultation Module не зависит от модели Lawyer Module напрямую -
+    оценки консультаций переносятся в профиль юриста через этот интерфейс.
+    """
+
+    @abstractmethod
+    async def add(self, lawyer_id: UUID, rating: int) -> None:
+        """
+        Учитывает новую оценку в агрегате юриста.
+
+        Выполняется атомарно (без чтения агрегата) в транзакции, в которой
+        сохранена оценка консультации.
+
+        Args:
+            lawyer_id: ID юриста (consultations.lawyer_id - ID пользователя)
+            rating: Оценка от 1 до 5
+        """
+        pass
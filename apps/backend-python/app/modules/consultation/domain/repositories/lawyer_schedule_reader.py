@@ -0,0 +1,36 @@
+"""
+Lawyer Schedule Reader Interface
+
+Интерфейс чтения рабочих часов юристов (данные Lawyer Module).
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+from uuid import UUID
+
+from app.modules.consultation.domain.services.availability_service import WorkingHours
+
+
+class ILawyerScheduleReader(ABC):
+    """
+    Интерфейс чтения расписания юристов.
+
+    Consultation Module не зависит от модели Lawyer Module напрямую -
+    расписание читается через этот интерфейс.
+    """
+
+    @abstractmethod
+    async def get_working_hours(
+        self,
+        lawyer_ids: Sequence[UUID],
+    ) -> Dict[UUID, WorkingHours]:
+        """
+        Получает рабочие часы юристов, которые могут принимать консультации.
+
+        Args:
+            lawyer_ids: ID юристов (как consultations.lawyer_id - ID пользователей)
+
+        Returns:
+            Словарь lawyer_id -> WorkingHours (неизвестные, неверифицированные
+            и недоступные юристы отсутствуют в словаре)
+        """
+        pass
@@ -0,0 +1,32 @@
+"""
+Domain Services для Consultation Domain
+"""
+from app.modules.consultation.domain.services.availability_service import (
+    AvailabilityService,
+    Interval,
+    WorkingHours,
+    merge_intervals,
+    subtract_intervals,
+    slice_slots,
+)
+from app.modules.consultation.domain.services.emergency_dispatch import (
+    EmergencyAssignment,
+    EmergencyOffer,
+    EmergencyRequest,
+    EmergencyRequestStatus,
+    IEmergencyDispatcher,
+)
+
+__all__ = [
+    "AvailabilityService",
+    "Interval",
+    "WorkingHours",
+    "merge_intervals",
+    "subtract_intervals",
+    "slice_slots",
+    "EmergencyAssignment",
+    "EmergencyOffer",
+    "EmergencyRequest",
+    "EmergencyRequestStatus",
+    "IEmergencyDispatcher",
+]
@@ -0,0 +1,272 @@
+"""
+Availability Service
+
+Доменный сервис расчета свободных слотов юриста.
+
+Вся арифметика выполняется над отсортированными списками интервалов
+за один проход (merge / sweep), без запросов к БД на каждый слот:
+    рабочие часы - (занятые слоты + буферы) -> свободные окна -> сетка слотов
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.core.domain.result import Result
+
+
+# Полуоткрытый интервал [start, end) в UTC
+Interval = Tuple[datetime, datetime]
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+DEFAULT_TIMEZONE = "Europe/Moscow"
+
+# Рабочие часы по умолчанию (для юристов, не заполнивших расписание)
+DEFAULT_WORKING_HOURS: Dict[str, List[List[str]]] = {
+    "mon": [["09:00", "18:00"]],
+    "tue": [["09:00", "18:00"]],
+    "wed": [["09:00", "18:00"]],
+    "thu": [["09:00", "18:00"]],
+    "fri": [["09:00", "18:00"]],
+}
+
+
+@dataclass(frozen=True)
+class WorkingHours:
+    """
+    Недельное расписание юриста в его локальном часовом поясе.
+
+    Attributes:
+        timezone: Часовой пояс IANA (например, "Europe/Moscow")
+        days: Интервалы рабочего времени по дням недели (0 = понедельник)
+    """
+
+    timezone: str
+    days: Mapping[int, Tuple[Tuple[time, time], ...]] = field(default_factory=dict)
+
+    @classmethod
+    def create(
+        cls,
+        schedule: Optional[Mapping[str, Sequence[Sequence[str]]]],
+        timezone_name: Optional[str] = None,
+    ) -> Result["WorkingHours"]:
+        """
+        Создает расписание из JSON представления.
+
+        Args:
+            schedule: {"mon": [["09:00", "13:00"], ["14:00", "18:00"]], ...}
+                (None - расписание по умолчанию)
+            timezone_name: Часовой пояс IANA (None - по умолчанию)
+
+        Returns:
+            Result с WorkingHours или ошибкой
+        """
+        tz_name = timezone_name or DEFAULT_TIMEZONE
+        try:
+            ZoneInfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            return Result.fail(f"Unknown timezone: {tz_name}")
+
+        days: Dict[int, Tuple[Tuple[time, time], ...]] = {}
+        for day_name, ranges in (schedule if schedule is not None else DEFAULT_WORKING_HOURS).items():
+            if day_name not in WEEKDAYS:
+                return Result.fail(f"Unknown weekday: {day_name}")
+
+            parsed = []
+            for item in ranges:
+                try:
+                    start, end = (time.fromisoformat(value) for value in item)
+                except (TypeError, ValueError):
+                    return Result.fail(f"Invalid working hours range for {day_name}: {item}")
+                if start >= end:
+                    return Result.fail(f"Working hours start must be before end: {item}")
+                parsed.append((start, end))
+
+            days[WEEKDAYS.index(day_name)] = tuple(sorted(parsed))
+
+        return Result.ok(cls(timezone=tz_name, days=days))
+
+    def intervals(self, range_start: datetime, range_end: datetime) -> List[Interval]:
+        """
+        Рабочие интервалы (UTC) в диапазоне, отсортированные по началу.
+
+        Переход на летнее/зимнее время учитывается через ZoneInfo.
+
+        Args:
+            range_start: Начало диапазона (UTC)
+            range_end: Конец диапазона (UTC)
+
+        Returns:
+            Список интервалов, обрезанных по границам диапазона
+        """
+        tz = ZoneInfo(self.timezone)
+        local_day: date = range_start.astimezone(tz).date() - timedelta(days=1)
+        last_day: date = range_end.astimezone(tz).date()
+
+        result: List[Interval] = []
+        while local_day <= last_day:
+            for start_t, end_t in self.days.get(local_day.weekday(), ()):
+                start = datetime.combine(local_day, start_t, tz).astimezone(timezone.utc)
+                end = datetime.combine(local_day, end_t, tz).astimezone(timezone.utc)
+                start, end = max(start, range_start), min(end, range_end)
+                if start < end:
+                    result.append((start, end))
+            local_day += timedelta(days=1)
+
+        return merge_intervals(result)
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """
+    Объединяет пересекающиеся и смежные интервалы.
+
+    Args:
+        intervals: Интервалы в произвольном порядке
+
+    Returns:
+        Отсортированный список непересекающихся интервалов
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(base: Sequence[Interval], busy: Sequence[Interval]) -> List[Interval]:
+    """
+    Вычитает занятые интервалы из базовых (sweep двумя указателями).
+
+    Args:
+        base: Отсортированные непересекающиеся интервалы
+        busy: Отсортированные непересекающиеся интервалы
+
+    Returns:
+        Части base, не покрытые busy
+    """
+    free: List[Interval] = []
+    j = 0
+    for start, end in base:
+        # Пропускаем занятые интервалы, закончившиеся до начала текущего
+        while j < len(busy) and busy[j][1] <= start:
+            j += 1
+
+        cursor = start
+        k = j
+        while k < len(busy) and busy[k][0] < end:
+            busy_start, busy_end = busy[k]
+            if busy_start > cursor:
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            if cursor >= end:
+                break
+            k += 1
+
+        if cursor < end:
+            free.append((cursor, end))
+    return free
+
+
+def slice_slots(
+    free: Sequence[Interval],
+    duration: timedelta,
+    step: timedelta,
+) -> List[Interval]:
+    """
+    Нарезает свободные окна на слоты заданной длительности.
+
+    Начало слота выравнивается по сетке step от начала часа (UTC),
+    чтобы клиенты видели "круглое" время (10:00, 10:30, ...).
+
+    Args:
+        free: Свободные окна
+        duration: Длительность консультации
+        step: Шаг сетки
+
+    Returns:
+        Список слотов [start, start + duration)
+    """
+    slots: List[Interval] = []
+    for start, end in free:
+        hour = start.replace(minute=0, second=0, microsecond=0)
+        steps = -(-(start - hour) // step)  # ceil
+        cursor = hour + steps * step
+        while cursor + duration <= end:
+            slots.append((cursor, cursor + duration))
+            cursor += step
+    return slots
+
+
+class AvailabilityService:
+    """
+    Доменный сервис расчета свободных слотов.
+
+    Не обращается к БД: получает рабочие часы и занятые интервалы
+    (пакетно для всех юристов) и считает слоты в памяти.
+    """
+
+    def __init__(
+        self,
+        step_minutes: int = 30,
+        buffer_minutes: int = 15,
+        min_notice_minutes: int = 60,
+    ) -> None:
+        """
+        Args:
+            step_minutes: Шаг сетки начала слотов
+            buffer_minutes: Буфер до и после каждой консультации
+            min_notice_minutes: Минимальное время до начала слота
+        """
+        self._step = timedelta(minutes=step_minutes)
+        self._buffer = timedelta(minutes=buffer_minutes)
+        self._min_notice = timedelta(minutes=min_notice_minutes)
+
+    def earliest_start(self, now: Optional[datetime] = None) -> datetime:
+        """
+        Самое раннее допустимое начало слота (с учетом min notice).
+
+        Args:
+            now: Текущее время (UTC), для тестов
+
+        Returns:
+            Время (UTC)
+        """
+        return (now or datetime.now(timezone.utc)) + self._min_notice
+
+    def compute_slots(
+        self,
+        working_hours: WorkingHours,
+        busy: Iterable[Interval],
+        range_start: datetime,
+        range_end: datetime,
+        duration_minutes: int,
+        now: Optional[datetime] = None,
+    ) -> List[Interval]:
+        """
+        Считает свободные слоты одного юриста.
+
+        Args:
+            working_hours: Расписание юриста
+            busy: Занятые интервалы (консультации), UTC
+            range_start: Начало диапазона (UTC)
+            range_end: Конец диапазона (UTC)
+            duration_minutes: Длительность консультации
+            now: Текущее время (UTC), для тестов
+
+        Returns:
+            Отсортированный список свободных слотов
+        """
+        range_start = max(range_start, self.earliest_start(now))
+        if range_start >= range_end:
+            return []
+
+        working = working_hours.intervals(range_start, range_end)
+        blocked = merge_intervals(
+            (start - self._buffer, end + self._buffer) for start, end in busy
+        )
+        free = subtract_intervals(working, blocked)
+        return slice_slots(free, timedelta(minutes=duration_minutes), self._step)
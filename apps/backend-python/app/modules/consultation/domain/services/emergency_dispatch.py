@@ -0,0 +1,198 @@
+"""
+Emergency Dispatch
+
+Доменные типы и интерфейс диспетчера экстренных консультаций.
+
+Клиент не выбирает юриста: запрос предлагается лучшим доступным
+юристам подходящей специализации в его городе, консультация создается
+с юристом, первым принявшим предложение.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from app.core.domain.result import Result
+
+
+class EmergencyRequestStatus(str, Enum):
+    """Статус экстренного запроса."""
+
+    SEARCHING = "searching"  # Идет поиск юриста
+    ASSIGNED = "assigned"  # Юрист принял предложение
+    EXPIRED = "expired"  # Никто не принял за отведенное время
+    FAILED = "failed"  # Консультацию не удалось создать
+
+
+@dataclass(frozen=True)
+class EmergencyRequest:
+    """
+    Экстренный запрос клиента.
+
+    Attributes:
+        id: ID запроса
+        client_id: ID клиента
+        specialization: Специализация (SpecializationType name, например "AUTO_ACCIDENTS")
+        city: Город (нормализованный)
+        description: Описание проблемы
+        status: Статус запроса
+        created_at: Время создания (UTC)
+        lawyer_id: ID профиля юриста (после назначения)
+        consultation_id: ID консультации (после назначения)
+        assigned_at: Время принятия юристом (UTC)
+    """
+
+    id: UUID
+    client_id: UUID
+    specialization: str
+    city: str
+    description: str
+    status: EmergencyRequestStatus
+    created_at: datetime
+    lawyer_id: Optional[UUID] = None
+    consultation_id: Optional[UUID] = None
+    assigned_at: Optional[datetime] = None
+
+    @property
+    def time_to_assignment(self) -> Optional[timedelta]:
+        """Время от запроса до принятия юристом (None - еще не назначен)."""
+        if self.assigned_at is None:
+            return None
+        return self.assigned_at - self.created_at
+
+
+@dataclass(frozen=True)
+class EmergencyOffer:
+    """
+    Предложение экстренного запроса юристу.
+
+    Attributes:
+        request: Экстренный запрос
+        expires_in_ms: Сколько осталось до истечения предложения
+    """
+
+    request: EmergencyRequest
+    expires_in_ms: int
+
+
+@dataclass(frozen=True)
+class EmergencyAssignment:
+    """
+    Результат захвата запроса юристом.
+
+    Attributes:
+        request: Экстренный запрос
+        lawyer_id: ID профиля юриста (lawyers.id)
+        price_amount: Цена консультации юриста
+    """
+
+    request: EmergencyRequest
+    lawyer_id: UUID
+    price_amount: Decimal
+
+
+class IEmergencyDispatcher(ABC):
+    """
+    Интерфейс диспетчера экстренных консультаций.
+    """
+
+    @abstractmethod
+    async def submit(
+        self,
+        client_id: UUID,
+        specialization: str,
+        city: str,
+        description: str,
+    ) -> Result[EmergencyRequest]:
+        """
+        Создает запрос и запускает поиск юриста в фоне.
+
+        Args:
+            client_id: ID клиента
+            specialization: Специализация
+            city: Город
+            description: Описание проблемы
+
+        Returns:
+            Result с созданным запросом (status = SEARCHING) или ошибкой
+            (диспетчер недоступен)
+        """
+        pass
+
+    @abstractmethod
+    async def get_request(self, request_id: UUID) -> Optional[EmergencyRequest]:
+        """
+        Получает запрос по ID.
+
+        Args:
+            request_id: ID запроса
+
+        Returns:
+            EmergencyRequest или None если не найден (истек)
+        """
+        pass
+
+    @abstractmethod
+    async def get_offer(self, lawyer_user_id: UUID) -> Optional[EmergencyOffer]:
+        """
+        Получает текущее предложение юристу.
+
+        Args:
+            lawyer_user_id: ID пользователя юриста
+
+        Returns:
+            EmergencyOffer или None
+        """
+        pass
+
+    @abstractmethod
+    async def claim(
+        self,
+        request_id: UUID,
+        lawyer_user_id: UUID,
+    ) -> Result[EmergencyAssignment]:
+        """
+        Атомарно захватывает запрос (первый принявший юрист).
+
+        Args:
+            request_id: ID запроса
+            lawyer_user_id: ID пользователя юриста
+
+        Returns:
+            Result с назначением или ошибкой (запрос уже назначен,
+            предложение истекло или не было сделано этому юристу)
+        """
+        pass
+
+    @abstractmethod
+    async def decline(self, request_id: UUID, lawyer_user_id: UUID) -> bool:
+        """
+        Отклоняет предложение.
+
+        Args:
+            request_id: ID запроса
+            lawyer_user_id: ID пользователя юриста
+
+        Returns:
+            True если предложение было активно
+        """
+        pass
+
+    @abstractmethod
+    async def complete_assignment(
+        self,
+        request_id: UUID,
+        consultation_id: Optional[UUID],
+    ) -> None:
+        """
+        Фиксирует результат назначения.
+
+        Args:
+            request_id: ID запроса
+            consultation_id: ID созданной консультации (None - не удалось
+                создать, запрос переводится в FAILED)
+        """
+        pass
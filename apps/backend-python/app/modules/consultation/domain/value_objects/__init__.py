@@ -9,6 +9,10 @@ from app.modules.consultation.domain.value_objects.consultation_type import (
     ConsultationType,
     ConsultationTypeEnum,
 )
+from app.modules.consultation.domain.value_objects.consultation_transition import (
+    ConsultationTransition,
+)
+from app.modules.consultation.domain.value_objects.lawyer_stats import LawyerStats
 from app.modules.consultation.domain.value_objects.time_slot import TimeSlot
 from app.modules.consultation.domain.value_objects.price import Price
 
@@ -17,6 +21,8 @@ __all__ = [
     "ConsultationStatusEnum",
     "ConsultationType",
     "ConsultationTypeEnum",
+    "ConsultationTransition",
+    "LawyerStats",
     "TimeSlot",
     "Price",
 ]
@@ -0,0 +1,74 @@
+"""
+Consultation Transition Value Object
+
+Описание перехода статуса консультации для compare-and-set обновления.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from uuid import UUID
+
+from app.modules.consultation.domain.value_objects.consultation_status import (
+    ConsultationStatusEnum,
+)
+
+
+@dataclass(frozen=True)
+class ConsultationTransition:
+    """
+    Переход статуса консультации.
+
+    Повторяет guard соответствующего метода Consultation (confirm/start/
+    complete) в виде условий, которые репозиторий проверяет в самом
+    UPDATE. Переход выполняется только если строка все еще удовлетворяет
+    условиям, поэтому конкурентные переходы не перезаписывают друг друга.
+
+    Attributes:
+        target: Целевой статус
+        allowed_from: Статусы, из которых разрешен переход
+        timestamp: Поле времени перехода (started_at/completed_at)
+        lawyer_id: Только для консультаций этого юриста
+        start_window_minutes: Scheduled консультацию можно начать не
+            раньше чем за N минут до начала
+        single_active: У юриста не должно быть другой активной консультации
+    """
+
+    target: ConsultationStatusEnum
+    allowed_from: Tuple[ConsultationStatusEnum, ...]
+    timestamp: Optional[str] = None
+    lawyer_id: Optional[UUID] = None
+    start_window_minutes: Optional[int] = None
+    single_active: bool = False
+
+    # Scheduled консультацию можно начать за 15 минут до начала
+    START_WINDOW_MINUTES = 15
+
+    @classmethod
+    def confirm(cls, lawyer_id: Optional[UUID] = None) -> "ConsultationTransition":
+        """Подтверждение: pending -> confirmed."""
+        return cls(
+            target=ConsultationStatusEnum.CONFIRMED,
+            allowed_from=(ConsultationStatusEnum.PENDING,),
+            lawyer_id=lawyer_id,
+        )
+
+    @classmethod
+    def start(cls, lawyer_id: Optional[UUID] = None) -> "ConsultationTransition":
+        """Начало: confirmed -> active (в окне начала, одна активная у юриста)."""
+        return cls(
+            target=ConsultationStatusEnum.ACTIVE,
+            allowed_from=(ConsultationStatusEnum.CONFIRMED,),
+            timestamp="started_at",
+            lawyer_id=lawyer_id,
+            start_window_minutes=cls.START_WINDOW_MINUTES,
+            single_active=True,
+        )
+
+    @classmethod
+    def complete(cls, lawyer_id: Optional[UUID] = None) -> "ConsultationTransition":
+        """Завершение: active -> completed."""
+        return cls(
+            target=ConsultationStatusEnum.COMPLETED,
+            allowed_from=(ConsultationStatusEnum.ACTIVE,),
+            timestamp="completed_at",
+            lawyer_id=lawyer_id,
+        )
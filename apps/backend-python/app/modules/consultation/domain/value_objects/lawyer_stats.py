@@ -0,0 +1,38 @@
+"""
+Lawyer Stats Value Object
+
+Сводная статистика консультаций юриста для дашборда.
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict
+
+from app.modules.consultation.domain.value_objects.consultation_status import (
+    ConsultationStatusEnum,
+)
+
+
+@dataclass(frozen=True)
+class LawyerStats:
+    """
+    Статистика консультаций юриста.
+
+    Attributes:
+        status_counts: Количество консультаций по статусам (все статусы,
+            отсутствующие - с нулем)
+        earnings_total: Сумма успешных платежей за консультации юриста
+        earnings_month: То же за текущий календарный месяц (UTC)
+    """
+
+    status_counts: Dict[ConsultationStatusEnum, int] = field(default_factory=dict)
+    earnings_total: Decimal = Decimal("0")
+    earnings_month: Decimal = Decimal("0")
+
+    def count(self, status: ConsultationStatusEnum) -> int:
+        """Количество консультаций в статусе."""
+        return self.status_counts.get(status, 0)
+
+    @property
+    def total(self) -> int:
+        """Общее количество консультаций."""
+        return sum(self.status_counts.values())
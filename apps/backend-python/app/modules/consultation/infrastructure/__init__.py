@@ -9,9 +9,37 @@ from app.modules.consultation.infrastructure.persistence import (
     ConsultationMapper,
     ConsultationRepositoryImpl,
 )
+from app.modules.consultation.infrastructure.availability import (
+    LawyerScheduleReaderImpl,
+    RedisAvailabilityCache,
+    availability_cache,
+)
+from app.modules.consultation.infrastructure.lawyer_rating import (
+    LawyerRatingAggregatorImpl,
+)
+from app.modules.consultation.infrastructure.lawyer_stats import (
+    RedisLawyerStatsCache,
+    lawyer_stats_cache,
+)
+from app.modules.consultation.infrastructure.emergency_dispatcher import (
+    EmergencyLawyerPool,
+    RedisEmergencyDispatcher,
+    emergency_dispatcher,
+    emergency_pool,
+)
 
 __all__ = [
     "ConsultationModel",
     "ConsultationMapper",
     "ConsultationRepositoryImpl",
+    "LawyerScheduleReaderImpl",
+    "RedisAvailabilityCache",
+    "availability_cache",
+    "LawyerRatingAggregatorImpl",
+    "RedisLawyerStatsCache",
+    "lawyer_stats_cache",
+    "EmergencyLawyerPool",
+    "RedisEmergencyDispatcher",
+    "emergency_dispatcher",
+    "emergency_pool",
 ]
@@ -0,0 +1,173 @@
+"""
+Availability Infrastructure
+
+Чтение расписаний юристов и Redis кеш свободных слотов.
+
+Инвалидация кеша - через версию юриста (VersionedRedisCache):
+подписчики на события бронирования/отмены увеличивают ее.
+"""
+import logging
+from datetime import timedelta
+from typing import Dict, Mapping, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.infrastructure.cache import RedisClient, redis_client
+from app.modules.consultation.application.dtos import LawyerAvailabilityDTO
+from app.modules.consultation.application.queries import (
+    AvailabilityWindow,
+    IAvailabilityCache,
+)
+from app.modules.consultation.domain import ILawyerScheduleReader, WorkingHours
+from app.modules.consultation.infrastructure.versioned_cache import VersionedRedisCache
+from app.modules.lawyer.infrastructure.persistence.models import LawyerModel
+
+logger = logging.getLogger(__name__)
+
+
+class LawyerScheduleReaderImpl(ILawyerScheduleReader):
+    """
+    Чтение рабочих часов из таблицы lawyers одним запросом.
+
+    Юристы идентифицируются как в consultations.lawyer_id - ID
+    пользователя (lawyers.user_id).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_working_hours(
+        self,
+        lawyer_ids: Sequence[UUID],
+    ) -> Dict[UUID, WorkingHours]:
+        """
+        Получает рабочие часы юристов, которые могут принимать консультации.
+
+        Args:
+            lawyer_ids: ID пользователей юристов
+
+        Returns:
+            Словарь lawyer_id -> WorkingHours
+        """
+        if not lawyer_ids:
+            return {}
+
+        stmt = select(
+            LawyerModel.user_id,
+            LawyerModel.working_hours,
+            LawyerModel.timezone,
+        ).where(
+            LawyerModel.user_id.in_([str(lawyer_id) for lawyer_id in lawyer_ids]),
+            LawyerModel.verification_status == "verified",
+            LawyerModel.is_available.is_(True),
+        )
+        result = await self._session.execute(stmt)
+
+        schedules: Dict[UUID, WorkingHours] = {}
+        for lawyer_id, working_hours, timezone_name in result.all():
+            hours_result = WorkingHours.create(working_hours, timezone_name)
+            if hours_result.is_failure:
+                # Некорректное расписание не должно ломать выдачу остальных юристов
+                logger.warning(
+                    f"Invalid working hours for lawyer {lawyer_id}: {hours_result.error}"
+                )
+                continue
+            schedules[UUID(lawyer_id)] = hours_result.value
+
+        return schedules
+
+
+class RedisAvailabilityCache(IAvailabilityCache):
+    """
+    Кеш свободных слотов в Redis (по юристу и окну).
+
+    Ключи:
+    - availability:version:{lawyer_id} - версия расписания юриста
+    - availability:slots:{lawyer_id}:v{version}:{start}:{end}:{duration} - слоты
+    """
+
+    KEY_PREFIX = "availability"
+
+    def __init__(self, redis: RedisClient, ttl: timedelta):
+        """
+        Args:
+            redis: Redis клиент
+            ttl: Время жизни записей слотов
+        """
+        self._cache = VersionedRedisCache(redis, self.KEY_PREFIX, ttl)
+
+    def _slots_key(self, lawyer_id: UUID, version: str, window: AvailabilityWindow) -> str:
+        return (
+            f"{self.KEY_PREFIX}:slots:{lawyer_id}:v{version}:"
+            f"{window.start.date().isoformat()}:{window.end.date().isoformat()}:"
+            f"{window.duration_minutes}"
+        )
+
+    async def get_many(
+        self,
+        lawyer_ids: Sequence[UUID],
+        window: AvailabilityWindow,
+    ) -> Tuple[Dict[UUID, LawyerAvailabilityDTO], Dict[UUID, str]]:
+        """
+        Получает закешированные слоты (2 round trip: версии + слоты).
+
+        Args:
+            lawyer_ids: ID юристов
+            window: Окно расчета
+
+        Returns:
+            Кортеж (найденные в кеше слоты, версии юристов)
+        """
+        values, versions = await self._cache.read(
+            lawyer_ids,
+            lambda lawyer_id, version: self._slots_key(lawyer_id, version, window),
+        )
+        hits = {
+            lawyer_id: LawyerAvailabilityDTO.model_validate_json(value)
+            for lawyer_id, value in values.items()
+        }
+        return hits, versions
+
+    async def set_many(
+        self,
+        window: AvailabilityWindow,
+        items: Sequence[LawyerAvailabilityDTO],
+        versions: Mapping[UUID, str],
+    ) -> None:
+        """
+        Сохраняет слоты в кеш под версиями, прочитанными до расчета.
+
+        Если бронирование произошло во время расчета, версия уже
+        увеличена и записанные слоты никогда не будут прочитаны.
+
+        Args:
+            window: Окно расчета
+            items: Слоты юристов
+            versions: Версии из get_many
+        """
+        await self._cache.write({
+            self._slots_key(item.lawyer_id, versions[item.lawyer_id], window): (
+                item.model_dump_json()
+            )
+            for item in items
+            if item.lawyer_id in versions
+        })
+
+    async def invalidate(self, lawyer_id: UUID | str) -> None:
+        """
+        Инвалидирует кеш слотов юриста (увеличивает версию).
+
+        Args:
+            lawyer_id: ID юриста
+        """
+        await self._cache.invalidate(lawyer_id)
+
+
+# Глобальный кеш свободных слотов
+availability_cache = RedisAvailabilityCache(
+    redis_client,
+    ttl=timedelta(seconds=settings.availability_cache_ttl_seconds),
+)
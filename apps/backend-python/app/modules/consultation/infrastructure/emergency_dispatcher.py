@@ -0,0 +1,871 @@
+"""
+Emergency Dispatcher
+
+Redis реализация диспетчера экстренных консультаций.
+
+Пул доступных верифицированных юристов хранится в Redis sorted sets по
+паре (специализация, город), score - рейтинг. Запрос предлагается
+волнами: top-k свободных кандидатов получают предложение с таймаутом,
+первый принявший атомарно захватывает запрос (Lua скрипт). Пока юристу
+сделано предложение или назначена экстренная консультация, он занят
+(ключ hold) и другим запросам не предлагается.
+
+Ключи:
+- dispatch:pool:{SPECIALIZATION}:{city} - ZSET lawyer_id -> score
+- dispatch:pools - SET всех ключей пулов
+- dispatch:lawyer:{lawyer_id} - HASH user_id, price, pools
+- dispatch:user:{user_id} - lawyer_id юриста
+- dispatch:hold:{lawyer_id} - "offer:{request_id}" (TTL предложения)
+  или "assigned:{request_id}" (до завершения консультации)
+- dispatch:request:{request_id} - HASH запроса
+- dispatch:request:{request_id}:offered - SET юристов, получивших предложение
+
+Ключи hold формируются внутри Lua скриптов, поэтому диспетчер рассчитан
+на single-node Redis (как и остальная инфраструктура).
+"""
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+from uuid import UUID, uuid4
+
+from prometheus_client import Counter, Histogram
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.domain.result import Result
+from app.core.infrastructure.cache import RedisClient, redis_client
+from app.core.infrastructure.database import async_session_factory
+from app.modules.consultation.domain import (
+    EmergencyAssignment,
+    EmergencyOffer,
+    EmergencyRequest,
+    EmergencyRequestStatus,
+    IEmergencyDispatcher,
+)
+from app.modules.lawyer.domain import SpecializationType, normalize_city
+from app.modules.lawyer.infrastructure.persistence.models import LawyerModel
+
+logger = logging.getLogger(__name__)
+
+
+KEY_PREFIX = "dispatch"
+POOLS_KEY = f"{KEY_PREFIX}:pools"
+HOLD_PREFIX = f"{KEY_PREFIX}:hold:"
+EVENTS_CHANNEL = f"{KEY_PREFIX}:events"
+OFFERS_CHANNEL = f"{KEY_PREFIX}:offers"
+
+EMERGENCY_TIME_TO_ASSIGNMENT = Histogram(
+    "emergency_dispatch_time_to_assignment_seconds",
+    "Время от экстренного запроса до принятия юристом",
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300),
+)
+EMERGENCY_DISPATCH_OUTCOMES = Counter(
+    "emergency_dispatch_requests_total",
+    "Экстренные запросы по итогу поиска",
+    ["outcome"],
+)
+EMERGENCY_OFFERS = Counter(
+    "emergency_dispatch_offers_total",
+    "Предложения экстренных запросов юристам",
+)
+
+
+# Волна предложений: top-k юристов пула, которым запрос еще не предлагался
+# и которые не заняты, получают hold "offer:{request_id}" с TTL.
+# KEYS: [pool, request, offered]
+# ARGV: [request_id, fanout, offer_ttl_ms, hold_prefix, scan_limit]
+OFFER_SCRIPT = """
+if redis.call('HGET', KEYS[2], 'status') ~= 'searching' then
+    return {}
+end
+local fanout = tonumber(ARGV[2])
+local scan_limit = tonumber(ARGV[5])
+local offered = {}
+local start = 0
+local batch = 50
+while #offered < fanout and start < scan_limit do
+    local members = redis.call('ZREVRANGE', KEYS[1], start, start + batch - 1)
+    if #members == 0 then
+        break
+    end
+    for _, lawyer_id in ipairs(members) do
+        if redis.call('SISMEMBER', KEYS[3], lawyer_id) == 0 then
+            local hold = redis.call(
+                'SET', ARGV[4] .. lawyer_id, 'offer:' .. ARGV[1], 'NX', 'PX', ARGV[3]
+            )
+            if hold then
+                redis.call('SADD', KEYS[3], lawyer_id)
+                offered[#offered + 1] = lawyer_id
+                if #offered >= fanout then
+                    break
+                end
+            end
+        end
+    end
+    start = start + batch
+end
+local ttl = redis.call('PTTL', KEYS[2])
+if #offered > 0 and ttl > 0 then
+    redis.call('PEXPIRE', KEYS[3], ttl)
+end
+return offered
+"""
+
+# Захват запроса: только юрист с активным предложением и только пока
+# запрос в поиске. Результат: 1 - захвачен, 0 - уже назначен/закрыт,
+# -1 - запрос не найден, -2 - у юриста нет активного предложения.
+# KEYS: [request, hold]
+# ARGV: [request_id, lawyer_id, assigned_at, assigned_hold_ms, channel]
+CLAIM_SCRIPT = """
+local status = redis.call('HGET', KEYS[1], 'status')
+if not status then
+    return -1
+end
+if status ~= 'searching' then
+    return 0
+end
+if redis.call('GET', KEYS[2]) ~= 'offer:' .. ARGV[1] then
+    return -2
+end
+redis.call('HSET', KEYS[1], 'status', 'assigned', 'lawyer_id', ARGV[2], 'assigned_at', ARGV[3])
+redis.call('SET', KEYS[2], 'assigned:' .. ARGV[1], 'PX', ARGV[4])
+redis.call('PUBLISH', ARGV[5], ARGV[1] .. ':assigned')
+return 1
+"""
+
+# Переход статуса запроса только из ожидаемого (compare-and-set).
+# KEYS: [request]
+# ARGV: [from_status, to_status]
+TRANSITION_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'status') == ARGV[1] then
+    redis.call('HSET', KEYS[1], 'status', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Удаление ключа, только если он хранит ожидаемое значение.
+# KEYS: hold ключи
+# ARGV: [expected_value]
+RELEASE_SCRIPT = """
+local released = 0
+for _, key in ipairs(KEYS) do
+    if redis.call('GET', key) == ARGV[1] then
+        redis.call('DEL', key)
+        released = released + 1
+    end
+end
+return released
+"""
+
+
+_SPECIALIZATION_NAMES = {item.value: item.name for item in SpecializationType}
+
+
+def pool_key(specialization: str, city: str) -> str:
+    """Ключ пула юристов по специализации (SpecializationType name) и городу."""
+    return f"{KEY_PREFIX}:pool:{specialization}:{normalize_city(city)}"
+
+
+def _lawyer_key(lawyer_id: str) -> str:
+    return f"{KEY_PREFIX}:lawyer:{lawyer_id}"
+
+
+def _user_key(user_id: str) -> str:
+    return f"{KEY_PREFIX}:user:{user_id}"
+
+
+def _hold_key(lawyer_id: str) -> str:
+    return f"{HOLD_PREFIX}{lawyer_id}"
+
+
+def _request_key(request_id: str) -> str:
+    return f"{KEY_PREFIX}:request:{request_id}"
+
+
+def _offered_key(request_id: str) -> str:
+    return f"{KEY_PREFIX}:request:{request_id}:offered"
+
+
+def _pools_for(specializations: Iterable[str], location: str) -> List[str]:
+    """Ключи пулов юриста (специализации хранятся русскими названиями)."""
+    pools = []
+    for specialization in specializations or []:
+        name = _SPECIALIZATION_NAMES.get(specialization)
+        if name is None and specialization in SpecializationType.__members__:
+            name = specialization
+        if name is not None:
+            pools.append(pool_key(name, location))
+    return pools
+
+
+def _score(rating: Optional[Decimal], reviews_count: int) -> float:
+    """Score в пуле: рейтинг, при равенстве - больше отзывов."""
+    return float(rating or 0) * 1000 + min(reviews_count or 0, 999)
+
+
+class EmergencyLawyerPool:
+    """
+    Пул доступных юристов для экстренных консультаций.
+
+    Обновляется инкрементально по событиям юриста и периодически
+    перестраивается из БД (на случай пропущенных событий).
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient = redis_client,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ):
+        """
+        Args:
+            redis: Redis клиент
+            session_factory: Фабрика сессий БД
+        """
+        self._redis = redis
+        self._session_factory = session_factory
+
+    @staticmethod
+    def _select_lawyers():
+        return select(
+            LawyerModel.id,
+            LawyerModel.user_id,
+            LawyerModel.specializations,
+            LawyerModel.location,
+            LawyerModel.rating,
+            LawyerModel.reviews_count,
+            LawyerModel.price_amount,
+        ).where(
+            LawyerModel.verification_status == "verified",
+            LawyerModel.is_available.is_(True),
+        )
+
+    async def sync_lawyer(self, lawyer_id: str) -> None:
+        """
+        Синхронизировать юриста с пулом по данным БД.
+
+        Args:
+            lawyer_id: ID юриста
+        """
+        if not self._redis.is_connected:
+            return
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                self._select_lawyers().where(LawyerModel.id == str(lawyer_id))
+            )
+            row = result.first()
+
+        if row is None:
+            await self.remove(str(lawyer_id))
+        else:
+            await self.upsert(row)
+
+    async def upsert(self, row: Any) -> None:
+        """
+        Добавить юриста в пулы его специализаций (или обновить score).
+
+        Args:
+            row: Строка выборки _select_lawyers
+        """
+        client = self._redis.client
+        old_pools = json.loads(await client.hget(_lawyer_key(row.id), "pools") or "[]")
+        new_pools = _pools_for(row.specializations, row.location)
+        score = _score(row.rating, row.reviews_count)
+
+        async with client.pipeline(transaction=True) as pipe:
+            for key in set(old_pools) - set(new_pools):
+                pipe.zrem(key, row.id)
+            for key in new_pools:
+                pipe.zadd(key, {row.id: score})
+            if new_pools:
+                pipe.sadd(POOLS_KEY, *new_pools)
+            pipe.hset(
+                _lawyer_key(row.id),
+                mapping={
+                    "user_id": row.user_id,
+                    "price": str(row.price_amount),
+                    "pools": json.dumps(new_pools),
+                },
+            )
+            pipe.set(_user_key(row.user_id), row.id)
+            await pipe.execute()
+
+    async def remove(self, lawyer_id: str) -> None:
+        """
+        Убрать юриста из всех пулов.
+
+        Args:
+            lawyer_id: ID юриста
+        """
+        if not self._redis.is_connected:
+            return
+
+        client = self._redis.client
+        old_pools = json.loads(await client.hget(_lawyer_key(lawyer_id), "pools") or "[]")
+        async with client.pipeline(transaction=True) as pipe:
+            for key in old_pools:
+                pipe.zrem(key, lawyer_id)
+            pipe.hset(_lawyer_key(lawyer_id), "pools", "[]")
+            await pipe.execute()
+
+    async def rebuild(self) -> int:
+        """
+        Перестроить все пулы из БД.
+
+        Пулы собираются во временных ключах и подменяются через RENAME
+        в одной транзакции, поэтому поиск не видит частично собранный пул.
+
+        Returns:
+            Количество юристов в пулах
+        """
+        if not self._redis.is_connected:
+            return 0
+
+        client = self._redis.client
+        chunk_size = settings.scheduler_chunk_size
+        pools: Dict[str, Dict[str, float]] = {}
+        lawyers = 0
+        last_id = ""
+
+        while True:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    self._select_lawyers()
+                    .where(LawyerModel.id > last_id)
+                    .order_by(LawyerModel.id)
+                    .limit(chunk_size)
+                )
+                rows = result.all()
+            if not rows:
+                break
+
+            async with client.pipeline(transaction=False) as pipe:
+                for row in rows:
+                    row_pools = _pools_for(row.specializations, row.location)
+                    score = _score(row.rating, row.reviews_count)
+                    for key in row_pools:
+                        pools.setdefault(key, {})[row.id] = score
+                    pipe.hset(
+                        _lawyer_key(row.id),
+                        mapping={
+                            "user_id": row.user_id,
+                            "price": str(row.price_amount),
+                            "pools": json.dumps(row_pools),
+                        },
+                    )
+                    pipe.set(_user_key(row.user_id), row.id)
+                await pipe.execute()
+
+            lawyers += len(rows)
+            last_id = rows[-1].id
+            if len(rows) < chunk_size:
+                break
+
+        async with client.pipeline(transaction=False) as pipe:
+            for key, members in pools.items():
+                pipe.delete(f"{key}:rebuild")
+                pipe.zadd(f"{key}:rebuild", members)
+            await pipe.execute()
+
+        stale_pools = await client.smembers(POOLS_KEY) - set(pools)
+        async with client.pipeline(transaction=True) as pipe:
+            for key in pools:
+                pipe.rename(f"{key}:rebuild", key)
+            for key in stale_pools:
+                pipe.delete(key)
+            pipe.delete(POOLS_KEY)
+            if pools:
+                pipe.sadd(POOLS_KEY, *pools)
+            await pipe.execute()
+
+        return lawyers
+
+
+class RedisEmergencyDispatcher(IEmergencyDispatcher):
+    """
+    Диспетчер экстренных консультаций на Redis.
+
+    Поиск юриста для запроса выполняется фоновой задачей процесса,
+    принявшего запрос. Захват может произойти в любой реплике: о нем
+    сообщает Redis pub/sub, поэтому волна завершается сразу после
+    принятия, а не по таймауту.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient = redis_client,
+        offer_fanout: int = 3,
+        offer_timeout_seconds: float = 15.0,
+        search_timeout_seconds: float = 120.0,
+        retry_interval_seconds: float = 2.0,
+        assignment_hold_minutes: int = 120,
+        request_ttl_seconds: int = 3600,
+        scan_limit: int = 500,
+    ):
+        """
+        Args:
+            redis: Redis клиент
+            offer_fanout: Сколько юристов получают предложение в одной волне
+            offer_timeout_seconds: Время на принятие предложения
+            search_timeout_seconds: Общее время поиска юриста
+            retry_interval_seconds: Пауза, если в пуле нет свободных юристов
+            assignment_hold_minutes: Максимальная занятость юриста
+                экстренной консультацией (если событие завершения потеряно)
+            request_ttl_seconds: Время хранения запроса после создания
+            scan_limit: Сколько юристов пула просматривается за волну
+        """
+        self._redis = redis
+        self._offer_fanout = offer_fanout
+        self._offer_timeout = offer_timeout_seconds
+        self._search_timeout = search_timeout_seconds
+        self._retry_interval = retry_interval_seconds
+        self._assignment_hold_ms = assignment_hold_minutes * 60 * 1000
+        self._request_ttl = request_ttl_seconds
+        self._scan_limit = scan_limit
+
+        self._scripts: Dict[str, Any] = {}
+        self._waiters: Dict[str, asyncio.Event] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    # ========== Lifecycle ==========
+
+    def start(self) -> None:
+        """Запустить слушателя событий захвата (pub/sub)."""
+        if self._listener is None and self._redis.is_connected:
+            self._stopping.clear()
+            self._listener = asyncio.create_task(
+                self._listen(), name="emergency-dispatcher-listener"
+            )
+
+    async def stop(self) -> None:
+        """Остановить поиск по текущим запросам и слушателя событий."""
+        self._stopping.set()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._listener is not None:
+            await self._listener
+            self._listener = None
+
+    async def _listen(self) -> None:
+        """Будить ожидающие волны при захвате или отклонении предложения."""
+        while not self._stopping.is_set():
+            pubsub = self._redis.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                while not self._stopping.is_set():
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    request_id, _, _ = message["data"].partition(":")
+                    waiter = self._waiters.get(request_id)
+                    if waiter is not None:
+                        waiter.set()
+            except (RedisError, RuntimeError) as e:
+                logger.warning(f"Emergency dispatcher listener failed: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+
+    def _script(self, name: str, source: str) -> Any:
+        if name not in self._scripts:
+            self._scripts[name] = self._redis.client.register_script(source)
+        return self._scripts[name]
+
+    # ========== IEmergencyDispatcher ==========
+
+    async def submit(
+        self,
+        client_id: UUID,
+        specialization: str,
+        city: str,
+        description: str,
+    ) -> Result[EmergencyRequest]:
+        """
+        Создает запрос и запускает поиск юриста в фоне.
+
+        Args:
+            client_id: ID клиента
+            specialization: Специализация (SpecializationType name)
+            city: Город
+            description: Описание проблемы
+
+        Returns:
+            Result с созданным запросом или ошибкой
+        """
+        if not self._redis.is_connected or self._listener is None:
+            return Result.fail("Emergency dispatch is temporarily unavailable")
+
+        request = EmergencyRequest(
+            id=uuid4(),
+            client_id=client_id,
+            specialization=specialization,
+            city=normalize_city(city),
+            description=description,
+            status=EmergencyRequestStatus.SEARCHING,
+            created_at=datetime.now(timezone.utc),
+        )
+        request_id = str(request.id)
+
+        try:
+            async with self._redis.client.pipeline(transaction=True) as pipe:
+                pipe.hset(
+                    _request_key(request_id),
+                    mapping={
+                        "client_id": str(client_id),
+                        "specialization": specialization,
+                        "city": request.city,
+                        "description": description,
+                        "status": request.status.value,
+                        "created_at": request.created_at.isoformat(),
+                    },
+                )
+                pipe.expire(_request_key(request_id), self._request_ttl)
+                await pipe.execute()
+        except RedisError as e:
+            logger.error(f"Failed to create emergency request: {e}")
+            return Result.fail("Emergency dispatch is temporarily unavailable")
+
+        task = asyncio.create_task(
+            self._dispatch(request_id, pool_key(specialization, request.city)),
+            name=f"emergency-dispatch-{request_id}",
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return Result.ok(request)
+
+    async def get_request(self, request_id: UUID) -> Optional[EmergencyRequest]:
+        """
+        Получает запрос по ID.
+
+        Args:
+            request_id: ID запроса
+
+        Returns:
+            EmergencyRequest или None
+        """
+        if not self._redis.is_connected:
+            return None
+        data = await self._redis.client.hgetall(_request_key(str(request_id)))
+        return self._to_request(str(request_id), data) if data else None
+
+    async def get_offer(self, lawyer_user_id: UUID) -> Optional[EmergencyOffer]:
+        """
+        Получает текущее предложение юристу.
+
+        Args:
+            lawyer_user_id: ID пользователя юриста
+
+        Returns:
+            EmergencyOffer или None
+        """
+        if not self._redis.is_connected:
+            return None
+
+        client = self._redis.client
+        lawyer_id = await client.get(_user_key(str(lawyer_user_id)))
+        if lawyer_id is None:
+            return None
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(_hold_key(lawyer_id))
+            pipe.pttl(_hold_key(lawyer_id))
+            hold, ttl_ms = await pipe.execute()
+
+        if not hold or not hold.startswith("offer:"):
+            return None
+
+        request = await self.get_request(UUID(hold.removeprefix("offer:")))
+        if request is None or request.status != EmergencyRequestStatus.SEARCHING:
+            return None
+
+        return EmergencyOffer(request=request, expires_in_ms=max(ttl_ms, 0))
+
+    async def claim(
+        self,
+        request_id: UUID,
+        lawyer_user_id: UUID,
+    ) -> Result[EmergencyAssignment]:
+        """
+        Атомарно захватывает запрос (первый принявший юрист).
+
+        Args:
+            request_id: ID запроса
+            lawyer_user_id: ID пользователя юриста
+
+        Returns:
+            Result с назначением или ошибкой
+        """
+        if not self._redis.is_connected:
+            return Result.fail("Emergency dispatch is temporarily unavailable")
+
+        client = self._redis.client
+        lawyer_id = await client.get(_user_key(str(lawyer_user_id)))
+        if lawyer_id is None:
+            return Result.fail("Lawyer is not accepting emergency consultations")
+
+        assigned_at = datetime.now(timezone.utc)
+        code = await self._script("claim", CLAIM_SCRIPT)(
+            keys=[_request_key(str(request_id)), _hold_key(lawyer_id)],
+            args=[
+                str(request_id),
+                lawyer_id,
+                assigned_at.isoformat(),
+                self._assignment_hold_ms,
+                EVENTS_CHANNEL,
+            ],
+        )
+        if code == -1:
+            return Result.fail("Emergency request not found")
+        if code == 0:
+            return Result.fail("Emergency request is already assigned or closed")
+        if code == -2:
+            return Result.fail("No active offer for this lawyer")
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(_request_key(str(request_id)))
+            pipe.hget(_lawyer_key(lawyer_id), "price")
+            data, price = await pipe.execute()
+
+        request = self._to_request(str(request_id), data)
+        EMERGENCY_TIME_TO_ASSIGNMENT.observe(
+            max(request.time_to_assignment.total_seconds(), 0.0)
+        )
+
+        return Result.ok(
+            EmergencyAssignment(
+                request=request,
+                lawyer_id=UUID(lawyer_id),
+                price_amount=Decimal(price or "0"),
+            )
+        )
+
+    async def decline(self, request_id: UUID, lawyer_user_id: UUID) -> bool:
+        """
+        Отклоняет предложение (юрист освобождается сразу).
+
+        Args:
+            request_id: ID запроса
+            lawyer_user_id: ID пользователя юриста
+
+        Returns:
+            True если предложение было активно
+        """
+        if not self._redis.is_connected:
+            return False
+
+        client = self._redis.client
+        lawyer_id = await client.get(_user_key(str(lawyer_user_id)))
+        if lawyer_id is None:
+            return False
+
+        released = await self._script("release", RELEASE_SCRIPT)(
+            keys=[_hold_key(lawyer_id)],
+            args=[f"offer:{request_id}"],
+        )
+        if released:
+            # Если отклонили все получившие предложение - следующая волна сразу
+            await client.publish(EVENTS_CHANNEL, f"{request_id}:declined")
+        return bool(released)
+
+    async def complete_assignment(
+        self,
+        request_id: UUID,
+        consultation_id: Optional[UUID],
+    ) -> None:
+        """
+        Фиксирует результат назначения.
+
+        Args:
+            request_id: ID запроса
+            consultation_id: ID созданной консультации (None - запрос FAILED,
+                юрист освобождается)
+        """
+        client = self._redis.client
+        key = _request_key(str(request_id))
+
+        if consultation_id is not None:
+            await client.hset(key, "consultation_id", str(consultation_id))
+            return
+
+        lawyer_id = await client.hget(key, "lawyer_id")
+        await self._script("transition", TRANSITION_SCRIPT)(
+            keys=[key],
+            args=[EmergencyRequestStatus.ASSIGNED.value, EmergencyRequestStatus.FAILED.value],
+        )
+        if lawyer_id:
+            await self._script("release", RELEASE_SCRIPT)(
+                keys=[_hold_key(lawyer_id)],
+                args=[f"assigned:{request_id}"],
+            )
+
+    async def release_lawyer(self, lawyer_user_id: str) -> None:
+        """
+        Освободить юриста после завершения или отмены экстренной консультации.
+
+        Args:
+            lawyer_user_id: ID пользователя юриста (consultations.lawyer_id)
+        """
+        if not self._redis.is_connected:
+            return
+        lawyer_id = await self._redis.client.get(_user_key(str(lawyer_user_id)))
+        if lawyer_id is None:
+            return
+        hold = await self._redis.client.get(_hold_key(lawyer_id))
+        if hold and hold.startswith("assigned:"):
+            await self._script("release", RELEASE_SCRIPT)(
+                keys=[_hold_key(lawyer_id)], args=[hold]
+            )
+
+    # ========== Dispatch loop ==========
+
+    async def _dispatch(self, request_id: str, pool: str) -> None:
+        """Волны предложений до захвата запроса или истечения времени поиска."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._search_timeout
+        waiter = asyncio.Event()
+        self._waiters[request_id] = waiter
+        offered: List[str] = []
+        outcome = EmergencyRequestStatus.EXPIRED.value
+
+        try:
+            status = EmergencyRequestStatus.SEARCHING.value
+            while status == EmergencyRequestStatus.SEARCHING.value and loop.time() < deadline:
+                wave = await self._script("offer", OFFER_SCRIPT)(
+                    keys=[pool, _request_key(request_id), _offered_key(request_id)],
+                    args=[
+                        request_id,
+                        self._offer_fanout,
+                        int(self._offer_timeout * 1000),
+                        HOLD_PREFIX,
+                        self._scan_limit,
+                    ],
+                )
+                if wave:
+                    offered.extend(wave)
+                    EMERGENCY_OFFERS.inc(len(wave))
+                    await self._redis.client.publish(
+                        OFFERS_CHANNEL,
+                        json.dumps({"request_id": request_id, "lawyer_ids": wave}),
+                    )
+                    wave_deadline = min(deadline, loop.time() + self._offer_timeout)
+                else:
+                    # Свободных юристов нет - ждем, пока кто-то освободится
+                    wave_deadline = min(deadline, loop.time() + self._retry_interval)
+
+                status = await self._wait_wave(request_id, wave, waiter, wave_deadline)
+
+            if status == EmergencyRequestStatus.SEARCHING.value:
+                expired = await self._script("transition", TRANSITION_SCRIPT)(
+                    keys=[_request_key(request_id)],
+                    args=[status, EmergencyRequestStatus.EXPIRED.value],
+                )
+                if not expired:
+                    # Захват произошел в последний момент
+                    status = await self._redis.client.hget(_request_key(request_id), "status")
+            outcome = status or EmergencyRequestStatus.EXPIRED.value
+        except asyncio.CancelledError:
+            await self._expire_quietly(request_id)
+            raise
+        except Exception:
+            logger.exception(f"Emergency dispatch failed for request {request_id}")
+            await self._expire_quietly(request_id)
+        finally:
+            self._waiters.pop(request_id, None)
+            EMERGENCY_DISPATCH_OUTCOMES.labels(outcome=outcome).inc()
+            if offered:
+                try:
+                    await self._script("release", RELEASE_SCRIPT)(
+                        keys=[_hold_key(lawyer_id) for lawyer_id in offered],
+                        args=[f"offer:{request_id}"],
+                    )
+                except RedisError as e:
+                    logger.warning(f"Failed to release emergency offers: {e}")
+
+    async def _wait_wave(
+        self,
+        request_id: str,
+        wave: Sequence[str],
+        waiter: asyncio.Event,
+        wave_deadline: float,
+    ) -> Optional[str]:
+        """
+        Ждать захвата, отклонения всей волны или таймаута волны.
+
+        Returns:
+            Текущий статус запроса
+        """
+        loop = asyncio.get_running_loop()
+        client = self._redis.client
+        pending_offer = f"offer:{request_id}"
+
+        while True:
+            # Сбрасываем до чтения состояния, чтобы не пропустить публикацию
+            waiter.clear()
+            status = await client.hget(_request_key(request_id), "status")
+            if status != EmergencyRequestStatus.SEARCHING.value:
+                return status
+
+            if wave:
+                holds = await client.mget([_hold_key(lawyer_id) for lawyer_id in wave])
+                if pending_offer not in holds:
+                    return status
+
+            remaining = wave_deadline - loop.time()
+            if remaining <= 0:
+                return status
+            try:
+                await asyncio.wait_for(waiter.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return status
+
+    async def _expire_quietly(self, request_id: str) -> None:
+        try:
+            await self._script("transition", TRANSITION_SCRIPT)(
+                keys=[_request_key(request_id)],
+                args=[
+                    EmergencyRequestStatus.SEARCHING.value,
+                    EmergencyRequestStatus.EXPIRED.value,
+                ],
+            )
+        except (RedisError, RuntimeError) as e:
+            logger.warning(f"Failed to expire emergency request {request_id}: {e}")
+
+    @staticmethod
+    def _to_request(request_id: str, data: Dict[str, str]) -> EmergencyRequest:
+        return EmergencyRequest(
+            id=UUID(request_id),
+            client_id=UUID(data["client_id"]),
+            specialization=data["specialization"],
+            city=data["city"],
+            description=data["description"],
+            status=EmergencyRequestStatus(data["status"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            lawyer_id=UUID(data["lawyer_id"]) if data.get("lawyer_id") else None,
+            consultation_id=(
+                UUID(data["consultation_id"]) if data.get("consultation_id") else None
+            ),
+            assigned_at=(
+                datetime.fromisoformat(data["assigned_at"]) if data.get("assigned_at") else None
+            ),
+        )
+
+
+# Глобальные экземпляры
+emergency_pool = EmergencyLawyerPool()
+emergency_dispatcher = RedisEmergencyDispatcher(
+    offer_fanout=settings.emergency_offer_fanout,
+    offer_timeout_seconds=settings.emergency_offer_timeout_seconds,
+    search_timeout_seconds=settings.emergency_search_timeout_seconds,
+    assignment_hold_minutes=settings.emergency_assignment_hold_minutes,
+)
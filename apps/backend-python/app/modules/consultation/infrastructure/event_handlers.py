@@ -0,0 +1,124 @@
+"""
+Consultation Event Handlers
+
+Подписчики Consultation Module на доменные события (доставляются через outbox).
+"""
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.infrastructure.database import async_session_factory
+from app.core.infrastructure.event_bus import EventBus, EventEnvelope
+from app.modules.consultation.infrastructure.availability import availability_cache
+from app.modules.consultation.infrastructure.emergency_dispatcher import (
+    emergency_dispatcher,
+    emergency_pool,
+)
+from app.modules.consultation.infrastructure.lawyer_stats import (
+    find_lawyer_by_payment,
+    lawyer_stats_cache,
+)
+from app.modules.lawyer.infrastructure.persistence.models import LawyerModel
+
+
+async def consultation_lawyer_id(event: EventEnvelope) -> Optional[str]:
+    """
+    ID юриста как в consultations.lawyer_id (ID пользователя) из события.
+
+    События консультаций содержат его напрямую, события юриста - lawyers.id,
+    он переводится через lawyers.user_id.
+    """
+    lawyer_id = event.payload.get("lawyer_id")
+    if not lawyer_id or event.aggregate_type != "Lawyer":
+        return lawyer_id
+
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(LawyerModel.user_id).where(LawyerModel.id == str(lawyer_id))
+        )
+        return result.scalar_one_or_none()
+
+
+async def invalidate_lawyer_availability(event: EventEnvelope) -> None:
+    """Сбросить кеш свободных слотов юриста после изменения его расписания."""
+    lawyer_id = await consultation_lawyer_id(event)
+    if lawyer_id:
+        await availability_cache.invalidate(lawyer_id)
+
+
+async def sync_emergency_pool(event: EventEnvelope) -> None:
+    """Обновить юриста в пуле экстренных консультаций."""
+    lawyer_id = event.payload.get("lawyer_id")
+    if lawyer_id:
+        await emergency_pool.sync_lawyer(lawyer_id)
+
+
+async def release_emergency_lawyer(event: EventEnvelope) -> None:
+    """Освободить юриста для новых экстренных запросов."""
+    # lawyer_id консультации - ID пользователя юриста
+    lawyer_id = event.payload.get("lawyer_id")
+    if lawyer_id:
+        await emergency_dispatcher.release_lawyer(lawyer_id)
+
+
+async def invalidate_lawyer_stats(event: EventEnvelope) -> None:
+    """Сбросить кеш статистики юриста после изменения его консультации."""
+    lawyer_id = event.payload.get("lawyer_id")
+    if lawyer_id:
+        await lawyer_stats_cache.invalidate(lawyer_id)
+
+
+async def invalidate_lawyer_stats_by_payment(event: EventEnvelope) -> None:
+    """Сбросить кеш статистики юриста после изменения платежа за консультацию."""
+    payment_id = event.payload.get("payment_id")
+    if not payment_id:
+        return
+    lawyer_id = await find_lawyer_by_payment(payment_id)
+    if lawyer_id:
+        await lawyer_stats_cache.invalidate(lawyer_id)
+
+
+def register_event_handlers(bus: EventBus) -> None:
+    """
+    Зарегистрировать подписчиков Consultation Module.
+
+    Args:
+        bus: Event bus
+    """
+    # Бронирование занимает слот, отмена и завершение - освобождают
+    bus.subscribe("ConsultationBookedEvent", invalidate_lawyer_availability)
+    bus.subscribe("ConsultationCancelledEvent", invalidate_lawyer_availability)
+    bus.subscribe("ConsultationCompletedEvent", invalidate_lawyer_availability)
+    # Юрист перестал (или снова начал) принимать консультации: слоты
+    # показываются только верифицированным и доступным юристам
+    for event_name in (
+        "LawyerAvailabilityUpdatedEvent",
+        "LawyerVerifiedEvent",
+        "LawyerRejectedEvent",
+        "LawyerSuspendedEvent",
+    ):
+        bus.subscribe(event_name, invalidate_lawyer_availability)
+
+    # Пул экстренных консультаций (профиль - цена в пуле)
+    for event_name in (
+        "LawyerAvailabilityUpdatedEvent",
+        "LawyerVerifiedEvent",
+        "LawyerProfileUpdatedEvent",
+        "LawyerRejectedEvent",
+        "LawyerSuspendedEvent",
+    ):
+        bus.subscribe(event_name, sync_emergency_pool)
+    bus.subscribe("ConsultationCancelledEvent", release_emergency_lawyer)
+    bus.subscribe("ConsultationCompletedEvent", release_emergency_lawyer)
+
+    # Статистика юриста: любая смена статуса консультации и заработка
+    for event_name in (
+        "ConsultationBookedEvent",
+        "ConsultationConfirmedEvent",
+        "ConsultationStartedEvent",
+        "ConsultationCompletedEvent",
+        "ConsultationCancelledEvent",
+    ):
+        bus.subscribe(event_name, invalidate_lawyer_stats)
+    bus.subscribe("PaymentSucceededEvent", invalidate_lawyer_stats_by_payment)
+    bus.subscribe("PaymentRefundedEvent", invalidate_lawyer_stats_by_payment)
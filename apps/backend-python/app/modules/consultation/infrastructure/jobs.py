@@ -0,0 +1,43 @@
+"""
+Consultation Background Jobs
+
+Фоновые задачи Consultation Module.
+"""
+import logging
+
+from app.config import settings
+from app.core.infrastructure.database import async_session_factory
+from app.core.infrastructure.jobs import JobPriority, JobQueue, job
+from app.modules.consultation.infrastructure.lawyer_rating import (
+    LawyerRatingAggregatorImpl,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@job(queue=JobQueue.IO, priority=JobPriority.LOW)
+async def backfill_lawyer_ratings_job(after_id: str = "") -> None:
+    """
+    Пересчитывает агрегаты оценок юристов из истории консультаций.
+
+    Обрабатывает одну пачку юристов (settings.scheduler_chunk_size) в
+    отдельной транзакции и ставит в очередь следующую, поэтому задача не
+    держит блокировки долго и продолжается с курсора после сбоя.
+
+    Запуск: `backfill_lawyer_ratings_job.enqueue()`
+
+    Args:
+        after_id: Курсор - ID последнего обработанного юриста
+    """
+    async with async_session_factory() as session:
+        async with session.begin():
+            aggregator = LawyerRatingAggregatorImpl(session)
+            cursor = await aggregator.recompute_chunk(
+                after_id=after_id, limit=settings.scheduler_chunk_size
+            )
+
+    if cursor is None:
+        logger.info("Lawyer ratings backfill finished")
+        return
+
+    backfill_lawyer_ratings_job.enqueue(after_id=cursor)
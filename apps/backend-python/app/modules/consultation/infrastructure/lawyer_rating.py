@@ -0,0 +1,137 @@
+"""
+Lawyer Rating Infrastructure
+
+Инкрементальный агрегат оценок юриста в таблице lawyers.
+
+Агрегат хранит сумму оценок, количество и распределение по звездам
+(rating_sum, reviews_count, rating_histogram); средний рейтинг (rating)
+пересчитывается из них в том же UPDATE. Новая оценка не требует чтения
+консультаций юриста - только атомарный инкремент строки lawyers.
+
+consultations.lawyer_id - ID пользователя юриста, поэтому строка lawyers
+ищется по lawyers.user_id.
+"""
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Numeric, cast, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.consultation.domain import ILawyerRatingAggregator
+from app.modules.consultation.infrastructure.persistence.models import ConsultationModel
+from app.modules.lawyer.infrastructure.persistence.models import LawyerModel
+
+STARS = range(1, 6)
+
+
+class LawyerRatingAggregatorImpl(ILawyerRatingAggregator):
+    """
+    Агрегат оценок юриста (атомарные инкременты и пересчет пачками).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(self, lawyer_id: UUID, rating: int) -> None:
+        """
+        Учитывает новую оценку одним UPDATE.
+
+        Правые части SET вычисляются по значениям строки до обновления,
+        поэтому средний рейтинг считается от уже увеличенных суммы и
+        количества явно. Конкурентные оценки сериализуются блокировкой строки.
+
+        Args:
+            lawyer_id: ID юриста (consultations.lawyer_id - ID пользователя)
+            rating: Оценка от 1 до 5
+        """
+        stars = LawyerModel.rating_histogram[rating]
+        stmt = (
+            update(LawyerModel)
+            .where(LawyerModel.user_id == str(lawyer_id))
+            .values(
+                {
+                    LawyerModel.rating_sum: LawyerModel.rating_sum + rating,
+                    LawyerModel.reviews_count: LawyerModel.reviews_count + 1,
+                    stars: stars + 1,
+                    LawyerModel.rating: func.round(
+                        cast(LawyerModel.rating_sum + rating, Numeric)
+                        / (LawyerModel.reviews_count + 1),
+                        1,
+                    ),
+                }
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
+
+    async def recompute_chunk(self, after_id: str, limit: int) -> Optional[str]:
+        """
+        Пересчитывает агрегаты пачки юристов из истории оценок.
+
+        Строки юристов блокируются до подсчета: оценка, сохраненная
+        конкурентно, либо уже видна подсчету, либо ждет блокировку и
+        применяет свой инкремент поверх пересчитанного значения.
+
+        Args:
+            after_id: Курсор - ID последнего юриста предыдущей пачки
+            limit: Размер пачки
+
+        Returns:
+            Курсор для следующей пачки или None, если юристы закончились
+        """
+        result = await self._session.execute(
+            select(LawyerModel.id, LawyerModel.user_id)
+            .where(LawyerModel.id > after_id)
+            .order_by(LawyerModel.id)
+            .limit(limit)
+            .with_for_update()
+        )
+        lawyers: List[Tuple[str, str]] = [tuple(row) for row in result.all()]
+        if not lawyers:
+            return None
+
+        rating = ConsultationModel.rating
+        result = await self._session.execute(
+            select(
+                ConsultationModel.lawyer_id,
+                func.sum(rating),
+                *[func.count().filter(rating == star) for star in STARS],
+            )
+            .where(
+                ConsultationModel.lawyer_id.in_([UUID(user_id) for _, user_id in lawyers]),
+                rating.is_not(None),
+            )
+            .group_by(ConsultationModel.lawyer_id)
+        )
+        stats: Dict[str, tuple] = {
+            str(lawyer_id): (int(rating_sum), list(histogram))
+            for lawyer_id, rating_sum, *histogram in result.all()
+        }
+
+        rows = []
+        for lawyer_id, user_id in lawyers:
+            rating_sum, histogram = stats.get(user_id, (0, [0] * len(STARS)))
+            reviews_count = sum(histogram)
+            rows.append(
+                {
+                    "id": lawyer_id,
+                    "rating_sum": rating_sum,
+                    "reviews_count": reviews_count,
+                    "rating_histogram": histogram,
+                    "rating": _average(rating_sum, reviews_count),
+                }
+            )
+        # ORM bulk UPDATE по первичному ключу (executemany)
+        await self._session.execute(update(LawyerModel), rows)
+
+        return lawyers[-1][0]
+
+
+def _average(rating_sum: int, reviews_count: int) -> Optional[Decimal]:
+    """Средний рейтинг с округлением как у round() в PostgreSQL."""
+    if reviews_count == 0:
+        return None
+    return (Decimal(rating_sum) / reviews_count).quantize(
+        Decimal("0.1"), rounding=ROUND_HALF_UP
+    )
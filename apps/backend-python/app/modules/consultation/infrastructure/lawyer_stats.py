@@ -0,0 +1,112 @@
+"""
+Lawyer Stats Infrastructure
+
+Redis кеш статистики юриста (дашборд).
+
+Инвалидация - через версию юриста (VersionedRedisCache): подписчики на
+события консультаций и платежей увеличивают ее.
+"""
+from datetime import timedelta
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.core.infrastructure.cache import RedisClient, redis_client
+from app.core.infrastructure.database import async_session_factory
+from app.modules.consultation.application.dtos import LawyerStatsDTO
+from app.modules.consultation.application.queries import ILawyerStatsCache
+from app.modules.consultation.infrastructure.persistence.models import ConsultationModel
+from app.modules.consultation.infrastructure.versioned_cache import VersionedRedisCache
+from app.modules.payment.infrastructure.persistence.models import PaymentModel
+
+
+class RedisLawyerStatsCache(ILawyerStatsCache):
+    """
+    Кеш статистики юриста в Redis.
+
+    Ключи:
+    - lawyer_stats:version:{lawyer_id} - версия статистики юриста
+    - lawyer_stats:{lawyer_id}:v{version} - статистика
+    """
+
+    KEY_PREFIX = "lawyer_stats"
+
+    def __init__(self, redis: RedisClient, ttl: timedelta):
+        """
+        Args:
+            redis: Redis клиент
+            ttl: Время жизни записей статистики
+        """
+        self._cache = VersionedRedisCache(redis, self.KEY_PREFIX, ttl)
+
+    def _stats_key(self, lawyer_id: UUID, version: str) -> str:
+        return f"{self.KEY_PREFIX}:{lawyer_id}:v{version}"
+
+    async def get(self, lawyer_id: UUID) -> Tuple[Optional[LawyerStatsDTO], Optional[str]]:
+        """
+        Получает закешированную статистику (2 round trip: версия + данные).
+
+        Args:
+            lawyer_id: ID юриста
+
+        Returns:
+            Кортеж (статистика или None, версия юриста)
+        """
+        values, versions = await self._cache.read([lawyer_id], self._stats_key)
+        value = values.get(lawyer_id)
+        stats = LawyerStatsDTO.model_validate_json(value) if value is not None else None
+        return stats, versions.get(lawyer_id)
+
+    async def set(self, lawyer_id: UUID, stats: LawyerStatsDTO, version: Optional[str]) -> None:
+        """
+        Сохраняет статистику под версией, прочитанной до расчета.
+
+        Args:
+            lawyer_id: ID юриста
+            stats: Статистика
+            version: Версия из get
+        """
+        if version is None:
+            return
+        await self._cache.write({self._stats_key(lawyer_id, version): stats.model_dump_json()})
+
+    async def invalidate(self, lawyer_id: UUID | str) -> None:
+        """
+        Инвалидирует статистику юриста (увеличивает версию).
+
+        Args:
+            lawyer_id: ID юриста
+        """
+        await self._cache.invalidate(lawyer_id)
+
+
+async def find_lawyer_by_payment(payment_id: UUID | str) -> Optional[UUID]:
+    """
+    Находит юриста консультации, за которую был платеж.
+
+    События платежей не содержат lawyer_id, поэтому для инвалидации
+    статистики юрист определяется по консультации платежа.
+
+    Args:
+        payment_id: ID платежа
+
+    Returns:
+        ID юриста или None (платеж не за консультацию)
+    """
+    stmt = (
+        select(ConsultationModel.lawyer_id)
+        .join(PaymentModel, PaymentModel.consultation_id == ConsultationModel.id)
+        .where(PaymentModel.id == UUID(str(payment_id)))
+    )
+    async with async_session_factory() as session:
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+
+# Глобальный кеш статистики юристов
+lawyer_stats_cache = RedisLawyerStatsCache(
+    redis_client,
+    ttl=timedelta(seconds=settings.lawyer_stats_cache_ttl_seconds),
+)
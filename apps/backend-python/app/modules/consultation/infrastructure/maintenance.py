@@ -0,0 +1,69 @@
+"""
+Consultation Maintenance Jobs
+
+Периодические задачи обслуживания Consultation Module.
+"""
+import logging
+from datetime import datetime, timedelta
+
+from app.config import settings
+from app.core.infrastructure.database import async_session_factory
+from app.core.infrastructure.scheduler import Scheduler, run_in_chunks
+from app.modules.consultation.infrastructure.emergency_dispatcher import emergency_pool
+from app.modules.consultation.infrastructure.persistence.repositories import (
+    ConsultationRepositoryImpl,
+)
+
+logger = logging.getLogger(__name__)
+
+AUTO_CANCEL_REASON = "Автоматическая отмена: юрист не подтвердил консультацию вовремя"
+
+
+async def cancel_stale_consultations() -> int:
+    """
+    Автоматически отменить pending консультации, которые юрист не подтвердил.
+
+    Returns:
+        Количество отмененных консультаций
+    """
+    chunk_size = settings.scheduler_chunk_size
+    created_before = datetime.utcnow() - timedelta(
+        minutes=settings.consultation_pending_timeout_minutes
+    )
+
+    async def process_chunk() -> int:
+        async with async_session_factory() as session:
+            async with session.begin():
+                repository = ConsultationRepositoryImpl(session)
+                consultations = await repository.find_stale_pending(
+                    created_before=created_before, limit=chunk_size
+                )
+                for consultation in consultations:
+                    result = consultation.cancel(reason=AUTO_CANCEL_REASON, cancelled_by="system")
+                    if result.is_success:
+                        await repository.save(consultation)
+                    else:
+                        logger.warning(f"Cannot cancel consultation {consultation.id}: {result.error}")
+                return len(consultations)
+
+    return await run_in_chunks(process_chunk, chunk_size, settings.scheduler_max_chunks)
+
+
+async def rebuild_emergency_pool() -> int:
+    """
+    Перестроить пул экстренных консультаций из БД.
+
+    Returns:
+        Количество юристов в пуле
+    """
+    return await emergency_pool.rebuild()
+
+
+def register_maintenance_jobs(scheduler: Scheduler) -> None:
+    """Зарегистрировать периодические задачи Consultation Module."""
+    scheduler.register(
+        "consultation.cancel-stale-pending", "*/10 * * * *", cancel_stale_consultations
+    )
+    scheduler.register(
+        "consultation.rebuild-emergency-pool", "*/5 * * * *", rebuild_emergency_pool
+    )
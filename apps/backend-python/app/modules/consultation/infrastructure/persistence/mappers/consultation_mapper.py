@@ -5,6 +5,8 @@ Mapper для конвертации между Domain Entity и ORM Model.
 """
 from typing import Optional
 
+from sqlalchemy.dialects.postgresql import Range
+
 from app.modules.consultation.domain import (
     Consultation,
     ConsultationStatus,
@@ -20,6 +22,21 @@ class ConsultationMapper:
     Mapper для конвертации Consultation Entity <-> ConsultationModel.
     """
 
+    @staticmethod
+    def to_slot(time_slot: Optional[TimeSlot]) -> Optional[Range]:
+        """
+        Конвертирует TimeSlot в полуоткрытый интервал [start, end).
+
+        Args:
+            time_slot: Временной слот консультации
+
+        Returns:
+            Range для колонки slot или None
+        """
+        if time_slot is None:
+            return None
+        return Range(time_slot.start_time, time_slot.end_time, bounds="[)")
+
     @staticmethod
     def to_domain(model: ConsultationModel) -> Consultation:
         """
@@ -55,8 +72,9 @@ class ConsultationMapper:
         consultation._description = model.description
         consultation._price = price
         consultation._time_slot = time_slot
-        consultation._actual_start = model.actual_start
-        consultation._actual_end = model.actual_end
+        consultation._confirmed_at = None
+        consultation._started_at = model.actual_start
+        consultation._completed_at = model.actual_end
         consultation._rating = model.rating
         consultation._review = model.review
         consultation._cancellation_reason = model.cancellation_reason
@@ -94,6 +112,7 @@ class ConsultationMapper:
             duration_minutes=(
                 entity.time_slot.duration_minutes if entity.time_slot else None
             ),
+            slot=ConsultationMapper.to_slot(entity.time_slot),
             actual_start=entity.actual_start,
             actual_end=entity.actual_end,
             rating=entity.rating,
@@ -125,6 +144,7 @@ class ConsultationMapper:
         model.duration_minutes = (
             entity.time_slot.duration_minutes if entity.time_slot else None
         )
+        model.slot = ConsultationMapper.to_slot(entity.time_slot)
         model.actual_start = entity.actual_start
         model.actual_end = entity.actual_end
         model.rating = entity.rating
@@ -16,8 +16,13 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     Index,
+    text,
+)
+from sqlalchemy.dialects.postgresql import (
+    UUID as PG_UUID,
+    TSTZRANGE,
+    ExcludeConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from app.core.infrastructure.database import Base
 from app.modules.consultation.domain import (
@@ -65,6 +70,9 @@ class ConsultationModel(Base):
     # Scheduled Time (for scheduled consultations)
     scheduled_start = Column(DateTime(timezone=True), nullable=True, index=True)
     duration_minutes = Column(Integer, nullable=True)
+    # Интервал [scheduled_start, scheduled_start + duration) для GiST индекса
+    # и exclusion constraint (заполняется маппером)
+    slot = Column(TSTZRANGE, nullable=True)
 
     # Actual Time (for tracking)
     actual_start = Column(DateTime(timezone=True), nullable=True)
@@ -97,6 +105,22 @@ class ConsultationModel(Base):
             "lawyer_id",
             "scheduled_start",
         ),
+        # Юрист не может иметь две пересекающиеся консультации в
+        # незавершенных статусах - гарантируется на уровне БД
+        ExcludeConstraint(
+            ("lawyer_id", "="),
+            ("slot", "&&"),
+            name="excl_consultations_lawyer_slot",
+            using="gist",
+            where=text("status IN ('pending', 'confirmed', 'active')"),
+        ),
+        # Юрист ведет не больше одной активной консультации
+        Index(
+            "uq_consultations_lawyer_active",
+            "lawyer_id",
+            unique=True,
+            postgresql_where=text("status = 'active'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -3,23 +3,52 @@ Consultation Repository Implementation
 
 Реализация репозитория консультаций с использованием SQLAlchemy.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
+from decimal import Decimal
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, literal, exists, update
+from sqlalchemy.dialects.postgresql import Range, TSTZRANGE
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.infrastructure.outbox import record_events
 from app.modules.consultation.domain import (
     Consultation,
     ConsultationStatusEnum,
+    ConsultationTransition,
     IConsultationRepository,
+    LawyerStats,
+    ScheduleConflictError,
 )
 from app.modules.consultation.infrastructure.persistence.models import ConsultationModel
+from app.modules.payment.domain import PaymentStatusEnum
+from app.modules.payment.infrastructure.persistence.models import PaymentModel
 from app.modules.consultation.infrastructure.persistence.mappers import (
     ConsultationMapper,
 )
 
+# Exclusion constraint, запрещающий пересечение слотов юриста
+SLOT_EXCLUSION_CONSTRAINT = "excl_consultations_lawyer_slot"
+
+# Частичный уникальный индекс: одна активная консультация у юриста
+SINGLE_ACTIVE_INDEX = "uq_consultations_lawyer_active"
+
+# Поля времени перехода -> колонки
+TRANSITION_TIMESTAMP_COLUMNS = {
+    "started_at": "actual_start",
+    "completed_at": "actual_end",
+}
+
+# Статусы, в которых консультация занимает слот юриста
+SLOT_HOLDING_STATUSES = (
+    ConsultationStatusEnum.PENDING,
+    ConsultationStatusEnum.CONFIRMED,
+    ConsultationStatusEnum.ACTIVE,
+)
+
 
 class ConsultationRepositoryImpl(IConsultationRepository):
     """
@@ -41,21 +70,38 @@ class ConsultationRepositoryImpl(IConsultationRepository):
 
         Returns:
             Сохраненная консультация
+
+        Raises:
+            ScheduleConflictError: Слот пересекается с другой консультацией юриста
         """
         # Проверяем, существует ли консультация в БД
         stmt = select(ConsultationModel).where(ConsultationModel.id == consultation.id)
         result = await self._session.execute(stmt)
         existing_model = result.scalar_one_or_none()
 
-        if existing_model:
-            # Обновляем существующую модель
-            self._mapper.update_model(consultation, existing_model)
-        else:
-            # Создаем новую модель
-            new_model = self._mapper.to_model(consultation)
-            self._session.add(new_model)
-
-        await self._session.flush()
+        # Изменения вносятся и flush выполняется внутри savepoint: begin_nested()
+        # сначала сбрасывает все pending изменения сессии, поэтому модель,
+        # добавленная до него, ушла бы в БД вне savepoint. Нарушение exclusion
+        # constraint откатывает только эту запись, а не всю транзакцию запроса
+        try:
+            async with self._session.begin_nested():
+                with self._session.no_autoflush:
+                    if existing_model:
+                        # Обновляем существующую модель
+                        self._mapper.update_model(consultation, existing_model)
+                    else:
+                        # Создаем новую модель
+                        new_model = self._mapper.to_model(consultation)
+                        self._session.add(new_model)
+
+                    # Доменные события - в outbox в той же транзакции
+                    record_events(self._session, consultation)
+
+                await self._session.flush()
+        except IntegrityError as e:
+            if SLOT_EXCLUSION_CONSTRAINT in str(e.orig):
+                raise ScheduleConflictError(consultation.lawyer_id) from e
+            raise
 
         # Получаем обновленную модель из БД
         stmt = select(ConsultationModel).where(ConsultationModel.id == consultation.id)
@@ -64,6 +110,113 @@ class ConsultationRepositoryImpl(IConsultationRepository):
 
         return self._mapper.to_domain(saved_model)
 
+    async def transition(
+        self,
+        consultation_id: UUID,
+        transition: ConsultationTransition,
+    ) -> Optional[Consultation]:
+        """
+        Атомарно переводит консультацию в новый статус (compare-and-set).
+
+        Args:
+            consultation_id: ID консультации
+            transition: Переход статуса
+
+        Returns:
+            Обновленная консультация или None, если условия перехода не выполнены
+        """
+        conditions = [
+            ConsultationModel.id == consultation_id,
+            ConsultationModel.status.in_(transition.allowed_from),
+        ]
+        if transition.lawyer_id is not None:
+            conditions.append(ConsultationModel.lawyer_id == transition.lawyer_id)
+        if transition.start_window_minutes is not None:
+            conditions.append(
+                or_(
+                    ConsultationModel.scheduled_start.is_(None),
+                    ConsultationModel.scheduled_start.between(
+                        func.now(),
+                        func.now() + timedelta(minutes=transition.start_window_minutes),
+                    ),
+                )
+            )
+        if transition.single_active:
+            other = aliased(ConsultationModel)
+            conditions.append(
+                ~exists().where(
+                    other.lawyer_id == ConsultationModel.lawyer_id,
+                    other.status == ConsultationStatusEnum.ACTIVE,
+                    other.id != ConsultationModel.id,
+                )
+            )
+
+        values = {"status": transition.target, "updated_at": func.now()}
+        if transition.timestamp:
+            values[TRANSITION_TIMESTAMP_COLUMNS[transition.timestamp]] = func.now()
+
+        stmt = (
+            update(ConsultationModel)
+            .where(and_(*conditions))
+            .values(**values)
+            .returning(ConsultationModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+
+        if transition.single_active:
+            # NOT EXISTS не видит параллельный старт; его отсекает уникальный
+            # индекс - в savepoint, чтобы не прерывать транзакцию запроса
+            try:
+                async with self._session.begin_nested():
+                    model = (await self._session.execute(stmt)).scalar_one_or_none()
+            except IntegrityError as e:
+                if SINGLE_ACTIVE_INDEX in str(e.orig):
+                    return None
+                raise
+        else:
+            model = (await self._session.execute(stmt)).scalar_one_or_none()
+
+        if model is None:
+            return None
+
+        consultation = self._mapper.to_domain(model)
+        consultation.record_transition(transition)
+        record_events(self._session, consultation)
+
+        return consultation
+
+    async def save_rating(self, consultation: Consultation) -> bool:
+        """
+        Сохраняет оценку консультации, если она еще не оценена.
+
+        Args:
+            consultation: Консультация с выставленной оценкой
+
+        Returns:
+            True, если оценка сохранена этим вызовом
+        """
+        stmt = (
+            update(ConsultationModel)
+            .where(
+                ConsultationModel.id == consultation.id,
+                ConsultationModel.status == ConsultationStatusEnum.COMPLETED,
+                ConsultationModel.rating.is_(None),
+            )
+            .values(
+                rating=consultation.rating,
+                review=consultation.review,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        if result.rowcount != 1:
+            consultation.clear_domain_events()
+            return False
+
+        record_events(self._session, consultation)
+        return True
+
     async def find_by_id(self, consultation_id: UUID) -> Optional[Consultation]:
         """
         Находит консультацию по ID.
@@ -231,6 +384,41 @@ class ConsultationRepositoryImpl(IConsultationRepository):
 
         return [self._mapper.to_domain(model) for model in models]
 
+    async def find_stale_pending(
+        self,
+        created_before: datetime,
+        limit: int = 100,
+    ) -> List[Consultation]:
+        """
+        Находит "зависшие" pending консультации для автоотмены.
+
+        Args:
+            created_before: Граница времени создания
+            limit: Максимальное количество результатов
+
+        Returns:
+            Список pending консультаций (строки заблокированы до конца транзакции)
+        """
+        stmt = (
+            select(ConsultationModel)
+            .where(
+                and_(
+                    ConsultationModel.status == ConsultationStatusEnum.PENDING,
+                    or_(
+                        ConsultationModel.created_at < created_before,
+                        ConsultationModel.scheduled_start < datetime.utcnow(),
+                    ),
+                )
+            )
+            .order_by(ConsultationModel.created_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+
+        return [self._mapper.to_domain(model) for model in models]
+
     async def find_scheduled_in_timeframe(
         self,
         lawyer_id: UUID,
@@ -250,38 +438,122 @@ class ConsultationRepositoryImpl(IConsultationRepository):
         Returns:
             Список консультаций в указанном диапазоне
         """
-        # Консультация конфликтует если:
-        # (scheduled_start < end_time) AND (scheduled_start + duration > start_time)
-        # Упрощенно: ищем консультации, которые начинаются в диапазоне или пересекаются
-        stmt = select(ConsultationModel).where(
-            and_(
-                ConsultationModel.lawyer_id == lawyer_id,
-                ConsultationModel.scheduled_start.isnot(None),
-                or_(
-                    ConsultationModel.status == ConsultationStatusEnum.PENDING,
-                    ConsultationModel.status == ConsultationStatusEnum.CONFIRMED,
-                    ConsultationModel.status == ConsultationStatusEnum.ACTIVE,
-                ),
-                # Проверка пересечения временных интервалов
-                ConsultationModel.scheduled_start < end_time,
-                # Для полной проверки нужно бы использовать scheduled_start + duration,
-                # но SQLAlchemy не поддерживает прямое сложение datetime + interval из колонки
-                # Поэтому делаем упрощенную проверку
+        # Один индексный запрос по GiST: slot && [start_time, end_time)
+        requested = literal(Range(start_time, end_time, bounds="[)"), TSTZRANGE)
+        stmt = (
+            select(ConsultationModel)
+            .where(
+                and_(
+                    ConsultationModel.lawyer_id == lawyer_id,
+                    ConsultationModel.status.in_(SLOT_HOLDING_STATUSES),
+                    ConsultationModel.slot.overlaps(requested),
+                )
             )
+            .order_by(ConsultationModel.scheduled_start.asc())
         )
         result = await self._session.execute(stmt)
         models = result.scalars().all()
 
-        # Дополнительная фильтрация в Python для точной проверки пересечения
-        consultations = []
-        for model in models:
-            domain = self._mapper.to_domain(model)
-            if domain.time_slot:
-                # Проверяем точное пересечение
-                if domain.time_slot.start_time < end_time and domain.time_slot.end_time > start_time:
-                    consultations.append(domain)
+        return [self._mapper.to_domain(model) for model in models]
+
+    async def find_busy_intervals(
+        self,
+        lawyer_ids: Sequence[UUID],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """
+        Находит занятые интервалы нескольких юристов одним запросом.
+
+        Args:
+            lawyer_ids: ID юристов
+            start_time: Начало диапазона
+            end_time: Конец диапазона
+
+        Returns:
+            Словарь lawyer_id -> отсортированный список интервалов [start, end)
+        """
+        intervals: Dict[UUID, List[Tuple[datetime, datetime]]] = {
+            lawyer_id: [] for lawyer_id in lawyer_ids
+        }
+        if not lawyer_ids:
+            return intervals
+
+        requested = literal(Range(start_time, end_time, bounds="[)"), TSTZRANGE)
+        stmt = (
+            select(
+                ConsultationModel.lawyer_id,
+                func.lower(ConsultationModel.slot),
+                func.upper(ConsultationModel.slot),
+            )
+            .where(
+                and_(
+                    ConsultationModel.lawyer_id.in_(list(lawyer_ids)),
+                    ConsultationModel.status.in_(SLOT_HOLDING_STATUSES),
+                    ConsultationModel.slot.overlaps(requested),
+                )
+            )
+            .order_by(ConsultationModel.lawyer_id, func.lower(ConsultationModel.slot))
+        )
+        result = await self._session.execute(stmt)
+
+        for lawyer_id, start, end in result.all():
+            intervals.setdefault(lawyer_id, []).append((start, end))
+
+        return intervals
+
+    async def get_lawyer_stats(self, lawyer_id: UUID) -> LawyerStats:
+        """
+        Получает статистику консультаций юриста одним запросом.
+
+        LEFT JOIN только успешных платежей, поэтому консультации без оплаты
+        тоже попадают в счетчики; count(DISTINCT) защищает от дублей,
+        если у консультации несколько платежей.
+
+        Args:
+            lawyer_id: ID юриста
+
+        Returns:
+            Статистика юриста
+        """
+        month_start = func.date_trunc("month", func.now())
+        stmt = (
+            select(
+                ConsultationModel.status,
+                func.count(ConsultationModel.id.distinct()),
+                func.coalesce(func.sum(PaymentModel.amount), 0),
+                func.coalesce(
+                    func.sum(PaymentModel.amount).filter(
+                        PaymentModel.processed_at >= month_start
+                    ),
+                    0,
+                ),
+            )
+            .outerjoin(
+                PaymentModel,
+                and_(
+                    PaymentModel.consultation_id == ConsultationModel.id,
+                    PaymentModel.status == PaymentStatusEnum.SUCCEEDED,
+                ),
+            )
+            .where(ConsultationModel.lawyer_id == lawyer_id)
+            .group_by(ConsultationModel.status)
+        )
+        result = await self._session.execute(stmt)
 
-        return consultations
+        status_counts = dict.fromkeys(ConsultationStatusEnum, 0)
+        earnings_total = Decimal("0")
+        earnings_month = Decimal("0")
+        for status, count, total, month in result.all():
+            status_counts[status] = count
+            earnings_total += Decimal(total)
+            earnings_month += Decimal(month)
+
+        return LawyerStats(
+            status_counts=status_counts,
+            earnings_total=earnings_total,
+            earnings_month=earnings_month,
+        )
 
     async def count_by_lawyer(
         self,
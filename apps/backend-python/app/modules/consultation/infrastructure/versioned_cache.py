@@ -0,0 +1,124 @@
+"""
+Versioned Redis Cache
+
+Общая логика кешей с инвалидацией через версию (слоты, статистика юриста).
+
+Ключ записи содержит текущую версию сущности, инвалидация увеличивает
+версию (INCR). Расчет, начатый до события, записывается под старой
+версией и никогда не читается; старые записи истекают по TTL.
+"""
+import logging
+from datetime import timedelta
+from typing import Callable, Dict, Hashable, Mapping, Sequence, Tuple, TypeVar
+
+from redis.exceptions import RedisError
+
+from app.core.infrastructure.cache import RedisClient
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+
+
+class VersionedRedisCache:
+    """
+    Кеш в Redis с версией на сущность.
+
+    Ключи:
+    - {prefix}:version:{entity_id} - версия сущности (без TTL: сброс в 0
+      мог бы "оживить" старые записи)
+    - ключи записей строит вызывающий по (entity_id, version)
+
+    Ошибки Redis не пробрасываются ни при чтении, ни при записи, ни при
+    инвалидации: при недоступности кеша данные считаются из БД, а
+    неудавшаяся инвалидация ограничена TTL записей.
+    """
+
+    def __init__(self, redis: RedisClient, prefix: str, ttl: timedelta):
+        """
+        Args:
+            redis: Redis клиент
+            prefix: Префикс ключей
+            ttl: Время жизни записей
+        """
+        self._redis = redis
+        self._prefix = prefix
+        self._ttl = ttl
+
+    def version_key(self, entity_id: object) -> str:
+        """Ключ версии сущности."""
+        return f"{self._prefix}:version:{entity_id}"
+
+    async def read(
+        self,
+        entity_ids: Sequence[K],
+        entry_key: Callable[[K, str], str],
+    ) -> Tuple[Dict[K, str], Dict[K, str]]:
+        """
+        Читает записи под текущими версиями (2 round trip: версии + записи).
+
+        Args:
+            entity_ids: ID сущностей
+            entry_key: Ключ записи по (entity_id, version)
+
+        Returns:
+            Кортеж (найденные записи, версии сущностей); при недоступном
+            Redis - пустые словари (записывать результат расчета некуда)
+        """
+        if not self._redis.is_connected or not entity_ids:
+            return {}, {}
+
+        try:
+            raw_versions = await self._redis.client.mget(
+                [self.version_key(entity_id) for entity_id in entity_ids]
+            )
+            versions = {
+                entity_id: version or "0"
+                for entity_id, version in zip(entity_ids, raw_versions, strict=True)
+            }
+            values = await self._redis.client.mget(
+                [entry_key(entity_id, versions[entity_id]) for entity_id in entity_ids]
+            )
+        except RedisError as e:
+            logger.warning(f"Cache {self._prefix} read failed: {e}")
+            return {}, {}
+
+        hits = {
+            entity_id: value
+            for entity_id, value in zip(entity_ids, values, strict=True)
+            if value is not None
+        }
+        return hits, versions
+
+    async def write(self, entries: Mapping[str, str]) -> None:
+        """
+        Записывает значения с TTL (ключи - под версиями из read).
+
+        Args:
+            entries: Ключ записи -> значение
+        """
+        if not self._redis.is_connected or not entries:
+            return
+
+        try:
+            async with self._redis.client.pipeline(transaction=False) as pipe:
+                for key, value in entries.items():
+                    pipe.set(key, value, ex=self._ttl)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Cache {self._prefix} write failed: {e}")
+
+    async def invalidate(self, entity_id: object) -> None:
+        """
+        Инвалидирует записи сущности (увеличивает версию).
+
+        Args:
+            entity_id: ID сущности
+        """
+        if not self._redis.is_connected:
+            return
+
+        try:
+            await self._redis.client.incr(self.version_key(entity_id))
+        except RedisError as e:
+            logger.warning(f"Cache {self._prefix} invalidation failed for {entity_id}: {e}")
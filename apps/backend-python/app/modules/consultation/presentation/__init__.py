@@ -4,6 +4,10 @@ Consultation Presentation Layer
 Presentation Layer для модуля консультаций.
 Содержит REST API endpoints и WebSocket handlers.
 """
-from app.modules.consultation.presentation.api import router
+from app.modules.consultation.presentation.api import (
+    router,
+    availability_router,
+    emergency_router,
+)
 
-__all__ = ["router"]
+__all__ = ["router", "availability_router", "emergency_router"]
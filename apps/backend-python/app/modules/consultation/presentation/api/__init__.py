@@ -2,5 +2,11 @@
 API для Consultation Presentation Layer
 """
 from app.modules.consultation.presentation.api.consultation_router import router
+from app.modules.consultation.presentation.api.availability_router import (
+    router as availability_router,
+)
+from app.modules.consultation.presentation.api.emergency_router import (
+    router as emergency_router,
+)
 
-__all__ = ["router"]
+__all__ = ["router", "availability_router", "emergency_router"]
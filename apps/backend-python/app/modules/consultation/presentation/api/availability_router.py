@@ -0,0 +1,107 @@
+"""
+Availability API Router
+
+REST API endpoints свободных слотов юристов для бронирования.
+"""
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.modules.consultation.application import (
+    GetAvailableSlotsQuery,
+    LawyerAvailabilityDTO,
+)
+from app.modules.consultation.presentation.dependencies import (
+    GetAvailableSlotsHandlerDep,
+)
+
+router = APIRouter(prefix="/lawyers", tags=["availability"])
+
+
+@router.get(
+    "/slots",
+    response_model=List[LawyerAvailabilityDTO],
+    summary="Свободные слоты нескольких юристов",
+)
+async def get_lawyers_slots(
+    handler: GetAvailableSlotsHandlerDep,
+    lawyer_ids: List[UUID] = Query(
+        ..., description="ID пользователей юристов (как lawyer_id при бронировании)"
+    ),
+    range_from: datetime = Query(..., alias="from", description="Начало диапазона"),
+    range_to: datetime = Query(..., alias="to", description="Конец диапазона"),
+    duration_minutes: int = Query(60, ge=15, le=480, description="Длительность консультации"),
+) -> List[LawyerAvailabilityDTO]:
+    """
+    Свободные слоты для бронирования у нескольких юристов (например,
+    для выдачи поиска).
+
+    **Публичный endpoint** (без auth). Юристы, которые не принимают
+    консультации, в ответ не попадают.
+    """
+    query = GetAvailableSlotsQuery(
+        lawyer_ids=tuple(lawyer_ids),
+        range_start=range_from,
+        range_end=range_to,
+        duration_minutes=duration_minutes,
+    )
+
+    result = await handler.handle(query)
+
+    if result.is_failure:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result.error,
+        )
+
+    return result.value
+
+
+@router.get(
+    "/{lawyer_id}/slots",
+    response_model=LawyerAvailabilityDTO,
+    summary="Свободные слоты юриста",
+)
+async def get_lawyer_slots(
+    lawyer_id: UUID,
+    handler: GetAvailableSlotsHandlerDep,
+    range_from: datetime = Query(..., alias="from", description="Начало диапазона"),
+    range_to: datetime = Query(..., alias="to", description="Конец диапазона"),
+    duration_minutes: int = Query(60, ge=15, le=480, description="Длительность консультации"),
+) -> LawyerAvailabilityDTO:
+    """
+    Свободные слоты юриста для бронирования.
+
+    **Публичный endpoint** (без auth).
+
+    - **from**, **to**: Диапазон (ISO 8601; без часового пояса - UTC)
+    - **duration_minutes**: Длительность консультации
+
+    Слоты учитывают рабочие часы юриста, уже забронированные консультации
+    и буферы между ними. Полученный `start` передается в `scheduled_start`
+    при бронировании.
+    """
+    query = GetAvailableSlotsQuery(
+        lawyer_ids=(lawyer_id,),
+        range_start=range_from,
+        range_end=range_to,
+        duration_minutes=duration_minutes,
+    )
+
+    result = await handler.handle(query)
+
+    if result.is_failure:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result.error,
+        )
+
+    if not result.value:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lawyer not found or not accepting consultations",
+        )
+
+    return result.value[0]
@@ -6,10 +6,11 @@ REST API endpoints для управления консультациями.
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.infrastructure.database import get_db
+from app.core.infrastructure.idempotency import idempotent
 from app.core.presentation.dependencies.auth import get_current_user
 from app.modules.consultation.domain import ConsultationStatusEnum
 from app.modules.consultation.application import (
@@ -23,6 +24,7 @@ from app.modules.consultation.application import (
     GetConsultationsByClientQuery,
     GetConsultationsByLawyerQuery,
     GetPendingConsultationsQuery,
+    GetLawyerStatsQuery,
     ConsultationDTO,
     ConsultationSearchResultDTO,
     ConsultationListItemDTO,
@@ -30,6 +32,7 @@ from app.modules.consultation.application import (
     ConfirmConsultationRequestDTO,
     CancelConsultationRequestDTO,
     RateConsultationRequestDTO,
+    LawyerStatsDTO,
 )
 from app.modules.consultation.presentation.dependencies import (
     BookConsultationHandlerDep,
@@ -42,6 +45,7 @@ from app.modules.consultation.presentation.dependencies import (
     GetConsultationsByClientHandlerDep,
     GetConsultationsByLawyerHandlerDep,
     GetPendingConsultationsHandlerDep,
+    GetLawyerStatsHandlerDep,
 )
 
 router = APIRouter(prefix="/consultations", tags=["consultations"])
@@ -55,6 +59,7 @@ router = APIRouter(prefix="/consultations", tags=["consultations"])
     response_model=ConsultationDTO,
     status_code=status.HTTP_201_CREATED,
     summary="Забронировать консультацию",
+    dependencies=[Depends(idempotent("consultations:book"))],
 )
 async def book_consultation(
     request: CreateConsultationRequestDTO,
@@ -70,6 +75,9 @@ async def book_consultation(
     - **price_amount**: Цена консультации
     - **scheduled_start**: Время начала (обязательно для scheduled)
     - **duration_minutes**: Длительность (по умолчанию 60 мин)
+
+    Повтор запроса с тем же заголовком `Idempotency-Key` возвращает
+    ранее созданную консультацию вместо повторного бронирования.
     """
     command = BookConsultationCommand(
         client_id=UUID(current_user["id"]),
@@ -426,3 +434,32 @@ async def get_my_pending_consultations(
         )
 
     return [ConsultationListItemDTO.from_entity(c) for c in result.value]
+
+
+@router.get(
+    "/lawyer/me/stats",
+    response_model=LawyerStatsDTO,
+    summary="Статистика моих консультаций (юрист)",
+)
+async def get_my_stats_as_lawyer(
+    handler: GetLawyerStatsHandlerDep,
+    current_user: dict = get_current_user,
+) -> LawyerStatsDTO:
+    """
+    Статистика текущего юриста для дашборда: количество консультаций по
+    статусам и заработок (за все время и текущий месяц).
+
+    Считается одним запросом и кешируется до следующего изменения
+    консультаций или платежей юриста.
+    """
+    query = GetLawyerStatsQuery(lawyer_id=UUID(current_user["id"]))
+
+    result = await handler.handle(query)
+
+    if result.is_failure:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result.error,
+        )
+
+    return result.value
@@ -0,0 +1,172 @@
+"""
+Emergency API Router
+
+REST API endpoints экстренных консультаций: клиент описывает проблему,
+диспетчер подбирает юриста, первый принявший юрист получает консультацию.
+"""
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.core.infrastructure.idempotency import idempotent
+from app.core.presentation.dependencies.auth import get_current_user
+from app.modules.consultation.application import (
+    AcceptEmergencyOfferCommand,
+    ConsultationDTO,
+    CreateEmergencyRequestDTO,
+    EmergencyOfferDTO,
+    EmergencyRequestDTO,
+    RequestEmergencyConsultationCommand,
+)
+from app.modules.consultation.presentation.dependencies import (
+    AcceptEmergencyOfferHandlerDep,
+    EmergencyDispatcherDep,
+    RequestEmergencyConsultationHandlerDep,
+)
+
+router = APIRouter(prefix="/consultations/emergency", tags=["emergency"])
+
+
+# ========== Client ==========
+
+
+@router.post(
+    "",
+    response_model=EmergencyRequestDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Экстренный запрос консультации",
+    dependencies=[Depends(idempotent("consultations:emergency"))],
+)
+async def request_emergency_consultation(
+    request: CreateEmergencyRequestDTO,
+    handler: RequestEmergencyConsultationHandlerDep,
+    current_user: dict = get_current_user,
+) -> EmergencyRequestDTO:
+    """
+    Экстренный запрос консультации без выбора юриста.
+
+    - **specialization**: Специализация (например, "ДТП")
+    - **city**: Город клиента
+    - **description**: Описание проблемы (10-2000 символов)
+
+    Запрос предлагается лучшим свободным юристам подходящей специализации
+    в городе клиента. Статус назначения - `GET /consultations/emergency/{id}`.
+    """
+    command = RequestEmergencyConsultationCommand(
+        client_id=UUID(current_user["id"]),
+        specialization=request.specialization.name,
+        city=request.city,
+        description=request.description,
+    )
+
+    result = await handler.handle(command)
+
+    if result.is_failure:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result.error,
+        )
+
+    return EmergencyRequestDTO.from_request(result.value)
+
+
+# ========== Lawyer ==========
+# /offers/me объявлен до /{request_id}, чтобы не совпасть с ним
+
+
+@router.get(
+    "/offers/me",
+    response_model=Optional[EmergencyOfferDTO],
+    summary="Текущее экстренное предложение (юрист)",
+)
+async def get_my_emergency_offer(
+    dispatcher: EmergencyDispatcherDep,
+    current_user: dict = get_current_user,
+) -> Optional[EmergencyOfferDTO]:
+    """
+    Текущее предложение экстренного запроса юристу (null - предложений нет).
+    """
+    offer = await dispatcher.get_offer(UUID(current_user["id"]))
+    return EmergencyOfferDTO.from_offer(offer) if offer else None
+
+
+@router.post(
+    "/{request_id}/accept",
+    response_model=ConsultationDTO,
+    status_code=status.HTTP_201_CREATED,
+    summary="Принять экстренный запрос (юрист)",
+)
+async def accept_emergency_offer(
+    request_id: UUID,
+    handler: AcceptEmergencyOfferHandlerDep,
+    current_user: dict = get_current_user,
+) -> ConsultationDTO:
+    """
+    Принятие экстренного запроса. Консультацию получает первый принявший
+    юрист; остальные получают 409.
+    """
+    command = AcceptEmergencyOfferCommand(
+        request_id=request_id,
+        lawyer_user_id=UUID(current_user["id"]),
+    )
+
+    result = await handler.handle(command)
+
+    if result.is_failure:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=result.error,
+        )
+
+    return ConsultationDTO.from_entity(result.value)
+
+
+@router.post(
+    "/{request_id}/decline",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Отклонить экстренный запрос (юрист)",
+)
+async def decline_emergency_offer(
+    request_id: UUID,
+    dispatcher: EmergencyDispatcherDep,
+    current_user: dict = get_current_user,
+) -> None:
+    """
+    Отклонение предложения: запрос сразу уходит следующим кандидатам.
+    """
+    declined = await dispatcher.decline(request_id, UUID(current_user["id"]))
+    if not declined:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No active offer for this request",
+        )
+
+
+# ========== Status ==========
+
+
+@router.get(
+    "/{request_id}",
+    response_model=EmergencyRequestDTO,
+    summary="Статус экстренного запроса (клиент)",
+)
+async def get_emergency_request(
+    request_id: UUID,
+    dispatcher: EmergencyDispatcherDep,
+    current_user: dict = get_current_user,
+) -> EmergencyRequestDTO:
+    """
+    Статус экстренного запроса: searching -> assigned (с `consultation_id`)
+    или expired, если никто из юристов не принял запрос.
+    """
+    request = await dispatcher.get_request(request_id)
+
+    # Чужой запрос не раскрываем
+    if request is None or request.client_id != UUID(current_user["id"]):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Emergency request {request_id} not found",
+        )
+
+    return EmergencyRequestDTO.from_request(request)
@@ -13,8 +13,14 @@ from app.modules.consultation.presentation.dependencies.consultation_deps import
     get_consultations_by_client_handler,
     get_consultations_by_lawyer_handler,
     get_pending_consultations_handler,
+    get_lawyer_schedule_reader,
+    get_available_slots_handler,
+    get_emergency_dispatcher,
+    get_request_emergency_consultation_handler,
+    get_accept_emergency_offer_handler,
     # Type aliases
     ConsultationRepositoryDep,
+    LawyerScheduleReaderDep,
     BookConsultationHandlerDep,
     ConfirmConsultationHandlerDep,
     StartConsultationHandlerDep,
@@ -25,6 +31,11 @@ from app.modules.consultation.presentation.dependencies.consultation_deps import
     GetConsultationsByClientHandlerDep,
     GetConsultationsByLawyerHandlerDep,
     GetPendingConsultationsHandlerDep,
+    GetAvailableSlotsHandlerDep,
+    GetLawyerStatsHandlerDep,
+    EmergencyDispatcherDep,
+    RequestEmergencyConsultationHandlerDep,
+    AcceptEmergencyOfferHandlerDep,
 )
 
 __all__ = [
@@ -40,8 +51,14 @@ __all__ = [
     "get_consultations_by_client_handler",
     "get_consultations_by_lawyer_handler",
     "get_pending_consultations_handler",
+    "get_lawyer_schedule_reader",
+    "get_available_slots_handler",
+    "get_emergency_dispatcher",
+    "get_request_emergency_consultation_handler",
+    "get_accept_emergency_offer_handler",
     # Type aliases
     "ConsultationRepositoryDep",
+    "LawyerScheduleReaderDep",
     "BookConsultationHandlerDep",
     "ConfirmConsultationHandlerDep",
     "StartConsultationHandlerDep",
@@ -52,4 +69,9 @@ __all__ = [
     "GetConsultationsByClientHandlerDep",
     "GetConsultationsByLawyerHandlerDep",
     "GetPendingConsultationsHandlerDep",
+    "GetAvailableSlotsHandlerDep",
+    "GetLawyerStatsHandlerDep",
+    "EmergencyDispatcherDep",
+    "RequestEmergencyConsultationHandlerDep",
+    "AcceptEmergencyOfferHandlerDep",
 ]
@@ -8,9 +8,23 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.core.infrastructure.database import get_db
-from app.modules.consultation.domain import IConsultationRepository
-from app.modules.consultation.infrastructure import ConsultationRepositoryImpl
+from app.modules.consultation.domain import (
+    AvailabilityService,
+    IConsultationRepository,
+    IEmergencyDispatcher,
+    ILawyerRatingAggregator,
+    ILawyerScheduleReader,
+)
+from app.modules.consultation.infrastructure import (
+    ConsultationRepositoryImpl,
+    LawyerRatingAggregatorImpl,
+    LawyerScheduleReaderImpl,
+    availability_cache,
+    emergency_dispatcher,
+    lawyer_stats_cache,
+)
 from app.modules.consultation.application import (
     BookConsultationHandler,
     ConfirmConsultationHandler,
@@ -22,6 +36,10 @@ from app.modules.consultation.application import (
     GetConsultationsByClientHandler,
     GetConsultationsByLawyerHandler,
     GetPendingConsultationsHandler,
+    GetAvailableSlotsHandler,
+    GetLawyerStatsHandler,
+    RequestEmergencyConsultationHandler,
+    AcceptEmergencyOfferHandler,
 )
 
 
@@ -40,6 +58,40 @@ ConsultationRepositoryDep = Annotated[
 ]
 
 
+def get_lawyer_schedule_reader(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> ILawyerScheduleReader:
+    """Factory для LawyerScheduleReader."""
+    return LawyerScheduleReaderImpl(session=db)
+
+
+LawyerScheduleReaderDep = Annotated[
+    ILawyerScheduleReader, Depends(get_lawyer_schedule_reader)
+]
+
+
+def get_lawyer_rating_aggregator(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> ILawyerRatingAggregator:
+    """Factory для LawyerRatingAggregator."""
+    return LawyerRatingAggregatorImpl(session=db)
+
+
+LawyerRatingAggregatorDep = Annotated[
+    ILawyerRatingAggregator, Depends(get_lawyer_rating_aggregator)
+]
+
+
+def get_emergency_dispatcher() -> IEmergencyDispatcher:
+    """Factory для EmergencyDispatcher (общий на процесс)."""
+    return emergency_dispatcher
+
+
+EmergencyDispatcherDep = Annotated[
+    IEmergencyDispatcher, Depends(get_emergency_dispatcher)
+]
+
+
 # ========== Command Handlers ==========
 
 
@@ -105,9 +157,12 @@ CancelConsultationHandlerDep = Annotated[
 
 def get_rate_consultation_handler(
     repository: ConsultationRepositoryDep,
+    rating_aggregator: LawyerRatingAggregatorDep,
 ) -> RateConsultationHandler:
     """Factory для RateConsultationHandler."""
-    return RateConsultationHandler(repository=repository)
+    return RateConsultationHandler(
+        repository=repository, rating_aggregator=rating_aggregator
+    )
 
 
 RateConsultationHandlerDep = Annotated[
@@ -115,6 +170,32 @@ RateConsultationHandlerDep = Annotated[
 ]
 
 
+def get_request_emergency_consultation_handler(
+    dispatcher: EmergencyDispatcherDep,
+) -> RequestEmergencyConsultationHandler:
+    """Factory для RequestEmergencyConsultationHandler."""
+    return RequestEmergencyConsultationHandler(dispatcher=dispatcher)
+
+
+RequestEmergencyConsultationHandlerDep = Annotated[
+    RequestEmergencyConsultationHandler,
+    Depends(get_request_emergency_consultation_handler),
+]
+
+
+def get_accept_emergency_offer_handler(
+    repository: ConsultationRepositoryDep,
+    dispatcher: EmergencyDispatcherDep,
+) -> AcceptEmergencyOfferHandler:
+    """Factory для AcceptEmergencyOfferHandler."""
+    return AcceptEmergencyOfferHandler(repository=repository, dispatcher=dispatcher)
+
+
+AcceptEmergencyOfferHandlerDep = Annotated[
+    AcceptEmergencyOfferHandler, Depends(get_accept_emergency_offer_handler)
+]
+
+
 # ========== Query Handlers ==========
 
 
@@ -164,3 +245,39 @@ def get_pending_consultations_handler(
 GetPendingConsultationsHandlerDep = Annotated[
     GetPendingConsultationsHandler, Depends(get_pending_consultations_handler)
 ]
+
+
+def get_available_slots_handler(
+    repository: ConsultationRepositoryDep,
+    schedule_reader: LawyerScheduleReaderDep,
+) -> GetAvailableSlotsHandler:
+    """Factory для GetAvailableSlotsHandler."""
+    return GetAvailableSlotsHandler(
+        repository=repository,
+        schedule_reader=schedule_reader,
+        service=AvailabilityService(
+            step_minutes=settings.availability_slot_step_minutes,
+            buffer_minutes=settings.availability_buffer_minutes,
+            min_notice_minutes=settings.availability_min_notice_minutes,
+        ),
+        cache=availability_cache,
+        max_range_days=settings.availability_max_range_days,
+        max_lawyers=settings.availability_max_lawyers,
+    )
+
+
+GetAvailableSlotsHandlerDep = Annotated[
+    GetAvailableSlotsHandler, Depends(get_available_slots_handler)
+]
+
+
+def get_lawyer_stats_handler(
+    repository: ConsultationRepositoryDep,
+) -> GetLawyerStatsHandler:
+    """Factory для GetLawyerStatsHandler."""
+    return GetLawyerStatsHandler(repository=repository, cache=lawyer_stats_cache)
+
+
+GetLawyerStatsHandlerDep = Annotated[
+    GetLawyerStatsHandler, Depends(get_lawyer_stats_handler)
+]
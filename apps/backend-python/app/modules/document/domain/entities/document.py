@@ -205,6 +205,26 @@ class Document(AggregateRoot):
 
         return Result.ok()
 
+    def release_processing(self) -> Result[None]:
+        """
+        Возвращает "зависший" документ в очередь обработки.
+
+        Используется, когда обработчик упал, не завершив обработку
+        (документ остался в статусе PROCESSING).
+
+        Returns:
+            Result с успехом или ошибкой
+        """
+        if not self._status.is_processing:
+            return Result.fail(
+                f"Cannot release document in status: {self._status.display_name}"
+            )
+
+        self._status = DocumentStatus.uploaded()
+        self._updated_at = datetime.utcnow()
+
+        return Result.ok()
+
     def mark_as_processed(self, extracted_text: Optional[str] = None) -> Result[None]:
         """
         Помечает документ как успешно обработанный.
@@ -4,6 +4,7 @@ Document Repository Interface
 Интерфейс репозитория для работы с документами.
 """
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
@@ -131,6 +132,26 @@ class IDocumentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_stuck_processing(
+        self,
+        updated_before: datetime,
+        limit: int = 100,
+    ) -> List[Document]:
+        """
+        Находит документы, "зависшие" в статусе PROCESSING.
+
+        Строки блокируются (FOR UPDATE SKIP LOCKED) до конца транзакции.
+
+        Args:
+            updated_before: Документ не обновлялся с этого времени
+            limit: Максимальное количество результатов
+
+        Returns:
+            Список документов в статусе PROCESSING
+        """
+        pass
+
     @abstractmethod
     async def delete(self, document_id: UUID) -> None:
         """
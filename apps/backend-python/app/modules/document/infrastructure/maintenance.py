@@ -0,0 +1,49 @@
+"""
+Document Maintenance Jobs
+
+Периодические задачи обслуживания Document Module.
+"""
+import logging
+from datetime import datetime, timedelta
+
+from app.config import settings
+from app.core.infrastructure.database import async_session_factory
+from app.core.infrastructure.scheduler import Scheduler, run_in_chunks
+from app.modules.document.infrastructure.persistence.repositories import DocumentRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+async def release_stuck_documents() -> int:
+    """
+    Вернуть в очередь документы, "зависшие" в статусе PROCESSING.
+
+    Returns:
+        Количество возвращенных документов
+    """
+    chunk_size = settings.scheduler_chunk_size
+    updated_before = datetime.utcnow() - timedelta(
+        minutes=settings.document_processing_timeout_minutes
+    )
+
+    async def process_chunk() -> int:
+        async with async_session_factory() as session:
+            async with session.begin():
+                repository = DocumentRepositoryImpl(session)
+                documents = await repository.find_stuck_processing(
+                    updated_before=updated_before, limit=chunk_size
+                )
+                for document in documents:
+                    result = document.release_processing()
+                    if result.is_success:
+                        await repository.save(document)
+                    else:
+                        logger.warning(f"Cannot release document {document.id}: {result.error}")
+                return len(documents)
+
+    return await run_in_chunks(process_chunk, chunk_size, settings.scheduler_max_chunks)
+
+
+def register_maintenance_jobs(scheduler: Scheduler) -> None:
+    """Зарегистрировать периодические задачи Document Module."""
+    scheduler.register("document.release-stuck-processing", "*/5 * * * *", release_stuck_documents)
@@ -1,6 +1,9 @@
 """ORM Models exports"""
+from app.modules.document.infrastructure.persistence.models.chunk_model import (
+    ChunkModel,
+)
 from app.modules.document.infrastructure.persistence.models.document_model import (
     DocumentModel,
 )
 
-__all__ = ["DocumentModel"]
+__all__ = ["ChunkModel", "DocumentModel"]
@@ -0,0 +1,83 @@
+"""
+Document Chunk ORM Model
+
+SQLAlchemy модель для чанков документов (индекс RAG).
+"""
+from datetime import datetime
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.infrastructure.database import Base
+
+# Размерность text-embedding-3-small
+EMBEDDING_DIMENSIONS = 1536
+
+# Конфигурация полнотекстового поиска (должна совпадать в колонке и запросах)
+TEXT_SEARCH_CONFIG = "russian"
+
+
+class ChunkModel(Base):
+    """
+    ORM модель для таблицы document_chunks.
+
+    Фрагмент извлеченного текста документа для гибридного поиска:
+    - content_tsv - tsvector (генерируемая колонка, GIN индекс)
+    - embedding - вектор OpenAI (HNSW индекс, cosine distance)
+
+    owner_id денормализован из documents, чтобы обе ветки поиска
+    фильтровали по владельцу без join.
+    """
+
+    __tablename__ = "document_chunks"
+
+    # Primary Key
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+
+    # Ownership
+    document_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    owner_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+
+    # Content
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    chunk_metadata: Mapped[dict] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+
+    # Search
+    content_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, content)", persisted=True),
+    )
+    embedding: Mapped[list] = mapped_column(Vector(EMBEDDING_DIMENSIONS), nullable=False)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("uq_document_chunks_document_index", "document_id", "chunk_index", unique=True),
+        Index("idx_document_chunks_tsv", "content_tsv", postgresql_using="gin"),
+        Index(
+            "idx_document_chunks_embedding",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """Строковое представление модели."""
+        return (
+            f"<ChunkModel(id={self.id}, document_id={self.document_id}, "
+            f"chunk_index={self.chunk_index})>"
+        )
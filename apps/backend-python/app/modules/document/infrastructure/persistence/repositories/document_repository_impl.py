@@ -3,12 +3,14 @@ Document Repository Implementation
 
 Реализация репозитория документов с использованием SQLAlchemy.
 """
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
 from sqlalchemy import select, func, or_, and_, delete as sql_delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.infrastructure.outbox import record_events
 from app.modules.document.domain.entities.document import Document
 from app.modules.document.domain.repositories.document_repository import (
     IDocumentRepository,
@@ -66,6 +68,9 @@ class DocumentRepositoryImpl(IDocumentRepository):
             model = DocumentMapper.to_model(document)
             self.session.add(model)
 
+        # Доменные события - в outbox в той же транзакции
+        record_events(self.session, document)
+
         await self.session.flush()
         await self.session.refresh(existing if existing else model)
 
@@ -274,6 +279,35 @@ class DocumentRepositoryImpl(IDocumentRepository):
 
         return [DocumentMapper.to_domain(model) for model in models]
 
+    async def find_stuck_processing(
+        self,
+        updated_before: datetime,
+        limit: int = 100,
+    ) -> List[Document]:
+        """
+        Находит документы, "зависшие" в статусе PROCESSING.
+
+        Args:
+            updated_before: Документ не обновлялся с этого времени
+            limit: Максимальное количество результатов
+
+        Returns:
+            Список документов (строки заблокированы до конца транзакции)
+        """
+        stmt = (
+            select(DocumentModel)
+            .where(DocumentModel.status == DocumentStatusEnum.PROCESSING.value)
+            .where(DocumentModel.updated_at < updated_before)
+            .order_by(DocumentModel.updated_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+
+        return [DocumentMapper.to_domain(model) for model in models]
+
     async def delete(self, document_id: UUID) -> None:
         """
         Физически удаляет документ из БД.
@@ -10,6 +10,7 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.infrastructure.outbox import record_events
 from ....domain.entities.user import User
 from ....domain.value_objects.email import Email
 from ....domain.value_objects.phone import Phone
@@ -64,11 +65,9 @@ class UserRepositoryImpl(IUserRepository):
                 self._session.add(user_model)
                 logger.debug(f"Creating new user {user.id}")
 
-            # TODO: Публикация доменных событий
-            # События нужно публиковать после успешного commit
-            # for event in user.domain_events:
-            #     await event_bus.publish(event)
-            # user.clear_domain_events()
+            # Доменные события записываются в outbox в той же транзакции
+            # и публикуются диспетчером после commit
+            record_events(self._session, user)
 
         except Exception as e:
             logger.error(f"Error saving user {user.id}: {str(e)}")
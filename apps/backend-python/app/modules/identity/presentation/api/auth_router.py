@@ -10,6 +10,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.infrastructure.database import get_db
+from app.core.infrastructure.rate_limiter import (
+    RateLimitCheck,
+    RateLimitExceeded,
+    RateLimits,
+    raise_too_many_requests,
+    rate_limit,
+    rate_limiter,
+)
 from ...application.commands.login_user import LoginUserCommand
 from ...application.commands.login_user_handler import LoginUserHandler
 from ...application.commands.register_user import RegisterUserCommand
@@ -41,6 +49,7 @@ router = APIRouter(
     "/register",
     response_model=RegisterResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit(RateLimits.AUTH_REGISTER))],
     summary="Регистрация нового пользователя",
     description="""
     Регистрирует нового пользователя в системе.
@@ -132,6 +141,7 @@ async def register(
     "/verify-otp",
     response_model=AuthResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit(RateLimits.OTP_VERIFY_IP))],
     summary="Верификация OTP кода",
     description="""
     Верифицирует OTP код и возвращает JWT токены.
@@ -166,8 +176,21 @@ async def verify_otp(
         AuthResponse с JWT токенами
 
     Raises:
-        HTTPException: 400 если OTP невалидный
+        HTTPException: 400 если OTP невалидный, 429 при превышении лимита попыток
     """
+    # Лимит попыток на номер телефона/email (защита от перебора с разных IP)
+    try:
+        await rate_limiter.enforce(
+            [
+                RateLimitCheck(
+                    rule=RateLimits.OTP_VERIFY_TARGET,
+                    identity=(request.phone or request.email or "").lower(),
+                )
+            ]
+        )
+    except RateLimitExceeded as e:
+        raise_too_many_requests(e)
+
     # Создаем зависимости
     user_repository = UserRepositoryImpl(db)
     jwt_service = JWTService()
@@ -208,6 +231,7 @@ async def verify_otp(
     "/login",
     response_model=AuthResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit(RateLimits.AUTH_LOGIN))],
     summary="Вход в систему",
     description="""
     Аутентифицирует пользователя и возвращает JWT токены.
@@ -124,7 +124,7 @@ async def get_verified_user(
     return user
 
 
-async def require_role(required_role: str):
+def require_role(required_role: str):
     """
     Dependency factory для проверки роли пользователя.
 
@@ -5,7 +5,12 @@ Use Cases (Commands & Queries) для Lawyer Module.
 """
 
 # DTOs
-from .dtos.lawyer_dto import LawyerDTO, LawyerListItemDTO, LawyerSearchResultDTO
+from .dtos.lawyer_dto import (
+    LawyerDTO,
+    LawyerFacetsDTO,
+    LawyerListItemDTO,
+    LawyerSearchResultDTO,
+)
 
 # Commands
 from .commands.register_lawyer import RegisterLawyerCommand
@@ -22,10 +27,13 @@ from .queries.get_lawyer import GetLawyerQuery
 from .queries.get_lawyer_handler import GetLawyerHandler
 from .queries.get_top_rated import GetTopRatedQuery
 from .queries.get_top_rated_handler import GetTopRatedHandler
+from .queries.get_lawyer_facets import GetLawyerFacetsQuery
+from .queries.get_lawyer_facets_handler import GetLawyerFacetsHandler
 
 __all__ = [
     # DTOs
     "LawyerDTO",
+    "LawyerFacetsDTO",
     "LawyerListItemDTO",
     "LawyerSearchResultDTO",
     # Commands
@@ -42,4 +50,6 @@ __all__ = [
     "GetLawyerHandler",
     "GetTopRatedQuery",
     "GetTopRatedHandler",
+    "GetLawyerFacetsQuery",
+    "GetLawyerFacetsHandler",
 ]
@@ -10,6 +10,8 @@ from .verify_lawyer import VerifyLawyerCommand
 from .verify_lawyer_handler import VerifyLawyerHandler
 from .update_availability import UpdateAvailabilityCommand
 from .update_availability_handler import UpdateAvailabilityHandler
+from .update_location import UpdateLocationCommand
+from .update_location_handler import UpdateLocationHandler
 
 __all__ = [
     "RegisterLawyerCommand",
@@ -18,4 +20,6 @@ __all__ = [
     "VerifyLawyerHandler",
     "UpdateAvailabilityCommand",
     "UpdateAvailabilityHandler",
+    "UpdateLocationCommand",
+    "UpdateLocationHandler",
 ]
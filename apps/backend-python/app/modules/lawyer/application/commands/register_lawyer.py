@@ -26,6 +26,8 @@ class RegisterLawyerCommand:
         about: Описание юриста (минимум 50 символов)
         location: Город/регион
         languages: Языки (опционально)
+        latitude: Широта офиса (опционально, иначе - через геокодер)
+        longitude: Долгота офиса (опционально)
     """
 
     user_id: str
@@ -37,3 +39,5 @@ class RegisterLawyerCommand:
     about: str
     location: str
     languages: Optional[List[str]] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
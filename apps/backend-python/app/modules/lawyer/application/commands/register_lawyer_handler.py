@@ -9,8 +9,10 @@ from typing import Tuple
 from app.core.domain.result import Result
 from ...domain.entities.lawyer import Lawyer
 from ...domain.repositories.lawyer_repository import ILawyerRepository
+from ...domain.services.geocoder import IGeocoder
 from ...domain.services.lawyer_verification_service import LawyerVerificationService
 from ...domain.value_objects.experience import Experience
+from ...domain.value_objects.geo_point import GeoPoint
 from ...domain.value_objects.price import Price
 from ...domain.value_objects.specialization import Specialization
 from ..dtos.lawyer_dto import LawyerDTO
@@ -31,16 +33,21 @@ class RegisterLawyerHandler:
 
     Dependencies:
         lawyer_repository: Репозиторий юристов
+        geocoder: Геокодер (координаты, если юрист их не указал)
     """
 
-    def __init__(self, lawyer_repository: ILawyerRepository) -> None:
+    def __init__(
+        self, lawyer_repository: ILawyerRepository, geocoder: IGeocoder
+    ) -> None:
         """
         Инициализирует handler.
 
         Args:
             lawyer_repository: Репозиторий юристов
+            geocoder: Геокодер
         """
         self.lawyer_repository = lawyer_repository
+        self.geocoder = geocoder
 
     async def handle(
         self, command: RegisterLawyerCommand
@@ -88,9 +95,18 @@ class RegisterLawyerHandler:
             # Цена
             price = Price(command.price_per_consultation)
 
+            # Координаты, указанные юристом
+            coordinates = None
+            if command.latitude is not None and command.longitude is not None:
+                coordinates = GeoPoint(command.latitude, command.longitude)
+
         except ValueError as e:
             return Result.fail(str(e))
 
+        # Иначе - через геокодер (None - проставит фоновое геокодирование)
+        if coordinates is None:
+            coordinates = await self.geocoder.locate(command.location)
+
         # 4. Создаем Lawyer aggregate
         lawyer_result = Lawyer.create(
             user_id=command.user_id,
@@ -102,6 +118,7 @@ class RegisterLawyerHandler:
             about=command.about,
             location=command.location,
             languages=command.languages,
+            coordinates=coordinates,
         )
 
         if lawyer_result.is_failure:
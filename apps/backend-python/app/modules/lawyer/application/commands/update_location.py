@@ -0,0 +1,29 @@
+"""
+UpdateLocationCommand
+
+Команда для обновления города и координат юриста.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class UpdateLocationCommand:
+    """
+    Команда: Обновить город и координаты юриста.
+
+    Координаты офиса задаются юристом; если они не указаны, их
+    определяет геокодер по городу.
+
+    Attributes:
+        lawyer_id: ID юриста
+        location: Город/регион
+        latitude: Широта офиса (опционально, иначе - через геокодер)
+        longitude: Долгота офиса (опционально)
+    """
+
+    lawyer_id: str
+    location: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
@@ -0,0 +1,82 @@
+"""
+UpdateLocationHandler
+
+Handler для обновления города и координат юриста.
+"""
+
+from app.core.domain.result import Result
+from ...domain.repositories.lawyer_repository import ILawyerRepository
+from ...domain.services.geocoder import IGeocoder
+from ...domain.value_objects.geo_point import GeoPoint
+from ..dtos.lawyer_dto import LawyerDTO
+from .update_location import UpdateLocationCommand
+
+
+class UpdateLocationHandler:
+    """
+    Handler для команды UpdateLocationCommand.
+
+    Процесс:
+    1. Находит юриста по ID
+    2. Берет координаты из команды или определяет их геокодером
+    3. Вызывает метод update_location() на aggregate
+    4. Сохраняет изменения
+    5. Возвращает обновленный LawyerDTO
+
+    Dependencies:
+        lawyer_repository: Репозиторий юристов
+        geocoder: Геокодер (координаты, если юрист их не указал)
+    """
+
+    def __init__(
+        self, lawyer_repository: ILawyerRepository, geocoder: IGeocoder
+    ) -> None:
+        """
+        Инициализирует handler.
+
+        Args:
+            lawyer_repository: Репозиторий юристов
+            geocoder: Геокодер
+        """
+        self.lawyer_repository = lawyer_repository
+        self.geocoder = geocoder
+
+    async def handle(self, command: UpdateLocationCommand) -> Result[LawyerDTO]:
+        """
+        Обрабатывает команду обновления города и координат.
+
+        Args:
+            command: Команда с данными
+
+        Returns:
+            Result с LawyerDTO или ошибкой
+        """
+        if (command.latitude is None) != (command.longitude is None):
+            return Result.fail("Both latitude and longitude must be specified")
+
+        # 1. Находим юриста
+        lawyer = await self.lawyer_repository.find_by_id(command.lawyer_id)
+        if not lawyer:
+            return Result.fail(f"Lawyer not found: {command.lawyer_id}")
+
+        # 2. Координаты, указанные юристом, иначе - через геокодер
+        if command.latitude is not None:
+            try:
+                coordinates = GeoPoint(command.latitude, command.longitude)
+            except ValueError as e:
+                return Result.fail(str(e))
+        else:
+            coordinates = await self.geocoder.locate(command.location)
+
+        # 3. Обновляем через domain method
+        update_result = lawyer.update_location(command.location, coordinates)
+
+        if update_result.is_failure:
+            return Result.fail(update_result.error)
+
+        # 4. Сохраняем изменения
+        await self.lawyer_repository.save(lawyer)
+
+        # 5. Возвращаем DTO
+        lawyer_dto = LawyerDTO.from_entity(lawyer)
+        return Result.ok(lawyer_dto)
@@ -4,10 +4,16 @@ DTOs для Lawyer Module
 Data Transfer Objects для передачи данных между слоями.
 """
 
-from .lawyer_dto import LawyerDTO, LawyerListItemDTO, LawyerSearchResultDTO
+from .lawyer_dto import (
+    LawyerDTO,
+    LawyerFacetsDTO,
+    LawyerListItemDTO,
+    LawyerSearchResultDTO,
+)
 
 __all__ = [
     "LawyerDTO",
+    "LawyerFacetsDTO",
     "LawyerListItemDTO",
     "LawyerSearchResultDTO",
 ]
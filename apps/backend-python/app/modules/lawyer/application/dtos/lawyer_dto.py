@@ -7,7 +7,9 @@ Data Transfer Objects для юристов.
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+from ...domain.value_objects.specialization import SpecializationType
 
 
 @dataclass
@@ -128,6 +130,7 @@ class LawyerListItemDTO:
         location: Город/регион
         is_available: Доступен ли
         verification_status: Статус верификации
+        distance_km: Расстояние до точки поиска рядом (км)
     """
 
     id: str
@@ -140,14 +143,16 @@ class LawyerListItemDTO:
     location: str
     is_available: bool
     verification_status: str
+    distance_km: Optional[float] = None
 
     @classmethod
-    def from_entity(cls, lawyer) -> "LawyerListItemDTO":
+    def from_entity(cls, lawyer, near=None) -> "LawyerListItemDTO":
         """
         Создает DTO из Lawyer entity.
 
         Args:
             lawyer: Lawyer entity
+            near: Точка поиска рядом (GeoPoint, опционально)
 
         Returns:
             LawyerListItemDTO
@@ -163,6 +168,11 @@ class LawyerListItemDTO:
             location=lawyer.location,
             is_available=lawyer.is_available,
             verification_status=lawyer.verification_status.value.value,
+            distance_km=(
+                round(near.distance_km(lawyer.coordinates), 1)
+                if near is not None and lawyer.coordinates is not None
+                else None
+            ),
         )
 
 
@@ -194,6 +204,7 @@ class LawyerSearchResultDTO:
         total: int,
         limit: int,
         offset: int,
+        near=None,
     ) -> "LawyerSearchResultDTO":
         """
         Создает DTO результатов поиска.
@@ -203,11 +214,12 @@ class LawyerSearchResultDTO:
             total: Общее количество
             limit: Лимит
             offset: Смещение
+            near: Точка поиска рядом (GeoPoint, опционально)
 
         Returns:
             LawyerSearchResultDTO
         """
-        lawyer_dtos = [LawyerListItemDTO.from_entity(lawyer) for lawyer in lawyers]
+        lawyer_dtos = [LawyerListItemDTO.from_entity(lawyer, near) for lawyer in lawyers]
         has_more = (offset + len(lawyers)) < total
 
         return cls(
@@ -217,3 +229,47 @@ class LawyerSearchResultDTO:
             offset=offset,
             has_more=has_more,
         )
+
+
+@dataclass
+class LawyerFacetsDTO:
+    """
+    DTO для facet counts поиска юристов.
+
+    Attributes:
+        total: Количество юристов с текущими фильтрами
+        specializations: По специализациям (SpecializationType name)
+        specialization_names: Русские названия специализаций из specializations
+        price_ranges: По ценовым категориям
+        experience_levels: По уровням опыта
+        cities: По городам
+    """
+
+    total: int
+    specializations: Dict[str, int]
+    specialization_names: Dict[str, str]
+    price_ranges: Dict[str, int]
+    experience_levels: Dict[str, int]
+    cities: Dict[str, int]
+
+    @classmethod
+    def from_facets(cls, facets) -> "LawyerFacetsDTO":
+        """
+        Создает DTO из LawyerFacets.
+
+        Args:
+            facets: LawyerFacets value object
+
+        Returns:
+            LawyerFacetsDTO
+        """
+        return cls(
+            total=facets.total,
+            specializations=dict(facets.specializations),
+            specialization_names={
+                name: SpecializationType[name].value for name in facets.specializations
+            },
+            price_ranges=dict(facets.price_ranges),
+            experience_levels=dict(facets.experience_levels),
+            cities=dict(facets.cities),
+        )
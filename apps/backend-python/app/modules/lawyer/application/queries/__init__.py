@@ -10,6 +10,10 @@ from .get_lawyer import GetLawyerQuery
 from .get_lawyer_handler import GetLawyerHandler
 from .get_top_rated import GetTopRatedQuery
 from .get_top_rated_handler import GetTopRatedHandler
+from .lawyer_leaderboard import ILawyerLeaderboard
+from .get_lawyer_facets import GetLawyerFacetsQuery
+from .get_lawyer_facets_handler import GetLawyerFacetsHandler
+from .lawyer_facets_cache import ILawyerFacetsCache
 
 __all__ = [
     "SearchLawyersQuery",
@@ -18,4 +22,8 @@ __all__ = [
     "GetLawyerHandler",
     "GetTopRatedQuery",
     "GetTopRatedHandler",
+    "ILawyerLeaderboard",
+    "GetLawyerFacetsQuery",
+    "GetLawyerFacetsHandler",
+    "ILawyerFacetsCache",
 ]
@@ -0,0 +1,34 @@
+"""
+GetLawyerFacetsQuery
+
+Запрос facet counts для фильтров поиска юристов.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class GetLawyerFacetsQuery:
+    """
+    Запрос: Facet counts для текущих фильтров поиска.
+
+    Фильтры совпадают с SearchLawyersQuery (без пагинации).
+
+    Attributes:
+        specializations: Фильтр по специализациям (русские названия или enum names)
+        min_rating: Минимальный рейтинг (1.0-5.0)
+        max_price: Максимальная цена (рубли)
+        location: Город/регион (частичное совпадение)
+        is_available: Только доступные юристы
+        min_experience: Минимальный опыт (годы)
+        query: Текстовый поиск (по описанию, образованию)
+    """
+
+    specializations: Optional[List[str]] = None
+    min_rating: Optional[float] = None
+    max_price: Optional[float] = None
+    location: Optional[str] = None
+    is_available: Optional[bool] = None
+    min_experience: Optional[int] = None
+    query: Optional[str] = None
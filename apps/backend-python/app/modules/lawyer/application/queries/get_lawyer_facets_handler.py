@@ -0,0 +1,126 @@
+"""
+GetLawyerFacetsHandler
+
+Handler для получения facet counts поиска юристов.
+"""
+
+import json
+from typing import List, Optional
+
+from app.core.domain.result import Result
+from ...domain.repositories.lawyer_repository import ILawyerRepository
+from ...domain.value_objects.location import normalize_city
+from ...domain.value_objects.specialization import SpecializationType
+from ..dtos.lawyer_dto import LawyerFacetsDTO
+from .get_lawyer_facets import GetLawyerFacetsQuery
+from .lawyer_facets_cache import ILawyerFacetsCache
+from .search_lawyers_handler import parse_specializations
+
+
+class GetLawyerFacetsHandler:
+    """
+    Handler для запроса GetLawyerFacetsQuery.
+
+    Процесс:
+    1. Конвертирует фильтры в domain types
+    2. Читает facet counts из кеша по нормализованному ключу фильтров
+    3. Если в кеше нет - вызывает get_facets() на репозитории
+    4. Возвращает LawyerFacetsDTO
+
+    Dependencies:
+        lawyer_repository: Репозиторий юристов
+        cache: Кеш facet counts (опционально)
+    """
+
+    def __init__(
+        self,
+        lawyer_repository: ILawyerRepository,
+        cache: Optional[ILawyerFacetsCache] = None,
+    ) -> None:
+        """
+        Инициализирует handler.
+
+        Args:
+            lawyer_repository: Репозиторий юристов
+            cache: Кеш facet counts
+        """
+        self.lawyer_repository = lawyer_repository
+        self.cache = cache
+
+    async def handle(self, query: GetLawyerFacetsQuery) -> Result[LawyerFacetsDTO]:
+        """
+        Обрабатывает запрос facet counts.
+
+        Args:
+            query: Запрос с фильтрами
+
+        Returns:
+            Result с LawyerFacetsDTO или ошибкой
+        """
+        # 1. Конвертируем специализации в enum types
+        specializations_result = parse_specializations(query.specializations)
+        if specializations_result.is_failure:
+            return Result.fail(specializations_result.error)
+        specializations = specializations_result.value
+
+        # 2. Валидация параметров
+        if query.min_rating is not None and (
+            query.min_rating < 1.0 or query.min_rating > 5.0
+        ):
+            return Result.fail("min_rating must be between 1.0 and 5.0")
+
+        if query.max_price is not None and query.max_price <= 0:
+            return Result.fail("max_price must be positive")
+
+        if query.min_experience is not None and query.min_experience < 0:
+            return Result.fail("min_experience cannot be negative")
+
+        # 3. Кеш
+        filter_key = self._filter_key(query, specializations)
+        version: Optional[str] = None
+        if self.cache is not None:
+            cached, version = await self.cache.get(filter_key)
+            if cached is not None:
+                return Result.ok(cached)
+
+        # 4. Считаем facets
+        facets = await self.lawyer_repository.get_facets(
+            specializations=specializations,
+            min_rating=query.min_rating,
+            max_price=query.max_price,
+            location=query.location,
+            is_available=query.is_available,
+            min_experience=query.min_experience,
+            query=query.query,
+        )
+        facets_dto = LawyerFacetsDTO.from_facets(facets)
+
+        if self.cache is not None:
+            await self.cache.set(filter_key, facets_dto, version)
+
+        return Result.ok(facets_dto)
+
+    @staticmethod
+    def _filter_key(
+        query: GetLawyerFacetsQuery,
+        specializations: Optional[List[SpecializationType]],
+    ) -> str:
+        """
+        Нормализованный ключ фильтров.
+
+        Одинаковые по смыслу фильтры дают один ключ: порядок и дубли
+        специализаций, регистр и пробелы в городе и тексте не важны.
+        """
+        return json.dumps(
+            {
+                "specializations": sorted({spec.name for spec in specializations or []}),
+                "min_rating": query.min_rating,
+                "max_price": query.max_price,
+                "location": normalize_city(query.location) if query.location else None,
+                "is_available": query.is_available,
+                "min_experience": query.min_experience,
+                "query": " ".join(query.query.split()).casefold() if query.query else None,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
@@ -11,6 +11,7 @@ from ...domain.repositories.lawyer_repository import ILawyerRepository
 from ...domain.value_objects.specialization import SpecializationType
 from ..dtos.lawyer_dto import LawyerListItemDTO
 from .get_top_rated import GetTopRatedQuery
+from .lawyer_leaderboard import ILawyerLeaderboard
 
 
 class GetTopRatedHandler:
@@ -19,21 +20,29 @@ class GetTopRatedHandler:
 
     Процесс:
     1. Конвертирует фильтры в domain types
-    2. Вызывает метод get_top_rated() на репозитории
-    3. Возвращает список LawyerListItemDTO
+    2. Читает топ из лидерборда (без запроса в БД)
+    3. Если лидерборды недоступны - вызывает get_top_rated() на репозитории
+    4. Возвращает список LawyerListItemDTO
 
     Dependencies:
         lawyer_repository: Репозиторий юристов
+        leaderboard: Лидерборды топ юристов (опционально)
     """
 
-    def __init__(self, lawyer_repository: ILawyerRepository) -> None:
+    def __init__(
+        self,
+        lawyer_repository: ILawyerRepository,
+        leaderboard: Optional[ILawyerLeaderboard] = None,
+    ) -> None:
         """
         Инициализирует handler.
 
         Args:
             lawyer_repository: Репозиторий юристов
+            leaderboard: Лидерборды топ юристов
         """
         self.lawyer_repository = lawyer_repository
+        self.leaderboard = leaderboard
 
     async def handle(
         self, query: GetTopRatedQuery
@@ -72,14 +81,24 @@ class GetTopRatedHandler:
         if query.limit <= 0 or query.limit > 50:
             return Result.fail("limit must be between 1 and 50")
 
-        # 3. Получаем топ юристов
+        # 3. Читаем из лидерборда
+        if self.leaderboard is not None:
+            top = await self.leaderboard.top(
+                specialization=specialization_enum,
+                city=query.location,
+                limit=query.limit,
+            )
+            if top is not None:
+                return Result.ok(top)
+
+        # 4. Лидерборды недоступны - читаем из БД
         lawyers = await self.lawyer_repository.get_top_rated(
             specialization=specialization_enum,
             location=query.location,
             limit=query.limit,
         )
 
-        # 4. Конвертируем в DTO
+        # 5. Конвертируем в DTO
         lawyer_dtos = [LawyerListItemDTO.from_entity(lawyer) for lawyer in lawyers]
 
         return Result.ok(lawyer_dtos)
@@ -0,0 +1,43 @@
+"""
+ILawyerFacetsCache
+
+Интерфейс кеша facet counts поиска юристов.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from ..dtos.lawyer_dto import LawyerFacetsDTO
+
+
+class ILawyerFacetsCache(ABC):
+    """
+    Кеш facet counts по нормализованному ключу фильтров.
+    """
+
+    @abstractmethod
+    async def get(self, filter_key: str) -> Tuple[Optional[LawyerFacetsDTO], Optional[str]]:
+        """
+        Получает закешированные facet counts.
+
+        Args:
+            filter_key: Нормализованный ключ фильтров
+
+        Returns:
+            Кортеж (facets или None, версия кеша для set)
+        """
+        pass
+
+    @abstractmethod
+    async def set(
+        self, filter_key: str, facets: LawyerFacetsDTO, version: Optional[str]
+    ) -> None:
+        """
+        Сохраняет facet counts в кеш.
+
+        Args:
+            filter_key: Нормализованный ключ фильтров
+            facets: Facet counts
+            version: Версия, полученная в get до расчета
+        """
+        pass
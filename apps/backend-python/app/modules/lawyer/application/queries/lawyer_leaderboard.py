@@ -0,0 +1,41 @@
+"""
+ILawyerLeaderboard
+
+Интерфейс предрассчитанных лидербордов юристов.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ...domain.value_objects.specialization import SpecializationType
+from ..dtos.lawyer_dto import LawyerListItemDTO
+
+
+class ILawyerLeaderboard(ABC):
+    """
+    Лидерборды топ юристов по (специализация, город).
+
+    Лидерборд содержит только юристов, подходящих под топ: верифицированных,
+    доступных и с рейтингом. Порядок - рейтинг DESC, отзывы DESC.
+    """
+
+    @abstractmethod
+    async def top(
+        self,
+        specialization: Optional[SpecializationType],
+        city: Optional[str],
+        limit: int,
+    ) -> Optional[List[LawyerListItemDTO]]:
+        """
+        Получает топ юристов из лидерборда.
+
+        Args:
+            specialization: Специализация (None - все)
+            city: Город (None - все), сравнивается после normalize_city
+            limit: Количество
+
+        Returns:
+            Список юристов или None, если лидерборды недоступны
+            (еще не построены или хранилище недоступно)
+        """
+        pass
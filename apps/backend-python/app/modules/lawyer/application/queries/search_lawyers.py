@@ -26,6 +26,9 @@ class SearchLawyersQuery:
         query: Текстовый поиск (по имени, описанию, образованию)
         limit: Максимальное количество результатов (по умолчанию 20)
         offset: Смещение для пагинации (по умолчанию 0)
+        near_latitude: Широта точки поиска рядом
+        near_longitude: Долгота точки поиска рядом
+        radius_km: Радиус поиска рядом (км)
     """
 
     specializations: Optional[List[str]] = None
@@ -37,3 +40,6 @@ class SearchLawyersQuery:
     query: Optional[str] = None
     limit: int = 20
     offset: int = 0
+    near_latitude: Optional[float] = None
+    near_longitude: Optional[float] = None
+    radius_km: Optional[float] = None
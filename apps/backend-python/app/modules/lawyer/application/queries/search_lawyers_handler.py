@@ -8,11 +8,39 @@ from typing import List, Optional
 
 from app.core.domain.result import Result
 from ...domain.repositories.lawyer_repository import ILawyerRepository
+from ...domain.value_objects.geo_point import GeoPoint
 from ...domain.value_objects.specialization import SpecializationType
 from ..dtos.lawyer_dto import LawyerSearchResultDTO
 from .search_lawyers import SearchLawyersQuery
 
 
+def parse_specializations(
+    names: Optional[List[str]],
+) -> Result[Optional[List[SpecializationType]]]:
+    """
+    Конвертирует специализации из фильтра в enum types.
+
+    Args:
+        names: Русские названия или enum names (None - без фильтра)
+
+    Returns:
+        Result со списком SpecializationType (или None) либо ошибкой
+    """
+    if not names:
+        return Result.ok(None)
+
+    specializations: List[SpecializationType] = []
+    for spec_str in names:
+        # Пробуем найти по display name (русское название) или enum name
+        for spec_type in SpecializationType:
+            if spec_type.value == spec_str or spec_type.name == spec_str:
+                specializations.append(spec_type)
+                break
+        else:
+            return Result.fail(f"Unknown specialization: {spec_str}")
+    return Result.ok(specializations)
+
+
 class SearchLawyersHandler:
     """
     Handler для запроса SearchLawyersQuery.
@@ -26,6 +54,9 @@ class SearchLawyersHandler:
         lawyer_repository: Репозиторий юристов
     """
 
+    DEFAULT_RADIUS_KM = 25.0
+    MAX_RADIUS_KM = 500.0
+
     def __init__(self, lawyer_repository: ILawyerRepository) -> None:
         """
         Инициализирует handler.
@@ -48,22 +79,10 @@ class SearchLawyersHandler:
             Result с LawyerSearchResultDTO или ошибкой
         """
         # 1. Конвертируем специализации в enum types
-        specializations_enum: Optional[List[SpecializationType]] = None
-        if query.specializations:
-            try:
-                specializations_enum = []
-                for spec_str in query.specializations:
-                    # Пробуем найти по display name (русское название)
-                    found = False
-                    for spec_type in SpecializationType:
-                        if spec_type.value == spec_str or spec_type.name == spec_str:
-                            specializations_enum.append(spec_type)
-                            found = True
-                            break
-                    if not found:
-                        return Result.fail(f"Unknown specialization: {spec_str}")
-            except Exception as e:
-                return Result.fail(f"Invalid specialization format: {str(e)}")
+        specializations_result = parse_specializations(query.specializations)
+        if specializations_result.is_failure:
+            return Result.fail(specializations_result.error)
+        specializations_enum = specializations_result.value
 
         # 2. Валидация параметров
         if query.min_rating is not None and (
@@ -83,6 +102,21 @@ class SearchLawyersHandler:
         if query.offset < 0:
             return Result.fail("offset cannot be negative")
 
+        near: Optional[GeoPoint] = None
+        radius_km: Optional[float] = None
+        if (query.near_latitude is None) != (query.near_longitude is None):
+            return Result.fail("near requires both latitude and longitude")
+        if query.near_latitude is not None:
+            try:
+                near = GeoPoint(query.near_latitude, query.near_longitude)
+            except ValueError as e:
+                return Result.fail(str(e))
+            radius_km = query.radius_km or self.DEFAULT_RADIUS_KM
+            if radius_km <= 0 or radius_km > self.MAX_RADIUS_KM:
+                return Result.fail(f"radius_km must be between 0 and {self.MAX_RADIUS_KM}")
+        elif query.radius_km is not None:
+            return Result.fail("radius_km requires near")
+
         # 3. Выполняем поиск
         lawyers, total = await self.lawyer_repository.search(
             specializations=specializations_enum,
@@ -94,6 +128,8 @@ class SearchLawyersHandler:
             query=query.query,
             limit=query.limit,
             offset=query.offset,
+            near=near,
+            radius_km=radius_km,
         )
 
         # 4. Создаем DTO результата
@@ -102,6 +138,7 @@ class SearchLawyersHandler:
             total=total,
             limit=query.limit,
             offset=query.offset,
+            near=near,
         )
 
         return Result.ok(result_dto)
@@ -9,7 +9,10 @@ from .entities.lawyer import Lawyer
 
 # Value Objects
 from .value_objects.experience import Experience
+from .value_objects.geo_point import GeoPoint
 from .value_objects.price import Price
+from .value_objects.lawyer_facets import LawyerFacets
+from .value_objects.location import normalize_city
 from .value_objects.rating import Rating
 from .value_objects.specialization import Specialization, SpecializationType
 from .value_objects.verification_status import (
@@ -21,11 +24,16 @@ from .value_objects.verification_status import (
 from .events.lawyer_registered import LawyerRegisteredEvent
 from .events.lawyer_verified import LawyerVerifiedEvent
 from .events.lawyer_availability_updated import LawyerAvailabilityUpdatedEvent
+from .events.lawyer_profile_updated import LawyerProfileUpdatedEvent
+from .events.lawyer_rejected import LawyerRejectedEvent
+from .events.lawyer_suspended import LawyerSuspendedEvent
 
 # Repositories
 from .repositories.lawyer_repository import ILawyerRepository
 
 # Services
+from .services.city_gazetteer import CityGazetteer
+from .services.geocoder import IGeocoder
 from .services.lawyer_verification_service import LawyerVerificationService
 
 __all__ = [
@@ -33,18 +41,26 @@ __all__ = [
     "Lawyer",
     # Value Objects
     "Experience",
+    "GeoPoint",
+    "LawyerFacets",
     "Price",
     "Rating",
     "Specialization",
     "SpecializationType",
     "VerificationStatus",
     "VerificationStatusType",
+    "normalize_city",
     # Events
     "LawyerRegisteredEvent",
     "LawyerVerifiedEvent",
     "LawyerAvailabilityUpdatedEvent",
+    "LawyerProfileUpdatedEvent",
+    "LawyerRejectedEvent",
+    "LawyerSuspendedEvent",
     # Repositories
     "ILawyerRepository",
     # Services
+    "CityGazetteer",
+    "IGeocoder",
     "LawyerVerificationService",
 ]
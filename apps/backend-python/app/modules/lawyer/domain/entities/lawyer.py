@@ -13,7 +13,11 @@ from app.core.domain.result import Result
 from ..events.lawyer_registered import LawyerRegisteredEvent
 from ..events.lawyer_verified import LawyerVerifiedEvent
 from ..events.lawyer_availability_updated import LawyerAvailabilityUpdatedEvent
+from ..events.lawyer_profile_updated import LawyerProfileUpdatedEvent
+from ..events.lawyer_rejected import LawyerRejectedEvent
+from ..events.lawyer_suspended import LawyerSuspendedEvent
 from ..value_objects.experience import Experience
+from ..value_objects.geo_point import GeoPoint
 from ..value_objects.price import Price
 from ..value_objects.rating import Rating
 from ..value_objects.specialization import Specialization
@@ -50,6 +54,7 @@ class Lawyer(AggregateRoot):
         is_available: Доступен ли для консультаций
         languages: Языки (русский, английский и т.д.)
         location: Город/регион
+        coordinates: Координаты для поиска по расстоянию (если известны)
     """
 
     MAX_SPECIALIZATIONS = 5
@@ -68,6 +73,7 @@ class Lawyer(AggregateRoot):
         education: str,
         about: str,
         location: str,
+        coordinates: Optional[GeoPoint] = None,
         rating: Optional[Rating] = None,
         reviews_count: int = 0,
         consultations_count: int = 0,
@@ -91,6 +97,7 @@ class Lawyer(AggregateRoot):
             education: Образование
             about: Описание
             location: Город/регион
+            coordinates: Координаты (опционально)
             rating: Рейтинг (опционально)
             reviews_count: Количество отзывов
             consultations_count: Количество консультаций
@@ -111,6 +118,7 @@ class Lawyer(AggregateRoot):
         self._education = education
         self._about = about
         self._location = location
+        self._coordinates = coordinates
         self._rating = rating
         self._reviews_count = reviews_count
         self._consultations_count = consultations_count
@@ -132,6 +140,7 @@ class Lawyer(AggregateRoot):
         about: str,
         location: str,
         languages: Optional[List[str]] = None,
+        coordinates: Optional[GeoPoint] = None,
     ) -> Result["Lawyer"]:
         """
         Фабричный метод для создания нового юриста.
@@ -146,6 +155,7 @@ class Lawyer(AggregateRoot):
             about: Описание
             location: Город/регион
             languages: Языки
+            coordinates: Координаты (None - юрист не участвует в поиске рядом)
 
         Returns:
             Result с новым юристом или ошибкой
@@ -192,6 +202,7 @@ class Lawyer(AggregateRoot):
             education=education.strip(),
             about=about.strip(),
             location=location.strip(),
+            coordinates=coordinates,
             rating=None,  # Новый юрист без рейтинга
             reviews_count=0,
             consultations_count=0,
@@ -274,6 +285,15 @@ class Lawyer(AggregateRoot):
         self._is_available = False
         self._updated_at = datetime.utcnow()
 
+        # Добавляем domain event
+        self.add_domain_event(
+            LawyerRejectedEvent(
+                lawyer_id=self.id,
+                reason=reason.strip(),
+                rejected_by=rejected_by_admin_id,
+            )
+        )
+
         return Result.ok()
 
     def suspend(self, reason: str, suspended_by_admin_id: str) -> Result[None]:
@@ -297,6 +317,15 @@ class Lawyer(AggregateRoot):
         self._is_available = False
         self._updated_at = datetime.utcnow()
 
+        # Добавляем domain event
+        self.add_domain_event(
+            LawyerSuspendedEvent(
+                lawyer_id=self.id,
+                reason=reason.strip(),
+                suspended_by=suspended_by_admin_id,
+            )
+        )
+
         return Result.ok()
 
     def update_availability(self, is_available: bool) -> Result[None]:
@@ -396,8 +425,40 @@ class Lawyer(AggregateRoot):
             self._languages = languages
 
         self._updated_at = datetime.utcnow()
+
+        # Добавляем domain event
+        self.add_domain_event(LawyerProfileUpdatedEvent(lawyer_id=self.id))
+
         return Result.ok()
 
+    def update_location(
+        self,
+        location: str,
+        coordinates: Optional[GeoPoint],
+    ) -> Result[None]:
+        """
+        Обновляет город и координаты юриста.
+
+        Args:
+            location: Город/регион
+            coordinates: Координаты офиса (None - неизвестны, их проставит
+                фоновое геокодирование)
+
+        Returns:
+            Result с успехом или ошибкой
+        """
+        if not location or len(location.strip()) < 2:
+            return Result.fail("Location must be specified")
+
+        self._location = location.strip()
+        self._coordinates = coordinates
+        self._updated_at = datetime.utcnow()
+
+        # Добавляем domain event
+        self.add_domain_event(LawyerProfileUpdatedEvent(lawyer_id=self.id))
+
+        return Result.ok(None)
+
     # Properties (read-only access)
 
     @property
@@ -448,6 +509,10 @@ class Lawyer(AggregateRoot):
     def location(self) -> str:
         return self._location
 
+    @property
+    def coordinates(self) -> Optional[GeoPoint]:
+        return self._coordinates
+
     @property
     def is_available(self) -> bool:
         return self._is_available
@@ -7,9 +7,15 @@ Domain Events для Lawyer Module
 from .lawyer_registered import LawyerRegisteredEvent
 from .lawyer_verified import LawyerVerifiedEvent
 from .lawyer_availability_updated import LawyerAvailabilityUpdatedEvent
+from .lawyer_profile_updated import LawyerProfileUpdatedEvent
+from .lawyer_rejected import LawyerRejectedEvent
+from .lawyer_suspended import LawyerSuspendedEvent
 
 __all__ = [
     "LawyerRegisteredEvent",
     "LawyerVerifiedEvent",
     "LawyerAvailabilityUpdatedEvent",
+    "LawyerProfileUpdatedEvent",
+    "LawyerRejectedEvent",
+    "LawyerSuspendedEvent",
 ]
@@ -0,0 +1,40 @@
+"""
+LawyerProfileUpdatedEvent
+
+Событие изменения профиля юриста.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import uuid4
+
+from app.core.domain.domain_event import DomainEvent
+
+
+@dataclass(frozen=True)
+class LawyerProfileUpdatedEvent(DomainEvent):
+    """
+    Событие: Профиль юриста изменен.
+
+    Публикуется после изменения описания, цены или языков юриста.
+
+    Use Cases:
+    - Обновление карточки юриста в лидербордах
+    - Обновление индекса поиска
+
+    Attributes:
+        lawyer_id: ID юриста
+        occurred_at: Время события
+    """
+
+    lawyer_id: str
+    occurred_at: datetime = None
+
+    def __post_init__(self):
+        """Инициализация после создания."""
+        if self.occurred_at is None:
+            object.__setattr__(self, "occurred_at", datetime.utcnow())
+        if not hasattr(self, "event_id") or self.event_id is None:
+            object.__setattr__(self, "event_id", str(uuid4()))
+        if not hasattr(self, "event_type") or self.event_type is None:
+            object.__setattr__(self, "event_type", "LawyerProfileUpdatedEvent")
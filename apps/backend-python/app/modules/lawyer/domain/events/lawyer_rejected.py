@@ -0,0 +1,46 @@
+"""
+LawyerRejectedEvent
+
+Событие отклонения заявки юриста.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import uuid4
+
+from app.core.domain.domain_event import DomainEvent
+
+
+@dataclass(frozen=True)
+class LawyerRejectedEvent(DomainEvent):
+    """
+    Событие: Заявка юриста отклонена.
+
+    Публикуется после отклонения документов администратором.
+    Юрист не может принимать консультации.
+
+    Use Cases:
+    - Уведомление юриста о причине отклонения
+    - Исключение из поиска и лидербордов
+    - Логирование для аудита
+
+    Attributes:
+        lawyer_id: ID юриста
+        reason: Причина отклонения
+        rejected_by: ID администратора
+        occurred_at: Время события
+    """
+
+    lawyer_id: str
+    reason: str
+    rejected_by: str
+    occurred_at: datetime = None
+
+    def __post_init__(self):
+        """Инициализация после создания."""
+        if self.occurred_at is None:
+            object.__setattr__(self, "occurred_at", datetime.utcnow())
+        if not hasattr(self, "event_id") or self.event_id is None:
+            object.__setattr__(self, "event_id", str(uuid4()))
+        if not hasattr(self, "event_type") or self.event_type is None:
+            object.__setattr__(self, "event_type", "LawyerRejectedEvent")
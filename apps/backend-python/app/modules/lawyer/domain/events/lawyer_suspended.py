@@ -0,0 +1,46 @@
+"""
+LawyerSuspendedEvent
+
+Событие приостановки аккаунта юриста.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import uuid4
+
+from app.core.domain.domain_event import DomainEvent
+
+
+@dataclass(frozen=True)
+class LawyerSuspendedEvent(DomainEvent):
+    """
+    Событие: Аккаунт юриста приостановлен.
+
+    Публикуется после приостановки аккаунта администратором.
+    Юрист перестает принимать консультации.
+
+    Use Cases:
+    - Уведомление юриста
+    - Исключение из поиска, лидербордов и экстренных консультаций
+    - Логирование для аудита
+
+    Attributes:
+        lawyer_id: ID юриста
+        reason: Причина приостановки
+        suspended_by: ID администратора
+        occurred_at: Время события
+    """
+
+    lawyer_id: str
+    reason: str
+    suspended_by: str
+    occurred_at: datetime = None
+
+    def __post_init__(self):
+        """Инициализация после создания."""
+        if self.occurred_at is None:
+            object.__setattr__(self, "occurred_at", datetime.utcnow())
+        if not hasattr(self, "event_id") or self.event_id is None:
+            object.__setattr__(self, "event_id", str(uuid4()))
+        if not hasattr(self, "event_type") or self.event_type is None:
+            object.__setattr__(self, "event_type", "LawyerSuspendedEvent")
@@ -8,6 +8,8 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from ..entities.lawyer import Lawyer
+from ..value_objects.geo_point import GeoPoint
+from ..value_objects.lawyer_facets import LawyerFacets
 from ..value_objects.specialization import SpecializationType
 from ..value_objects.verification_status import VerificationStatusType
 
@@ -25,6 +27,7 @@ class ILawyerRepository(ABC):
         find_by_user_id: Найти по user_id
         find_by_status: Найти по статусу верификации
         search: Поиск юристов с фильтрами
+        get_facets: Facet counts для фильтров поиска
         exists_by_user_id: Проверить существование по user_id
         delete: Удалить юриста
         get_top_rated: Получить топ юристов по рейтингу
@@ -99,6 +102,8 @@ class ILawyerRepository(ABC):
         query: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        near: Optional[GeoPoint] = None,
+        radius_km: Optional[float] = None,
     ) -> tuple[List[Lawyer], int]:
         """
         Поиск юристов с фильтрами.
@@ -113,12 +118,42 @@ class ILawyerRepository(ABC):
             query: Текстовый поиск (по имени, описанию)
             limit: Максимальное количество результатов
             offset: Смещение для пагинации
+            near: Точка поиска рядом (результаты - по расстоянию)
+            radius_km: Радиус поиска рядом (км), обязателен вместе с near
 
         Returns:
             Tuple (список Lawyer entities, общее количество)
         """
         pass
 
+    @abstractmethod
+    async def get_facets(
+        self,
+        specializations: Optional[List[SpecializationType]] = None,
+        min_rating: Optional[float] = None,
+        max_price: Optional[float] = None,
+        location: Optional[str] = None,
+        is_available: Optional[bool] = None,
+        min_experience: Optional[int] = None,
+        query: Optional[str] = None,
+    ) -> LawyerFacets:
+        """
+        Facet counts для фильтров поиска (фильтры - как в search).
+
+        Args:
+            specializations: Фильтр по специализациям
+            min_rating: Минимальный рейтинг
+            max_price: Максимальная цена
+            location: Город/регион
+            is_available: Доступность
+            min_experience: Минимальный опыт (годы)
+            query: Текстовый поиск (по имени, описанию)
+
+        Returns:
+            LawyerFacets
+        """
+        pass
+
     @abstractmethod
     async def exists_by_user_id(self, user_id: str) -> bool:
         """
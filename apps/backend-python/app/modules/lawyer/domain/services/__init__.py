@@ -4,6 +4,8 @@ Domain Services для Lawyer Module
 Бизнес-логика, не принадлежащая одной сущности.
 """
 
+from .city_gazetteer import CityGazetteer
+from .geocoder import IGeocoder
 from .lawyer_verification_service import LawyerVerificationService
 
-__all__ = ["LawyerVerificationService"]
+__all__ = ["CityGazetteer", "IGeocoder", "LawyerVerificationService"]
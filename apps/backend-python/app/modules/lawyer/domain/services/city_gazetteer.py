@@ -0,0 +1,98 @@
+"""
+City Gazetteer
+
+Domain Service для геокодирования города юриста.
+"""
+
+from typing import Dict, Optional
+
+from ..value_objects.geo_point import GeoPoint
+from ..value_objects.location import normalize_city
+
+
+class CityGazetteer:
+    """
+    Справочник координат городов (центр города).
+
+    Юрист указывает город свободным текстом ("г. Москва", "Санкт-Петербург,
+    Россия"), поэтому сначала ищется точное совпадение, затем самое
+    длинное название из справочника, входящее в строку.
+
+    Examples:
+        >>> CityGazetteer.locate("г. Санкт-Петербург").latitude
+        59.9343
+    """
+
+    CITIES: Dict[str, tuple[float, float]] = {
+        "москва": (55.7558, 37.6173),
+        "санкт-петербург": (59.9343, 30.3351),
+        "новосибирск": (55.0084, 82.9357),
+        "екатеринбург": (56.8389, 60.6057),
+        "казань": (55.7963, 49.1088),
+        "нижний новгород": (56.2965, 43.9361),
+        "челябинск": (55.1644, 61.4368),
+        "самара": (53.1959, 50.1002),
+        "омск": (54.9885, 73.3242),
+        "ростов-на-дону": (47.2357, 39.7015),
+        "уфа": (54.7388, 55.9721),
+        "красноярск": (56.0153, 92.8932),
+        "воронеж": (51.6720, 39.1843),
+        "пермь": (58.0105, 56.2502),
+        "волгоград": (48.7080, 44.5133),
+        "краснодар": (45.0355, 38.9753),
+        "саратов": (51.5336, 46.0343),
+        "тюмень": (57.1522, 65.5272),
+        "тольятти": (53.5078, 49.4204),
+        "ижевск": (56.8526, 53.2045),
+        "барнаул": (53.3548, 83.7698),
+        "ульяновск": (54.3142, 48.4031),
+        "иркутск": (52.2870, 104.3050),
+        "хабаровск": (48.4802, 135.0719),
+        "ярославль": (57.6261, 39.8845),
+        "владивосток": (43.1198, 131.8869),
+        "махачкала": (42.9849, 47.5047),
+        "томск": (56.4977, 84.9744),
+        "оренбург": (51.7682, 55.0970),
+        "кемерово": (55.3547, 86.0873),
+        "новокузнецк": (53.7557, 87.1099),
+        "рязань": (54.6292, 39.7364),
+        "астрахань": (46.3479, 48.0336),
+        "пенза": (53.1959, 45.0184),
+        "липецк": (52.6088, 39.5992),
+        "тула": (54.1931, 37.6173),
+        "калининград": (54.7104, 20.4522),
+        "сочи": (43.6028, 39.7342),
+        "севастополь": (44.6167, 33.5254),
+        "симферополь": (44.9521, 34.1024),
+        "мурманск": (68.9585, 33.0827),
+        "архангельск": (64.5393, 40.5187),
+        "якутск": (62.0355, 129.6755),
+    }
+
+    # Для поиска вхождений: длинные названия раньше ("нижний новгород" до "новгород")
+    _BY_LENGTH = sorted(CITIES, key=len, reverse=True)
+
+    @classmethod
+    def locate(cls, location: str) -> Optional[GeoPoint]:
+        """
+        Геокодирует город.
+
+        Args:
+            location: Город/регион в произвольном написании
+
+        Returns:
+            GeoPoint центра города или None, если города нет в справочнике
+        """
+        city = normalize_city(location or "")
+        if not city:
+            return None
+
+        coordinates = cls.CITIES.get(city)
+        if coordinates is None:
+            for name in cls._BY_LENGTH:
+                if name in city:
+                    coordinates = cls.CITIES[name]
+                    break
+        if coordinates is None:
+            return None
+        return GeoPoint(*coordinates)
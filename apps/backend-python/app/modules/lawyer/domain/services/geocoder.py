@@ -0,0 +1,32 @@
+"""
+Geocoder Interface
+
+Интерфейс геокодирования адреса юриста.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..value_objects.geo_point import GeoPoint
+
+
+class IGeocoder(ABC):
+    """
+    Интерфейс геокодера.
+
+    Реализация живет в infrastructure слое (внешний сервис геокодирования
+    со справочником CityGazetteer в качестве запасного варианта).
+    """
+
+    @abstractmethod
+    async def locate(self, address: str) -> Optional[GeoPoint]:
+        """
+        Определяет координаты адреса.
+
+        Args:
+            address: Адрес или город в свободной форме
+
+        Returns:
+            GeoPoint или None, если адрес не найден
+        """
+        pass
@@ -9,6 +9,9 @@ from .specialization import Specialization
 from .verification_status import VerificationStatus
 from .rating import Rating
 from .price import Price
+from .location import normalize_city
+from .lawyer_facets import LawyerFacets
+from .geo_point import GeoPoint
 
 __all__ = [
     "Experience",
@@ -16,4 +19,7 @@ __all__ = [
     "VerificationStatus",
     "Rating",
     "Price",
+    "normalize_city",
+    "LawyerFacets",
+    "GeoPoint",
 ]
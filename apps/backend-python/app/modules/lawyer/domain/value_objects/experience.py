@@ -39,6 +39,7 @@ class Experience(ValueObject):
     MIDDLE_THRESHOLD = 7  # 3-7 лет - Опытный
     SENIOR_THRESHOLD = 15  # 7-15 лет - Старший
     # 15+ лет - Эксперт
+    LEVELS = ("Начинающий", "Опытный", "Старший", "Эксперт")
 
     def __init__(self, years: int) -> None:
         """
@@ -89,13 +90,13 @@ class Experience(ValueObject):
             Уровень: Начинающий, Опытный, Старший, Эксперт
         """
         if self._years < self.JUNIOR_THRESHOLD:
-            return "Начинающий"
+            return self.LEVELS[0]
         elif self._years < self.MIDDLE_THRESHOLD:
-            return "Опытный"
+            return self.LEVELS[1]
         elif self._years < self.SENIOR_THRESHOLD:
-            return "Старший"
+            return self.LEVELS[2]
         else:
-            return "Эксперт"
+            return self.LEVELS[3]
 
     @property
     def is_junior(self) -> bool:
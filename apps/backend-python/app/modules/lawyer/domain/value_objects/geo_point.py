@@ -0,0 +1,176 @@
+"""
+GeoPoint Value Object
+
+Координаты юриста и geohash для поиска по расстоянию.
+"""
+
+import math
+from typing import Any, List
+
+from app.core.domain.value_object import ValueObject
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Алфавит geohash (base32 без a, i, l, o)
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+class GeoPoint(ValueObject):
+    """
+    Value Object для географической точки (WGS 84).
+
+    Business Rules:
+    - Широта от -90 до 90
+    - Долгота от -180 до 180
+
+    Examples:
+        >>> point = GeoPoint(59.9343, 30.3351)
+        >>> point.geohash(5)
+        'udtsf'
+    """
+
+    # Точность geohash, хранимого у юриста (~4.8 x 4.8 м)
+    GEOHASH_PRECISION = 9
+
+    def __init__(self, latitude: float, longitude: float) -> None:
+        """
+        Создает точку.
+
+        Args:
+            latitude: Широта
+            longitude: Долгота
+
+        Raises:
+            ValueError: Если координаты невалидные
+        """
+        if not -90.0 <= latitude <= 90.0:
+            raise ValueError(f"Latitude must be between -90 and 90, got {latitude}")
+        if not -180.0 <= longitude <= 180.0:
+            raise ValueError(f"Longitude must be between -180 and 180, got {longitude}")
+
+        self._latitude = float(latitude)
+        self._longitude = float(longitude)
+
+    @property
+    def latitude(self) -> float:
+        """Широта."""
+        return self._latitude
+
+    @property
+    def longitude(self) -> float:
+        """Долгота."""
+        return self._longitude
+
+    def geohash(self, precision: int = GEOHASH_PRECISION) -> str:
+        """
+        Кодирует точку в geohash.
+
+        Args:
+            precision: Количество символов
+
+        Returns:
+            Geohash (соседние точки имеют общий префикс)
+        """
+        lat_range = [-90.0, 90.0]
+        lon_range = [-180.0, 180.0]
+        chars = []
+        bits = 0
+        value = 0
+        even = True
+        while len(chars) < precision:
+            # Биты чередуются: четные - долгота, нечетные - широта
+            coordinate, bounds = (
+                (self._longitude, lon_range) if even else (self._latitude, lat_range)
+            )
+            middle = (bounds[0] + bounds[1]) / 2
+            value <<= 1
+            if coordinate >= middle:
+                value |= 1
+                bounds[0] = middle
+            else:
+                bounds[1] = middle
+            even = not even
+            bits += 1
+            if bits == 5:
+                chars.append(_GEOHASH_ALPHABET[value])
+                bits = 0
+                value = 0
+        return "".join(chars)
+
+    def distance_km(self, other: "GeoPoint") -> float:
+        """
+        Расстояние по поверхности Земли (формула гаверсинусов).
+
+        Args:
+            other: Другая точка
+
+        Returns:
+            Расстояние в километрах
+        """
+        lat1, lat2 = math.radians(self._latitude), math.radians(other._latitude)
+        d_lat = lat2 - lat1
+        d_lon = math.radians(other._longitude - self._longitude)
+        a = (
+            math.sin(d_lat / 2) ** 2
+            + math.cos(lat1) * math.cos(lat2) * math.sin(d_lon / 2) ** 2
+        )
+        return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+
+    def geohash_cover(self, radius_km: float) -> List[str]:
+        """
+        Префиксы geohash, покрывающие круг радиуса radius_km вокруг точки.
+
+        Выбирается самая длинная точность, у которой ячейка не меньше
+        радиуса, и берутся ячейка точки и 8 соседних: круг целиком лежит
+        в этом блоке 3x3.
+
+        Args:
+            radius_km: Радиус поиска
+
+        Returns:
+            Список префиксов (пустой - круг больше ячеек первого уровня,
+            фильтровать по geohash не нужно)
+        """
+        lat_km = 111.32
+        lon_km = lat_km * max(math.cos(math.radians(self._latitude)), 0.01)
+
+        precision = 0
+        for candidate in range(1, self.GEOHASH_PRECISION + 1):
+            lat_deg, lon_deg = _cell_size(candidate)
+            if min(lat_deg * lat_km, lon_deg * lon_km) < radius_km:
+                break
+            precision = candidate
+        if precision == 0:
+            return []
+
+        lat_deg, lon_deg = _cell_size(precision)
+        prefixes = set()
+        for d_lat in (-1, 0, 1):
+            latitude = self._latitude + d_lat * lat_deg
+            if not -90.0 <= latitude <= 90.0:
+                continue
+            for d_lon in (-1, 0, 1):
+                # Через антимеридиан
+                longitude = (self._longitude + d_lon * lon_deg + 180.0) % 360.0 - 180.0
+                prefixes.add(GeoPoint(latitude, longitude).geohash(precision))
+        return sorted(prefixes)
+
+    def _get_equality_components(self) -> tuple[Any, ...]:
+        """Компоненты для сравнения."""
+        return (self._latitude, self._longitude)
+
+    def __str__(self) -> str:
+        """Строковое представление."""
+        return f"{self._latitude:.6f},{self._longitude:.6f}"
+
+    def __repr__(self) -> str:
+        """Repr для отладки."""
+        return f"GeoPoint({self._latitude}, {self._longitude})"
+
+
+def _cell_size(precision: int) -> tuple[float, float]:
+    """Размер ячейки geohash в градусах (широта, долгота)."""
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
@@ -0,0 +1,33 @@
+"""
+Lawyer Facets Value Object
+
+Количество юристов по значениям фильтров поиска (facet counts).
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class LawyerFacets:
+    """
+    Facet counts поиска юристов.
+
+    Каждый facet считается со всеми фильтрами, кроме собственного
+    (специализации - без фильтра специализаций, ценовые категории - без
+    max_price и т.д.): счетчик показывает, сколько юристов будет найдено
+    при выборе значения. Нулевые значения не включаются.
+
+    Attributes:
+        total: Количество юристов со всеми фильтрами
+        specializations: По SpecializationType name
+        price_ranges: По ценовой категории (Price.CATEGORIES)
+        experience_levels: По уровню опыта (Experience.LEVELS)
+        cities: По городу (normalize_city)
+    """
+
+    total: int = 0
+    specializations: Dict[str, int] = field(default_factory=dict)
+    price_ranges: Dict[str, int] = field(default_factory=dict)
+    experience_levels: Dict[str, int] = field(default_factory=dict)
+    cities: Dict[str, int] = field(default_factory=dict)
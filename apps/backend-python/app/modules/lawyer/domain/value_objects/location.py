@@ -0,0 +1,21 @@
+"""
+Location
+
+Нормализация города юриста для ключей поиска.
+"""
+
+
+def normalize_city(city: str) -> str:
+    """
+    Нормализует город ("Санкт-Петербург " -> "санкт-петербург").
+
+    Используется как ключ выборок по городу (лидерборды, пулы экстренных
+    консультаций), поэтому одинаково применяется при записи и при поиске.
+
+    Args:
+        city: Город/регион в произвольном написании
+
+    Returns:
+        Нормализованное название
+    """
+    return " ".join(city.split()).casefold().replace("ё", "е")
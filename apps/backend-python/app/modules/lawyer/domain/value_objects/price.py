@@ -42,6 +42,8 @@ class Price(ValueObject):
     BUDGET_THRESHOLD = Decimal("1500.00")  # До 1500 - Бюджетный
     AVERAGE_THRESHOLD = Decimal("3000.00")  # 1500-3000 - Средний
     PREMIUM_THRESHOLD = Decimal("5000.00")  # 3000-5000 - Выше среднего
+    # Категории по порядку порогов (последняя - от PREMIUM_THRESHOLD)
+    CATEGORIES = ("Бюджетный", "Средний", "Выше среднего", "Премиум")
     # 5000+ - Премиум
 
     def __init__(self, amount: Decimal | int | float | str) -> None:
@@ -141,13 +143,13 @@ class Price(ValueObject):
             Категория: Бюджетный, Средний, Выше среднего, Премиум
         """
         if self._amount < self.BUDGET_THRESHOLD:
-            return "Бюджетный"
+            return self.CATEGORIES[0]
         elif self._amount < self.AVERAGE_THRESHOLD:
-            return "Средний"
+            return self.CATEGORIES[1]
         elif self._amount < self.PREMIUM_THRESHOLD:
-            return "Выше среднего"
+            return self.CATEGORIES[2]
         else:
-            return "Премиум"
+            return self.CATEGORIES[3]
 
     @property
     def is_budget(self) -> bool:
@@ -3,3 +3,17 @@ Lawyer Infrastructure Layer
 
 Реализация технических деталей для Lawyer Module.
 """
+
+from .facets_cache import RedisLawyerFacetsCache, lawyer_facets_cache
+from .leaderboard import RedisLawyerLeaderboard, lawyer_leaderboard
+from .search_index import LawyerIndexResult, LawyerSearchIndex, lawyer_search_index
+
+__all__ = [
+    "RedisLawyerFacetsCache",
+    "lawyer_facets_cache",
+    "RedisLawyerLeaderboard",
+    "lawyer_leaderboard",
+    "LawyerIndexResult",
+    "LawyerSearchIndex",
+    "lawyer_search_index",
+]
@@ -0,0 +1,82 @@
+"""
+Lawyer Event Handlers
+
+Подписчики Lawyer Module на доменные события (доставляются через outbox).
+"""
+
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.infrastructure.database import async_session_factory
+from app.core.infrastructure.event_bus import EventBus, EventEnvelope
+from .facets_cache import lawyer_facets_cache
+from .leaderboard import lawyer_leaderboard
+from .persistence.models import LawyerModel
+from .search_index import lawyer_search_index
+
+
+async def lawyer_id_from_event(event: EventEnvelope) -> Optional[str]:
+    """
+    ID профиля юриста (lawyers.id) из события.
+
+    События юриста содержат lawyers.id, события консультаций - ID
+    пользователя юриста (consultations.lawyer_id), он переводится через
+    lawyers.user_id.
+    """
+    lawyer_id = event.payload.get("lawyer_id")
+    if not lawyer_id or event.aggregate_type != "Consultation":
+        return lawyer_id
+
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(LawyerModel.id).where(LawyerModel.user_id == str(lawyer_id))
+        )
+        return result.scalar_one_or_none()
+
+
+async def sync_leaderboards(event: EventEnvelope) -> None:
+    """Обновить юриста в лидербордах топ юристов."""
+    lawyer_id = await lawyer_id_from_event(event)
+    if lawyer_id:
+        await lawyer_leaderboard.sync_lawyer(lawyer_id)
+
+
+async def refresh_search_index(event: EventEnvelope) -> None:
+    """Обновить юриста в in-memory индексах поиска всех процессов и сбросить кеш facets."""
+    lawyer_id = await lawyer_id_from_event(event)
+    if lawyer_id:
+        await lawyer_search_index.publish_change(lawyer_id)
+        await lawyer_facets_cache.invalidate()
+
+
+def register_event_handlers(bus: EventBus) -> None:
+    """
+    Зарегистрировать подписчиков Lawyer Module.
+
+    Args:
+        bus: Event bus
+    """
+    # Лидерборды: попадание в топ (верификация, доступность, отклонение,
+    # приостановка), карточка (профиль) и рейтинг
+    for event_name in (
+        "LawyerVerifiedEvent",
+        "LawyerAvailabilityUpdatedEvent",
+        "LawyerProfileUpdatedEvent",
+        "LawyerRejectedEvent",
+        "LawyerSuspendedEvent",
+        "ConsultationRatedEvent",
+    ):
+        bus.subscribe(event_name, sync_leaderboards)
+
+    # Индекс поиска и кеш facets: любые изменения полей, по которым фильтруется поиск
+    for event_name in (
+        "LawyerRegisteredEvent",
+        "LawyerVerifiedEvent",
+        "LawyerAvailabilityUpdatedEvent",
+        "LawyerProfileUpdatedEvent",
+        "LawyerRejectedEvent",
+        "LawyerSuspendedEvent",
+        "ConsultationRatedEvent",
+    ):
+        bus.subscribe(event_name, refresh_search_index)
@@ -0,0 +1,115 @@
+"""
+Lawyer Facets Cache
+
+Redis кеш facet counts поиска юристов.
+
+Ключ записи - хеш нормализованных фильтров и глобальная версия. Любое
+изменение юриста, влияющее на поиск, увеличивает версию (INCR), и все
+записи разом перестают читаться; изменения без событий (например, цены)
+видны после TTL.
+
+Ключи:
+- lawyer_facets:version - версия facet counts
+- lawyer_facets:v{version}:{sha1(filters)} - JSON LawyerFacetsDTO
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.core.infrastructure.cache import RedisClient, redis_client
+from ..application.dtos.lawyer_dto import LawyerFacetsDTO
+from ..application.queries.lawyer_facets_cache import ILawyerFacetsCache
+
+logger = logging.getLogger(__name__)
+
+
+class RedisLawyerFacetsCache(ILawyerFacetsCache):
+    """
+    Кеш facet counts в Redis.
+
+    Ошибки Redis не пробрасываются: при недоступности кеша facets
+    считаются заново.
+    """
+
+    KEY_PREFIX = "lawyer_facets"
+    VERSION_KEY = f"{KEY_PREFIX}:version"
+
+    def __init__(self, redis: RedisClient, ttl: timedelta):
+        """
+        Args:
+            redis: Redis клиент
+            ttl: Время жизни записей
+        """
+        self._redis = redis
+        self._ttl = ttl
+
+    def _facets_key(self, filter_key: str, version: str) -> str:
+        digest = hashlib.sha1(filter_key.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:v{version}:{digest}"
+
+    async def get(self, filter_key: str) -> Tuple[Optional[LawyerFacetsDTO], Optional[str]]:
+        """
+        Получает закешированные facet counts (2 round trip: версия + данные).
+
+        Args:
+            filter_key: Нормализованный ключ фильтров
+
+        Returns:
+            Кортеж (facets или None, версия кеша)
+        """
+        if not self._redis.is_connected:
+            return None, None
+
+        try:
+            version = await self._redis.client.get(self.VERSION_KEY) or "0"
+            value = await self._redis.client.get(self._facets_key(filter_key, version))
+        except RedisError as e:
+            logger.warning(f"Lawyer facets cache read failed: {e}")
+            return None, None
+
+        if value is None:
+            return None, version
+        return LawyerFacetsDTO(**json.loads(value)), version
+
+    async def set(
+        self, filter_key: str, facets: LawyerFacetsDTO, version: Optional[str]
+    ) -> None:
+        """
+        Сохраняет facet counts под версией, прочитанной до расчета.
+
+        Args:
+            filter_key: Нормализованный ключ фильтров
+            facets: Facet counts
+            version: Версия из get
+        """
+        if not self._redis.is_connected or version is None:
+            return
+
+        try:
+            await self._redis.client.set(
+                self._facets_key(filter_key, version),
+                json.dumps(asdict(facets), ensure_ascii=False),
+                ex=self._ttl,
+            )
+        except RedisError as e:
+            logger.warning(f"Lawyer facets cache write failed: {e}")
+
+    async def invalidate(self) -> None:
+        """Инвалидирует все facet counts (увеличивает версию)."""
+        if not self._redis.is_connected:
+            return
+        await self._redis.client.incr(self.VERSION_KEY)
+
+
+# Глобальный кеш facet counts
+lawyer_facets_cache = RedisLawyerFacetsCache(
+    redis=redis_client,
+    ttl=timedelta(seconds=settings.lawyer_facets_cache_ttl_seconds),
+)
@@ -0,0 +1,200 @@
+"""
+Lawyer Geocoding
+
+Геокодирование адресов юристов: внешний геокодер (Nominatim API) со
+справочником городов CityGazetteer в качестве запасного варианта, и
+фоновое геокодирование юристов без координат.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.core.infrastructure.database import async_session_factory
+from ..domain.services.city_gazetteer import CityGazetteer
+from ..domain.services.geocoder import IGeocoder
+from ..domain.value_objects.geo_point import GeoPoint
+from .persistence.models.lawyer_model import LawyerModel
+
+logger = logging.getLogger(__name__)
+
+
+class NominatimGeocoder(IGeocoder):
+    """
+    Геокодер поверх Nominatim-совместимого API (GET /search).
+
+    Запросы выполняются не чаще одного в min_interval секунд на процесс
+    (usage policy публичного Nominatim - 1 запрос в секунду).
+    """
+
+    def __init__(self, base_url: str, timeout: float, min_interval: float) -> None:
+        """
+        Args:
+            base_url: URL геокодера (например, https://nominatim.openstreetmap.org)
+            timeout: Таймаут запроса (секунды)
+            min_interval: Минимальный интервал между запросами (секунды)
+        """
+        self._url = base_url.rstrip("/") + "/search"
+        self._timeout = timeout
+        self._min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._last_request = 0.0
+
+    async def locate(self, address: str) -> Optional[GeoPoint]:
+        """
+        Определяет координаты адреса.
+
+        Args:
+            address: Адрес или город в свободной форме
+
+        Returns:
+            GeoPoint или None, если адрес не найден
+
+        Raises:
+            httpx.HTTPError: Геокодер недоступен или вернул ошибку
+        """
+        async with self._lock:
+            delay = self._last_request + self._min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                async with httpx.AsyncClient(timeout=self._timeout) as client:
+                    response = await client.get(
+                        self._url,
+                        params={"q": address, "format": "jsonv2", "limit": 1},
+                        headers={
+                            "User-Agent": f"{settings.app_name}/{settings.app_version}",
+                            "Accept-Language": "ru",
+                        },
+                    )
+            finally:
+                self._last_request = time.monotonic()
+
+        response.raise_for_status()
+        places = response.json()
+        if not places:
+            return None
+        try:
+            return GeoPoint(float(places[0]["lat"]), float(places[0]["lon"]))
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Unexpected geocoder response for {address!r}: {places[0]}")
+            return None
+
+
+class LawyerGeocoder(IGeocoder):
+    """
+    Геокодер юристов: внешний геокодер, если он настроен, иначе (или если
+    он не нашел адрес либо недоступен) - центр города из CityGazetteer.
+    """
+
+    def __init__(self, primary: Optional[IGeocoder] = None) -> None:
+        """
+        Args:
+            primary: Внешний геокодер (None - только справочник городов)
+        """
+        self._primary = primary
+
+    async def locate(self, address: str) -> Optional[GeoPoint]:
+        """
+        Определяет координаты адреса.
+
+        Args:
+            address: Адрес или город в свободной форме
+
+        Returns:
+            GeoPoint или None, если адрес не найден ни геокодером, ни в справочнике
+        """
+        if self._primary is not None:
+            try:
+                point = await self._primary.locate(address)
+            except httpx.HTTPError as e:
+                logger.warning(f"Geocoder failed for {address!r}: {e}")
+            else:
+                if point is not None:
+                    return point
+        return CityGazetteer.locate(address)
+
+
+def create_lawyer_geocoder() -> LawyerGeocoder:
+    """Создать геокодер юристов по настройкам."""
+    primary = None
+    if settings.lawyer_geocoder_url:
+        primary = NominatimGeocoder(
+            base_url=settings.lawyer_geocoder_url,
+            timeout=settings.lawyer_geocoder_timeout_seconds,
+            min_interval=settings.lawyer_geocoder_min_interval_seconds,
+        )
+    return LawyerGeocoder(primary)
+
+
+# Глобальный геокодер (общий на процесс: интервал запросов считается на процесс)
+lawyer_geocoder = create_lawyer_geocoder()
+
+
+async def geocode_missing_lawyers() -> int:
+    """
+    Проставить координаты юристам без них (через lawyer_geocoder).
+
+    Обходит юристов без координат пачками по первичному ключу. Геокодер
+    вызывается вне транзакции (внешний сервис может отвечать секундами),
+    координаты записываются, только если их еще никто не проставил и
+    город за это время не сменился.
+
+    Каждый город геокодируется один раз за запуск. Ненайденные адреса
+    остаются без координат и повторяются при следующем запуске.
+
+    Returns:
+        Количество геокодированных юристов
+    """
+    chunk_size = settings.scheduler_chunk_size
+    points: Dict[str, Optional[GeoPoint]] = {}
+    geocoded = 0
+    last_id = ""
+    while True:
+        async with async_session_factory() as session:
+            result = await session.execute(
+                select(LawyerModel.id, LawyerModel.location)
+                .where(LawyerModel.latitude.is_(None), LawyerModel.id > last_id)
+                .order_by(LawyerModel.id)
+                .limit(chunk_size)
+            )
+            rows = result.all()
+
+        located: List[Tuple[str, str, GeoPoint]] = []
+        for lawyer_id, location in rows:
+            if location not in points:
+                points[location] = await lawyer_geocoder.locate(location)
+            if points[location] is not None:
+                located.append((lawyer_id, location, points[location]))
+
+        if located:
+            async with async_session_factory() as session:
+                async with session.begin():
+                    for lawyer_id, location, point in located:
+                        result = await session.execute(
+                            update(LawyerModel)
+                            .where(
+                                LawyerModel.id == lawyer_id,
+                                LawyerModel.location == location,
+                                LawyerModel.latitude.is_(None),
+                            )
+                            .values(
+                                latitude=point.latitude,
+                                longitude=point.longitude,
+                                geohash=point.geohash(),
+                            )
+                        )
+                        geocoded += result.rowcount
+
+        if len(rows) < chunk_size:
+            break
+        last_id = rows[-1].id
+
+    if geocoded:
+        logger.info(f"Geocoded {geocoded} lawyers")
+    return geocoded
@@ -0,0 +1,320 @@
+"""
+Lawyer Leaderboard
+
+Redis лидерборды топ юристов по (специализация, город).
+
+Каждый подходящий юрист (верифицирован, доступен, есть рейтинг) входит в
+sorted sets всех комбинаций своих специализаций и города, включая "все
+специализации" и "все города". Карточки юристов для ответа хранятся в
+одном HASH, поэтому топ-k читается одним Lua скриптом: ZREVRANGE +
+HMGET, O(log n + k), без запроса в БД.
+
+Лидерборды обновляются инкрементально по событиям (верификация,
+доступность, новая оценка) и периодически перестраиваются из БД.
+
+Ключи:
+- leaderboard:top:{SPECIALIZATION|*}:{city|*} - ZSET lawyer_id -> score
+- leaderboard:boards - SET всех ключей лидербордов
+- leaderboard:cards - HASH lawyer_id -> JSON LawyerListItemDTO
+- leaderboard:memberships - HASH lawyer_id -> JSON список лидербордов юриста
+- leaderboard:ready - признак построенных лидербордов
+"""
+
+import json
+import logging
+from dataclasses import asdict
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.infrastructure.cache import RedisClient, redis_client
+from app.core.infrastructure.database import async_session_factory
+from ..application.dtos.lawyer_dto import LawyerListItemDTO
+from ..application.queries.lawyer_leaderboard import ILawyerLeaderboard
+from ..domain.value_objects.location import normalize_city
+from ..domain.value_objects.specialization import SpecializationType
+from .persistence.mappers.lawyer_mapper import LawyerMapper
+from .persistence.models.lawyer_model import LawyerModel
+
+logger = logging.getLogger(__name__)
+
+
+KEY_PREFIX = "leaderboard"
+BOARDS_KEY = f"{KEY_PREFIX}:boards"
+CARDS_KEY = f"{KEY_PREFIX}:cards"
+MEMBERSHIPS_KEY = f"{KEY_PREFIX}:memberships"
+READY_KEY = f"{KEY_PREFIX}:ready"
+ANY = "*"
+
+# Топ-k и карточки одним round trip; nil - лидерборды еще не построены
+TOP_SCRIPT = """
+if redis.call('EXISTS', KEYS[3]) == 0 then
+    return false
+end
+local ids = redis.call('ZREVRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #ids == 0 then
+    return {}
+end
+return redis.call('HMGET', KEYS[2], unpack(ids))
+"""
+
+_SPECIALIZATION_NAMES = {item.value: item.name for item in SpecializationType}
+
+
+def board_key(specialization: Optional[str], city: Optional[str]) -> str:
+    """
+    Ключ лидерборда.
+
+    Args:
+        specialization: SpecializationType name (None - все специализации)
+        city: Город (None - все города)
+    """
+    city_part = normalize_city(city) if city else ANY
+    return f"{KEY_PREFIX}:top:{specialization or ANY}:{city_part}"
+
+
+def _boards_for(model: LawyerModel) -> List[str]:
+    """Лидерборды юриста (специализации хранятся русскими названиями)."""
+    names = [
+        _SPECIALIZATION_NAMES[specialization]
+        for specialization in model.specializations or []
+        if specialization in _SPECIALIZATION_NAMES
+    ]
+    boards = []
+    for specialization in [None, *names]:
+        boards.append(board_key(specialization, None))
+        if model.location:
+            boards.append(board_key(specialization, model.location))
+    return boards
+
+
+def _score(rating: Optional[Decimal], reviews_count: int) -> float:
+    """Score: рейтинг (до десятых), при равенстве - больше отзывов."""
+    return int((rating or 0) * 10) * 1_000_000 + min(reviews_count or 0, 999_999)
+
+
+def _card(model: LawyerModel) -> str:
+    """Карточка юриста для ответа (как в выдаче из БД)."""
+    return json.dumps(
+        asdict(LawyerListItemDTO.from_entity(LawyerMapper.to_domain(model))),
+        ensure_ascii=False,
+    )
+
+
+class RedisLawyerLeaderboard(ILawyerLeaderboard):
+    """
+    Лидерборды топ юристов в Redis.
+
+    Ошибки Redis не пробрасываются: при недоступности лидербордов
+    handler читает топ из БД.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient = redis_client,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ):
+        """
+        Args:
+            redis: Redis клиент
+            session_factory: Фабрика сессий БД
+        """
+        self._redis = redis
+        self._session_factory = session_factory
+        self._top_script = None
+
+    @staticmethod
+    def _select_eligible():
+        return select(LawyerModel).where(
+            LawyerModel.verification_status == "verified",
+            LawyerModel.is_available.is_(True),
+            LawyerModel.rating.isnot(None),
+        )
+
+    async def top(
+        self,
+        specialization: Optional[SpecializationType],
+        city: Optional[str],
+        limit: int,
+    ) -> Optional[List[LawyerListItemDTO]]:
+        """
+        Получает топ юристов из лидерборда (один round trip).
+
+        Args:
+            specialization: Специализация (None - все)
+            city: Город (None - все)
+            limit: Количество
+
+        Returns:
+            Список юристов или None, если лидерборды недоступны
+        """
+        if not self._redis.is_connected:
+            return None
+
+        if self._top_script is None:
+            self._top_script = self._redis.client.register_script(TOP_SCRIPT)
+
+        key = board_key(specialization.name if specialization else None, city)
+        try:
+            cards = await self._top_script(
+                keys=[key, CARDS_KEY, READY_KEY], args=[limit]
+            )
+        except RedisError as e:
+            logger.warning(f"Leaderboard read failed: {e}")
+            return None
+
+        if cards is None:
+            return None
+        return [
+            LawyerListItemDTO(**json.loads(card)) for card in cards if card is not None
+        ]
+
+    async def sync_lawyer(self, lawyer_id: str) -> None:
+        """
+        Синхронизирует юриста с лидербордами по данным БД.
+
+        Args:
+            lawyer_id: ID юриста
+        """
+        if not self._redis.is_connected:
+            return
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                self._select_eligible().where(LawyerModel.id == str(lawyer_id))
+            )
+            model = result.scalar_one_or_none()
+
+        if model is None:
+            await self.remove(str(lawyer_id))
+        else:
+            await self.upsert(model)
+
+    async def upsert(self, model: LawyerModel) -> None:
+        """
+        Добавляет юриста в его лидерборды (или обновляет score и карточку).
+
+        Args:
+            model: Модель подходящего юриста
+        """
+        client = self._redis.client
+        old_boards = json.loads(await client.hget(MEMBERSHIPS_KEY, model.id) or "[]")
+        new_boards = _boards_for(model)
+        score = _score(model.rating, model.reviews_count)
+
+        async with client.pipeline(transaction=True) as pipe:
+            for key in set(old_boards) - set(new_boards):
+                pipe.zrem(key, model.id)
+            for key in new_boards:
+                pipe.zadd(key, {model.id: score})
+            pipe.sadd(BOARDS_KEY, *new_boards)
+            pipe.hset(CARDS_KEY, model.id, _card(model))
+            pipe.hset(MEMBERSHIPS_KEY, model.id, json.dumps(new_boards))
+            await pipe.execute()
+
+    async def remove(self, lawyer_id: str) -> None:
+        """
+        Убирает юриста из всех лидербордов.
+
+        Args:
+            lawyer_id: ID юриста
+        """
+        if not self._redis.is_connected:
+            return
+
+        client = self._redis.client
+        old_boards = json.loads(await client.hget(MEMBERSHIPS_KEY, lawyer_id) or "[]")
+        async with client.pipeline(transaction=True) as pipe:
+            for key in old_boards:
+                pipe.zrem(key, lawyer_id)
+            pipe.hdel(CARDS_KEY, lawyer_id)
+            pipe.hdel(MEMBERSHIPS_KEY, lawyer_id)
+            await pipe.execute()
+
+    async def rebuild(self) -> int:
+        """
+        Перестраивает все лидерборды из БД.
+
+        Лидерборды и карточки собираются во временных ключах и подменяются
+        через RENAME в одной транзакции, поэтому чтение не видит частично
+        собранный лидерборд.
+
+        Returns:
+            Количество юристов в лидербордах
+        """
+        if not self._redis.is_connected:
+            return 0
+
+        client = self._redis.client
+        chunk_size = settings.scheduler_chunk_size
+        boards: Dict[str, Dict[str, float]] = {}
+        cards_tmp = f"{CARDS_KEY}:rebuild"
+        memberships_tmp = f"{MEMBERSHIPS_KEY}:rebuild"
+        await client.delete(cards_tmp, memberships_tmp)
+
+        lawyers = 0
+        last_id = ""
+        while True:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    self._select_eligible()
+                    .where(LawyerModel.id > last_id)
+                    .order_by(LawyerModel.id)
+                    .limit(chunk_size)
+                )
+                models = result.scalars().all()
+            if not models:
+                break
+
+            cards = {}
+            memberships = {}
+            for model in models:
+                model_boards = _boards_for(model)
+                score = _score(model.rating, model.reviews_count)
+                for key in model_boards:
+                    boards.setdefault(key, {})[model.id] = score
+                cards[model.id] = _card(model)
+                memberships[model.id] = json.dumps(model_boards)
+
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hset(cards_tmp, mapping=cards)
+                pipe.hset(memberships_tmp, mapping=memberships)
+                await pipe.execute()
+
+            lawyers += len(models)
+            last_id = models[-1].id
+            if len(models) < chunk_size:
+                break
+
+        async with client.pipeline(transaction=False) as pipe:
+            for key, members in boards.items():
+                pipe.delete(f"{key}:rebuild")
+                pipe.zadd(f"{key}:rebuild", members)
+            await pipe.execute()
+
+        stale_boards = await client.smembers(BOARDS_KEY) - set(boards)
+        async with client.pipeline(transaction=True) as pipe:
+            for key in boards:
+                pipe.rename(f"{key}:rebuild", key)
+            for key in stale_boards:
+                pipe.delete(key)
+            if lawyers:
+                pipe.rename(cards_tmp, CARDS_KEY)
+                pipe.rename(memberships_tmp, MEMBERSHIPS_KEY)
+            else:
+                pipe.delete(CARDS_KEY, MEMBERSHIPS_KEY)
+            pipe.delete(BOARDS_KEY)
+            if boards:
+                pipe.sadd(BOARDS_KEY, *boards)
+            pipe.set(READY_KEY, "1")
+            await pipe.execute()
+
+        return lawyers
+
+
+# Глобальные лидерборды (общие на процесс)
+lawyer_leaderboard = RedisLawyerLeaderboard()
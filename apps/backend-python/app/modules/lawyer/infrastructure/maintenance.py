@@ -0,0 +1,25 @@
+"""
+Lawyer Maintenance Jobs
+
+Периодические задачи обслуживания Lawyer Module.
+"""
+
+from app.core.infrastructure.scheduler import Scheduler
+from .geocoding import geocode_missing_lawyers
+from .leaderboard import lawyer_leaderboard
+
+
+async def rebuild_leaderboards() -> int:
+    """
+    Перестроить лидерборды топ юристов из БД (на случай пропущенных событий).
+
+    Returns:
+        Количество юристов в лидербордах
+    """
+    return await lawyer_leaderboard.rebuild()
+
+
+def register_maintenance_jobs(scheduler: Scheduler) -> None:
+    """Зарегистрировать периодические задачи Lawyer Module."""
+    scheduler.register("lawyer.rebuild-leaderboards", "*/15 * * * *", rebuild_leaderboards)
+    scheduler.register("lawyer.geocode-missing", "20 * * * *", geocode_missing_lawyers)
@@ -4,10 +4,11 @@ LawyerMapper
 Маппинг между Lawyer entity и LawyerModel.
 """
 
-from typing import List
+from typing import List, Optional
 
 from ....domain.entities.lawyer import Lawyer
 from ....domain.value_objects.experience import Experience
+from ....domain.value_objects.geo_point import GeoPoint
 from ....domain.value_objects.price import Price
 from ....domain.value_objects.rating import Rating
 from ....domain.value_objects.specialization import Specialization
@@ -46,6 +47,11 @@ class LawyerMapper:
         price = Price(model.price_amount)
         verification_status = VerificationStatus(model.verification_status)
         rating = Rating(float(model.rating)) if model.rating else None
+        coordinates = (
+            GeoPoint(model.latitude, model.longitude)
+            if model.latitude is not None and model.longitude is not None
+            else None
+        )
 
         # Создаем Lawyer entity через конструктор
         lawyer = Lawyer(
@@ -59,6 +65,7 @@ class LawyerMapper:
             education=model.education,
             about=model.about,
             location=model.location,
+            coordinates=coordinates,
             rating=rating,
             reviews_count=model.reviews_count,
             consultations_count=model.consultations_count,
@@ -106,6 +113,8 @@ class LawyerMapper:
             updated_at=lawyer.updated_at,
         )
 
+        LawyerMapper._set_coordinates(model, lawyer.coordinates)
+
         return model
 
     @staticmethod
@@ -120,14 +129,17 @@ class LawyerMapper:
         # Конвертируем specializations в строки
         specializations_str = [spec.display_name for spec in lawyer.specializations]
 
+        # Координаты не сбрасываем: их может проставить геокодирование в фоне.
+        # Исключение - смена города: старые координаты больше неверны
+        if lawyer.coordinates is not None or model.location != lawyer.location:
+            LawyerMapper._set_coordinates(model, lawyer.coordinates)
+
         # Обновляем все поля
         model.user_id = lawyer.user_id
         model.specializations = specializations_str
         model.experience_years = lawyer.experience.years
         model.price_amount = lawyer.price_per_consultation.amount
         model.verification_status = lawyer.verification_status.value.value
-        model.rating = lawyer.rating.value if lawyer.rating else None
-        model.reviews_count = lawyer.reviews_count
         model.consultations_count = lawyer.consultations_count
         model.license_number = lawyer.license_number
         model.education = lawyer.education
@@ -138,3 +150,18 @@ class LawyerMapper:
         model.verified_at = lawyer.verified_at
         model.updated_at = lawyer.updated_at
         # created_at НЕ обновляем
+        # rating и reviews_count НЕ обновляем: их атомарно пишет
+        # LawyerRatingAggregatorImpl, сохранение загруженного ранее
+        # агрегата затерло бы параллельные оценки
+
+    @staticmethod
+    def _set_coordinates(model: LawyerModel, coordinates: Optional[GeoPoint]) -> None:
+        """Записывает координаты и geohash (для поиска по расстоянию)."""
+        if coordinates is None:
+            model.latitude = None
+            model.longitude = None
+            model.geohash = None
+        else:
+            model.latitude = coordinates.latitude
+            model.longitude = coordinates.longitude
+            model.geohash = coordinates.geohash()
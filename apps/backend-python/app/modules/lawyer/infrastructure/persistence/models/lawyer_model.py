@@ -6,11 +6,12 @@ SQLAlchemy ORM модель для юристов.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
     Boolean,
     DateTime,
+    Float,
     Index,
     Integer,
     Numeric,
@@ -18,7 +19,7 @@ from sqlalchemy import (
     Text,
     func,
 )
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.infrastructure.database import Base
@@ -106,6 +107,20 @@ class LawyerModel(Base):
         comment="Количество отзывов",
     )
 
+    rating_sum: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Сумма оценок (для инкрементального среднего)",
+    )
+
+    rating_histogram: Mapped[List[int]] = mapped_column(
+        ARRAY(Integer),
+        nullable=False,
+        server_default="{0,0,0,0,0}",
+        comment="Количество оценок по звездам [1..5]",
+    )
+
     consultations_count: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
@@ -140,6 +155,26 @@ class LawyerModel(Base):
         comment="Город/регион",
     )
 
+    # Geo (поиск рядом)
+    latitude: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Широта (NULL - город не геокодирован)",
+    )
+
+    longitude: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Долгота",
+    )
+
+    # Collation "C": B-tree по байтам, префикс ищется диапазоном [p, p + "{")
+    geohash: Mapped[Optional[str]] = mapped_column(
+        String(12, collation="C"),
+        nullable=True,
+        comment="Geohash координат",
+    )
+
     # Availability
     is_available: Mapped[bool] = mapped_column(
         Boolean,
@@ -149,6 +184,20 @@ class LawyerModel(Base):
         comment="Доступен ли для консультаций",
     )
 
+    # Schedule
+    working_hours: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment='Рабочие часы по дням недели: {"mon": [["09:00", "18:00"]], ...} (NULL - по умолчанию)',
+    )
+
+    timezone: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        server_default="Europe/Moscow",
+        comment="Часовой пояс юриста (IANA)",
+    )
+
     # Languages (массив строк)
     languages: Mapped[List[str]] = mapped_column(
         ARRAY(String(50)),
@@ -203,6 +252,11 @@ class LawyerModel(Base):
             "idx_lawyers_price",
             "price_amount",
         ),
+        # Поиск рядом: диапазоны префиксов geohash
+        Index(
+            "idx_lawyers_geohash",
+            "geohash",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -4,18 +4,26 @@ LawyerRepositoryImpl
 Реализация ILawyerRepository с использованием SQLAlchemy.
 """
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy import and_, case, delete, func, literal_column, or_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.infrastructure.outbox import record_events
 from ....domain.entities.lawyer import Lawyer
+from ....domain.value_objects.experience import Experience
+from ....domain.value_objects.geo_point import EARTH_RADIUS_KM, GeoPoint
+from ....domain.value_objects.lawyer_facets import LawyerFacets
+from ....domain.value_objects.price import Price
 from ....domain.repositories.lawyer_repository import ILawyerRepository
 from ....domain.value_objects.specialization import SpecializationType
 from ....domain.value_objects.verification_status import VerificationStatusType
 from ..mappers.lawyer_mapper import LawyerMapper
 from ..models.lawyer_model import LawyerModel
 
+if TYPE_CHECKING:
+    from ...search_index import LawyerSearchIndex
+
 
 class LawyerRepositoryImpl(ILawyerRepository):
     """
@@ -26,16 +34,23 @@ class LawyerRepositoryImpl(ILawyerRepository):
 
     Args:
         session: SQLAlchemy async session
+        search_index: In-memory индекс для поиска (опционально)
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        search_index: Optional["LawyerSearchIndex"] = None,
+    ) -> None:
         """
         Инициализирует репозиторий.
 
         Args:
             session: Async database session
+            search_index: In-memory индекс для поиска (опционально)
         """
         self._session = session
+        self._search_index = search_index
 
     async def save(self, lawyer: Lawyer) -> None:
         """
@@ -58,6 +73,9 @@ class LawyerRepositoryImpl(ILawyerRepository):
             lawyer_model = LawyerMapper.to_model(lawyer)
             self._session.add(lawyer_model)
 
+        # Доменные события - в outbox в той же транзакции
+        record_events(self._session, lawyer)
+
         # Flush для получения ID (если нужно)
         await self._session.flush()
 
@@ -140,6 +158,8 @@ class LawyerRepositoryImpl(ILawyerRepository):
         query: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        near: Optional[GeoPoint] = None,
+        radius_km: Optional[float] = None,
     ) -> tuple[List[Lawyer], int]:
         """
         Поиск юристов с множественными фильтрами.
@@ -154,10 +174,27 @@ class LawyerRepositoryImpl(ILawyerRepository):
             query: Текстовый поиск
             limit: Лимит
             offset: Смещение
+            near: Точка поиска рядом (результаты - по расстоянию)
+            radius_km: Радиус поиска рядом (км), обязателен вместе с near
 
         Returns:
             Tuple (список Lawyer entities, общее количество)
         """
+        # Без текстового поиска и поиска рядом отвечаем из in-memory индекса
+        if self._search_index is not None and not query and near is None:
+            indexed = self._search_index.search(
+                specializations=specializations,
+                min_rating=min_rating,
+                max_price=max_price,
+                location=location,
+                is_available=is_available,
+                min_experience=min_experience,
+                limit=limit,
+                offset=offset,
+            )
+            if indexed is not None:
+                return indexed.lawyers, indexed.total
+
         # Базовый запрос - только верифицированные юристы
         conditions = [LawyerModel.verification_status == "verified"]
 
@@ -203,6 +240,25 @@ class LawyerRepositoryImpl(ILawyerRepository):
                 )
             )
 
+        # Поиск рядом: префиксы geohash (B-tree) отсекают кандидатов,
+        # точное расстояние считается в БД
+        distance = None
+        if near is not None:
+            distance = self._distance_km(near)
+            conditions.append(LawyerModel.geohash.isnot(None))
+            prefixes = near.geohash_cover(radius_km)
+            if prefixes:
+                # "{" следует за "z" в ASCII: [p, p + "{") - все geohash с префиксом p
+                conditions.append(
+                    or_(
+                        *[
+                            and_(LawyerModel.geohash >= prefix, LawyerModel.geohash < prefix + "{")
+                            for prefix in prefixes
+                        ]
+                    )
+                )
+            conditions.append(distance <= radius_km)
+
         # Применяем все условия
         where_clause = and_(*conditions)
 
@@ -212,14 +268,18 @@ class LawyerRepositoryImpl(ILawyerRepository):
         total = count_result.scalar_one()
 
         # Запрос для получения данных с сортировкой
-        # Сортировка: сначала по рейтингу (DESC), потом по дате (DESC)
+        # Сортировка: сначала по рейтингу (DESC), потом по дате (DESC);
+        # при поиске рядом - сначала по расстоянию
+        order_by = [
+            LawyerModel.rating.desc().nulls_last(),
+            LawyerModel.created_at.desc(),
+        ]
+        if distance is not None:
+            order_by.insert(0, distance.asc())
         data_query = (
             select(LawyerModel)
             .where(where_clause)
-            .order_by(
-                LawyerModel.rating.desc().nulls_last(),
-                LawyerModel.created_at.desc(),
-            )
+            .order_by(*order_by)
             .limit(limit)
             .offset(offset)
         )
@@ -231,6 +291,172 @@ class LawyerRepositoryImpl(ILawyerRepository):
 
         return lawyers, total
 
+    @staticmethod
+    def _distance_km(point: GeoPoint):
+        """Расстояние от юриста до точки (формула гаверсинусов, км)."""
+        d_lat = func.radians(LawyerModel.latitude - point.latitude)
+        d_lon = func.radians(LawyerModel.longitude - point.longitude)
+        a = func.power(func.sin(d_lat / 2), 2) + func.cos(
+            func.radians(point.latitude)
+        ) * func.cos(func.radians(LawyerModel.latitude)) * func.power(func.sin(d_lon / 2), 2)
+        return 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(1.0, a)))
+
+    async def get_facets(
+        self,
+        specializations: Optional[List[SpecializationType]] = None,
+        min_rating: Optional[float] = None,
+        max_price: Optional[float] = None,
+        location: Optional[str] = None,
+        is_available: Optional[bool] = None,
+        min_experience: Optional[int] = None,
+        query: Optional[str] = None,
+    ) -> LawyerFacets:
+        """
+        Facet counts для фильтров поиска.
+
+        Без текстового поиска отвечает in-memory индекс. Иначе - один запрос
+        с GROUPING SETS: специализации разворачиваются unnest (WITH
+        ORDINALITY, чтобы остальные facets считали юриста один раз), а
+        фильтры, у которых есть facet, считаются флагами и применяются в
+        FILTER агрегатов - каждый facet без собственного фильтра.
+
+        Args:
+            specializations: Фильтр по специализациям
+            min_rating: Минимальный рейтинг
+            max_price: Максимальная цена
+            location: Город/регион
+            is_available: Доступность
+            min_experience: Минимальный опыт
+            query: Текстовый поиск
+
+        Returns:
+            LawyerFacets
+        """
+        if self._search_index is not None and not query:
+            indexed = self._search_index.facets(
+                specializations=specializations,
+                min_rating=min_rating,
+                max_price=max_price,
+                location=location,
+                is_available=is_available,
+                min_experience=min_experience,
+            )
+            if indexed is not None:
+                return indexed
+
+        # Фильтры без facets - в WHERE
+        conditions = [LawyerModel.verification_status == "verified"]
+        if min_rating is not None:
+            conditions.append(LawyerModel.rating >= min_rating)
+        if is_available is not None:
+            conditions.append(LawyerModel.is_available == is_available)
+        if query:
+            search_pattern = f"%{query}%"
+            conditions.append(
+                or_(
+                    LawyerModel.about.ilike(search_pattern),
+                    LawyerModel.education.ilike(search_pattern),
+                )
+            )
+
+        # Фильтры с facets - флагами строки
+        flags = {}
+        if specializations:
+            flags["specialization"] = or_(
+                *[LawyerModel.specializations.any(spec.value) for spec in specializations]
+            )
+        if max_price is not None:
+            flags["price"] = LawyerModel.price_amount <= max_price
+        if min_experience is not None:
+            flags["experience"] = LawyerModel.experience_years >= min_experience
+        if location:
+            flags["city"] = LawyerModel.location.ilike(f"%{location}%")
+
+        spec = (
+            func.unnest(LawyerModel.specializations)
+            .table_valued("name", with_ordinality="ordinality")
+            .render_derived(name="spec")
+        )
+        price = LawyerModel.price_amount
+        experience = LawyerModel.experience_years
+        rows = (
+            select(
+                spec.c.name.label("specialization"),
+                case(
+                    (price < Price.BUDGET_THRESHOLD, Price.CATEGORIES[0]),
+                    (price < Price.AVERAGE_THRESHOLD, Price.CATEGORIES[1]),
+                    (price < Price.PREMIUM_THRESHOLD, Price.CATEGORIES[2]),
+                    else_=Price.CATEGORIES[3],
+                ).label("price"),
+                case(
+                    (experience < Experience.JUNIOR_THRESHOLD, Experience.LEVELS[0]),
+                    (experience < Experience.MIDDLE_THRESHOLD, Experience.LEVELS[1]),
+                    (experience < Experience.SENIOR_THRESHOLD, Experience.LEVELS[2]),
+                    else_=Experience.LEVELS[3],
+                ).label("experience"),
+                # Как normalize_city: схлопнуть пробелы, нижний регистр, ё -> е
+                func.replace(
+                    func.lower(
+                        func.regexp_replace(func.btrim(LawyerModel.location), r"\s+", " ", "g")
+                    ),
+                    "ё",
+                    "е",
+                ).label("city"),
+                or_(spec.c.ordinality.is_(None), spec.c.ordinality == 1).label("is_first"),
+                *[flag.label(f"match_{name}") for name, flag in flags.items()],
+            )
+            .select_from(LawyerModel)
+            .outerjoin(spec, true())
+            .where(and_(*conditions))
+            .subquery("facet_rows")
+        )
+
+        def count_without(facet: Optional[str]):
+            # Строки unnest: для facet специализаций считаются все, для остальных - первая
+            matches = [rows.c[f"match_{name}"] for name in flags if name != facet]
+            if facet != "specialization":
+                matches.append(rows.c.is_first)
+            return func.count().filter(and_(true(), *matches))
+
+        facet_columns = ("specialization", "price", "experience", "city")
+        stmt = select(
+            *[rows.c[name] for name in facet_columns],
+            func.grouping(*[rows.c[name] for name in facet_columns]).label("grouping"),
+            *[count_without(name).label(f"count_{name}") for name in facet_columns],
+            count_without(None).label("count_total"),
+        ).group_by(
+            func.grouping_sets(*[rows.c[name] for name in facet_columns], literal_column("()"))
+        )
+        result = await self._session.execute(stmt)
+
+        # Бит GROUPING = 1 для колонок, не входящих в набор (старший - первая)
+        full = (1 << len(facet_columns)) - 1
+        counts = {name: {} for name in facet_columns}
+        total = 0
+        for row in result:
+            if row.grouping == full:
+                total = row.count_total
+                continue
+            for position, name in enumerate(facet_columns):
+                if row.grouping == full ^ (1 << (len(facet_columns) - 1 - position)):
+                    value = getattr(row, name)
+                    count = getattr(row, f"count_{name}")
+                    if value is not None and count:
+                        counts[name][value] = count
+
+        specialization_names = {item.value: item.name for item in SpecializationType}
+        return LawyerFacets(
+            total=total,
+            specializations={
+                specialization_names[value]: count
+                for value, count in counts["specialization"].items()
+                if value in specialization_names
+            },
+            price_ranges=counts["price"],
+            experience_levels=counts["experience"],
+            cities=counts["city"],
+        )
+
     async def exists_by_user_id(self, user_id: str) -> bool:
         """
         Проверяет существование юриста по user_id.
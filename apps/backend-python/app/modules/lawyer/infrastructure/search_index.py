@@ -0,0 +1,477 @@
+"""
+Lawyer Search Index
+
+In-memory колоночный индекс верифицированных юристов для поиска.
+
+Верифицированных юристов немного (десятки тысяч), поэтому каждый процесс
+API держит их в памяти: числовые поля - в NumPy массивах, специализации
+и города - в булевых масках (битсетах) по значению. Фильтр - это
+несколько векторных сравнений и AND масок, без запроса в БД; заодно
+считаются facet counts.
+
+Свежесть:
+- обработчики событий юриста публикуют его ID в Redis pub/sub, и каждый
+  процесс перечитывает эту строку из БД (outbox доставляет событие только
+  в один процесс);
+- индекс периодически перестраивается целиком (на случай пропущенных
+  сообщений и изменений без событий, например цены).
+
+Текстовый поиск (about/education) индексом не поддерживается - такие
+запросы выполняются в БД.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.infrastructure.cache import RedisClient, redis_client
+from app.core.infrastructure.database import async_session_factory
+from ..domain.entities.lawyer import Lawyer
+from ..domain.value_objects.experience import Experience
+from ..domain.value_objects.lawyer_facets import LawyerFacets
+from ..domain.value_objects.location import normalize_city
+from ..domain.value_objects.price import Price
+from ..domain.value_objects.specialization import SpecializationType
+from .persistence.mappers.lawyer_mapper import LawyerMapper
+from .persistence.models.lawyer_model import LawyerModel
+
+logger = logging.getLogger(__name__)
+
+CHANGES_CHANNEL = "lawyer_index:changes"
+
+_SPECIALIZATIONS = {item.value: item for item in SpecializationType}
+
+# Границы ценовых категорий и уровней опыта (np.digitize -> индекс категории)
+_PRICE_BOUNDS = np.array(
+    [Price.BUDGET_THRESHOLD, Price.AVERAGE_THRESHOLD, Price.PREMIUM_THRESHOLD],
+    dtype=np.float64,
+)
+_EXPERIENCE_BOUNDS = np.array(
+    [Experience.JUNIOR_THRESHOLD, Experience.MIDDLE_THRESHOLD, Experience.SENIOR_THRESHOLD]
+)
+
+
+@dataclass
+class LawyerIndexResult:
+    """
+    Результат поиска по индексу.
+
+    Attributes:
+        lawyers: Страница юристов (rating DESC NULLS LAST, created_at DESC)
+        total: Общее количество найденных
+    """
+
+    lawyers: List[Lawyer]
+    total: int
+
+
+class _Columns:
+    """Колонки индекса (неизменяемый снимок для одной сборки)."""
+
+    def __init__(self, capacity: int) -> None:
+        self.ids: List[str] = []
+        self.lawyers: List[Optional[Lawyer]] = []
+        self.cities: List[str] = []
+        self.rating = np.full(capacity, np.nan, dtype=np.float32)
+        self.price = np.zeros(capacity, dtype=np.float64)
+        self.experience = np.zeros(capacity, dtype=np.int32)
+        self.available = np.zeros(capacity, dtype=bool)
+        self.created = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.specializations: Dict[SpecializationType, np.ndarray] = {}
+        self.city_masks: Dict[str, np.ndarray] = {}
+
+
+class LawyerSearchIndex:
+    """
+    Колоночный индекс юристов процесса.
+
+    Строка юриста не переиспользуется: обновление перезаписывает ее на
+    месте, удаление снимает флаг alive. Порядок выдачи (перестановка
+    строк) пересчитывается лениво после изменений.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient = redis_client,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        refresh_interval_seconds: float = 300.0,
+    ):
+        """
+        Args:
+            redis: Redis клиент (pub/sub изменений)
+            session_factory: Фабрика сессий БД
+            refresh_interval_seconds: Период полной перестройки
+        """
+        self._redis = redis
+        self._session_factory = session_factory
+        self._refresh_interval = refresh_interval_seconds
+        self._columns: Optional[_Columns] = None
+        self._rows: Dict[str, int] = {}
+        self._order: Optional[np.ndarray] = None
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    @property
+    def is_ready(self) -> bool:
+        """Индекс построен и может отвечать на запросы."""
+        return self._columns is not None
+
+    # ========== Lifecycle ==========
+
+    async def start(self) -> None:
+        """Построить индекс и запустить обновление (pub/sub и перестройка)."""
+        if self._tasks:
+            return
+        self._stopping.clear()
+        try:
+            await self.rebuild()
+        except Exception as e:
+            # Без индекса поиск выполняется в БД, перестройка будет повторена
+            logger.warning(f"Lawyer search index build failed: {e}")
+
+        self._tasks.append(asyncio.create_task(self._refresh_loop(), name="lawyer-index-refresh"))
+        if self._redis.is_connected:
+            self._tasks.append(asyncio.create_task(self._listen(), name="lawyer-index-listener"))
+
+    async def stop(self) -> None:
+        """Остановить обновление индекса."""
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _refresh_loop(self) -> None:
+        while not self._stopping.is_set():
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.rebuild()
+            except Exception as e:
+                logger.warning(f"Lawyer search index rebuild failed: {e}")
+
+    async def _listen(self) -> None:
+        """Перечитывать юристов, об изменении которых сообщили другие процессы."""
+        while not self._stopping.is_set():
+            pubsub = self._redis.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(CHANGES_CHANNEL)
+                while not self._stopping.is_set():
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        await self.refresh_lawyer(message["data"])
+            except (RedisError, RuntimeError) as e:
+                logger.warning(f"Lawyer search index listener failed: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+
+    async def publish_change(self, lawyer_id: str) -> None:
+        """
+        Сообщить всем процессам об изменении юриста.
+
+        Args:
+            lawyer_id: ID юриста
+        """
+        if self._redis.is_connected:
+            await self._redis.client.publish(CHANGES_CHANNEL, str(lawyer_id))
+        else:
+            await self.refresh_lawyer(str(lawyer_id))
+
+    # ========== Build & Update ==========
+
+    @staticmethod
+    def _select_verified():
+        return select(LawyerModel).where(LawyerModel.verification_status == "verified")
+
+    async def rebuild(self) -> int:
+        """
+        Перестроить индекс из БД (пачками по первичному ключу).
+
+        Returns:
+            Количество юристов в индексе
+        """
+        models: List[LawyerModel] = []
+        chunk_size = settings.scheduler_chunk_size
+        last_id = ""
+        while True:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    self._select_verified()
+                    .where(LawyerModel.id > last_id)
+                    .order_by(LawyerModel.id)
+                    .limit(chunk_size)
+                )
+                chunk = result.scalars().all()
+            models.extend(chunk)
+            if len(chunk) < chunk_size:
+                break
+            last_id = chunk[-1].id
+
+        # Запас под юристов, добавленных до следующей перестройки
+        columns = _Columns(capacity=max(64, int(len(models) * 1.25)))
+        rows: Dict[str, int] = {}
+        for model in models:
+            rows[model.id] = self._append(columns, model)
+
+        # Подмена целиком: запросы видят либо старый, либо новый индекс
+        self._columns, self._rows, self._order = columns, rows, None
+        return len(models)
+
+    async def refresh_lawyer(self, lawyer_id: str) -> None:
+        """
+        Перечитать юриста из БД и обновить его строку.
+
+        Args:
+            lawyer_id: ID юриста
+        """
+        if self._columns is None:
+            return
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                self._select_verified().where(LawyerModel.id == lawyer_id)
+            )
+            model = result.scalar_one_or_none()
+
+        columns = self._columns
+        row = self._rows.get(lawyer_id)
+        if model is None:
+            if row is not None:
+                columns.alive[row] = False
+                columns.lawyers[row] = None
+        elif row is not None:
+            self._write(columns, row, model)
+        elif len(columns.ids) < len(columns.alive):
+            self._rows[lawyer_id] = self._append(columns, model)
+        else:
+            # Запас исчерпан - перестраиваем с новой емкостью
+            await self.rebuild()
+            return
+        self._order = None
+
+    def _append(self, columns: _Columns, model: LawyerModel) -> int:
+        row = len(columns.ids)
+        columns.ids.append(model.id)
+        columns.lawyers.append(None)
+        columns.cities.append("")
+        self._write(columns, row, model)
+        return row
+
+    @staticmethod
+    def _write(columns: _Columns, row: int, model: LawyerModel) -> None:
+        capacity = len(columns.alive)
+
+        old_city = columns.cities[row]
+        if old_city:
+            columns.city_masks[old_city][row] = False
+        for mask in columns.specializations.values():
+            mask[row] = False
+
+        city = normalize_city(model.location or "")
+        columns.cities[row] = city
+        if city:
+            columns.city_masks.setdefault(city, np.zeros(capacity, dtype=bool))[row] = True
+        for name in model.specializations or []:
+            specialization = _SPECIALIZATIONS.get(name)
+            if specialization is not None:
+                columns.specializations.setdefault(
+                    specialization, np.zeros(capacity, dtype=bool)
+                )[row] = True
+
+        columns.lawyers[row] = LawyerMapper.to_domain(model)
+        columns.rating[row] = np.nan if model.rating is None else float(model.rating)
+        columns.price[row] = float(model.price_amount)
+        columns.experience[row] = model.experience_years
+        columns.available[row] = bool(model.is_available)
+        columns.created[row] = model.created_at.timestamp() if model.created_at else 0.0
+        columns.alive[row] = True
+
+    def _sort_order(self, columns: _Columns) -> np.ndarray:
+        """Строки в порядке выдачи: rating DESC NULLS LAST, created_at DESC."""
+        if self._order is None:
+            size = len(columns.ids)
+            rating = np.nan_to_num(columns.rating[:size], nan=-1.0)
+            self._order = np.lexsort((-columns.created[:size], -rating))
+        return self._order
+
+    # ========== Search ==========
+
+    def search(
+        self,
+        specializations: Optional[Sequence[SpecializationType]] = None,
+        min_rating: Optional[float] = None,
+        max_price: Optional[float] = None,
+        location: Optional[str] = None,
+        is_available: Optional[bool] = None,
+        min_experience: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Optional[LawyerIndexResult]:
+        """
+        Поиск юристов по индексу (семантика как у LawyerRepositoryImpl.search).
+
+        Args:
+            specializations: Любая из специализаций (OR)
+            min_rating: Минимальный рейтинг
+            max_price: Максимальная цена
+            location: Подстрока города (без учета регистра)
+            is_available: Доступность
+            min_experience: Минимальный опыт
+            limit: Лимит
+            offset: Смещение
+
+        Returns:
+            LawyerIndexResult или None, если индекс еще не построен
+        """
+        columns = self._columns
+        if columns is None:
+            return None
+
+        masks = self._filter_masks(
+            columns, specializations, min_rating, max_price,
+            location, is_available, min_experience,
+        )
+        matched = masks.all()
+
+        order = self._sort_order(columns)
+        rows = order[matched[order]]
+        page = rows[offset:offset + limit]
+
+        return LawyerIndexResult(
+            lawyers=[columns.lawyers[row] for row in page],
+            total=int(rows.size),
+        )
+
+    def facets(
+        self,
+        specializations: Optional[Sequence[SpecializationType]] = None,
+        min_rating: Optional[float] = None,
+        max_price: Optional[float] = None,
+        location: Optional[str] = None,
+        is_available: Optional[bool] = None,
+        min_experience: Optional[int] = None,
+    ) -> Optional[LawyerFacets]:
+        """
+        Facet counts по индексу (семантика как у LawyerRepositoryImpl.get_facets).
+
+        Args:
+            specializations: Любая из специализаций (OR)
+            min_rating: Минимальный рейтинг
+            max_price: Максимальная цена
+            location: Подстрока города (без учета регистра)
+            is_available: Доступность
+            min_experience: Минимальный опыт
+
+        Returns:
+            LawyerFacets или None, если индекс еще не построен
+        """
+        columns = self._columns
+        if columns is None:
+            return None
+
+        size = len(columns.ids)
+        masks = self._filter_masks(
+            columns, specializations, min_rating, max_price,
+            location, is_available, min_experience,
+        )
+
+        without_specialization = masks.all(skip="specialization")
+        without_city = masks.all(skip="city")
+        price_bands = np.bincount(
+            np.digitize(columns.price[:size][masks.all(skip="price")], _PRICE_BOUNDS),
+            minlength=len(Price.CATEGORIES),
+        )
+        experience_bands = np.bincount(
+            np.digitize(
+                columns.experience[:size][masks.all(skip="experience")], _EXPERIENCE_BOUNDS
+            ),
+            minlength=len(Experience.LEVELS),
+        )
+
+        return LawyerFacets(
+            total=int(np.count_nonzero(masks.all())),
+            specializations=_non_zero({
+                specialization.name: np.count_nonzero(mask[:size] & without_specialization)
+                for specialization, mask in columns.specializations.items()
+            }),
+            price_ranges=_non_zero(dict(zip(Price.CATEGORIES, price_bands, strict=True))),
+            experience_levels=_non_zero(dict(zip(Experience.LEVELS, experience_bands, strict=True))),
+            cities=_non_zero({
+                city: np.count_nonzero(mask[:size] & without_city)
+                for city, mask in columns.city_masks.items()
+            }),
+        )
+
+    def _filter_masks(
+        self,
+        columns: _Columns,
+        specializations: Optional[Sequence[SpecializationType]],
+        min_rating: Optional[float],
+        max_price: Optional[float],
+        location: Optional[str],
+        is_available: Optional[bool],
+        min_experience: Optional[int],
+    ) -> "_FilterMasks":
+        size = len(columns.ids)
+        base = columns.alive[:size].copy()
+        if min_rating is not None:
+            # NaN (нет рейтинга) не проходит сравнение, как NULL в SQL
+            base &= columns.rating[:size] >= min_rating
+        if is_available is not None:
+            base &= columns.available[:size] == is_available
+
+        masks = _FilterMasks(base)
+        if max_price is not None:
+            masks.facets["price"] = columns.price[:size] <= max_price
+        if min_experience is not None:
+            masks.facets["experience"] = columns.experience[:size] >= min_experience
+        if specializations:
+            mask = np.zeros(size, dtype=bool)
+            for specialization in specializations:
+                spec_mask = columns.specializations.get(specialization)
+                if spec_mask is not None:
+                    mask |= spec_mask[:size]
+            masks.facets["specialization"] = mask
+        if location:
+            # Подстрока, как ILIKE '%location%' (городов мало - перебор дешевый)
+            needle = normalize_city(location)
+            mask = np.zeros(size, dtype=bool)
+            for city, city_mask in columns.city_masks.items():
+                if needle in city:
+                    mask |= city_mask[:size]
+            masks.facets["city"] = mask
+        return masks
+
+
+class _FilterMasks:
+    """Маски фильтров запроса: общая и по фильтрам, у которых есть facet."""
+
+    def __init__(self, base: np.ndarray) -> None:
+        self.base = base
+        self.facets: Dict[str, np.ndarray] = {}
+
+    def all(self, skip: Optional[str] = None) -> np.ndarray:
+        """Все фильтры, кроме skip (facet считается без собственного фильтра)."""
+        mask = self.base
+        for name, facet_mask in self.facets.items():
+            if name != skip:
+                mask = mask & facet_mask
+        return mask
+
+
+def _non_zero(counts: Dict[str, int]) -> Dict[str, int]:
+    return {value: int(count) for value, count in counts.items() if count}
+
+
+# Индекс процесса API
+lawyer_search_index = LawyerSearchIndex(
+    refresh_interval_seconds=settings.lawyer_search_index_refresh_seconds,
+)
@@ -21,14 +21,24 @@ from ...application.commands.update_availability import UpdateAvailabilityComman
 from ...application.commands.update_availability_handler import (
     UpdateAvailabilityHandler,
 )
+from ...application.commands.update_location import UpdateLocationCommand
+from ...application.commands.update_location_handler import UpdateLocationHandler
 from ...application.commands.verify_lawyer import VerifyLawyerCommand
 from ...application.commands.verify_lawyer_handler import VerifyLawyerHandler
 from ...application.queries.get_lawyer import GetLawyerQuery
+from ...application.queries.get_lawyer_facets import GetLawyerFacetsQuery
+from ...application.queries.get_lawyer_facets_handler import GetLawyerFacetsHandler
 from ...application.queries.get_lawyer_handler import GetLawyerHandler
 from ...application.queries.get_top_rated import GetTopRatedQuery
 from ...application.queries.get_top_rated_handler import GetTopRatedHandler
 from ...application.queries.search_lawyers import SearchLawyersQuery
 from ...application.queries.search_lawyers_handler import SearchLawyersHandler
+from ...domain.value_objects.experience import Experience
+from ...domain.value_objects.price import Price
+from ...infrastructure.facets_cache import lawyer_facets_cache
+from ...infrastructure.geocoding import lawyer_geocoder
+from ...infrastructure.leaderboard import lawyer_leaderboard
+from ...infrastructure.search_index import lawyer_search_index
 from ...infrastructure.persistence.repositories.lawyer_repository_impl import (
     LawyerRepositoryImpl,
 )
@@ -36,9 +46,12 @@ from ..schemas.requests import (
     RegisterLawyerRequest,
     SearchLawyersRequest,
     UpdateAvailabilityRequest,
+    UpdateLocationRequest,
 )
 from ..schemas.responses import (
     ErrorResponse,
+    FacetValueResponse,
+    LawyerFacetsResponse,
     LawyerListResponse,
     LawyerResponse,
     LawyerSearchResponse,
@@ -88,6 +101,31 @@ def _to_lawyer_response(lawyer_dto) -> LawyerResponse:
     )
 
 
+def _to_facets_response(facets_dto) -> LawyerFacetsResponse:
+    """Конвертирует LawyerFacetsDTO в LawyerFacetsResponse."""
+
+    def by_count(counts, labels=None):
+        return [
+            FacetValueResponse(value=value, label=(labels or {}).get(value, value), count=count)
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    def by_order(counts, order):
+        return [
+            FacetValueResponse(value=value, label=value, count=counts[value])
+            for value in order
+            if value in counts
+        ]
+
+    return LawyerFacetsResponse(
+        total=facets_dto.total,
+        specializations=by_count(facets_dto.specializations, facets_dto.specialization_names),
+        price_ranges=by_order(facets_dto.price_ranges, Price.CATEGORIES),
+        experience_levels=by_order(facets_dto.experience_levels, Experience.LEVELS),
+        cities=by_count(facets_dto.cities),
+    )
+
+
 def _to_lawyer_list_response(lawyer_dto) -> LawyerListResponse:
     """Конвертирует LawyerListItemDTO в LawyerListResponse."""
     return LawyerListResponse(
@@ -101,6 +139,7 @@ def _to_lawyer_list_response(lawyer_dto) -> LawyerListResponse:
         location=lawyer_dto.location,
         is_available=lawyer_dto.is_available,
         verification_status=lawyer_dto.verification_status,
+        distance_km=lawyer_dto.distance_km,
     )
 
 
@@ -149,7 +188,7 @@ async def register_lawyer(
     """
     # Создаем repository и handler
     lawyer_repository = LawyerRepositoryImpl(db)
-    handler = RegisterLawyerHandler(lawyer_repository)
+    handler = RegisterLawyerHandler(lawyer_repository, lawyer_geocoder)
 
     # Создаем команду
     command = RegisterLawyerCommand(
@@ -162,6 +201,8 @@ async def register_lawyer(
         about=request.about,
         location=request.location,
         languages=request.languages,
+        latitude=request.latitude,
+        longitude=request.longitude,
     )
 
     # Выполняем регистрацию
@@ -191,12 +232,15 @@ async def register_lawyer(
     - is_available: только доступные
     - min_experience: минимальный опыт (годы)
     - query: текстовый поиск (описание, образование)
+    - near: точка "lat,lon" - поиск рядом (только юристы с известными координатами)
+    - radius_km: радиус поиска рядом (по умолчанию 25, максимум 500)
 
     **Пагинация:**
     - limit: 1-100 (по умолчанию 20)
     - offset: смещение (по умолчанию 0)
 
     **Сортировка:**
+    - По расстоянию (ASC), если задан near
     - По рейтингу (DESC)
     - По дате регистрации (DESC)
 
@@ -223,6 +267,16 @@ async def search_lawyers(
     ] = None,
     limit: Annotated[int, Query(ge=1, le=100, description="Лимит")] = 20,
     offset: Annotated[int, Query(ge=0, description="Смещение")] = 0,
+    near: Annotated[
+        str | None,
+        Query(
+            pattern=r"^\s*-?\d+(\.\d+)?\s*,\s*-?\d+(\.\d+)?\s*$",
+            description="Точка поиска рядом: lat,lon",
+        ),
+    ] = None,
+    radius_km: Annotated[
+        float | None, Query(gt=0, le=500, description="Радиус поиска рядом (км)")
+    ] = None,
     db: Annotated[AsyncSession, Depends(get_db)] = None,
 ) -> LawyerSearchResponse:
     """
@@ -238,13 +292,15 @@ async def search_lawyers(
         query: Текстовый поиск
         limit: Лимит
         offset: Смещение
+        near: Точка поиска рядом (lat,lon)
+        radius_km: Радиус поиска рядом
         db: Database session
 
     Returns:
         LawyerSearchResponse
     """
     # Создаем repository и handler
-    lawyer_repository = LawyerRepositoryImpl(db)
+    lawyer_repository = LawyerRepositoryImpl(db, search_index=lawyer_search_index)
     handler = SearchLawyersHandler(lawyer_repository)
 
     # Создаем query
@@ -258,6 +314,9 @@ async def search_lawyers(
         query=query,
         limit=limit,
         offset=offset,
+        near_latitude=float(near.split(",")[0]) if near else None,
+        near_longitude=float(near.split(",")[1]) if near else None,
+        radius_km=radius_km,
     )
 
     # Выполняем поиск
@@ -281,6 +340,88 @@ async def search_lawyers(
     )
 
 
+@router.get(
+    "/facets",
+    response_model=LawyerFacetsResponse,
+    summary="Facet counts для фильтров поиска",
+    description="""
+    Количество юристов по значениям фильтров для текущего набора фильтров.
+
+    **Facets:**
+    - specializations: специализации
+    - price_ranges: ценовые категории
+    - experience_levels: уровни опыта
+    - cities: города
+
+    Каждый facet считается со всеми фильтрами, кроме собственного
+    (specializations, max_price, min_experience, location), поэтому счетчик
+    показывает, сколько юристов будет найдено при выборе значения.
+
+    **Фильтры:** как в GET /lawyers (без пагинации)
+
+    **Публичный endpoint** (без auth)
+    """,
+)
+async def get_lawyer_facets(
+    specializations: Annotated[
+        List[str] | None, Query(description="Фильтр по специализациям")
+    ] = None,
+    min_rating: Annotated[
+        float | None, Query(ge=1.0, le=5.0, description="Минимальный рейтинг")
+    ] = None,
+    max_price: Annotated[
+        float | None, Query(ge=500.0, le=100000.0, description="Максимальная цена")
+    ] = None,
+    location: Annotated[str | None, Query(max_length=100, description="Локация")] = None,
+    is_available: Annotated[bool | None, Query(description="Только доступные")] = None,
+    min_experience: Annotated[
+        int | None, Query(ge=0, le=70, description="Минимальный опыт")
+    ] = None,
+    query: Annotated[
+        str | None, Query(min_length=3, max_length=200, description="Текстовый поиск")
+    ] = None,
+    db: Annotated[AsyncSession, Depends(get_db)] = None,
+) -> LawyerFacetsResponse:
+    """
+    Facet counts для фильтров поиска.
+
+    Args:
+        specializations: Фильтр по специализациям
+        min_rating: Минимальный рейтинг
+        max_price: Максимальная цена
+        location: Локация
+        is_available: Только доступные
+        min_experience: Минимальный опыт
+        query: Текстовый поиск
+        db: Database session
+
+    Returns:
+        LawyerFacetsResponse
+    """
+    lawyer_repository = LawyerRepositoryImpl(db, search_index=lawyer_search_index)
+    handler = GetLawyerFacetsHandler(lawyer_repository, cache=lawyer_facets_cache)
+
+    result = await handler.handle(
+        GetLawyerFacetsQuery(
+            specializations=specializations,
+            min_rating=min_rating,
+            max_price=max_price,
+            location=location,
+            is_available=is_available,
+            min_experience=min_experience,
+            query=query,
+        )
+    )
+
+    if result.is_failure:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result.error,
+        )
+
+    return _to_facets_response(result.value)
+
+
 @router.get(
     "/top-rated",
     response_model=List[LawyerListResponse],
@@ -302,6 +443,9 @@ async def search_lawyers(
     - Рейтинг DESC
     - Количество отзывов DESC
 
+    Отдается из предрассчитанных лидербордов (Redis) без запроса в БД.
+    Город сравнивается целиком без учета регистра и пробелов.
+
     **Публичный endpoint** (без auth)
     """,
 )
@@ -327,7 +471,7 @@ async def get_top_rated(
     """
     # Создаем repository и handler
     lawyer_repository = LawyerRepositoryImpl(db)
-    handler = GetTopRatedHandler(lawyer_repository)
+    handler = GetTopRatedHandler(lawyer_repository, leaderboard=lawyer_leaderboard)
 
     # Создаем query
     query = GetTopRatedQuery(
@@ -467,6 +611,78 @@ async def update_availability(
     return _to_lawyer_response(result.value)
 
 
+@router.put(
+    "/{lawyer_id}/location",
+    response_model=LawyerResponse,
+    summary="Обновить город и координаты юриста",
+    description="""
+    Обновляет город и координаты офиса юриста (для поиска рядом).
+
+    **Координаты:**
+    - `latitude` и `longitude` указываются вместе
+    - Без них координаты определяет геокодер по городу
+      (справочник городов - запасной вариант)
+
+    **Права:** Владелец профиля
+    """,
+)
+async def update_location(
+    lawyer_id: str,
+    request: UpdateLocationRequest,
+    current_user: Annotated[UserDTO, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> LawyerResponse:
+    """
+    Обновить город и координаты.
+
+    Args:
+        lawyer_id: ID юриста
+        request: Город и координаты
+        current_user: Текущий пользователь
+        db: Database session
+
+    Returns:
+        LawyerResponse
+
+    Raises:
+        HTTPException: 403 если не владелец, 404 если не найден
+    """
+    # Проверяем что пользователь - владелец профиля
+    lawyer_repository = LawyerRepositoryImpl(db)
+    lawyer_result = await lawyer_repository.find_by_id(lawyer_id)
+
+    if not lawyer_result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Lawyer not found: {lawyer_id}",
+        )
+
+    if lawyer_result.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to update this lawyer profile",
+        )
+
+    handler = UpdateLocationHandler(lawyer_repository, lawyer_geocoder)
+
+    command = UpdateLocationCommand(
+        lawyer_id=lawyer_id,
+        location=request.location,
+        latitude=request.latitude,
+        longitude=request.longitude,
+    )
+
+    result = await handler.handle(command)
+
+    if result.is_failure:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result.error,
+        )
+
+    return _to_lawyer_response(result.value)
+
+
 @router.post(
     "/{lawyer_id}/verify",
     response_model=LawyerResponse,
@@ -13,6 +13,8 @@ from .responses import (
     LawyerResponse,
     LawyerListResponse,
     LawyerSearchResponse,
+    FacetValueResponse,
+    LawyerFacetsResponse,
     ErrorResponse,
 )
 
@@ -25,5 +27,7 @@ __all__ = [
     "LawyerResponse",
     "LawyerListResponse",
     "LawyerSearchResponse",
+    "FacetValueResponse",
+    "LawyerFacetsResponse",
     "ErrorResponse",
 ]
@@ -6,7 +6,7 @@ Pydantic модели для валидации входящих данных.
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class RegisterLawyerRequest(BaseModel):
@@ -22,6 +22,8 @@ class RegisterLawyerRequest(BaseModel):
         about: Описание юриста (50-2000 символов)
         location: Город/регион (мин 2 символа)
         languages: Языки (опционально)
+        latitude: Широта офиса (опционально)
+        longitude: Долгота офиса (опционально)
     """
 
     specializations: List[str] = Field(
@@ -90,6 +92,22 @@ class RegisterLawyerRequest(BaseModel):
         examples=[["Русский", "Английский"]],
     )
 
+    latitude: Optional[float] = Field(
+        default=None,
+        ge=-90,
+        le=90,
+        description="Широта офиса (по умолчанию - через геокодер)",
+        examples=[59.9343],
+    )
+
+    longitude: Optional[float] = Field(
+        default=None,
+        ge=-180,
+        le=180,
+        description="Долгота офиса",
+        examples=[30.3351],
+    )
+
     @field_validator("specializations")
     @classmethod
     def validate_specializations_not_empty(cls, v: List[str]) -> List[str]:
@@ -125,6 +143,48 @@ class UpdateAvailabilityRequest(BaseModel):
     )
 
 
+class UpdateLocationRequest(BaseModel):
+    """
+    Схема для обновления города и координат юриста.
+
+    Attributes:
+        location: Город/регион (мин 2 символа)
+        latitude: Широта офиса (опционально)
+        longitude: Долгота офиса (опционально)
+    """
+
+    location: str = Field(
+        ...,
+        min_length=2,
+        max_length=100,
+        description="Город/регион",
+        examples=["Санкт-Петербург"],
+    )
+
+    latitude: Optional[float] = Field(
+        default=None,
+        ge=-90,
+        le=90,
+        description="Широта офиса (по умолчанию - через геокодер)",
+        examples=[59.9343],
+    )
+
+    longitude: Optional[float] = Field(
+        default=None,
+        ge=-180,
+        le=180,
+        description="Долгота офиса",
+        examples=[30.3351],
+    )
+
+    @model_validator(mode="after")
+    def validate_coordinates_pair(self) -> "UpdateLocationRequest":
+        """Проверка что широта и долгота указаны вместе."""
+        if (self.latitude is None) != (self.longitude is None):
+            raise ValueError("Both latitude and longitude must be specified")
+        return self
+
+
 class SearchLawyersRequest(BaseModel):
     """
     Схема для поиска юристов с фильтрами.
@@ -116,6 +116,7 @@ class LawyerListResponse(BaseModel):
     location: str = Field(..., description="Локация")
     is_available: bool = Field(..., description="Доступен")
     verification_status: str = Field(..., description="Статус")
+    distance_km: Optional[float] = Field(None, description="Расстояние (поиск рядом)")
 
     class Config:
         """Pydantic config."""
@@ -178,6 +179,54 @@ class LawyerSearchResponse(BaseModel):
         }
 
 
+class FacetValueResponse(BaseModel):
+    """
+    Значение фильтра с количеством юристов.
+    """
+
+    value: str = Field(..., description="Значение для фильтра")
+    label: str = Field(..., description="Название для отображения")
+    count: int = Field(..., description="Количество юристов")
+
+
+class LawyerFacetsResponse(BaseModel):
+    """
+    Facet counts для фильтров поиска юристов.
+
+    Используется для:
+    - GET /lawyers/facets
+
+    Каждый facet посчитан со всеми фильтрами, кроме собственного.
+    """
+
+    total: int = Field(..., description="Количество юристов с текущими фильтрами")
+    specializations: List[FacetValueResponse] = Field(..., description="Специализации")
+    price_ranges: List[FacetValueResponse] = Field(..., description="Ценовые категории")
+    experience_levels: List[FacetValueResponse] = Field(..., description="Уровни опыта")
+    cities: List[FacetValueResponse] = Field(..., description="Города")
+
+    class Config:
+        """Pydantic config."""
+
+        json_schema_extra = {
+            "example": {
+                "total": 156,
+                "specializations": [
+                    {"value": "FAMILY_DIVORCE", "label": "Разводы", "count": 124}
+                ],
+                "price_ranges": [
+                    {"value": "Средний", "label": "Средний", "count": 61}
+                ],
+                "experience_levels": [
+                    {"value": "Опытный", "label": "Опытный", "count": 48}
+                ],
+                "cities": [
+                    {"value": "санкт-петербург", "label": "санкт-петербург", "count": 37}
+                ],
+            }
+        }
+
+
 class ErrorResponse(BaseModel):
     """
     Схема для ошибок API.
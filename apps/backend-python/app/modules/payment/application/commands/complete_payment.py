@@ -8,7 +8,7 @@ from uuid import UUID
 
 from app.core.application.command import ICommand, ICommandHandler
 from app.core.domain.result import Result
-from app.modules.payment.domain import Payment, IPaymentRepository
+from app.modules.payment.domain import Payment, PaymentTransition, IPaymentRepository
 
 
 @dataclass(frozen=True)
@@ -41,17 +41,20 @@ class CompletePaymentHandler(ICommandHandler[CompletePaymentCommand, Payment]):
         Returns:
             Result с обновленным платежом или ошибкой
         """
-        # Находим платеж
+        # Переход одним UPDATE: processing -> succeeded
+        saved_payment = await self._repository.transition(
+            command.payment_id, PaymentTransition.succeeded()
+        )
+        if saved_payment:
+            return Result.ok(saved_payment)
+
+        # Переход не выполнен - объясняем причину по текущему состоянию
         payment = await self._repository.find_by_id(command.payment_id)
         if not payment:
             return Result.fail(f"Payment {command.payment_id} not found")
 
-        # Завершаем платеж
         complete_result = payment.mark_succeeded()
         if complete_result.is_failure:
             return Result.fail(complete_result.error)
 
-        # Сохраняем изменения
-        saved_payment = await self._repository.save(payment)
-
-        return Result.ok(saved_payment)
+        return Result.fail("Payment was modified concurrently, please retry")
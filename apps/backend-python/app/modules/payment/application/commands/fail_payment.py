@@ -8,7 +8,7 @@ from uuid import UUID
 
 from app.core.application.command import ICommand, ICommandHandler
 from app.core.domain.result import Result
-from app.modules.payment.domain import Payment, IPaymentRepository
+from app.modules.payment.domain import Payment, PaymentTransition, IPaymentRepository
 
 
 @dataclass(frozen=True)
@@ -43,17 +43,24 @@ class FailPaymentHandler(ICommandHandler[FailPaymentCommand, Payment]):
         Returns:
             Result с обновленным платежом или ошибкой
         """
-        # Находим платеж
+        transition_result = PaymentTransition.failed(command.reason)
+        if transition_result.is_failure:
+            return Result.fail(transition_result.error)
+
+        # Переход одним UPDATE: processing -> failed
+        saved_payment = await self._repository.transition(
+            command.payment_id, transition_result.value
+        )
+        if saved_payment:
+            return Result.ok(saved_payment)
+
+        # Переход не выполнен - объясняем причину по текущему состоянию
         payment = await self._repository.find_by_id(command.payment_id)
         if not payment:
             return Result.fail(f"Payment {command.payment_id} not found")
 
-        # Отмечаем как неудачный
         fail_result = payment.mark_failed(command.reason)
         if fail_result.is_failure:
             return Result.fail(fail_result.error)
 
-        # Сохраняем изменения
-        saved_payment = await self._repository.save(payment)
-
-        return Result.ok(saved_payment)
+        return Result.fail("Payment was modified concurrently, please retry")
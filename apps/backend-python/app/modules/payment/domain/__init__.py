@@ -8,6 +8,7 @@ Domain Layer для модуля платежей.
 from app.modules.payment.domain.value_objects import (
     PaymentStatus,
     PaymentStatusEnum,
+    PaymentTransition,
     PaymentMethod,
     PaymentMethodEnum,
     Money,
@@ -45,6 +46,7 @@ __all__ = [
     # Value Objects
     "PaymentStatus",
     "PaymentStatusEnum",
+    "PaymentTransition",
     "PaymentMethod",
     "PaymentMethodEnum",
     "Money",
@@ -13,6 +13,7 @@ from app.core.domain.result import Result
 from app.modules.payment.domain.value_objects import (
     PaymentStatus,
     PaymentStatusEnum,
+    PaymentTransition,
     PaymentMethod,
     Money,
     RefundReason,
@@ -229,12 +230,7 @@ class Payment(AggregateRoot):
         self._external_payment_id = external_payment_id
         self._updated_at = datetime.utcnow()
 
-        self.add_domain_event(
-            PaymentProcessingEvent(
-                payment_id=self.id,
-                external_payment_id=external_payment_id,
-            )
-        )
+        self.add_domain_event(self._processing_event())
 
         return Result.ok()
 
@@ -252,16 +248,7 @@ class Payment(AggregateRoot):
         self._processed_at = datetime.utcnow()
         self._updated_at = datetime.utcnow()
 
-        self.add_domain_event(
-            PaymentSucceededEvent(
-                payment_id=self.id,
-                user_id=self._user_id,
-                consultation_id=self._consultation_id,
-                subscription_id=self._subscription_id,
-                amount=self._amount.amount,
-                currency=self._amount.currency,
-            )
-        )
+        self.add_domain_event(self._succeeded_event())
 
         return Result.ok()
 
@@ -286,13 +273,7 @@ class Payment(AggregateRoot):
         self._processed_at = datetime.utcnow()
         self._updated_at = datetime.utcnow()
 
-        self.add_domain_event(
-            PaymentFailedEvent(
-                payment_id=self.id,
-                user_id=self._user_id,
-                reason=reason,
-            )
-        )
+        self.add_domain_event(self._failed_event())
 
         return Result.ok()
 
@@ -352,17 +333,60 @@ class Payment(AggregateRoot):
         self._refunded_at = datetime.utcnow()
         self._updated_at = datetime.utcnow()
 
-        self.add_domain_event(
-            PaymentRefundedEvent(
-                payment_id=self.id,
-                user_id=self._user_id,
-                refund_amount=self._refund_amount.amount if self._refund_amount else self._amount.amount,
-                currency=self._amount.currency,
-            )
-        )
+        self.add_domain_event(self._refunded_event())
 
         return Result.ok()
 
+    def record_transition(self, transition: PaymentTransition) -> None:
+        """
+        Добавить domain event перехода, уже выполненного репозиторием.
+
+        Используется после compare-and-set обновления: guard проверен в
+        UPDATE, сущность восстановлена из возвращенной строки.
+
+        Args:
+            transition: Выполненный переход
+        """
+        if transition.target == PaymentStatusEnum.PROCESSING:
+            self.add_domain_event(self._processing_event())
+        elif transition.target == PaymentStatusEnum.SUCCEEDED:
+            self.add_domain_event(self._succeeded_event())
+        elif transition.target == PaymentStatusEnum.FAILED:
+            self.add_domain_event(self._failed_event())
+        elif transition.target == PaymentStatusEnum.REFUNDED:
+            self.add_domain_event(self._refunded_event())
+
+    def _processing_event(self) -> PaymentProcessingEvent:
+        return PaymentProcessingEvent(
+            payment_id=self.id,
+            external_payment_id=self._external_payment_id,
+        )
+
+    def _succeeded_event(self) -> PaymentSucceededEvent:
+        return PaymentSucceededEvent(
+            payment_id=self.id,
+            user_id=self._user_id,
+            consultation_id=self._consultation_id,
+            subscription_id=self._subscription_id,
+            amount=self._amount.amount,
+            currency=self._amount.currency,
+        )
+
+    def _failed_event(self) -> PaymentFailedEvent:
+        return PaymentFailedEvent(
+            payment_id=self.id,
+            user_id=self._user_id,
+            reason=self._failure_reason,
+        )
+
+    def _refunded_event(self) -> PaymentRefundedEvent:
+        return PaymentRefundedEvent(
+            payment_id=self.id,
+            user_id=self._user_id,
+            refund_amount=self._refund_amount.amount if self._refund_amount else self._amount.amount,
+            currency=self._amount.currency,
+        )
+
     def is_for_consultation(self) -> bool:
         """Проверка, является ли платеж за консультацию."""
         return self._consultation_id is not None
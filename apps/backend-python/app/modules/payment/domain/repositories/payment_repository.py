@@ -8,7 +8,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.modules.payment.domain.entities import Payment
-from app.modules.payment.domain.value_objects import PaymentStatusEnum
+from app.modules.payment.domain.value_objects import PaymentStatusEnum, PaymentTransition
 
 
 class IPaymentRepository(ABC):
@@ -31,6 +31,26 @@ class IPaymentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def transition(
+        self, payment_id: UUID, transition: PaymentTransition
+    ) -> Optional[Payment]:
+        """
+        Атомарно перевести платеж в новый статус (compare-and-set).
+
+        Один UPDATE ... WHERE status IN (allowed_from) RETURNING; domain
+        event перехода записывается в outbox.
+
+        Args:
+            payment_id: ID платежа
+            transition: Переход статуса
+
+        Returns:
+            Обновленный платеж или None, если платеж не найден или его
+            статус не допускает переход
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, payment_id: UUID) -> Optional[Payment]:
         """
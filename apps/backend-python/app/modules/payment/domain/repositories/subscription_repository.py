@@ -4,6 +4,7 @@ Subscription Repository Interface
 Интерфейс репозитория для подписок.
 """
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from typing import List, Optional
 from uuid import UUID
 
@@ -97,12 +98,24 @@ class ISubscriptionRepository(ABC):
         pass
 
     @abstractmethod
-    async def find_expired(self) -> List[Subscription]:
+    async def find_expired(
+        self,
+        grace_period: timedelta = timedelta(0),
+        limit: Optional[int] = None,
+        skip_locked: bool = False,
+    ) -> List[Subscription]:
         """
         Найти истекшие подписки (активные, но срок истек).
 
         Используется для деактивации подписок.
 
+        Args:
+            grace_period: Льготный период для подписок с auto_renew
+                (ожидание платежа за продление)
+            limit: Максимальное количество результатов
+            skip_locked: Заблокировать строки (FOR UPDATE SKIP LOCKED)
+                для параллельной обработки
+
         Returns:
             Список истекших подписок
         """
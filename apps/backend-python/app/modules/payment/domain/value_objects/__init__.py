@@ -5,6 +5,9 @@ from app.modules.payment.domain.value_objects.payment_status import (
     PaymentStatus,
     PaymentStatusEnum,
 )
+from app.modules.payment.domain.value_objects.payment_transition import (
+    PaymentTransition,
+)
 from app.modules.payment.domain.value_objects.payment_method import (
     PaymentMethod,
     PaymentMethodEnum,
@@ -23,6 +26,7 @@ __all__ = [
     # Payment Status
     "PaymentStatus",
     "PaymentStatusEnum",
+    "PaymentTransition",
     # Payment Method
     "PaymentMethod",
     "PaymentMethodEnum",
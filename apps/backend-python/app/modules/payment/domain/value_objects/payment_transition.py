@@ -0,0 +1,81 @@
+"""
+Payment Transition Value Object
+
+Описание перехода статуса платежа для compare-and-set обновления.
+"""
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from app.core.domain.result import Result
+from app.modules.payment.domain.value_objects.payment_status import PaymentStatusEnum
+
+
+@dataclass(frozen=True)
+class PaymentTransition:
+    """
+    Переход статуса платежа.
+
+    Повторяет guard соответствующего метода Payment в виде условия на
+    текущий статус, которое репозиторий проверяет в самом UPDATE.
+
+    Attributes:
+        target: Целевой статус
+        allowed_from: Статусы, из которых разрешен переход
+        values: Дополнительные поля платежа (имя, значение)
+        timestamp: Поле времени перехода (processed_at)
+    """
+
+    target: PaymentStatusEnum
+    allowed_from: Tuple[PaymentStatusEnum, ...]
+    values: Tuple[Tuple[str, Any], ...] = ()
+    timestamp: Optional[str] = None
+
+    @classmethod
+    def processing(cls, external_payment_id: str) -> "PaymentTransition":
+        """Начало обработки: pending -> processing."""
+        return cls(
+            target=PaymentStatusEnum.PROCESSING,
+            allowed_from=(PaymentStatusEnum.PENDING,),
+            values=(("external_payment_id", external_payment_id),),
+        )
+
+    @classmethod
+    def succeeded(cls) -> "PaymentTransition":
+        """Успешное завершение: processing -> succeeded."""
+        return cls(
+            target=PaymentStatusEnum.SUCCEEDED,
+            allowed_from=(PaymentStatusEnum.PROCESSING,),
+            timestamp="processed_at",
+        )
+
+    @classmethod
+    def failed(cls, reason: str) -> Result["PaymentTransition"]:
+        """
+        Неудача: processing -> failed.
+
+        Args:
+            reason: Причина неудачи
+
+        Returns:
+            Result с переходом или ошибкой валидации причины
+        """
+        if not reason or len(reason) < 3:
+            return Result.fail("Failure reason must be at least 3 characters")
+
+        return Result.ok(
+            cls(
+                target=PaymentStatusEnum.FAILED,
+                allowed_from=(PaymentStatusEnum.PROCESSING,),
+                values=(("failure_reason", reason),),
+                timestamp="processed_at",
+            )
+        )
+
+    @classmethod
+    def refunded(cls) -> "PaymentTransition":
+        """Завершение возврата: refund_pending -> refunded."""
+        return cls(
+            target=PaymentStatusEnum.REFUNDED,
+            allowed_from=(PaymentStatusEnum.REFUND_PENDING,),
+            timestamp="refunded_at",
+        )
@@ -114,6 +114,21 @@ class SubscriptionPlan(ValueObject):
         """Проверка наличия AI анализа документов."""
         return self.value != SubscriptionPlanEnum.FREE
 
+    def get_llm_priority_weight(self) -> int:
+        """
+        Вес плана в очереди запросов к AI ассистенту (fair queuing).
+
+        Returns:
+            Относительная доля пропускной способности LLM
+        """
+        weights = {
+            SubscriptionPlanEnum.FREE: 1,
+            SubscriptionPlanEnum.BASIC: 2,
+            SubscriptionPlanEnum.PRO: 4,
+            SubscriptionPlanEnum.ENTERPRISE: 8,
+        }
+        return weights[self.value]
+
     def get_display_name(self) -> str:
         """Получить отображаемое имя плана."""
         names = {
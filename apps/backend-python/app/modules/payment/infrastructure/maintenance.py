@@ -0,0 +1,51 @@
+"""
+Payment Maintenance Jobs
+
+Периодические задачи обслуживания Payment Module.
+"""
+import logging
+from datetime import timedelta
+
+from app.config import settings
+from app.core.infrastructure.database import async_session_factory
+from app.core.infrastructure.scheduler import Scheduler, run_in_chunks
+from app.modules.payment.infrastructure.persistence.repositories import SubscriptionRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+async def expire_subscriptions() -> int:
+    """
+    Деактивировать подписки с истекшим сроком.
+
+    Подписки с auto_renew истекают после льготного периода (ожидание
+    платежа за продление). Каждый чанк - отдельная транзакция,
+    события SubscriptionExpiredEvent уходят в outbox.
+
+    Returns:
+        Количество деактивированных подписок
+    """
+    chunk_size = settings.scheduler_chunk_size
+    grace_period = timedelta(days=settings.subscription_renewal_grace_days)
+
+    async def process_chunk() -> int:
+        async with async_session_factory() as session:
+            async with session.begin():
+                repository = SubscriptionRepositoryImpl(session)
+                subscriptions = await repository.find_expired(
+                    grace_period=grace_period, limit=chunk_size, skip_locked=True
+                )
+                for subscription in subscriptions:
+                    result = subscription.expire()
+                    if result.is_success:
+                        await repository.save(subscription)
+                    else:
+                        logger.warning(f"Cannot expire subscription {subscription.id}: {result.error}")
+                return len(subscriptions)
+
+    return await run_in_chunks(process_chunk, chunk_size, settings.scheduler_max_chunks)
+
+
+def register_maintenance_jobs(scheduler: Scheduler) -> None:
+    """Зарегистрировать периодические задачи Payment Module."""
+    scheduler.register("payment.expire-subscriptions", "*/5 * * * *", expire_subscriptions)
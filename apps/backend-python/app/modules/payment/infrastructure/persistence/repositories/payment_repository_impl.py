@@ -1,10 +1,16 @@
 """Payment Repository Implementation"""
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.payment.domain import Payment, PaymentStatusEnum, IPaymentRepository
+from app.core.infrastructure.outbox import record_events
+from app.modules.payment.domain import (
+    Payment,
+    PaymentStatusEnum,
+    PaymentTransition,
+    IPaymentRepository,
+)
 from app.modules.payment.infrastructure.persistence.models import PaymentModel
 from app.modules.payment.infrastructure.persistence.mappers import PaymentMapper
 
@@ -25,12 +31,38 @@ class PaymentRepositoryImpl(IPaymentRepository):
             new_model = self._mapper.to_model(payment)
             self._session.add(new_model)
 
+        record_events(self._session, payment)
         await self._session.flush()
         stmt = select(PaymentModel).where(PaymentModel.id == payment.id)
         result = await self._session.execute(stmt)
         saved_model = result.scalar_one()
         return self._mapper.to_domain(saved_model)
 
+    async def transition(self, payment_id: UUID, transition: PaymentTransition) -> Optional[Payment]:
+        values = {"status": transition.target, "updated_at": func.now(), **dict(transition.values)}
+        if transition.timestamp:
+            values[transition.timestamp] = func.now()
+
+        stmt = (
+            update(PaymentModel)
+            .where(
+                PaymentModel.id == payment_id,
+                PaymentModel.status.in_(transition.allowed_from),
+            )
+            .values(**values)
+            .returning(PaymentModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one_or_none()
+        if model is None:
+            return None
+
+        payment = self._mapper.to_domain(model)
+        payment.record_transition(transition)
+        record_events(self._session, payment)
+        return payment
+
     async def find_by_id(self, payment_id: UUID) -> Optional[Payment]:
         stmt = select(PaymentModel).where(PaymentModel.id == payment_id)
         result = await self._session.execute(stmt)
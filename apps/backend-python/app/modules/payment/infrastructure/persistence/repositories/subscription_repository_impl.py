@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.infrastructure.outbox import record_events
 from app.modules.payment.domain import Subscription, SubscriptionPlanEnum, ISubscriptionRepository
 from app.modules.payment.infrastructure.persistence.models import SubscriptionModel
 from app.modules.payment.infrastructure.persistence.mappers import SubscriptionMapper
@@ -26,6 +27,7 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
             new_model = self._mapper.to_model(subscription)
             self._session.add(new_model)
 
+        record_events(self._session, subscription)
         await self._session.flush()
         stmt = select(SubscriptionModel).where(SubscriptionModel.id == subscription.id)
         result = await self._session.execute(stmt)
@@ -66,8 +68,17 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         models = result.scalars().all()
         return [self._mapper.to_domain(model) for model in models]
 
-    async def find_expired(self) -> List[Subscription]:
-        stmt = select(SubscriptionModel).where(and_(SubscriptionModel.is_active == True, SubscriptionModel.end_date < datetime.utcnow()))
+    async def find_expired(self, grace_period: timedelta = timedelta(0), limit: Optional[int] = None, skip_locked: bool = False) -> List[Subscription]:
+        now = datetime.utcnow()
+        stmt = select(SubscriptionModel).where(and_(
+            SubscriptionModel.is_active.is_(True),
+            SubscriptionModel.end_date < now,
+            or_(SubscriptionModel.auto_renew.is_(False), SubscriptionModel.end_date < now - grace_period),
+        )).order_by(SubscriptionModel.end_date)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if skip_locked:
+            stmt = stmt.with_for_update(skip_locked=True)
         result = await self._session.execute(stmt)
         models = result.scalars().all()
         return [self._mapper.to_domain(model) for model in models]
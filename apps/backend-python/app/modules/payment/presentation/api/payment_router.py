@@ -1,8 +1,9 @@
 """Payment API Router - REST endpoints"""
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 
+from app.core.infrastructure.idempotency import idempotent
 from app.core.presentation.dependencies.auth import get_current_user
 from app.modules.payment.domain import PaymentStatusEnum, PaymentMethodEnum, RefundReasonEnum
 from app.modules.payment.application import (
@@ -19,7 +20,8 @@ from app.modules.payment.presentation.dependencies.payment_deps import (
 
 router = APIRouter(prefix="/payments", tags=["payments"])
 
-@router.post("/consultations", response_model=PaymentDTO, status_code=status.HTTP_201_CREATED)
+@router.post("/consultations", response_model=PaymentDTO, status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(idempotent("payments:consultation"))])
 async def create_consultation_payment(request: CreatePaymentRequestDTO, handler: CreateConsultationPaymentHandlerDep, current_user: dict = get_current_user) -> PaymentDTO:
     """Создать платеж за консультацию"""
     if not request.consultation_id:
@@ -34,7 +36,8 @@ async def create_consultation_payment(request: CreatePaymentRequestDTO, handler:
         raise HTTPException(status_code=400, detail=result.error)
     return PaymentDTO.from_entity(result.value)
 
-@router.post("/subscriptions", response_model=PaymentDTO, status_code=status.HTTP_201_CREATED)
+@router.post("/subscriptions", response_model=PaymentDTO, status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(idempotent("payments:subscription"))])
 async def create_subscription_payment(request: CreatePaymentRequestDTO, handler: CreateSubscriptionPaymentHandlerDep, current_user: dict = get_current_user) -> PaymentDTO:
     """Создать платеж за подписку"""
     if not request.subscription_id:
@@ -74,7 +77,8 @@ async def get_my_payments(handler: GetUserPaymentsHandlerDep, current_user: dict
     items = [PaymentListItemDTO.from_entity(p) for p in payments]
     return PaymentSearchResultDTO(items=items, total=total, limit=limit, offset=offset)
 
-@router.post("/{payment_id}/refund", response_model=PaymentDTO)
+@router.post("/{payment_id}/refund", response_model=PaymentDTO,
+             dependencies=[Depends(idempotent("payments:refund"))])
 async def request_refund(payment_id: UUID, request: RequestRefundRequestDTO, handler: RequestRefundHandlerDep, current_user: dict = get_current_user) -> PaymentDTO:
     """Запросить возврат платежа"""
     command = RequestRefundCommand(payment_id=payment_id, reason=request.reason, 
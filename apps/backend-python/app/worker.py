@@ -0,0 +1,32 @@
+"""
+Advocata Background Worker
+
+Точка входа Celery воркера.
+
+Запуск:
+    celery -A app.worker worker -Q cpu,io,llm -l info
+
+Отдельные пулы по типу нагрузки (рекомендуется в production):
+    celery -A app.worker worker -Q cpu -c 4 -n cpu@%h
+    celery -A app.worker worker -Q io -c 16 -n io@%h
+    celery -A app.worker worker -Q llm -c 8 -n llm@%h
+
+Мониторинг:
+    celery -A app.worker flower
+"""
+
+import logging
+
+from app.config import settings
+from app.core.infrastructure.jobs import celery_app
+
+logging.basicConfig(
+    level=getattr(logging, settings.log_level.upper()),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+__all__ = ["celery_app"]
+
+
+if __name__ == "__main__":
+    celery_app.worker_main(["worker", "-Q", "cpu,io,llm", "-l", settings.log_level.lower()])
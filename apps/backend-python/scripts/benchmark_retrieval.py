@@ -0,0 +1,218 @@
+"""
+RAG Retrieval Benchmark
+
+Офлайн бенчмарк поиска по документам: recall@k и латентность (p50/p95)
+полнотекстовой, векторной и гибридной (RRF + MMR) выдачи HybridRetriever
+на фиксированном корпусе.
+
+Корпус загружается в БД (DATABASE_URL из настроек) под временным
+владельцем и удаляется после прогона. Требуется миграция 014.
+
+Embeddings:
+- hashing (по умолчанию) - детерминированные хеши символьных триграмм,
+  без сети; векторная ветка в этом режиме лексическая и нужна для
+  сравнения латентности и регрессий fusion
+- openai - модель text-embedding-3-small (OPENAI_API_KEY), для оценки
+  качества
+
+Запуск (из apps/backend-python):
+    python -m scripts.benchmark_retrieval
+    python -m scripts.benchmark_retrieval --embedder openai -k 5 --repeat 20
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Sequence
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy import delete
+
+from app.config import settings
+from app.core.infrastructure.database import async_session_factory, engine
+from app.modules.chat.infrastructure.services.hybrid_retriever import (
+    HybridRetriever,
+    RetrievedChunk,
+)
+from app.modules.document.infrastructure.persistence.models.chunk_model import (
+    EMBEDDING_DIMENSIONS,
+    ChunkModel,
+)
+from app.modules.document.infrastructure.persistence.models.document_model import (
+    DocumentModel,
+)
+
+DEFAULT_FIXTURE = Path(__file__).parent / "fixtures" / "retrieval_corpus.json"
+MODES = ("lexical", "vector", "hybrid")
+
+Embedder = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+async def hashing_embedder(texts: List[str]) -> List[List[float]]:
+    """Хеширует символьные триграммы слов в вектор EMBEDDING_DIMENSIONS."""
+    vectors = []
+    for value in texts:
+        vector = np.zeros(EMBEDDING_DIMENSIONS, dtype=np.float32)
+        for word in re.findall(r"\w+", value.lower()):
+            padded = f"#{word}#"
+            for i in range(len(padded) - 2):
+                digest = hashlib.blake2b(padded[i:i + 3].encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % EMBEDDING_DIMENSIONS
+                vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        vectors.append((vector / norm if norm else vector).tolist())
+    return vectors
+
+
+def openai_embedder() -> Embedder:
+    """Embeddings OpenAI (та же модель, что при индексации документов)."""
+    from app.modules.chat.infrastructure.services.llm_gateway import llm_gateway
+
+    async def embed(texts: List[str]) -> List[List[float]]:
+        response = await llm_gateway.embeddings(
+            operation="benchmark", model=settings.openai_embedding_model, input=texts
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    return embed
+
+
+async def load_corpus(owner_id: str, documents: List[dict], embed: Embedder) -> Dict[str, str]:
+    """
+    Загружает документы корпуса (чанк - абзац).
+
+    Returns:
+        Соответствие ID документа в БД -> ID документа в корпусе
+    """
+    now = datetime.now(timezone.utc)
+    ids: Dict[str, str] = {}
+    async with async_session_factory() as session:
+        async with session.begin():
+            for document in documents:
+                document_id = str(uuid4())
+                ids[document_id] = document["id"]
+                session.add(
+                    DocumentModel(
+                        id=document_id,
+                        owner_id=owner_id,
+                        document_type="other",
+                        category=document.get("category", "other"),
+                        title=document["title"],
+                        file_size=len(document["text"].encode("utf-8")),
+                        mime_type="text/plain",
+                        original_filename=f"{document['id']}.txt",
+                        file_extension="txt",
+                        storage_path=f"benchmark/{owner_id}/{document_id}.txt",
+                        status="processed",
+                        extracted_text=document["text"],
+                        uploaded_at=now,
+                        processed_at=now,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+                paragraphs = [p.strip() for p in document["text"].split("\n\n") if p.strip()]
+                embeddings = await embed(paragraphs)
+                session.add_all(
+                    ChunkModel(
+                        id=str(uuid4()),
+                        document_id=document_id,
+                        owner_id=owner_id,
+                        chunk_index=i,
+                        content=paragraph,
+                        chunk_metadata={"title": document["title"]},
+                        embedding=embedding,
+                    )
+                    for i, (paragraph, embedding) in enumerate(zip(paragraphs, embeddings, strict=True))
+                )
+                # Чанки ссылаются на документ (FK)
+                await session.flush()
+    return ids
+
+
+async def remove_corpus(owner_id: str) -> None:
+    """Удаляет документы временного владельца (чанки - каскадом)."""
+    async with async_session_factory() as session:
+        async with session.begin():
+            await session.execute(delete(DocumentModel).where(DocumentModel.owner_id == owner_id))
+
+
+def recall_at_k(retrieved: Sequence[str], relevant: Sequence[str], k: int) -> float:
+    """Доля релевантных документов среди первых k уникальных документов выдачи."""
+    top = list(dict.fromkeys(retrieved))[:k]
+    return len(set(top) & set(relevant)) / len(relevant)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Перцентиль латентности (мс)."""
+    return float(np.percentile(np.asarray(values), q)) * 1000.0
+
+
+async def run(args: argparse.Namespace) -> None:
+    fixture = json.loads(Path(args.fixture).read_text(encoding="utf-8"))
+    embed = openai_embedder() if args.embedder == "openai" else hashing_embedder
+    retriever = HybridRetriever()
+    owner_id = str(uuid4())
+
+    try:
+        ids = await load_corpus(owner_id, fixture["documents"], embed)
+        queries = fixture["queries"]
+        query_embeddings = await embed([q["query"] for q in queries])
+
+        async def search(mode: str, query: str, embedding: List[float]) -> List[RetrievedChunk]:
+            candidates = args.k * 3
+            if mode == "lexical":
+                return await retriever.lexical_search(owner_id, query, candidates)
+            if mode == "vector":
+                return await retriever.vector_search(owner_id, embedding, candidates)
+            # Только корпус бенчмарка: база знаний не участвует
+            return await retriever.retrieve(
+                owner_id, query, embedding, top_k=candidates, include_knowledge_base=False
+            )
+
+        print(
+            f"corpus={len(fixture['documents'])} docs, queries={len(queries)}, "
+            f"embedder={args.embedder}, k={args.k}, repeat={args.repeat}"
+        )
+        print(f"{'mode':<8} {'recall@k':>9} {'p50 ms':>8} {'p95 ms':>8}")
+
+        for mode in MODES:
+            recalls: List[float] = []
+            latencies: List[float] = []
+            for q, embedding in zip(queries, query_embeddings, strict=True):
+                for attempt in range(args.repeat):
+                    started = time.perf_counter()
+                    chunks = await search(mode, q["query"], embedding)
+                    latencies.append(time.perf_counter() - started)
+                    if attempt == 0:
+                        retrieved = [ids[chunk.document_id] for chunk in chunks]
+                        recalls.append(recall_at_k(retrieved, q["relevant"], args.k))
+                        if args.verbose and recalls[-1] < 1.0:
+                            print(f"  [{mode}] miss: {q['query']!r} -> {retrieved[:args.k]}")
+
+            print(
+                f"{mode:<8} {sum(recalls) / len(recalls):>9.3f} "
+                f"{percentile(latencies, 50):>8.1f} {percentile(latencies, 95):>8.1f}"
+            )
+    finally:
+        await remove_corpus(owner_id)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RAG retrieval benchmark (recall@k, p95)")
+    parser.add_argument("--fixture", default=str(DEFAULT_FIXTURE), help="JSON корпус")
+    parser.add_argument("--embedder", choices=("hashing", "openai"), default="hashing")
+    parser.add_argument("-k", type=int, default=3, help="k для recall@k")
+    parser.add_argument("--repeat", type=int, default=10, help="Повторов запроса для латентности")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Печатать промахи")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
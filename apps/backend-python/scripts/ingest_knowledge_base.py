@@ -0,0 +1,102 @@
+"""
+Knowledge Base Ingestion
+
+Загрузка общей правовой базы знаний (kb_sources / kb_chunks) из
+текстовых файлов UTF-8: кодексы, федеральные законы, судебная практика.
+
+Ключ источника - путь файла относительно корня (каталога из аргументов),
+поэтому повторный запуск по тому же каталогу обновляет источники:
+неизменившиеся файлы пропускаются по SHA-256, в измененных
+переиспользуются embeddings неизменившихся чанков.
+
+Требуется миграция 018 и OPENAI_API_KEY.
+
+Запуск (из apps/backend-python):
+    python -m scripts.ingest_knowledge_base corpus/codes --type code
+    python -m scripts.ingest_knowledge_base corpus/practice --type court_practice --glob "*.txt"
+    python -m scripts.ingest_knowledge_base corpus/laws/152-fz.txt --type federal_law --force
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Tuple
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.modules.chat.infrastructure.persistence.models.knowledge_base_model import (
+    KB_SOURCE_TYPES,
+)
+from app.modules.chat.infrastructure.services.knowledge_base import KnowledgeBaseIngestor
+from app.modules.chat.infrastructure.services.llm_gateway import llm_gateway
+
+
+def iter_sources(paths: list[str], pattern: str) -> Iterator[Tuple[Path, str]]:
+    """Файлы источников и их ключи (путь относительно корня аргумента)."""
+    for value in paths:
+        root = Path(value)
+        if root.is_file():
+            yield root, root.name
+            continue
+        for path in sorted(root.rglob(pattern)):
+            if path.is_file():
+                yield path, f"{root.name}/{path.relative_to(root).as_posix()}"
+
+
+async def run(args: argparse.Namespace) -> int:
+    # Отдельный engine без пула: COPY регистрирует на соединении codec
+    # vector (pgvector.asyncpg), соединение не должно вернуться в общий пул
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    ingestor = KnowledgeBaseIngestor(
+        session_factory=async_sessionmaker(engine, expire_on_commit=False)
+    )
+
+    failed = 0
+    totals = {"ingested": 0, "unchanged": 0, "chunks": 0, "embedded": 0, "reused": 0}
+    try:
+        for path, source_key in iter_sources(args.paths, args.glob):
+            started = time.perf_counter()
+            result = await ingestor.ingest_file(
+                path, source_key, args.type, title=args.title, force=args.force
+            )
+            if not result.is_success:
+                failed += 1
+                print(f"FAILED    {source_key}: {result.error}", file=sys.stderr)
+                continue
+
+            report = result.value
+            totals[report.status] += 1
+            totals["chunks"] += report.chunks
+            totals["embedded"] += report.embedded
+            totals["reused"] += report.reused
+            print(
+                f"{report.status:<9} {source_key}: chunks={report.chunks} "
+                f"embedded={report.embedded} reused={report.reused} "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+    finally:
+        await llm_gateway.close()
+        await engine.dispose()
+
+    print(
+        f"ingested={totals['ingested']} unchanged={totals['unchanged']} failed={failed} "
+        f"chunks={totals['chunks']} embedded={totals['embedded']} reused={totals['reused']}"
+    )
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Загрузка правовой базы знаний для RAG")
+    parser.add_argument("paths", nargs="+", help="Файлы или каталоги корпуса")
+    parser.add_argument("--type", choices=KB_SOURCE_TYPES, required=True, help="Тип источников")
+    parser.add_argument("--glob", default="*.txt", help="Шаблон файлов в каталогах")
+    parser.add_argument("--title", help="Название (для одного файла; по умолчанию - первая строка)")
+    parser.add_argument("--force", action="store_true", help="Загрузить неизменившиеся файлы")
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Тесты чистых функций гибридного поиска (tsquery, RRF, MMR).
+"""
+from typing import Sequence
+
+import numpy as np
+import pytest
+
+from app.modules.chat.infrastructure.services.hybrid_retriever import (
+    RetrievedChunk,
+    build_or_tsquery,
+    mmr,
+    reciprocal_rank_fusion,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def chunk(chunk_id: str, embedding: Sequence[float] = (1.0, 0.0), score: float = 0.0) -> RetrievedChunk:
+    return RetrievedChunk(
+        chunk_id=chunk_id,
+        document_id=f"doc-{chunk_id}",
+        document_title="Документ",
+        content=f"Текст {chunk_id}",
+        metadata={},
+        embedding=np.asarray(embedding, dtype=np.float32),
+        score=score,
+    )
+
+
+class TestBuildOrTsquery:
+    """Запрос для to_tsquery."""
+
+    def test_words_joined_with_or(self):
+        assert build_or_tsquery("Штраф за превышение скорости") == (
+            "штраф | за | превышение | скорости"
+        )
+
+    def test_special_characters_dropped_and_duplicates_removed(self):
+        assert build_or_tsquery("ст. 12.9 КоАП & (ст. 12.9)!") == "ст | 12 | 9 | коап"
+
+    def test_no_words(self):
+        assert build_or_tsquery("?! -- &") is None
+
+
+class TestReciprocalRankFusion:
+    """Объединение ранжированных списков."""
+
+    def test_chunk_in_both_lists_ranks_first(self):
+        lexical = [chunk("a"), chunk("b"), chunk("c")]
+        vector = [chunk("d"), chunk("c"), chunk("e")]
+
+        fused = reciprocal_rank_fusion([lexical, vector], k=60)
+
+        assert fused[0].chunk_id == "c"
+        assert fused[0].score == pytest.approx(1 / 63 + 1 / 62)
+
+    def test_scores_by_rank(self):
+        fused = reciprocal_rank_fusion([[chunk("a"), chunk("b")]], k=10)
+
+        assert [(item.chunk_id, item.score) for item in fused] == [
+            ("a", pytest.approx(1 / 11)),
+            ("b", pytest.approx(1 / 12)),
+        ]
+
+    def test_ties_ordered_by_chunk_id(self):
+        fused = reciprocal_rank_fusion([[chunk("b")], [chunk("a")]], k=60)
+
+        assert [item.chunk_id for item in fused] == ["a", "b"]
+
+    def test_duplicates_merged(self):
+        fused = reciprocal_rank_fusion([[chunk("a")], [chunk("a")], [chunk("a")]], k=60)
+
+        assert len(fused) == 1
+        assert fused[0].score == pytest.approx(3 / 61)
+
+    def test_first_occurrence_kept(self):
+        lexical = [chunk("a", embedding=(1.0, 0.0))]
+        vector = [chunk("a", embedding=(0.0, 1.0))]
+
+        fused = reciprocal_rank_fusion([lexical, vector])
+
+        np.testing.assert_array_equal(fused[0].embedding, [1.0, 0.0])
+
+    def test_empty(self):
+        assert reciprocal_rank_fusion([[], []]) == []
+
+
+class TestMMR:
+    """Maximal Marginal Relevance."""
+
+    QUERY = (1.0, 0.0, 0.0)
+
+    def test_near_duplicate_skipped(self):
+        candidates = [
+            chunk("a", embedding=(1.0, 0.1, 0.0), score=1.0),
+            chunk("a-copy", embedding=(1.0, 0.1, 0.0), score=0.95),
+            chunk("b", embedding=(0.6, 0.0, 0.8), score=0.8),
+        ]
+
+        selected = mmr(self.QUERY, candidates, top_k=2, lambda_=0.7)
+
+        assert [item.chunk_id for item in selected] == ["a", "b"]
+
+    def test_relevance_only(self):
+        candidates = [
+            chunk("a", embedding=(1.0, 0.1, 0.0), score=1.0),
+            chunk("a-copy", embedding=(1.0, 0.1, 0.0), score=0.95),
+            chunk("b", embedding=(0.6, 0.0, 0.8), score=0.8),
+        ]
+
+        selected = mmr(self.QUERY, candidates, top_k=2, lambda_=1.0)
+
+        assert [item.chunk_id for item in selected] == ["a", "a-copy"]
+
+    def test_similarity_filled(self):
+        candidates = [chunk("a", embedding=(3.0, 4.0, 0.0), score=1.0)]
+
+        (selected,) = mmr(self.QUERY, candidates, top_k=1)
+
+        assert selected.similarity == pytest.approx(0.6)
+        assert selected.score == 1.0
+
+    def test_zero_scores_fall_back_to_similarity(self):
+        candidates = [
+            chunk("far", embedding=(0.0, 1.0, 0.0)),
+            chunk("near", embedding=(1.0, 0.0, 0.0)),
+        ]
+
+        selected = mmr(self.QUERY, candidates, top_k=1)
+
+        assert selected[0].chunk_id == "near"
+
+    def test_zero_vector_does_not_break(self):
+        candidates = [
+            chunk("zero", embedding=(0.0, 0.0, 0.0), score=0.5),
+            chunk("a", embedding=(1.0, 0.0, 0.0), score=1.0),
+        ]
+
+        selected = mmr(self.QUERY, candidates, top_k=2)
+
+        assert [item.chunk_id for item in selected] == ["a", "zero"]
+        assert selected[1].similarity == 0.0
+
+    def test_top_k_larger_than_candidates(self):
+        candidates = [chunk("a", score=1.0), chunk("b", score=0.5)]
+
+        assert len(mmr((1.0, 0.0), candidates, top_k=10)) == 2
+
+    @pytest.mark.parametrize("top_k", [0, -1])
+    def test_nothing_requested(self, top_k):
+        assert mmr(self.QUERY, [chunk("a", embedding=self.QUERY, score=1.0)], top_k) == []
+
+    def test_no_candidates(self):
+        assert mmr(self.QUERY, [], top_k=5) == []
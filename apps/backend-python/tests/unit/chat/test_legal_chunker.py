@@ -0,0 +1,256 @@
+"""
+Тесты LegalTextChunker.
+
+Tokenizer подменяется побайтовым (1 байт UTF-8 = 1 токен): размеры
+предсказуемы, кириллица занимает 2 токена на символ, и разрез по
+токенам попадает в середину символа.
+"""
+from typing import List
+
+import pytest
+
+from app.modules.chat.infrastructure.services import legal_chunker
+from app.modules.chat.infrastructure.services.legal_chunker import (
+    LegalTextChunker,
+    TextChunk,
+    _complete_utf8_prefix,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class ByteEncoding:
+    """Побайтовая кодировка с интерфейсом tiktoken.Encoding."""
+
+    def encode(self, text: str, disallowed_special=()) -> List[int]:
+        return list(text.encode("utf-8"))
+
+    def decode_bytes(self, tokens: List[int]) -> bytes:
+        return bytes(tokens)
+
+
+@pytest.fixture(autouse=True)
+def byte_encoding(monkeypatch):
+    monkeypatch.setattr(legal_chunker, "get_encoding", lambda model: ByteEncoding())
+
+
+def make_chunker(max_tokens: int, min_tokens: int = 0) -> LegalTextChunker:
+    return LegalTextChunker("test-model", max_tokens=max_tokens, min_tokens=min_tokens)
+
+
+def assert_well_formed(chunker: LegalTextChunker, chunks: List[TextChunk], max_tokens: int):
+    assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+    for chunk in chunks:
+        assert chunk.token_count == chunker.count_tokens(chunk.content)
+        assert chunk.token_count <= max_tokens
+
+
+class TestArticleBoundaries:
+    """Границы статей и метаданные структуры."""
+
+    TEXT = (
+        "Глава 2. Права потребителей\n"
+        "Статья 7. Право потребителя на безопасность товара\n"
+        "1. Потребитель имеет право на то, чтобы товар был безопасен.\n"
+        "2. Вред, причиненный товаром, подлежит возмещению.\n"
+        "Статья 8. Право потребителя на информацию\n"
+        "1. Потребитель вправе потребовать информацию об изготовителе.\n"
+    )
+
+    def test_new_article_starts_new_chunk(self):
+        # Заголовок главы (49 токенов) меньше min_tokens и упаковывается со статьей 7
+        chunker = make_chunker(max_tokens=1000, min_tokens=60)
+
+        chunks = list(chunker.chunks(self.TEXT))
+
+        assert len(chunks) == 2
+        assert chunks[0].content.startswith("Глава 2.")
+        assert chunks[1].content.startswith("Статья 8.")
+        assert_well_formed(chunker, chunks, 1000)
+
+    def test_section_metadata(self):
+        chunker = make_chunker(max_tokens=1000, min_tokens=60)
+
+        first, second = chunker.chunks(self.TEXT)
+
+        assert first.section == {
+            "chapter": "2",
+            "heading": "Глава 2. Права потребителей",
+        }
+        assert second.section == {
+            "chapter": "2",
+            "article": "8",
+            "heading": "Статья 8. Право потребителя на информацию",
+        }
+
+    def test_short_heading_alone_once_min_reached(self):
+        chunker = make_chunker(max_tokens=1000, min_tokens=10)
+
+        chunks = list(chunker.chunks(self.TEXT))
+
+        assert [chunk.content.splitlines()[0] for chunk in chunks] == [
+            "Глава 2. Права потребителей",
+            "Статья 7. Право потребителя на безопасность товара",
+            "Статья 8. Право потребителя на информацию",
+        ]
+
+    def test_iterable_of_lines(self):
+        chunker = make_chunker(max_tokens=1000, min_tokens=60)
+
+        from_lines = list(chunker.chunks(iter(self.TEXT.splitlines())))
+
+        assert from_lines == list(chunker.chunks(self.TEXT))
+
+
+class TestMinTokensPacking:
+    """Мелкие статьи упаковываются вместе."""
+
+    TEXT = (
+        "Статья 1. Утратила силу.\n"
+        "Статья 2. Утратила силу.\n"
+        "Статья 3. Утратила силу.\n"
+    )
+
+    def test_small_articles_share_chunk(self):
+        chunker = make_chunker(max_tokens=1000, min_tokens=500)
+
+        chunks = list(chunker.chunks(self.TEXT))
+
+        assert len(chunks) == 1
+        assert chunks[0].content == self.TEXT.strip()
+        assert chunks[0].section["article"] == "1"
+        assert_well_formed(chunker, chunks, 1000)
+
+    def test_article_boundary_once_min_reached(self):
+        chunker = make_chunker(max_tokens=1000, min_tokens=1)
+
+        chunks = list(chunker.chunks(self.TEXT))
+
+        assert [chunk.section["article"] for chunk in chunks] == ["1", "2", "3"]
+
+    def test_max_tokens_wins_over_packing(self):
+        # Две статьи и разделитель помещаются, третья - нет
+        max_tokens = len("Статья 1. Утратила силу.".encode()) * 2 + 1
+        chunker = make_chunker(max_tokens=max_tokens, min_tokens=max_tokens)
+
+        chunks = list(chunker.chunks(self.TEXT))
+
+        assert [chunk.section["article"] for chunk in chunks] == ["1", "3"]
+        assert_well_formed(chunker, chunks, max_tokens)
+
+
+class TestHeadingCarry:
+    """Продолжение статьи начинается с ее заголовка."""
+
+    HEADING = "Статья 5. Сроки"
+    PARAGRAPH = "Срок исчисляется днями, если иное не установлено законом"
+
+    def text(self, parts: int) -> str:
+        lines = [self.HEADING]
+        lines += [f"{number}. {self.PARAGRAPH}" for number in range(1, parts + 1)]
+        return "\n".join(lines)
+
+    def test_continuation_starts_with_heading(self):
+        paragraph_tokens = len(f"1. {self.PARAGRAPH}".encode())
+        heading_tokens = len(self.HEADING.encode())
+        max_tokens = heading_tokens + paragraph_tokens * 2 + 2
+        chunker = make_chunker(max_tokens=max_tokens)
+
+        chunks = list(chunker.chunks(self.text(4)))
+
+        assert len(chunks) == 2
+        assert chunks[0].content.startswith(self.HEADING)
+        assert chunks[1].content.splitlines()[0] == self.HEADING
+        assert chunks[1].content.splitlines()[1].startswith("3.")
+        assert chunks[1].section["article"] == "5"
+        assert chunks[1].section["part"] == "3"
+        assert_well_formed(chunker, chunks, max_tokens)
+
+    def test_long_heading_not_carried(self):
+        # Заголовок больше max_tokens / 8 съел бы бюджет чанка
+        paragraph_tokens = len(f"1. {self.PARAGRAPH}".encode())
+        max_tokens = paragraph_tokens * 2 + 1
+        chunker = make_chunker(max_tokens=max_tokens)
+        heading = "Статья 5. " + "Очень длинное название статьи " * 3
+
+        text = "\n".join([heading] + [f"{n}. {self.PARAGRAPH}" for n in range(1, 5)])
+        chunks = list(chunker.chunks(text))
+
+        assert not any(chunk.content.startswith(heading) for chunk in chunks[1:])
+        assert_well_formed(chunker, chunks, max_tokens)
+
+
+class TestOversizedParagraph:
+    """Абзац больше max_tokens режется по предложениям."""
+
+    SENTENCE = "Арендатор обязан своевременно вносить арендную плату."
+
+    def test_split_by_sentences(self):
+        sentence_tokens = len(self.SENTENCE.encode())
+        max_tokens = sentence_tokens * 2 + 1
+        chunker = make_chunker(max_tokens=max_tokens)
+        paragraph = " ".join([self.SENTENCE] * 5)
+
+        chunks = list(chunker.chunks(paragraph))
+
+        assert [chunk.content.count(self.SENTENCE) for chunk in chunks] == [2, 2, 1]
+        assert " ".join(chunk.content for chunk in chunks) == paragraph
+        assert_well_formed(chunker, chunks, max_tokens)
+
+    def test_last_piece_is_packed_with_next_paragraph(self):
+        sentence_tokens = len(self.SENTENCE.encode())
+        max_tokens = sentence_tokens * 2 + 1
+        chunker = make_chunker(max_tokens=max_tokens)
+        text = " ".join([self.SENTENCE] * 3) + "\n\nИтог."
+
+        chunks = list(chunker.chunks(text))
+
+        assert chunks[-1].content == f"{self.SENTENCE}\nИтог."
+        assert_well_formed(chunker, chunks, max_tokens)
+
+    def test_oversized_sentence_is_split_by_tokens(self):
+        chunker = make_chunker(max_tokens=40)
+        sentence = "слово" * 30  # без границ предложений, 300 токенов
+
+        chunks = list(chunker.chunks(sentence))
+
+        assert len(chunks) > 1
+        assert "".join(chunk.content for chunk in chunks) == sentence
+
+
+class TestUtf8Cut:
+    """Разрез по токенам не разрывает многобайтовые символы."""
+
+    def test_cyrillic_cut_with_odd_budget(self):
+        chunker = make_chunker(max_tokens=512)
+        text = "Гражданский кодекс Российской Федерации"
+
+        pieces = list(chunker._split_tokens(text, budget=7))
+
+        assert all("�" not in piece for piece, _ in pieces)
+        assert "".join(piece for piece, _ in pieces).replace(" ", "") == text.replace(" ", "")
+
+    def test_pending_bytes_are_carried_to_next_piece(self):
+        chunker = make_chunker(max_tokens=512)
+
+        pieces = [piece for piece, _ in chunker._split_tokens("яяя", budget=3)]
+
+        # 6 байт, окна по 3: "я" + половина второго "я" переносится
+        assert pieces == ["я", "яя"]
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b"", 0),
+            (b"abc", 3),
+            ("я".encode(), 2),
+            ("я".encode()[:1], 0),
+            (b"a" + "я".encode()[:1], 1),
+            ("€".encode()[:2], 0),
+            ("€".encode(), 3),
+            ("😀".encode()[:3], 0),
+            ("😀".encode(), 4),
+        ],
+    )
+    def test_complete_utf8_prefix(self, data, expected):
+        assert _complete_utf8_prefix(data) == expected
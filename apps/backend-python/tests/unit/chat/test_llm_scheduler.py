@@ -0,0 +1,303 @@
+"""
+Тесты LLMScheduler (weighted fair queuing запросов к LLM).
+
+Часы подменяются управляемыми (дедлайны), rate limiter - заглушкой
+(бюджет токенов без Redis).
+"""
+import asyncio
+from typing import List, Sequence, Tuple
+
+import pytest
+
+from app.core.infrastructure.rate_limiter import RateLimitCheck, RateLimitResult
+from app.modules.chat.infrastructure.services.llm_scheduler import (
+    LLMRequestDroppedError,
+    LLMScheduler,
+)
+
+pytestmark = pytest.mark.unit
+
+TOKENS = 100
+
+
+class FakeClock:
+    """Монотонные часы, которые двигает тест."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class StubLimiter:
+    """Бюджет токенов: по очереди возвращает заданные результаты, затем allowed."""
+
+    def __init__(self, results: Sequence[RateLimitResult] = ()) -> None:
+        self.results = list(results)
+        self.acquired: List[int] = []
+        self.charged: List[int] = []
+
+    async def acquire(self, checks: Sequence[RateLimitCheck]) -> RateLimitResult:
+        self.acquired.append(sum(check.cost for check in checks))
+        if self.results:
+            return self.results.pop(0)
+        return RateLimitResult(allowed=True, remaining=0.0, retry_after=0.0)
+
+    async def charge(self, rule, identity: str, cost: int) -> None:
+        self.charged.append(cost)
+
+
+def denied(retry_after: float) -> RateLimitResult:
+    return RateLimitResult(allowed=False, remaining=0.0, retry_after=retry_after)
+
+
+async def settle() -> None:
+    """Дать задачам и диспетчеру отработать."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter() -> StubLimiter:
+    return StubLimiter()
+
+
+@pytest.fixture
+async def scheduler(clock, limiter):
+    scheduler = LLMScheduler(
+        limiter=limiter,
+        enabled=True,
+        max_concurrency=1,
+        max_queue=100,
+        max_wait=30.0,
+        clock=clock,
+    )
+    yield scheduler
+    await scheduler.stop()
+
+
+async def hold_slot(scheduler: LLMScheduler) -> Tuple[asyncio.Event, asyncio.Task]:
+    """Занять единственный слот запросом, который ждет события."""
+    release = asyncio.Event()
+
+    async def blocked() -> str:
+        await release.wait()
+        return "blocker"
+
+    task = asyncio.create_task(scheduler.run("blocker", "free", TOKENS, blocked))
+    await settle()
+    assert scheduler._in_flight == 1
+    return release, task
+
+
+class TestWeightOrdering:
+    """Порядок выдачи слотов по весам планов."""
+
+    async def test_paid_plan_gets_larger_share(self, scheduler):
+        release, blocker = await hold_slot(scheduler)
+        order: List[str] = []
+
+        def call(label: str):
+            async def run() -> str:
+                order.append(label)
+                return label
+
+            return run
+
+        requests = [("free-user", "free", "f1"), ("free-user", "free", "f2")]
+        requests += [("pro-user", "pro", f"p{n}") for n in range(1, 5)]
+        tasks = [
+            asyncio.create_task(scheduler.run(user_id, plan, TOKENS, call(label)))
+            for user_id, plan, label in requests
+        ]
+        await settle()
+
+        release.set()
+        await asyncio.gather(blocker, *tasks)
+
+        # Вес pro = 4, free = 1: виртуальное время окончания
+        # p1=25, p2=50, p3=75, f1=100, p4=100 (позже в очереди), f2=200
+        assert order == ["p1", "p2", "p3", "f1", "p4", "f2"]
+        assert scheduler._in_flight == 0
+
+    async def test_unknown_plan_weighs_as_free(self, scheduler):
+        release, blocker = await hold_slot(scheduler)
+        order: List[str] = []
+
+        def call(label: str):
+            async def run() -> str:
+                order.append(label)
+                return label
+
+            return run
+
+        tasks = [
+            asyncio.create_task(scheduler.run("a", "legacy", TOKENS, call("a1"))),
+            asyncio.create_task(scheduler.run("a", "legacy", TOKENS, call("a2"))),
+            asyncio.create_task(scheduler.run("b", None, TOKENS, call("b1"))),
+        ]
+        await settle()
+
+        release.set()
+        await asyncio.gather(blocker, *tasks)
+
+        assert order == ["a1", "b1", "a2"]
+
+
+class TestDeadlineDrop:
+    """Запрос, не получивший слот до дедлайна, отбрасывается."""
+
+    async def test_waiter_times_out(self, clock, limiter):
+        scheduler = LLMScheduler(
+            limiter=limiter, enabled=True, max_concurrency=1, max_queue=100,
+            max_wait=0.05, clock=clock,
+        )
+        try:
+            release, blocker = await hold_slot(scheduler)
+            called = False
+
+            async def call() -> None:
+                nonlocal called
+                called = True
+
+            with pytest.raises(LLMRequestDroppedError) as exc_info:
+                await scheduler.run("late", "free", TOKENS, call)
+
+            assert exc_info.value.reason == "deadline"
+            assert not called
+            # Отброшенный запрос не сдвигает виртуальное время пользователя
+            assert scheduler._last_finish["late"] == scheduler._virtual_time
+
+            release.set()
+            await blocker
+        finally:
+            await scheduler.stop()
+
+    async def test_dispatcher_drops_expired_ticket(self, scheduler, clock):
+        release, blocker = await hold_slot(scheduler)
+        called = False
+
+        async def call() -> None:
+            nonlocal called
+            called = True
+
+        waiter = asyncio.create_task(scheduler.run("late", "free", TOKENS, call))
+        await settle()
+        clock.advance(31.0)
+        release.set()
+
+        with pytest.raises(LLMRequestDroppedError) as exc_info:
+            await waiter
+
+        assert exc_info.value.reason == "deadline"
+        assert not called
+        assert scheduler._last_finish["late"] == scheduler._virtual_time
+        await blocker
+
+
+class TestBudgetDrop:
+    """Глобальный бюджет токенов."""
+
+    async def test_dropped_when_budget_recovers_after_deadline(self, scheduler, limiter):
+        limiter.results = [denied(retry_after=60.0)]
+
+        async def call() -> None:
+            raise AssertionError("must not be called")
+
+        with pytest.raises(LLMRequestDroppedError) as exc_info:
+            await scheduler.run("user", "pro", TOKENS, call)
+
+        assert exc_info.value.reason == "budget"
+        assert scheduler._last_finish["user"] == scheduler._virtual_time
+        assert scheduler._in_flight == 0
+
+    async def test_waits_for_budget_within_deadline(self, scheduler, limiter):
+        limiter.results = [denied(retry_after=0.01)]
+
+        async def call() -> str:
+            return "answer"
+
+        assert await scheduler.run("user", "pro", TOKENS, call) == "answer"
+        assert limiter.acquired == [TOKENS, TOKENS]
+        assert scheduler._in_flight == 0
+
+    async def test_estimate_is_capped_by_bucket_size(self, scheduler, limiter):
+        async def call() -> None:
+            return None
+
+        await scheduler.run("user", "pro", 10**9, call)
+
+        # Иначе запрос больше корзины никогда не прошел бы проверку
+        assert limiter.acquired[0] < 10**9
+
+    async def test_charge_reports_difference(self, scheduler, limiter):
+        await scheduler.charge(estimated_tokens=100, actual_tokens=140)
+
+        assert limiter.charged == [40]
+
+
+class TestCancellation:
+    """Клиент отключился, пока запрос ждал в очереди."""
+
+    async def test_cancelled_waiter_is_refunded(self, scheduler):
+        release, blocker = await hold_slot(scheduler)
+
+        async def call() -> None:
+            raise AssertionError("must not be called")
+
+        waiter = asyncio.create_task(scheduler.run("gone", "free", TOKENS, call))
+        await settle()
+        assert scheduler._last_finish["gone"] == TOKENS
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert scheduler._last_finish["gone"] == scheduler._virtual_time
+
+        release.set()
+        await blocker
+        await settle()
+        assert scheduler._in_flight == 0
+
+    async def test_refund_keeps_later_requests_of_same_user(self, scheduler):
+        release, blocker = await hold_slot(scheduler)
+        done: List[str] = []
+
+        async def call() -> None:
+            done.append("second")
+
+        first = asyncio.create_task(scheduler.run("user", "free", TOKENS, call))
+        second = asyncio.create_task(scheduler.run("user", "free", TOKENS, call))
+        await settle()
+        assert scheduler._last_finish["user"] == 2 * TOKENS
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        # Возвращена только стоимость отмененного запроса
+        assert scheduler._last_finish["user"] == TOKENS
+
+        release.set()
+        await asyncio.gather(blocker, second)
+        assert done == ["second"]
+
+
+async def test_disabled_scheduler_calls_directly(limiter, clock):
+    scheduler = LLMScheduler(limiter=limiter, enabled=False, clock=clock)
+
+    async def call() -> str:
+        return "answer"
+
+    assert await scheduler.run("user", "free", TOKENS, call) == "answer"
+    assert limiter.acquired == []
@@ -0,0 +1,111 @@
+"""
+Тесты CronExpression (парсер расписаний планировщика).
+"""
+from datetime import datetime
+
+import pytest
+
+from app.core.infrastructure.scheduler import CronExpression
+
+pytestmark = pytest.mark.unit
+
+
+class TestParseField:
+    """Разбор отдельных полей."""
+
+    def test_wildcard(self):
+        cron = CronExpression("* * * * *")
+
+        assert cron._minutes == frozenset(range(0, 60))
+        assert cron._weekdays == frozenset(range(0, 7))
+
+    def test_wildcard_step(self):
+        cron = CronExpression("*/15 * * * *")
+
+        assert cron._minutes == {0, 15, 30, 45}
+
+    def test_range_and_list(self):
+        cron = CronExpression("0 9-11,14 * * *")
+
+        assert cron._hours == {9, 10, 11, 14}
+
+    def test_range_step(self):
+        cron = CronExpression("10-40/10 * * * *")
+
+        assert cron._minutes == {10, 20, 30, 40}
+
+    def test_start_step_runs_to_end_of_range(self):
+        # Как в cron: "a/n" = "a-max/n"
+        cron = CronExpression("5/20 * * * *")
+
+        assert cron._minutes == {5, 25, 45}
+
+    def test_start_step_uses_field_range(self):
+        cron = CronExpression("0 0 10/10 * *")
+
+        assert cron._days == {10, 20, 30}
+
+    def test_single_value(self):
+        cron = CronExpression("40 3 * * *")
+
+        assert cron._minutes == {40}
+        assert cron._hours == {3}
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "* * * *",
+            "60 * * * *",
+            "* 24 * * *",
+            "* * 0 * *",
+            "* * * 13 *",
+            "* * * * 7",
+            "*/0 * * * *",
+            "30-10 * * * *",
+        ],
+    )
+    def test_invalid(self, expression):
+        with pytest.raises(ValueError):
+            CronExpression(expression)
+
+
+class TestNextAfter:
+    """Расчет следующего запуска."""
+
+    def test_next_minute_step(self):
+        cron = CronExpression("*/5 * * * *")
+
+        assert cron.next_after(datetime(2026, 1, 1, 10, 2, 30)) == datetime(2026, 1, 1, 10, 5)
+
+    def test_strictly_after(self):
+        cron = CronExpression("*/5 * * * *")
+
+        assert cron.next_after(datetime(2026, 1, 1, 10, 5)) == datetime(2026, 1, 1, 10, 10)
+
+    def test_daily_rolls_to_next_day(self):
+        cron = CronExpression("40 3 * * *")
+
+        assert cron.next_after(datetime(2026, 1, 1, 4, 0)) == datetime(2026, 1, 2, 3, 40)
+
+    def test_start_step_wraps_to_next_hour(self):
+        cron = CronExpression("5/20 * * * *")
+
+        assert cron.next_after(datetime(2026, 1, 1, 10, 46)) == datetime(2026, 1, 1, 11, 5)
+
+    def test_weekday(self):
+        # 2026-01-01 - четверг; 0 = воскресенье
+        cron = CronExpression("0 12 * * 0")
+
+        assert cron.next_after(datetime(2026, 1, 1)) == datetime(2026, 1, 4, 12, 0)
+
+    def test_day_of_month_or_weekday(self):
+        # Заданы оба поля - достаточно совпадения любого
+        cron = CronExpression("0 0 15 * 1")
+
+        assert cron.next_after(datetime(2026, 1, 1)) == datetime(2026, 1, 5, 0, 0)
+
+    def test_never_fires(self):
+        cron = CronExpression("0 0 31 2 *")
+
+        with pytest.raises(ValueError):
+            cron.next_after(datetime(2026, 1, 1))
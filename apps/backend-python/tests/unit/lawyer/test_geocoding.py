@@ -0,0 +1,247 @@
+"""
+Тесты геокодирования юристов (геокодер, обновление города и координат).
+
+Внешний геокодер подменяется: HTTP - через httpx.MockTransport, в
+остальных тестах - заглушкой IGeocoder.
+"""
+from typing import Dict, List, Optional
+
+import httpx
+import pytest
+
+from app.modules.lawyer.application.commands.update_location import UpdateLocationCommand
+from app.modules.lawyer.application.commands.update_location_handler import (
+    UpdateLocationHandler,
+)
+from app.modules.lawyer.domain.entities.lawyer import Lawyer
+from app.modules.lawyer.domain.services.geocoder import IGeocoder
+from app.modules.lawyer.domain.value_objects.experience import Experience
+from app.modules.lawyer.domain.value_objects.geo_point import GeoPoint
+from app.modules.lawyer.domain.value_objects.price import Price
+from app.modules.lawyer.domain.value_objects.specialization import Specialization
+from app.modules.lawyer.infrastructure import geocoding
+from app.modules.lawyer.infrastructure.geocoding import LawyerGeocoder, NominatimGeocoder
+from app.modules.lawyer.infrastructure.persistence.mappers.lawyer_mapper import LawyerMapper
+
+pytestmark = pytest.mark.unit
+
+SPB = GeoPoint(59.9343, 30.3351)
+OFFICE = GeoPoint(59.9311, 30.3609)
+
+
+class StubGeocoder(IGeocoder):
+    """Геокодер с заданными ответами (или ошибкой)."""
+
+    def __init__(self, points: Dict[str, GeoPoint], error: Optional[Exception] = None) -> None:
+        self.points = points
+        self.error = error
+        self.calls: List[str] = []
+
+    async def locate(self, address: str) -> Optional[GeoPoint]:
+        self.calls.append(address)
+        if self.error is not None:
+            raise self.error
+        return self.points.get(address)
+
+
+class InMemoryLawyerRepository:
+    """Репозиторий юристов в памяти (только методы, нужные handler)."""
+
+    def __init__(self, *lawyers: Lawyer) -> None:
+        self.lawyers = {lawyer.id: lawyer for lawyer in lawyers}
+        self.saved: List[Lawyer] = []
+
+    async def find_by_id(self, lawyer_id: str) -> Optional[Lawyer]:
+        return self.lawyers.get(lawyer_id)
+
+    async def save(self, lawyer: Lawyer) -> None:
+        self.saved.append(lawyer)
+
+
+def make_lawyer(location: str = "Санкт-Петербург", coordinates: Optional[GeoPoint] = SPB) -> Lawyer:
+    return Lawyer.create(
+        user_id="user-1",
+        specializations=[Specialization("ДТП")],
+        experience=Experience(5),
+        price_per_consultation=Price(2500.0),
+        license_number="АБ1234567",
+        education="МГУ, Юридический факультет",
+        about="Специализируюсь на автомобильных спорах. " * 3,
+        location=location,
+        coordinates=coordinates,
+    ).value
+
+
+class TestNominatimGeocoder:
+    """HTTP геокодер."""
+
+    @pytest.fixture
+    def requests(self, monkeypatch) -> List[httpx.Request]:
+        """Перехватывает запросы; ответ берется из request.url.params["q"]."""
+        responses = {
+            "Кострома": httpx.Response(200, json=[{"lat": "57.7677", "lon": "40.9264"}]),
+            "Нигде": httpx.Response(200, json=[]),
+            "Сломано": httpx.Response(200, json=[{"lat": "north"}]),
+            "Ошибка": httpx.Response(503),
+        }
+        seen: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return responses[request.url.params["q"]]
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            geocoding.httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        return seen
+
+    @pytest.fixture
+    def geocoder(self) -> NominatimGeocoder:
+        return NominatimGeocoder("https://geo.test/", timeout=1.0, min_interval=0.0)
+
+    async def test_found(self, geocoder, requests):
+        point = await geocoder.locate("Кострома")
+
+        assert (point.latitude, point.longitude) == (57.7677, 40.9264)
+        assert requests[0].url.path == "/search"
+        assert requests[0].url.params["limit"] == "1"
+        assert requests[0].headers["User-Agent"]
+
+    async def test_not_found(self, geocoder, requests):
+        assert await geocoder.locate("Нигде") is None
+
+    async def test_malformed_response(self, geocoder, requests):
+        assert await geocoder.locate("Сломано") is None
+
+    async def test_http_error_raised(self, geocoder, requests):
+        with pytest.raises(httpx.HTTPStatusError):
+            await geocoder.locate("Ошибка")
+
+
+class TestLawyerGeocoder:
+    """Внешний геокодер со справочником городов как запасным вариантом."""
+
+    async def test_primary_result_wins(self):
+        geocoder = LawyerGeocoder(StubGeocoder({"Санкт-Петербург": OFFICE}))
+
+        assert await geocoder.locate("Санкт-Петербург") == OFFICE
+
+    async def test_city_outside_gazetteer(self):
+        kostroma = GeoPoint(57.7677, 40.9264)
+        geocoder = LawyerGeocoder(StubGeocoder({"Кострома": kostroma}))
+
+        assert await geocoder.locate("Кострома") == kostroma
+
+    async def test_falls_back_when_not_found(self):
+        geocoder = LawyerGeocoder(StubGeocoder({}))
+
+        assert await geocoder.locate("г. Санкт-Петербург") == SPB
+
+    async def test_falls_back_when_unavailable(self):
+        primary = StubGeocoder({}, error=httpx.ConnectError("refused"))
+        geocoder = LawyerGeocoder(primary)
+
+        assert await geocoder.locate("Санкт-Петербург") == SPB
+        assert primary.calls == ["Санкт-Петербург"]
+
+    async def test_gazetteer_only(self):
+        geocoder = LawyerGeocoder()
+
+        assert await geocoder.locate("Санкт-Петербург") == SPB
+        assert await geocoder.locate("Кострома") is None
+
+
+class TestUpdateLocationHandler:
+    """Обновление города и координат юриста."""
+
+    async def test_explicit_coordinates_skip_geocoder(self):
+        lawyer = make_lawyer()
+        geocoder = StubGeocoder({})
+        handler = UpdateLocationHandler(InMemoryLawyerRepository(lawyer), geocoder)
+
+        result = await handler.handle(
+            UpdateLocationCommand(
+                lawyer_id=lawyer.id,
+                location="Санкт-Петербург",
+                latitude=OFFICE.latitude,
+                longitude=OFFICE.longitude,
+            )
+        )
+
+        assert result.is_success
+        assert lawyer.coordinates == OFFICE
+        assert geocoder.calls == []
+
+    async def test_geocoded_without_coordinates(self):
+        lawyer = make_lawyer()
+        kostroma = GeoPoint(57.7677, 40.9264)
+        repository = InMemoryLawyerRepository(lawyer)
+        handler = UpdateLocationHandler(repository, StubGeocoder({"Кострома": kostroma}))
+
+        result = await handler.handle(UpdateLocationCommand(lawyer_id=lawyer.id, location="Кострома"))
+
+        assert result.is_success
+        assert lawyer.location == "Кострома"
+        assert lawyer.coordinates == kostroma
+        assert repository.saved == [lawyer]
+
+    async def test_unknown_city_clears_coordinates(self):
+        lawyer = make_lawyer()
+        handler = UpdateLocationHandler(InMemoryLawyerRepository(lawyer), StubGeocoder({}))
+
+        result = await handler.handle(UpdateLocationCommand(lawyer_id=lawyer.id, location="Кострома"))
+
+        assert result.is_success
+        assert lawyer.coordinates is None
+
+    async def test_half_of_coordinates_rejected(self):
+        lawyer = make_lawyer()
+        repository = InMemoryLawyerRepository(lawyer)
+        handler = UpdateLocationHandler(repository, StubGeocoder({}))
+
+        result = await handler.handle(
+            UpdateLocationCommand(lawyer_id=lawyer.id, location="Кострома", latitude=57.7)
+        )
+
+        assert result.is_failure
+        assert repository.saved == []
+
+    async def test_invalid_coordinates_rejected(self):
+        lawyer = make_lawyer()
+        handler = UpdateLocationHandler(InMemoryLawyerRepository(lawyer), StubGeocoder({}))
+
+        result = await handler.handle(
+            UpdateLocationCommand(lawyer_id=lawyer.id, location="Кострома", latitude=91.0, longitude=0.0)
+        )
+
+        assert result.is_failure
+
+    async def test_lawyer_not_found(self):
+        handler = UpdateLocationHandler(InMemoryLawyerRepository(), StubGeocoder({}))
+
+        result = await handler.handle(UpdateLocationCommand(lawyer_id="missing", location="Кострома"))
+
+        assert result.is_failure
+
+
+class TestMapperCoordinates:
+    """Сохранение координат в модель."""
+
+    def test_unknown_coordinates_kept_for_same_city(self):
+        model = LawyerMapper.to_model(make_lawyer())
+
+        LawyerMapper.update_model_from_entity(model, make_lawyer(coordinates=None))
+
+        assert (model.latitude, model.longitude) == (SPB.latitude, SPB.longitude)
+
+    def test_city_change_clears_stale_coordinates(self):
+        model = LawyerMapper.to_model(make_lawyer())
+        lawyer = make_lawyer()
+        lawyer.update_location("Кострома", None)
+
+        LawyerMapper.update_model_from_entity(model, lawyer)
+
+        assert (model.latitude, model.longitude, model.geohash) == (None, None, None)